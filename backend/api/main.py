@@ -5,21 +5,21 @@ This module provides the application factory pattern for creating and configurin
 the FastAPI application instance with all middleware, exception handlers, and routes.
 """
 
-import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
-from typing import Any, Callable
+from typing import Any
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.middleware.gzip import GZipMiddleware
 
 from api.config import get_settings
+from api.middleware.compression import CompressionMiddleware
+from api.middleware.request_context import RequestContextMiddleware
 from api.middleware.security_headers import SecurityHeadersMiddleware
 from api.middleware.api_rate_limit import APIRateLimitMiddleware
 from api.middleware.prometheus_metrics import PrometheusMiddleware, get_metrics_router, METRICS_ENABLED
+from backend.services.exceptions import PasswordHashingBusyError
 
 # =============================================================================
 # Constants
@@ -39,37 +39,6 @@ Aurastream Backend API - AI-powered asset generation for content creators.
 """
 
 
-# =============================================================================
-# Request ID Middleware
-# =============================================================================
-
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware that adds a unique request ID to each request for tracing.
-    
-    The request ID is:
-    - Generated as a UUID4 if not provided in the X-Request-ID header
-    - Added to the request state for use in logging and error responses
-    - Included in the response X-Request-ID header
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Any:
-        """Process the request and add request ID."""
-        # Get existing request ID from header or generate new one
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        
-        # Store in request state for access in route handlers
-        request.state.request_id = request_id
-        
-        # Process the request
-        response = await call_next(request)
-        
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
-
-
 # =============================================================================
 # Exception Handlers
 # =============================================================================
@@ -183,6 +152,23 @@ async def validation_exception_handler(request: Request, exc: Any) -> JSONRespon
     )
 
 
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError) -> JSONResponse:
+    """
+    Shed login/signup load when the password hash pool is full.
+    
+    Returns 503 with Retry-After so clients back off instead of piling
+    more bcrypt work onto an already saturated pool.
+    """
+    request_id = getattr(request.state, "request_id", "unknown")
+    retry_after = exc.details.get("retry_after_seconds", 1)
+    
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={**exc.to_dict(), "request_id": request_id},
+        headers={**_get_cors_headers(request), "Retry-After": str(retry_after)},
+    )
+
+
 # =============================================================================
 # Lifespan Context Manager
 # =============================================================================
@@ -194,8 +180,10 @@ async def lifespan(app: FastAPI):
     
     Startup:
     - Initialize database connections
-    - Set up Redis connection pool
+    - Start the shared Redis connection manager (bounded per-purpose pools)
     - Configure logging
+    - Spawn the password hash pool's workers in the background
+    - Compile the prompt template registry
     
     NOTE: Background workers (clip_radar, playbook, analytics_flush, etc.) are now
     managed by the Head Orchestrator and run as separate Docker containers.
@@ -203,11 +191,22 @@ async def lifespan(app: FastAPI):
     
     Shutdown:
     - Close database connections
-    - Clean up Redis connections
+    - Stop the alert relay subscription and keepalive wheel
+    - Close every Redis pool owned by the connection manager
+    - Stop the password hash pool's worker processes
     """
     import asyncio
     import logging
     
+    from backend.database.redis_client import close_redis_client
+    from backend.database.redis_pool import get_redis_manager
+    from backend.services.alert_relay_service import shutdown_alert_relay_service
+    from backend.services.password_service import (
+        get_password_hash_pool,
+        shutdown_password_hash_pool,
+    )
+    from backend.services.prompt_engine import get_prompt_engine
+    
     settings = get_settings()
     logger = logging.getLogger("aurastream.lifespan")
     
@@ -215,12 +214,31 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Aurastream API...")
     logger.info("NOTE: Workers are managed by Head Orchestrator (separate containers)")
     
+    redis_manager = get_redis_manager()
+    await redis_manager.startup()
+    app.state.redis_manager = redis_manager
+    
+    # Spawning bcrypt workers takes ~1s; do it off the startup path
+    def _log_warmup_failure(future: "asyncio.Future[None]") -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Password hash pool warmup failed: {future.exception()}")
+    
+    warmup = asyncio.get_running_loop().run_in_executor(None, get_password_hash_pool().warmup)
+    warmup.add_done_callback(_log_warmup_failure)
+    
+    # Parse and compile every prompt template before the first request
+    get_prompt_engine().warmup()
+    
     logger.info("Aurastream API ready (workers managed by Head Orchestrator)")
     
     yield
     
     # Shutdown
     logger.info("Shutting down Aurastream API...")
+    await shutdown_alert_relay_service()
+    await close_redis_client()
+    # Joining the worker processes blocks; keep it off the event loop
+    await asyncio.to_thread(shutdown_password_hash_pool)
     logger.info("API shutdown complete")
 
 
@@ -235,7 +253,7 @@ def create_app() -> FastAPI:
     This factory function:
     1. Creates the FastAPI app with appropriate settings
     2. Configures CORS middleware
-    3. Adds request ID middleware for tracing
+    3. Adds the request context middleware (request ID, timing) for tracing
     4. Sets up exception handlers for consistent error responses
     5. Registers health check endpoint
     6. Includes API routers (when implemented)
@@ -275,10 +293,11 @@ def create_app() -> FastAPI:
     # =========================================================================
     # Note: Middleware is executed in REVERSE order of addition.
     # First added = last to process request, first to process response.
-    # Order below: RequestID -> CORS -> GZip -> SecurityHeaders
-    
-    # Request ID middleware (must be added first to ensure ID is available)
-    app.add_middleware(RequestIDMiddleware)
+    # Order below (outermost first):
+    #   RequestContext -> Prometheus -> SecurityHeaders -> RateLimit -> Compression -> CORS
+    # Every layer is pure ASGI: responses stream through unbuffered, and
+    # the request ID, decoded token and start time live on one shared
+    # RequestContext instead of being recomputed per layer.
     
     # CORS middleware
     app.add_middleware(
@@ -290,19 +309,23 @@ def create_app() -> FastAPI:
         expose_headers=["X-Request-ID"],
     )
     
-    # GZip compression for responses larger than 1000 bytes
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Gzip for responses larger than 1000 bytes; SSE and other streams are never compressed
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
     
     # Global API rate limiting (tier-based)
     app.add_middleware(APIRateLimitMiddleware)
     
-    # Security headers middleware (added last so headers are on final response)
+    # Security headers middleware (outside rate limiting so 429s carry them too)
     app.add_middleware(SecurityHeadersMiddleware)
     
     # Prometheus metrics middleware (collects HTTP request metrics)
     if METRICS_ENABLED:
         app.add_middleware(PrometheusMiddleware)
     
+    # Request context (added last so it is outermost: every response,
+    # including 429s, carries X-Request-ID and timing covers the whole stack)
+    app.add_middleware(RequestContextMiddleware)
+    
     # =========================================================================
     # Exception Handlers
     # =========================================================================
@@ -312,6 +335,7 @@ def create_app() -> FastAPI:
     app.add_exception_handler(Exception, generic_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
+    app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
     
     # =========================================================================
     # Health Check Endpoint
@@ -337,6 +361,7 @@ def create_app() -> FastAPI:
                 - services: Health status of dependent services (Redis)
         """
         from backend.database.redis_client import get_resilient_redis_client
+        from backend.database.redis_pool import get_redis_manager
         
         # Check Redis health
         redis_client = get_resilient_redis_client()
@@ -356,6 +381,7 @@ def create_app() -> FastAPI:
                     "latency_ms": redis_health.latency_ms,
                     "circuit_state": redis_health.circuit_state.value,
                     "error": redis_health.error,
+                    "pools": get_redis_manager().stats(),
                 }
             }
         }
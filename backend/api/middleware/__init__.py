@@ -5,6 +5,8 @@ This package contains FastAPI middleware and dependencies for:
 - Authentication (JWT token validation)
 - Authorization (tier-based access control)
 - Security headers (CSP, HSTS, etc.)
+- Per-request context (request ID, decoded principal, timing)
+- Response compression (streams excluded)
 """
 
 from backend.api.middleware.auth import (
@@ -13,6 +15,12 @@ from backend.api.middleware.auth import (
     require_tier,
     TIER_HIERARCHY,
 )
+from backend.api.middleware.compression import CompressionMiddleware
+from backend.api.middleware.request_context import (
+    RequestContext,
+    RequestContextMiddleware,
+    get_request_context,
+)
 from backend.api.middleware.security_headers import SecurityHeadersMiddleware
 
 __all__ = [
@@ -21,4 +29,8 @@ __all__ = [
     "require_tier",
     "TIER_HIERARCHY",
     "SecurityHeadersMiddleware",
+    "CompressionMiddleware",
+    "RequestContext",
+    "RequestContextMiddleware",
+    "get_request_context",
 ]
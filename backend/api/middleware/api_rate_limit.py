@@ -20,12 +20,13 @@ Headers added:
 """
 
 import logging
-from typing import Callable, Optional
+from typing import Optional
 
 import jwt
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.api.middleware.rate_limit import (
     API_RATE_LIMITS,
@@ -34,6 +35,9 @@ from backend.api.middleware.rate_limit import (
     get_client_ip,
     get_rate_limit_store,
 )
+from backend.api.middleware.auth import verify_access_token
+from backend.api.middleware.request_context import resolve_principal
+from backend.services.exceptions import TokenExpiredError, TokenInvalidError
 from api.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -61,9 +65,22 @@ def _decode_jwt_for_rate_limit(token: str) -> Optional[dict]:
     """
     Decode JWT token to extract user_id and tier for rate limiting.
     
-    This is a lightweight decode that doesn't validate expiration strictly
-    since we just need the user identity for rate limiting purposes.
+    Valid access tokens go through verify_access_token, so the verified
+    payload is cached and handed on to get_current_user instead of being
+    decoded again. Anything else (e.g. an expired token) falls back to a
+    lightweight decode that doesn't validate expiration, since we just
+    need the user identity for rate limiting purposes.
     """
+    try:
+        principal = verify_access_token(token)
+        return {
+            "user_id": principal.sub,
+            "tier": principal.tier or "free",
+            "principal": principal,
+        }
+    except (TokenExpiredError, TokenInvalidError, ValueError):
+        pass
+    
     try:
         settings = get_settings()
         # Decode without full validation - we just need user_id and tier
@@ -84,7 +101,7 @@ def _decode_jwt_for_rate_limit(token: str) -> Optional[dict]:
         return None
 
 
-class APIRateLimitMiddleware(BaseHTTPMiddleware):
+class APIRateLimitMiddleware:
     """
     Middleware that applies global API rate limiting.
     
@@ -93,53 +110,47 @@ class APIRateLimitMiddleware(BaseHTTPMiddleware):
     - free: 60/min (free tier users)
     - pro: 120/min (pro tier users)
     - studio: 300/min (studio tier users)
+    
+    Pure ASGI: the response body is never buffered, and the decoded token
+    is shared with other layers through the request context.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and apply rate limiting."""
-        # Skip if rate limiting is disabled
-        if not RATE_LIMITING_ENABLED:
-            return await call_next(request)
+        # Skip non-HTTP traffic, or everything if rate limiting is disabled
+        if scope["type"] != "http" or not RATE_LIMITING_ENABLED:
+            await self.app(scope, receive, send)
+            return
         
         # Skip OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        
-        # Skip excluded paths
-        path = request.url.path
-        if path in EXCLUDED_PATHS or any(path.startswith(p) for p in EXCLUDED_PATHS):
-            return await call_next(request)
-        
-        # Only rate limit API paths
-        if not path.startswith("/api/"):
-            return await call_next(request)
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
         
-        # Extract user info from request (set by auth middleware)
-        user_id: Optional[str] = None
-        tier: str = "anonymous"
+        # Skip excluded paths and anything outside the API
+        path = scope["path"]
+        if (
+            path in EXCLUDED_PATHS
+            or any(path.startswith(p) for p in EXCLUDED_PATHS)
+            or not path.startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
         
-        # Try to get user info from request state (set by auth dependency)
-        if hasattr(request.state, "user"):
-            user = request.state.user
-            user_id = getattr(user, "sub", None)
-            tier = getattr(user, "tier", "free")
-        
-        # If no user in state, try to decode JWT from Authorization header
-        if not user_id:
-            auth_header = request.headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                token = auth_header[7:]  # Remove "Bearer " prefix
-                jwt_data = _decode_jwt_for_rate_limit(token)
-                if jwt_data and jwt_data.get("user_id"):
-                    user_id = jwt_data["user_id"]
-                    tier = jwt_data.get("tier", "free")
+        # User info from the shared request context (token decoded once)
+        ctx = resolve_principal(scope, _decode_jwt_for_rate_limit)
+        user_id: Optional[str] = ctx.user_id
+        tier: str = ctx.tier or "anonymous"
         
         # Determine rate limit key
         if user_id:
             key = f"api:user:{user_id}"
             max_attempts = API_RATE_LIMITS.get(tier, API_RATE_LIMITS["free"])
         else:
-            client_ip = get_client_ip(request)
+            client_ip = get_client_ip(Request(scope))
             key = f"api:ip:{client_ip}"
             max_attempts = API_RATE_LIMITS["anonymous"]
         
@@ -159,7 +170,7 @@ class APIRateLimitMiddleware(BaseHTTPMiddleware):
                 f"API rate limit exceeded: key={key}, tier={tier}, "
                 f"limit={max_attempts}, retry_after={retry_after}"
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": {
@@ -179,16 +190,19 @@ class APIRateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(API_RATE_WINDOW_SECONDS),
                 }
             )
+            await response(scope, receive, send)
+            return
         
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(max_attempts)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, remaining - 1))
-        response.headers["X-RateLimit-Reset"] = str(API_RATE_WINDOW_SECONDS)
+        # Add rate limit headers as the response starts
+        async def send_with_rate_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(max_attempts)
+                headers["X-RateLimit-Remaining"] = str(max(0, remaining - 1))
+                headers["X-RateLimit-Reset"] = str(API_RATE_WINDOW_SECONDS)
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_rate_headers)
 
 
 __all__ = ["APIRateLimitMiddleware"]
@@ -22,18 +22,22 @@ Headers added:
 """
 
 import logging
-from typing import Callable, Optional
+from typing import Optional
 
 import jwt
-from fastapi import Request, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.services.rate_limit import (
     get_rate_limit_service,
     get_client_ip,
     RATE_LIMITING_ENABLED,
 )
+from backend.api.middleware.auth import verify_access_token
+from backend.api.middleware.request_context import resolve_principal
+from backend.services.exceptions import TokenExpiredError, TokenInvalidError
 from api.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -62,9 +66,22 @@ def _decode_jwt_for_rate_limit(token: str) -> Optional[dict]:
     """
     Decode JWT token to extract user_id and tier for rate limiting.
     
-    This is a lightweight decode that doesn't validate expiration strictly
-    since we just need the user identity for rate limiting purposes.
+    Valid access tokens go through verify_access_token, so the verified
+    payload is cached and handed on to get_current_user instead of being
+    decoded again. Anything else (e.g. an expired token) falls back to a
+    lightweight decode that doesn't validate expiration, since we just
+    need the user identity for rate limiting purposes.
     """
+    try:
+        principal = verify_access_token(token)
+        return {
+            "user_id": principal.sub,
+            "tier": principal.tier or "free",
+            "principal": principal,
+        }
+    except (TokenExpiredError, TokenInvalidError, ValueError):
+        pass
+    
     try:
         settings = get_settings()
         payload = jwt.decode(
@@ -84,57 +101,51 @@ def _decode_jwt_for_rate_limit(token: str) -> Optional[dict]:
         return None
 
 
-class APIRateLimitMiddlewareV2(BaseHTTPMiddleware):
+class APIRateLimitMiddlewareV2:
     """
     Middleware that applies global API rate limiting using unified service.
     
     Rate limits are tier-based and configured in backend/services/rate_limit/config.py
+    
+    Pure ASGI: the response body is never buffered, and the decoded token
+    is shared with other layers through the request context.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and apply rate limiting."""
-        # Skip if rate limiting is disabled
-        if not RATE_LIMITING_ENABLED:
-            return await call_next(request)
+        # Skip non-HTTP traffic, or everything if rate limiting is disabled
+        if scope["type"] != "http" or not RATE_LIMITING_ENABLED:
+            await self.app(scope, receive, send)
+            return
         
         # Skip OPTIONS requests (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        
-        # Skip excluded paths
-        path = request.url.path
-        if path in EXCLUDED_PATHS or any(path.startswith(p) for p in EXCLUDED_PATHS):
-            return await call_next(request)
-        
-        # Only rate limit API paths
-        if not path.startswith("/api/"):
-            return await call_next(request)
+        if scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
         
-        # Extract user info from request
-        user_id: Optional[str] = None
-        tier: str = "free"
+        # Skip excluded paths and anything outside the API
+        path = scope["path"]
+        if (
+            path in EXCLUDED_PATHS
+            or any(path.startswith(p) for p in EXCLUDED_PATHS)
+            or not path.startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
         
-        # Try to get user info from request state (set by auth dependency)
-        if hasattr(request.state, "user"):
-            user = request.state.user
-            user_id = getattr(user, "sub", None)
-            tier = getattr(user, "tier", "free")
-        
-        # If no user in state, try to decode JWT from Authorization header
-        if not user_id:
-            auth_header = request.headers.get("Authorization", "")
-            if auth_header.startswith("Bearer "):
-                token = auth_header[7:]
-                jwt_data = _decode_jwt_for_rate_limit(token)
-                if jwt_data and jwt_data.get("user_id"):
-                    user_id = jwt_data["user_id"]
-                    tier = jwt_data.get("tier", "free")
+        # User info from the shared request context (token decoded once)
+        ctx = resolve_principal(scope, _decode_jwt_for_rate_limit)
+        user_id: Optional[str] = ctx.user_id
+        tier: str = ctx.tier or "free"
         
         # Determine identifier (user_id or IP)
         if user_id:
             identifier = user_id
         else:
-            identifier = get_client_ip(request)
+            identifier = get_client_ip(Request(scope))
             tier = "free"  # Anonymous uses free tier limits
         
         # Check rate limit using unified service
@@ -146,7 +157,7 @@ class APIRateLimitMiddlewareV2(BaseHTTPMiddleware):
                 f"API rate limit exceeded: identifier={identifier[:20]}..., tier={tier}, "
                 f"limit={result.limit}, retry_after={result.retry_after}"
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "error": {
@@ -167,19 +178,22 @@ class APIRateLimitMiddlewareV2(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(result.retry_after or 60),
                 }
             )
+            await response(scope, receive, send)
+            return
         
         # Increment the counter
         await service.increment("api_requests", identifier)
         
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(result.limit)
-        response.headers["X-RateLimit-Remaining"] = str(max(0, result.remaining - 1))
-        response.headers["X-RateLimit-Reset"] = "60"
+        # Add rate limit headers as the response starts
+        async def send_with_rate_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(result.limit)
+                headers["X-RateLimit-Remaining"] = str(max(0, result.remaining - 1))
+                headers["X-RateLimit-Reset"] = "60"
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_rate_headers)
 
 
 __all__ = ["APIRateLimitMiddlewareV2"]
@@ -18,13 +18,15 @@ CSRF Protection:
 
 import os
 import secrets
-from typing import Annotated, Optional
+import time
+from typing import Annotated, Any, Optional
 
 from fastapi import Cookie, Depends, Header, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from backend.api.config import get_settings, Settings
-from backend.services.jwt_service import JWTService, TokenPayload
+from backend.api.middleware.request_context import get_request_context
+from backend.services.jwt_service import JWTService, TokenPayload, get_verified_token_cache
 from backend.services.exceptions import TokenExpiredError, TokenInvalidError
 
 
@@ -64,13 +66,50 @@ bearer_scheme = HTTPBearer(auto_error=False)
 
 
 def _get_jwt_service(settings: Settings) -> JWTService:
-    """Create JWT service from settings."""
+    """Create JWT service from settings, backed by the verified token cache."""
     return JWTService(
         secret_key=settings.JWT_SECRET_KEY,
         algorithm=settings.JWT_ALGORITHM,
+        token_cache=get_verified_token_cache(),
     )
 
 
+def verify_access_token(token: str, request: Optional[Any] = None) -> TokenPayload:
+    """
+    Verify an access token at most once per request.
+    
+    The verified payload is kept on the request context, so the rate
+    limiter and the auth dependencies share one verification. Across
+    requests, repeat tokens are served from the verified token cache.
+    
+    Args:
+        token: JWT access token string
+        request: Request or ASGI scope to share the result with (optional)
+        
+    Returns:
+        TokenPayload: Decoded and verified token payload
+        
+    Raises:
+        TokenExpiredError: If the token has expired
+        TokenInvalidError: If the token is invalid
+    """
+    ctx = get_request_context(request) if request is not None else None
+    if (
+        ctx is not None
+        and ctx.principal is not None
+        and ctx.token == token
+        and ctx.principal.exp > time.time()
+    ):
+        return ctx.principal
+    
+    payload = _get_jwt_service(get_settings()).decode_access_token(token)
+    
+    if ctx is not None:
+        ctx.principal = payload
+        ctx.token = token
+    return payload
+
+
 def _extract_token(
     credentials: Optional[HTTPAuthorizationCredentials],
     access_token_cookie: Optional[str],
@@ -131,8 +170,6 @@ async def get_current_user(
             return {"user_id": current_user.sub, "email": current_user.email}
         ```
     """
-    settings = get_settings()
-    
     # Extract token from header or cookie
     token = _extract_token(credentials, access_token)
     
@@ -148,12 +185,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Validate and decode token
-    jwt_service = _get_jwt_service(settings)
-    
+    # Validate and decode token (shared with the rate limiter)
     try:
-        payload = jwt_service.decode_access_token(token)
-        return payload
+        return verify_access_token(token, request)
     except TokenExpiredError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -199,20 +233,15 @@ async def get_current_user_optional(
             return {"message": "Hello, anonymous user!"}
         ```
     """
-    settings = get_settings()
-    
     # Extract token from header or cookie
     token = _extract_token(credentials, access_token)
     
     if token is None:
         return None
     
-    # Try to validate and decode token
-    jwt_service = _get_jwt_service(settings)
-    
+    # Try to validate and decode token (shared with the rate limiter)
     try:
-        payload = jwt_service.decode_access_token(token)
-        return payload
+        return verify_access_token(token, request)
     except (TokenExpiredError, TokenInvalidError):
         # Token is invalid or expired, treat as unauthenticated
         return None
@@ -280,6 +309,7 @@ __all__ = [
     "get_current_user_optional",
     "CurrentUserDep",
     "CurrentUserOptionalDep",
+    "verify_access_token",
     "require_tier",
     "TIER_HIERARCHY",
     # CSRF Protection
@@ -0,0 +1,157 @@
+"""
+Response Compression Middleware for Aurastream.
+
+Pure-ASGI gzip compression that never touches streaming responses.
+
+Server-Sent Events and NDJSON streams are passed through untouched: a
+compressor buffers output until it has enough to emit a block, which
+would hold SSE events back from the client. Already-compressed media is
+skipped as well, since gzip only costs CPU there.
+
+Starlette's GZipMiddleware only learned to exclude event streams in
+recent releases; doing the check here keeps the behaviour independent of
+the installed Starlette version.
+"""
+
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content types that are streamed or already compressed (prefix match)
+EXCLUDED_CONTENT_TYPES: Tuple[str, ...] = (
+    "text/event-stream",
+    "application/x-ndjson",
+    "image/png",
+    "image/jpeg",
+    "image/webp",
+    "image/gif",
+    "video/",
+    "audio/",
+    "application/zip",
+    "application/gzip",
+)
+
+
+class CompressionMiddleware:
+    """
+    Gzip responses at least `minimum_size` bytes long.
+
+    Skips requests that do not accept gzip, responses that already carry
+    a Content-Encoding, and any excluded content type.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 6,
+        exclude_content_types: Tuple[str, ...] = EXCLUDED_CONTENT_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.exclude_content_types = exclude_content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        responder = _GZipResponder(
+            send, self.minimum_size, self.compresslevel, self.exclude_content_types
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _GZipResponder:
+    """Per-response state: holds the start message until the first body chunk."""
+
+    def __init__(
+        self,
+        send: Send,
+        minimum_size: int,
+        compresslevel: int,
+        exclude_content_types: Tuple[str, ...],
+    ) -> None:
+        self._send = send
+        self._minimum_size = minimum_size
+        self._compresslevel = compresslevel
+        self._exclude = exclude_content_types
+        self._start: Optional[Message] = None
+        self._passthrough = False
+        self._compressor: Optional["zlib._Compress"] = None
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            if "content-encoding" in headers or content_type.startswith(self._exclude):
+                self._passthrough = True
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message_type != "http.response.body":
+            # Extension messages (e.g. pathsend): release the response as-is
+            await self._flush_start()
+            self._passthrough = True
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor is None:
+            if not more_body and len(body) < self._minimum_size:
+                await self._flush_start()
+                self._passthrough = True
+                await self._send(message)
+                return
+
+            self._compressor = zlib.compressobj(
+                self._compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+            compressed = self._compressor.compress(body)
+            if not more_body:
+                compressed += self._compressor.flush()
+
+            headers = MutableHeaders(scope=self._start)
+            headers["Content-Encoding"] = "gzip"
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            await self._flush_start()
+            await self._send({
+                "type": "http.response.body", "body": compressed, "more_body": more_body,
+            })
+            return
+
+        compressed = self._compressor.compress(body)
+        if not more_body:
+            compressed += self._compressor.flush()
+        await self._send({
+            "type": "http.response.body", "body": compressed, "more_body": more_body,
+        })
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            start, self._start = self._start, None
+            await self._send(start)
+
+
+__all__ = ["CompressionMiddleware", "EXCLUDED_CONTENT_TYPES"]
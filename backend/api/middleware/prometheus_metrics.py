@@ -31,12 +31,12 @@ Environment Variables:
 
 import logging
 import os
-import time
-from typing import Callable, Dict, Optional
+from typing import Dict, Optional
 
-from fastapi import APIRouter, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.routing import Match
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.api.middleware.request_context import get_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -172,69 +172,78 @@ def get_registry() -> MetricsRegistry:
 # =============================================================================
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+class PrometheusMiddleware:
     """
     Middleware that collects HTTP request metrics.
     
     Metrics collected:
     - http_requests_total: Counter of total requests by method, path, status
     - http_request_duration_seconds: Histogram of request latency
-    - http_requests_in_progress: Gauge of currently processing requests
+    - http_requests_in_progress: Gauge of currently processing requests by method
+    
+    Pure ASGI: the status is read from the response start message and the
+    route template from the route the router matched, so no request pays
+    for a second pass over the route table. Latency is measured from when
+    the request entered the middleware stack (the shared request context).
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics."""
-        if not METRICS_ENABLED:
-            return await call_next(request)
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
         
         # Skip metrics endpoint itself
-        if request.url.path == METRICS_PATH:
-            return await call_next(request)
+        if scope["path"] == METRICS_PATH:
+            await self.app(scope, receive, send)
+            return
         
-        # Get route pattern for consistent labeling
-        path = self._get_path_template(request)
-        method = request.method
+        ctx = get_request_context(scope)
+        method = scope["method"]
+        status_code = 500
         
-        # Track in-progress requests
-        labels = {"method": method, "path": path}
-        _registry.inc_gauge("http_requests_in_progress", labels)
+        # The route template is only known once routing ran, so the
+        # in-progress gauge is labelled by method alone
+        progress_labels = {"method": method}
+        _registry.inc_gauge("http_requests_in_progress", progress_labels)
         
-        # Time the request
-        start_time = time.perf_counter()
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
         
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-        except Exception as e:
-            status_code = 500
-            raise
+            await self.app(scope, receive, send_with_status)
         finally:
-            # Record duration
-            duration = time.perf_counter() - start_time
+            duration = ctx.elapsed
+            path = self._get_path_template(scope)
             
             # Update metrics
             request_labels = {"method": method, "path": path, "status": str(status_code)}
             _registry.inc_counter("http_requests_total", request_labels)
             _registry.observe_histogram("http_request_duration_seconds", request_labels, duration)
-            _registry.dec_gauge("http_requests_in_progress", labels)
-        
-        return response
+            _registry.dec_gauge("http_requests_in_progress", progress_labels)
     
-    def _get_path_template(self, request: Request) -> str:
+    @staticmethod
+    def _get_path_template(scope: Scope) -> str:
         """
         Get the route template instead of actual path.
         
         This prevents high cardinality from path parameters.
         E.g., /api/v1/users/123 -> /api/v1/users/{user_id}
         """
-        # Try to match against app routes
-        for route in request.app.routes:
-            match, _ = route.matches(request.scope)
-            if match == Match.FULL:
-                return route.path
+        # The router records the matched route on the scope
+        route = scope.get("route")
+        template = getattr(route, "path", None)
+        if template:
+            return template
         
         # Fallback to actual path (truncated for safety)
-        path = request.url.path
+        path = scope["path"]
         if len(path) > 50:
             path = path[:50] + "..."
         return path
@@ -353,6 +362,92 @@ def track_redis_operation(
     )
 
 
+def track_redis_pool_wait(
+    pool: str,
+    wait_seconds: float,
+    timed_out: bool = False,
+    connection_error: bool = False,
+) -> None:
+    """
+    Track time spent waiting for a connection from a shared Redis pool.
+    
+    Args:
+        pool: Pool purpose (default, intel, sse, etc.)
+        wait_seconds: Time spent acquiring the connection
+        timed_out: Whether the wait for a free pooled connection timed out
+        connection_error: Whether connecting to Redis failed (refused, DNS)
+    """
+    if not METRICS_ENABLED:
+        return
+    
+    labels = {"pool": pool}
+    _registry.observe_histogram("aurastream_redis_pool_wait_seconds", labels, wait_seconds)
+    if timed_out:
+        _registry.inc_counter("aurastream_redis_pool_timeouts_total", labels)
+    if connection_error:
+        _registry.inc_counter("aurastream_redis_pool_connection_errors_total", labels)
+
+
+def track_community_feed_cache(feed: str, outcome: str) -> None:
+    """
+    Track a precomputed community feed lookup.
+    
+    Args:
+        feed: trending or featured
+        outcome: hit, miss (rebuilt on request), bypass (page larger than
+            the cache) or error (Redis unavailable, served live)
+    """
+    if not METRICS_ENABLED:
+        return
+    
+    _registry.inc_counter("aurastream_community_feed_cache_total", {"feed": feed, "outcome": outcome})
+
+
+def track_generation_result_cache(outcome: str, tier: str = "unknown") -> None:
+    """
+    Track a generation result cache lookup for a seeded request.
+    
+    Args:
+        outcome: hit, miss, disabled (tier not enabled) or error (Redis
+            unavailable, generated normally)
+        tier: User's subscription tier
+    """
+    if not METRICS_ENABLED:
+        return
+    
+    _registry.inc_counter("aurastream_generation_result_cache_total", {"outcome": outcome, "tier": tier})
+
+
+def track_password_hash(
+    operation: str,
+    pending: int,
+    wait_seconds: Optional[float] = None,
+    run_seconds: Optional[float] = None,
+    rejected: bool = False,
+) -> None:
+    """
+    Track the dedicated bcrypt pool: queue depth, wait/run time and load shedding.
+    
+    Args:
+        operation: hash or verify
+        pending: Jobs queued or running in the pool
+        wait_seconds: Time the job waited for a worker (on completion)
+        run_seconds: Time spent inside bcrypt (on completion)
+        rejected: Whether the job was shed at the admission limit
+    """
+    if not METRICS_ENABLED:
+        return
+    
+    labels = {"operation": operation}
+    _registry.set_gauge("aurastream_password_hash_queue_depth", {}, pending)
+    if rejected:
+        _registry.inc_counter("aurastream_password_hash_rejected_total", labels)
+    if wait_seconds is not None:
+        _registry.observe_histogram("aurastream_password_hash_wait_seconds", labels, wait_seconds)
+    if run_seconds is not None:
+        _registry.observe_histogram("aurastream_password_hash_run_seconds", labels, run_seconds)
+
+
 def track_worker_job(
     worker: str,
     success: bool,
@@ -26,6 +26,8 @@ from typing import Optional, Tuple
 from fastapi import HTTPException, Request, status
 import redis.asyncio as aioredis
 
+from backend.database.redis_pool import get_async_redis
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,19 +52,14 @@ class RedisRateLimiter:
         Initialize the rate limiter.
         
         Args:
-            redis_client: Async Redis client. If None, creates from REDIS_URL.
+            redis_client: Async Redis client. If None, uses the shared "rate_limit" pool.
         """
         self._redis = redis_client
-        self._redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     
     async def _get_redis(self) -> aioredis.Redis:
-        """Get or create Redis connection."""
+        """Get the Redis connection, defaulting to the shared "rate_limit" pool."""
         if self._redis is None:
-            self._redis = await aioredis.from_url(
-                self._redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-            )
+            self._redis = get_async_redis("rate_limit")
         return self._redis
     
     async def check_and_increment(
@@ -217,10 +214,8 @@ class RedisRateLimiter:
             }
     
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.close()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
 
 
 # =============================================================================
@@ -0,0 +1,178 @@
+"""
+Per-Request Context for Aurastream.
+
+A single RequestContext object is attached to every HTTP request's ASGI
+scope and shared by the pure-ASGI middleware stack, so the request ID,
+the decoded JWT principal and timing are computed once per request
+instead of once per middleware layer.
+
+The context lives in scope["state"], which is the dict behind Starlette's
+request.state. The request ID is also mirrored to request.state.request_id
+so existing handlers keep working unchanged.
+
+Usage:
+    from backend.api.middleware.request_context import get_request_context
+
+    ctx = get_request_context(request)     # a Request or a raw ASGI scope
+    logger.info(f"[{ctx.request_id}] took {ctx.elapsed_ms:.1f} ms")
+
+    ctx = resolve_principal(scope, decode)  # bearer token decoded at most once
+"""
+
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.services.batch_loader import loader_scope
+
+REQUEST_CONTEXT_KEY = "request_context"
+REQUEST_ID_HEADER = "X-Request-ID"
+
+
+@dataclass
+class RequestContext:
+    """
+    State shared by every middleware layer for one HTTP request.
+
+    Attributes:
+        request_id: Client-supplied X-Request-ID or a generated UUID4
+        started_at: time.perf_counter() when the first layer saw the request
+        user_id: JWT subject, once a layer has decoded the token
+        tier: Subscription tier claim from the JWT
+        principal: Verified access-token payload, reused by get_current_user
+        token: The raw token `principal` was verified from
+        principal_resolved: True once the Authorization header has been inspected
+        status_code: Response status, set when the response starts
+    """
+    request_id: str
+    started_at: float
+    user_id: Optional[str] = None
+    tier: Optional[str] = None
+    principal: Optional[Any] = None
+    token: Optional[str] = None
+    principal_resolved: bool = False
+    status_code: Optional[int] = None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the request entered the middleware stack."""
+        return time.perf_counter() - self.started_at
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the request entered the middleware stack."""
+        return self.elapsed * 1000
+
+
+def get_request_context(scope_or_request: Any) -> RequestContext:
+    """
+    Get the request's context, creating it on first access.
+
+    Whichever layer touches the request first creates the context, so
+    the result does not depend on middleware order.
+
+    Args:
+        scope_or_request: An ASGI HTTP scope or a Starlette Request
+
+    Returns:
+        The RequestContext shared by every layer of this request
+    """
+    scope = getattr(scope_or_request, "scope", scope_or_request)
+    state = scope.setdefault("state", {})
+    ctx = state.get(REQUEST_CONTEXT_KEY)
+    if ctx is None:
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        ctx = RequestContext(request_id=request_id, started_at=time.perf_counter())
+        state[REQUEST_CONTEXT_KEY] = ctx
+        state["request_id"] = request_id
+    return ctx
+
+
+def resolve_principal(
+    scope: Scope,
+    decode: Callable[[str], Optional[Dict[str, Any]]],
+) -> RequestContext:
+    """
+    Resolve the request's user ID and tier, decoding the bearer token once.
+
+    Later callers get the cached result from the context, so stacked
+    middleware never decode the same token twice.
+
+    Args:
+        scope: ASGI HTTP scope
+        decode: Token decoder returning {"user_id", "tier"} or None, plus
+            "principal" when the token was fully verified
+
+    Returns:
+        The request context with user_id/tier set when a valid token is present
+    """
+    ctx = get_request_context(scope)
+    if ctx.principal_resolved:
+        return ctx
+    ctx.principal_resolved = True
+
+    # User set on request.state by an auth dependency
+    user = scope["state"].get("user")
+    if user is not None:
+        ctx.user_id = getattr(user, "sub", None)
+        ctx.tier = getattr(user, "tier", "free")
+
+    if not ctx.user_id:
+        auth_header = Headers(scope=scope).get("authorization", "")
+        if auth_header.startswith("Bearer "):
+            token = auth_header[7:]
+            jwt_data = decode(token)
+            if jwt_data and jwt_data.get("user_id"):
+                ctx.user_id = jwt_data["user_id"]
+                ctx.tier = jwt_data.get("tier", "free")
+                if jwt_data.get("principal") is not None:
+                    ctx.principal = jwt_data["principal"]
+                    ctx.token = token
+
+    return ctx
+
+
+class RequestContextMiddleware:
+    """
+    Pure-ASGI middleware that creates the request context and echoes the ID.
+
+    The request ID is:
+    - Taken from the X-Request-ID header or generated as a UUID4
+    - Stored on request.state.request_id for logging and error responses
+    - Returned in the X-Request-ID response header
+    
+    It also opens the request's batch loader scope, so lookups batched by
+    services/batch_loader.py are cached for exactly one request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                ctx.status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = ctx.request_id
+            await send(message)
+
+        with loader_scope():
+            await self.app(scope, receive, send_with_request_id)
+
+
+__all__ = [
+    "REQUEST_CONTEXT_KEY",
+    "RequestContext",
+    "RequestContextMiddleware",
+    "get_request_context",
+    "resolve_principal",
+]
@@ -11,13 +11,43 @@ Adds security headers to all HTTP responses:
 - Permissions-Policy
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+SECURITY_HEADERS = {
+    # Content Security Policy - restrict resource loading
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://js.stripe.com; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https: blob:; "
+        "font-src 'self' data:; "
+        "connect-src 'self' https://api.stripe.com https://*.supabase.co wss://*.supabase.co; "
+        "frame-src https://js.stripe.com https://hooks.stripe.com; "
+        "frame-ancestors 'none';"
+    ),
+    # Prevent clickjacking
+    "X-Frame-Options": "DENY",
+    # Prevent MIME type sniffing
+    "X-Content-Type-Options": "nosniff",
+    # Force HTTPS (1 year, include subdomains, allow preload)
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains; preload",
+    # XSS Protection (legacy browsers)
+    "X-XSS-Protection": "1; mode=block",
+    # Referrer Policy - send origin only for cross-origin
+    "Referrer-Policy": "strict-origin-when-cross-origin",
+    # Permissions Policy - disable unnecessary features
+    "Permissions-Policy": "camera=(), microphone=(), geolocation=(), payment=(self)",
+}
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+# Encoded once; replaces any same-named header the route set
+_SECURITY_HEADER_NAMES = {name.lower().encode("latin-1") for name in SECURITY_HEADERS}
+_RAW_SECURITY_HEADERS = [
+    (name.lower().encode("latin-1"), value.encode("latin-1"))
+    for name, value in SECURITY_HEADERS.items()
+]
+
+
+class SecurityHeadersMiddleware:
     """
     Middleware that adds security headers to all responses.
     
@@ -26,43 +56,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - Clickjacking (X-Frame-Options)
     - MIME sniffing (X-Content-Type-Options)
     - Protocol downgrade (Strict-Transport-Security)
+    
+    Implemented as pure ASGI so streaming responses pass through unbuffered.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-        
-        # Content Security Policy - restrict resource loading
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' 'unsafe-eval' https://js.stripe.com; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https: blob:; "
-            "font-src 'self' data:; "
-            "connect-src 'self' https://api.stripe.com https://*.supabase.co wss://*.supabase.co; "
-            "frame-src https://js.stripe.com https://hooks.stripe.com; "
-            "frame-ancestors 'none';"
-        )
-        
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-        
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        
-        # Force HTTPS (1 year, include subdomains, allow preload)
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains; preload"
-        )
-        
-        # XSS Protection (legacy browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        
-        # Referrer Policy - send origin only for cross-origin
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Permissions Policy - disable unnecessary features
-        response.headers["Permissions-Policy"] = (
-            "camera=(), microphone=(), geolocation=(), payment=(self)"
-        )
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                raw = [
+                    h for h in message.get("headers", [])
+                    if h[0].lower() not in _SECURITY_HEADER_NAMES
+                ]
+                raw.extend(_RAW_SECURITY_HEADERS)
+                message["headers"] = raw
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
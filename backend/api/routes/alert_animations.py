@@ -17,7 +17,6 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from redis import Redis
 from rq import Queue
 
 from backend.api.schemas.alert_animation import (
@@ -43,12 +42,12 @@ from backend.api.schemas.alert_animation import (
 from backend.api.middleware.auth import get_current_user
 from backend.services.jwt_service import TokenPayload
 from backend.database.supabase_client import get_supabase_client
+from backend.database.redis_pool import get_sync_redis
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/alert-animations", tags=["alert-animations"])
 
-REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "https://app.aurastream.io")
 QUEUE_NAME = "alert_animation"
 
@@ -532,7 +531,7 @@ async def remove_background(
     job_id = str(uuid.uuid4())
     
     try:
-        redis_conn = Redis.from_url(REDIS_URL)
+        redis_conn = get_sync_redis("queue")
         queue = Queue(QUEUE_NAME, connection=redis_conn)
         
         queue.enqueue(
@@ -904,7 +903,7 @@ async def generate_depth_map(
     job_id = str(uuid.uuid4())
     
     try:
-        redis_conn = Redis.from_url(REDIS_URL)
+        redis_conn = get_sync_redis("queue")
         queue = Queue(QUEUE_NAME, connection=redis_conn)
         
         queue.enqueue(
@@ -976,7 +975,7 @@ async def export_animation(
         job_id = str(uuid.uuid4())
         
         try:
-            redis_conn = Redis.from_url(REDIS_URL)
+            redis_conn = get_sync_redis("queue")
             queue = Queue(QUEUE_NAME, connection=redis_conn)
             
             config = project.get("animation_config", {})
@@ -168,7 +168,7 @@ async def get_relay_status(
     current_user: TokenPayload = Depends(get_current_user),
 ):
     """
-    Check if an alert has an active relay connection.
+    Check if an alert has an active relay connection on any instance.
     
     Useful for showing connection status in the dashboard.
     """
@@ -189,7 +189,7 @@ async def get_relay_status(
         )
     
     relay = get_alert_relay_service()
-    is_connected = relay.is_connected(str(alert_id))
+    is_connected = await relay.is_connected(str(alert_id))
     
     return {
         "alert_id": str(alert_id),
@@ -204,11 +204,10 @@ async def get_relay_stats(
     """
     Get relay service statistics.
     
-    Returns the number of active connections.
+    Returns this pod's active connections, watched alerts and events
+    dropped from full per-connection buffers.
     Admin/debugging endpoint.
     """
     relay = get_alert_relay_service()
     
-    return {
-        "active_connections": relay.get_connection_count(),
-    }
+    return relay.get_stats()
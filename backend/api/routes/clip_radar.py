@@ -155,7 +155,7 @@ async def get_viral_clips(
     
     try:
         clips = await service.get_viral_clips(limit=limit, game_id=game_id)
-        last_poll = service.get_last_poll_time()
+        last_poll = await service.get_last_poll_time()
         
         # If no viral clips in cache, try fetching fresh clips directly
         if not clips and not last_poll:
@@ -164,7 +164,7 @@ async def get_viral_clips(
             try:
                 await service.poll_clips()
                 clips = await service.get_viral_clips(limit=limit, game_id=game_id)
-                last_poll = service.get_last_poll_time()
+                last_poll = await service.get_last_poll_time()
             except Exception as poll_err:
                 logger.warning(f"Auto-poll failed: {poll_err}")
         
@@ -268,7 +268,7 @@ async def get_radar_status(
     
     Shows last poll time and tracked categories.
     """
-    last_poll = service.get_last_poll_time()
+    last_poll = await service.get_last_poll_time()
     
     return RadarStatusResponse(
         is_active=last_poll is not None,
@@ -353,7 +353,7 @@ async def get_radar_health(
     - no_data: No poll data available
     - error: Error retrieving health status
     """
-    health = service.get_poll_health()
+    health = await service.get_poll_health()
     return RadarHealthResponse(**health)
 
 
@@ -173,6 +173,7 @@ async def generate_from_session(
         media_asset_placements=media_asset_placements,
         canvas_snapshot_url=canvas_snapshot_url,
         canvas_snapshot_description=final_canvas_description,
+        user_tier=tier,
     )
     
     # Increment usage
@@ -292,6 +293,7 @@ async def refine_image(
         asset_type=session.asset_type or "thumbnail",
         custom_prompt=data.refinement,
         parameters=parameters,
+        user_tier=tier,
     )
     
     # Increment usage
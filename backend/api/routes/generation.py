@@ -149,6 +149,10 @@ async def create_generation_job(
                     "use_catchphrase": bc.voice.use_catchphrase,
                 }
         
+        # Seeded requests opt in to the generation result cache
+        if data.seed is not None:
+            parameters["seed"] = data.seed
+        
         # DEBUG: Log canvas snapshot presence
         logger.info(f"[CANVAS DEBUG] /generate request: canvas_snapshot_url={data.canvas_snapshot_url is not None}, canvas_snapshot_description={data.canvas_snapshot_description is not None}")
         if data.canvas_snapshot_url:
@@ -368,44 +372,36 @@ async def refine_job(
     original_parameters = original_job.parameters or {}
     
     # Build conversation history from the original job's generated asset
-    # This enables multi-turn refinement with Gemini (cheaper than re-generating)
+    # This enables multi-turn refinement with Gemini (cheaper than re-generating).
+    # The model turn references the stored image; the worker loads it only
+    # when it calls Gemini, and sends the refinement prompt-only if it is gone.
     conversation_history = []
     try:
-        import base64
-        import httpx
-        
         # Get the asset from the original job
         assets = await service.get_job_assets(current_user.sub, job_id)
         if assets:
             original_asset = assets[0]
             
-            # Download the image to build conversation history
-            async with httpx.AsyncClient() as client:
-                response = await client.get(original_asset.url, timeout=30.0)
-                if response.status_code == 200:
-                    image_data = response.content
-                    image_b64 = base64.b64encode(image_data).decode()
-                    
-                    # Build conversation history in the format expected by nano_banana_client
-                    model_turn = {
-                        "role": "model",
-                        "image_data": image_b64,
-                        "image_mime_type": "image/png",
-                    }
-                    
-                    # Include thought_signature if stored on the asset
-                    # This is required by Gemini for multi-turn image refinements
-                    if hasattr(original_asset, 'thought_signature') and original_asset.thought_signature:
-                        model_turn["thought_signature"] = original_asset.thought_signature
-                    
-                    conversation_history = [
-                        {
-                            "role": "user",
-                            "text": original_prompt,
-                        },
-                        model_turn,
-                    ]
-                    logger.info(f"Built conversation history for refinement: job_id={job_id}, history_turns=2, has_signature={model_turn.get('thought_signature') is not None}")
+            # Build conversation history in the format expected by nano_banana_client
+            model_turn = {
+                "role": "model",
+                "image_url": original_asset.url,
+                "image_mime_type": "image/png",
+            }
+            
+            # Include thought_signature if stored on the asset
+            # This is required by Gemini for multi-turn image refinements
+            if hasattr(original_asset, 'thought_signature') and original_asset.thought_signature:
+                model_turn["thought_signature"] = original_asset.thought_signature
+            
+            conversation_history = [
+                {
+                    "role": "user",
+                    "text": original_prompt,
+                },
+                model_turn,
+            ]
+            logger.info(f"Built conversation history for refinement: job_id={job_id}, history_turns=2, has_signature={model_turn.get('thought_signature') is not None}")
     except Exception as e:
         logger.warning(f"Failed to build conversation history, falling back to prompt-only: {e}")
         conversation_history = []
@@ -431,6 +427,7 @@ async def refine_job(
             asset_type=original_job.asset_type,
             custom_prompt=data.refinement,  # Just the refinement, not the full prompt
             parameters=refined_parameters,
+            user_tier=user_tier,
         )
         
         # Increment appropriate counter
@@ -150,7 +150,7 @@ async def get_worker_states(redis_client) -> Dict[str, Dict[str, Any]]:
         "intel_aggregation_hourly", "intel_aggregation_daily",
         "generation_worker", "twitch_worker", "playbook_worker",
         "analytics_flush_worker", "coach_cleanup_worker", "clip_radar_recap_worker",
-        "sse_guardian",
+        "sse_guardian", "community_feed_refresh",
     ]
     
     for name in worker_names:
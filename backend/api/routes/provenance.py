@@ -257,26 +257,7 @@ async def list_factors(
 ):
     """List all decision factors used in recent insights."""
     service = get_provenance_service()
-    
-    query = ProvenanceQuery(
-        start_time=datetime.now(timezone.utc) - timedelta(hours=hours),
-        page_size=500,
-    )
-    records, _ = service.query(query)
-    
-    factor_counts: Dict[str, Dict[str, Any]] = {}
-    for r in records:
-        for f in r.decision_factors:
-            if f.factor_name not in factor_counts:
-                factor_counts[f.factor_name] = {"name": f.factor_name, "count": 0, "total_contribution": 0}
-            factor_counts[f.factor_name]["count"] += 1
-            factor_counts[f.factor_name]["total_contribution"] += f.contribution
-    
-    factors = list(factor_counts.values())
-    for f in factors:
-        f["avg_contribution"] = f["total_contribution"] / f["count"] if f["count"] > 0 else 0
-    
-    return sorted(factors, key=lambda x: x["count"], reverse=True)
+    return service.list_factors(hours)
 
 
 @router.get("/insight-types")
@@ -537,13 +518,11 @@ async def get_summary(hours: int = Query(24, ge=1, le=168)):
     """Get a quick summary of provenance activity."""
     service = get_provenance_service()
     
-    query = ProvenanceQuery(
+    agg = service.aggregate(ProvenanceQuery(
         start_time=datetime.now(timezone.utc) - timedelta(hours=hours),
-        page_size=1000,
-    )
-    records, total = service.query(query)
+    ))
     
-    if not records:
+    if not agg.total_records:
         return {
             "total_insights": 0,
             "avg_confidence": 0,
@@ -553,20 +532,13 @@ async def get_summary(hours: int = Query(24, ge=1, le=168)):
             "validation_rate": 0,
         }
     
-    # Category counts
-    cat_counts: Dict[str, int] = {}
-    worker_counts: Dict[str, int] = {}
-    for r in records:
-        cat_counts[r.category_key] = cat_counts.get(r.category_key, 0) + 1
-        worker_counts[r.worker_name] = worker_counts.get(r.worker_name, 0) + 1
-    
     return {
-        "total_insights": total,
-        "avg_confidence": sum(r.confidence_score for r in records) / len(records),
-        "avg_quality": sum(r.quality_score for r in records) / len(records),
-        "top_categories": sorted([{"key": k, "count": v} for k, v in cat_counts.items()], key=lambda x: x["count"], reverse=True)[:5],
-        "top_workers": sorted([{"name": k, "count": v} for k, v in worker_counts.items()], key=lambda x: x["count"], reverse=True)[:5],
-        "validation_rate": sum(1 for r in records if r.validation_passed) / len(records),
+        "total_insights": agg.total_records,
+        "avg_confidence": agg.avg_confidence_score,
+        "avg_quality": agg.avg_quality_score,
+        "top_categories": sorted([{"key": k, "count": v} for k, v in agg.records_by_category.items()], key=lambda x: x["count"], reverse=True)[:5],
+        "top_workers": sorted([{"name": k, "count": v} for k, v in agg.records_by_worker.items()], key=lambda x: x["count"], reverse=True)[:5],
+        "validation_rate": agg.validation_pass_rate,
     }
 
 
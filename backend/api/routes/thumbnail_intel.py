@@ -177,6 +177,7 @@ async def trigger_analysis(
                     }
                     for key, insight in results.items()
                 ],
+                "run": service.last_run_report,
             }
     except HTTPException:
         raise
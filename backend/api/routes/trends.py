@@ -1123,7 +1123,7 @@ async def refresh_youtube_games(
     Manually trigger a refresh of game-specific YouTube data.
     
     This will fetch fresh data for all 8 tracked games.
-    Quota cost: ~808 units (101 per game).
+    Quota cost: ~907 units (100 per search + shared stats batches).
     
     Requires authentication.
     """
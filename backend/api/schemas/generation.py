@@ -287,6 +287,12 @@ class GenerateRequest(BaseModel):
         max_length=2000,
         description="Description of canvas snapshot contents for AI context (asset names, positions, annotations).",
     )
+    seed: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=2**31 - 1,
+        description="Optional generation seed. Repeating a seeded request with unchanged inputs may return the cached result instead of a new generation.",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -0,0 +1,78 @@
+-- ============================================================================
+-- Migration 086: Conversation Summaries
+-- AuraStream - Set-based inbox query for direct messages
+-- ============================================================================
+-- The inbox used to issue a last-message query and an exact-count unread
+-- query per conversation. get_conversation_summaries returns both for every
+-- conversation of a user in one round trip.
+
+-- Last message per conversation is an index scan on (conversation_id, created_at)
+CREATE INDEX IF NOT EXISTS idx_messages_conversation_created
+    ON messages(conversation_id, created_at DESC);
+
+-- ============================================================================
+-- get_conversation_summaries
+-- ============================================================================
+-- One row per conversation the user belongs to, newest first, with the other
+-- participant, the last message, and the count of unread messages the other
+-- participant sent.
+
+CREATE OR REPLACE FUNCTION get_conversation_summaries(p_user_id UUID)
+RETURNS TABLE (
+  conversation_id UUID,
+  other_user_id UUID,
+  updated_at TIMESTAMPTZ,
+  last_message_id UUID,
+  last_message_content TEXT,
+  last_message_sender_id UUID,
+  last_message_created_at TIMESTAMPTZ,
+  unread_count BIGINT
+) AS $$
+BEGIN
+  RETURN QUERY
+  WITH user_conversations AS (
+    SELECT
+      c.id,
+      CASE WHEN c.user1_id = p_user_id THEN c.user2_id ELSE c.user1_id END AS other_id,
+      c.updated_at
+    FROM conversations c
+    WHERE c.user1_id = p_user_id OR c.user2_id = p_user_id
+  ),
+  unread AS (
+    SELECT m.conversation_id, COUNT(*)::BIGINT AS unread_count
+    FROM messages m
+    JOIN user_conversations uc ON uc.id = m.conversation_id
+    WHERE m.sender_id = uc.other_id AND m.read_at IS NULL
+    GROUP BY m.conversation_id
+  )
+  SELECT
+    uc.id AS conversation_id,
+    uc.other_id AS other_user_id,
+    uc.updated_at,
+    lm.id AS last_message_id,
+    lm.content AS last_message_content,
+    lm.sender_id AS last_message_sender_id,
+    lm.created_at AS last_message_created_at,
+    COALESCE(u.unread_count, 0)::BIGINT AS unread_count
+  FROM user_conversations uc
+  LEFT JOIN LATERAL (
+    SELECT m.id, m.content, m.sender_id, m.created_at
+    FROM messages m
+    WHERE m.conversation_id = uc.id
+    ORDER BY m.created_at DESC
+    LIMIT 1
+  ) lm ON TRUE
+  LEFT JOIN unread u ON u.conversation_id = uc.id
+  ORDER BY uc.updated_at DESC;
+END;
+$$ LANGUAGE plpgsql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION get_conversation_summaries IS 'Inbox rows (last message + unread count) for every conversation of a user in one query.';
+
+-- ============================================================================
+-- GRANT PERMISSIONS
+-- ============================================================================
+-- Takes an arbitrary user ID, so only the backend (service role) may call it
+
+REVOKE EXECUTE ON FUNCTION get_conversation_summaries FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION get_conversation_summaries TO service_role;
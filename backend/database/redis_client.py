@@ -22,6 +22,8 @@ from typing import Any, Callable, Optional, TypeVar
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis, get_redis_manager
+
 logger = logging.getLogger(__name__)
 
 # Type variable for generic return types
@@ -173,11 +175,13 @@ class ResilientRedisClient:
         Initialize resilient Redis client.
         
         Args:
-            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+            redis_url: Dedicated Redis connection URL (defaults to the shared
+                       connection manager's "default" pool)
             security_mode: STRICT or PERMISSIVE (defaults to REDIS_SECURITY_MODE env var)
             circuit_config: Circuit breaker configuration
         """
-        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._owns_client = redis_url is not None
+        self._redis_url = redis_url or get_redis_manager().redis_url
         self._client: Optional[redis.Redis] = None
         self._circuit_breaker = CircuitBreaker(circuit_config)
         self._last_health_check: Optional[RedisHealthStatus] = None
@@ -208,9 +212,12 @@ class ResilientRedisClient:
         return self._circuit_breaker.state
     
     async def _get_client(self) -> redis.Redis:
-        """Get or create Redis client."""
+        """Get the Redis client (shared pool unless a dedicated URL was given)."""
         if self._client is None:
-            self._client = redis.from_url(self._redis_url, decode_responses=True)
+            if self._owns_client:
+                self._client = redis.from_url(self._redis_url, decode_responses=True)
+            else:
+                self._client = get_async_redis("default")
         return self._client
     
     async def health_check(self) -> RedisHealthStatus:
@@ -411,9 +418,10 @@ class ResilientRedisClient:
         )
     
     async def close(self) -> None:
-        """Close the Redis connection."""
+        """Close the Redis connection (shared pools are closed by the manager)."""
         if self._client is not None:
-            await self._client.aclose()
+            if self._owns_client:
+                await self._client.aclose()
             self._client = None
             logger.info("Redis connection closed")
 
@@ -437,13 +445,12 @@ def get_redis_client() -> redis.Redis:
     This function is maintained for backward compatibility.
     
     Returns:
-        redis.Redis: Async Redis client instance
+        redis.Redis: Async Redis client backed by the shared "default" pool
     """
     global _redis_client
     
     if _redis_client is None:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        _redis_client = redis.from_url(redis_url, decode_responses=True)
+        _redis_client = get_async_redis("default")
     
     return _redis_client
 
@@ -472,13 +479,15 @@ async def close_redis_client() -> None:
     """Close all Redis client connections."""
     global _redis_client, _resilient_client
     
-    if _redis_client is not None:
-        await _redis_client.aclose()
-        _redis_client = None
+    from backend.database.redis_pool import close_redis_manager
+    
+    _redis_client = None
     
     if _resilient_client is not None:
         await _resilient_client.close()
         _resilient_client = None
+    
+    await close_redis_manager()
 
 
 def reset_redis_clients() -> None:
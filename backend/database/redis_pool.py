@@ -0,0 +1,475 @@
+"""
+Shared Redis connection manager for Aurastream.
+
+Every API route, service and worker used to build its own pool with
+``redis.from_url(...)``, so a single pod could hold an unbounded and
+unpredictable number of Redis connections. This module owns one bounded,
+instrumented connection pool per *purpose* and hands out clients that share
+those pools.
+
+Features:
+- Per-purpose pools (``default``, ``intel``, ``intel_payload``, ``sse``,
+  ``coordination``, ``rate_limit``, ``queue``, ``queue_worker``, ``blob``)
+  with independent connection limits
+- Blocking pools: callers wait (up to a timeout) for a free connection
+  instead of opening new ones past the limit
+- Health-checked reuse via ``health_check_interval`` so idle connections
+  are PINGed before being handed out again
+- Pool-wait instrumentation (count, total/max wait, timeouts, connection
+  errors) exported to the Prometheus registry when metrics are enabled
+- Lifecycle owned by the FastAPI lifespan (``startup()`` / ``shutdown()``);
+  workers get the same lazily-initialized manager without extra wiring
+
+Usage:
+    from backend.database.redis_pool import get_async_redis
+
+    redis_client = get_async_redis("intel")
+    await redis_client.get("intel:format:precomputed:fortnite")
+
+Environment Variables:
+    REDIS_URL: Redis connection URL (default: redis://localhost:6379)
+    REDIS_POOL_<PURPOSE>_MAX_CONNECTIONS: Override a pool's connection limit
+    REDIS_POOL_TIMEOUT: Seconds to wait for a free connection (default: 10)
+    REDIS_HEALTH_CHECK_INTERVAL: Seconds between idle health checks (default: 30)
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+DEFAULT_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "10"))
+DEFAULT_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+
+@dataclass(frozen=True)
+class RedisPoolConfig:
+    """Configuration for a single purpose-specific pool."""
+    purpose: str
+    max_connections: int
+    timeout: float = DEFAULT_POOL_TIMEOUT
+    health_check_interval: int = DEFAULT_HEALTH_CHECK_INTERVAL
+    socket_timeout: Optional[float] = 5.0
+    socket_connect_timeout: Optional[float] = 5.0
+    decode_responses: bool = True
+
+
+# Connection budget per pod. The sum of these (async + sync) is the upper
+# bound on Redis connections a single process will ever open.
+DEFAULT_POOL_LIMITS: Dict[str, int] = {
+    "default": 32,       # General API caching and service state
+    "intel": 16,         # Creator Intel analyzers, scoring and routes
+    "intel_payload": 8,  # Pre-serialized intel responses (binary responses)
+    "sse": 16,           # SSE stream registry, completion store, guardian
+    "coordination": 8,   # Distributed locks and circuit breakers
+    "rate_limit": 16,    # Rate limiting (hot path on every request)
+    "queue": 8,          # RQ job enqueueing (binary responses)
+    "queue_worker": 4,   # RQ worker dequeue and heartbeats (binary responses)
+    "blob": 8,           # Content-addressed image blobs (binary responses)
+}
+
+# RQ pickles job payloads, intel payloads may be gzipped and blobs are raw
+# image bytes, so these pools must not decode responses.
+BINARY_POOLS = frozenset({"queue", "queue_worker", "intel_payload", "blob"})
+
+# RQ workers block in BLPOP for up to the dequeue timeout (~405s), far past
+# the default 5s socket timeout, so their reads must not time out.
+SOCKET_TIMEOUT_OVERRIDES: Dict[str, Optional[float]] = {"queue_worker": None}
+
+# Sync pools are only used by the few remaining blocking callers
+# (RQ enqueue paths, provenance, clip radar), so they stay small.
+DEFAULT_SYNC_POOL_LIMIT = 8
+
+
+def _pool_config(purpose: str, default_limit: int) -> RedisPoolConfig:
+    """Build a pool config, applying any env var override for the limit."""
+    env_key = f"REDIS_POOL_{purpose.upper()}_MAX_CONNECTIONS"
+    max_connections = int(os.getenv(env_key, str(default_limit)))
+    config = RedisPoolConfig(
+        purpose=purpose,
+        max_connections=max_connections,
+        decode_responses=purpose not in BINARY_POOLS,
+    )
+    if purpose in SOCKET_TIMEOUT_OVERRIDES:
+        config = replace(config, socket_timeout=SOCKET_TIMEOUT_OVERRIDES[purpose])
+    return config
+
+
+# =============================================================================
+# Pool Instrumentation
+# =============================================================================
+
+@dataclass
+class PoolWaitStats:
+    """Accumulated connection-acquisition statistics for a pool."""
+    acquisitions: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    timeouts: int = 0
+    connection_errors: int = 0
+
+    def record(
+        self,
+        wait_seconds: float,
+        timed_out: bool = False,
+        connection_error: bool = False,
+    ) -> None:
+        self.acquisitions += 1
+        self.total_wait_seconds += wait_seconds
+        if wait_seconds > self.max_wait_seconds:
+            self.max_wait_seconds = wait_seconds
+        if timed_out:
+            self.timeouts += 1
+        if connection_error:
+            self.connection_errors += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        avg = self.total_wait_seconds / self.acquisitions if self.acquisitions else 0.0
+        return {
+            "acquisitions": self.acquisitions,
+            "avg_wait_ms": round(avg * 1000, 3),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            "timeouts": self.timeouts,
+            "connection_errors": self.connection_errors,
+        }
+
+
+def _is_pool_timeout(error: redis.ConnectionError) -> bool:
+    """
+    Whether get_connection gave up waiting for a free pooled connection.
+
+    redis-py raises the same ConnectionError for an exhausted pool as for a
+    refused connection or failed DNS lookup; only the exhaustion case comes
+    from the pool's own wait timing out (asyncio timeout / queue.Empty).
+    """
+    cause = error.__cause__ or error.__context__
+    return isinstance(cause, (asyncio.TimeoutError, queue.Empty))
+
+
+def _observe_pool_wait(
+    purpose: str,
+    wait_seconds: float,
+    timed_out: bool,
+    connection_error: bool,
+) -> None:
+    """Export a pool wait to the Prometheus registry (best effort)."""
+    try:
+        from backend.api.middleware.prometheus_metrics import track_redis_pool_wait
+        track_redis_pool_wait(purpose, wait_seconds, timed_out, connection_error)
+    except Exception:  # pragma: no cover - metrics must never break Redis access
+        pass
+
+
+class InstrumentedBlockingConnectionPool(aioredis.BlockingConnectionPool):
+    """
+    Async blocking pool that records how long callers wait for a connection.
+
+    Workers call ``asyncio.run`` once per cycle, and connections opened on a
+    previous (now closed) event loop cannot be reused. The pool remembers the
+    loop it was last used on and drops its connections when that changes,
+    much like redis-py's sync pools do after a fork.
+    """
+
+    def __init__(self, *args, purpose: str = "default", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.purpose = purpose
+        self.wait_stats = PoolWaitStats()
+        self._bound_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._bound_loop is loop:
+            return
+        if self._bound_loop is not None:
+            logger.debug(f"Redis pool '{self.purpose}' moved to a new event loop, resetting")
+            self.reset()
+            self._condition = asyncio.Condition()
+            self._lock = asyncio.Lock()
+        self._bound_loop = loop
+
+    async def get_connection(self, *args, **kwargs):
+        self._bind_to_running_loop()
+        start = time.perf_counter()
+        timed_out = connection_error = False
+        try:
+            return await super().get_connection(*args, **kwargs)
+        except redis.ConnectionError as e:
+            timed_out = _is_pool_timeout(e)
+            connection_error = not timed_out
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            self.wait_stats.record(wait, timed_out, connection_error)
+            _observe_pool_wait(self.purpose, wait, timed_out, connection_error)
+
+
+class InstrumentedSyncBlockingConnectionPool(redis.BlockingConnectionPool):
+    """Sync counterpart of :class:`InstrumentedBlockingConnectionPool`."""
+
+    def __init__(self, *args, purpose: str = "default", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.purpose = purpose
+        self.wait_stats = PoolWaitStats()
+
+    def get_connection(self, *args, **kwargs):
+        start = time.perf_counter()
+        timed_out = connection_error = False
+        try:
+            return super().get_connection(*args, **kwargs)
+        except redis.ConnectionError as e:
+            timed_out = _is_pool_timeout(e)
+            connection_error = not timed_out
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            self.wait_stats.record(wait, timed_out, connection_error)
+            _observe_pool_wait(f"{self.purpose}_sync", wait, timed_out, connection_error)
+
+
+# =============================================================================
+# Connection Manager
+# =============================================================================
+
+@dataclass
+class RedisConnectionManager:
+    """
+    Owns every Redis connection pool in the process.
+
+    Clients returned by :meth:`client` / :meth:`sync_client` are cached per
+    purpose and share that purpose's bounded pool, so calling them on every
+    request is cheap and never opens connections beyond the configured limit.
+    """
+    redis_url: str = field(
+        default_factory=lambda: os.getenv("REDIS_URL", "redis://localhost:6379")
+    )
+    pool_limits: Dict[str, int] = field(default_factory=lambda: dict(DEFAULT_POOL_LIMITS))
+    sync_pool_limit: int = DEFAULT_SYNC_POOL_LIMIT
+
+    def __post_init__(self) -> None:
+        self._pools: Dict[str, InstrumentedBlockingConnectionPool] = {}
+        self._clients: Dict[str, aioredis.Redis] = {}
+        self._sync_pools: Dict[str, InstrumentedSyncBlockingConnectionPool] = {}
+        self._sync_clients: Dict[str, redis.Redis] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def _config_for(self, purpose: str) -> RedisPoolConfig:
+        if purpose not in self.pool_limits:
+            raise ValueError(
+                f"Unknown Redis pool purpose '{purpose}'. "
+                f"Expected one of: {', '.join(sorted(self.pool_limits))}"
+            )
+        return _pool_config(purpose, self.pool_limits[purpose])
+
+    def client(self, purpose: str = "default") -> aioredis.Redis:
+        """
+        Get the shared async client for a purpose.
+
+        Args:
+            purpose: Pool name (see DEFAULT_POOL_LIMITS)
+
+        Returns:
+            Async Redis client backed by the purpose's bounded pool
+        """
+        existing = self._clients.get(purpose)
+        if existing is not None:
+            return existing
+
+        with self._lock:
+            if purpose not in self._clients:
+                config = self._config_for(purpose)
+                pool = InstrumentedBlockingConnectionPool.from_url(
+                    self.redis_url,
+                    purpose=purpose,
+                    max_connections=config.max_connections,
+                    timeout=config.timeout,
+                    health_check_interval=config.health_check_interval,
+                    socket_timeout=config.socket_timeout,
+                    socket_connect_timeout=config.socket_connect_timeout,
+                    decode_responses=config.decode_responses,
+                )
+                self._pools[purpose] = pool
+                self._clients[purpose] = aioredis.Redis(connection_pool=pool)
+                logger.debug(
+                    f"Created Redis pool '{purpose}' "
+                    f"(max_connections={config.max_connections})"
+                )
+            return self._clients[purpose]
+
+    def sync_client(self, purpose: str = "default") -> redis.Redis:
+        """
+        Get the shared synchronous client for a purpose.
+
+        Only for legacy blocking callers; new code should use :meth:`client`.
+        """
+        existing = self._sync_clients.get(purpose)
+        if existing is not None:
+            return existing
+
+        with self._lock:
+            if purpose not in self._sync_clients:
+                config = self._config_for(purpose)
+                pool = InstrumentedSyncBlockingConnectionPool.from_url(
+                    self.redis_url,
+                    purpose=purpose,
+                    max_connections=min(config.max_connections, self.sync_pool_limit),
+                    timeout=config.timeout,
+                    health_check_interval=config.health_check_interval,
+                    socket_timeout=config.socket_timeout,
+                    socket_connect_timeout=config.socket_connect_timeout,
+                    decode_responses=config.decode_responses,
+                )
+                self._sync_pools[purpose] = pool
+                self._sync_clients[purpose] = redis.Redis(connection_pool=pool)
+            return self._sync_clients[purpose]
+
+    @property
+    def max_total_connections(self) -> int:
+        """Upper bound on connections this manager can open across all pools."""
+        async_total = sum(
+            _pool_config(p, limit).max_connections for p, limit in self.pool_limits.items()
+        )
+        sync_total = sum(
+            min(_pool_config(p, limit).max_connections, self.sync_pool_limit)
+            for p, limit in self.pool_limits.items()
+        )
+        return async_total + sync_total
+
+    async def startup(self) -> None:
+        """
+        Warm the default pool and verify connectivity.
+
+        Connection failures are logged rather than raised so the API can
+        still start in degraded mode (the /health endpoint reports it).
+        """
+        if self._started:
+            return
+        self._started = True
+        try:
+            await self.client("default").ping()
+            logger.info(
+                "Redis connection manager started",
+                extra={
+                    "redis_url": self.redis_url.split("@")[-1],
+                    "max_total_connections": self.max_total_connections,
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Redis unavailable at startup: {e}")
+
+    async def shutdown(self) -> None:
+        """Close every pool owned by the manager."""
+        for purpose, client in list(self._clients.items()):
+            try:
+                await client.aclose()
+                await self._pools[purpose].disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Redis pool '{purpose}': {e}")
+        for purpose, pool in list(self._sync_pools.items()):
+            try:
+                pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing sync Redis pool '{purpose}': {e}")
+
+        self._clients.clear()
+        self._pools.clear()
+        self._sync_clients.clear()
+        self._sync_pools.clear()
+        self._started = False
+        logger.info("Redis connection manager shut down")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Snapshot of pool usage and wait statistics, keyed by pool name."""
+        snapshot: Dict[str, Dict[str, float]] = {}
+        for name, pool in self._pools.items():
+            snapshot[name] = {
+                "max_connections": pool.max_connections,
+                "in_use": len(pool._in_use_connections),
+                "idle": len(pool._available_connections),
+                **pool.wait_stats.to_dict(),
+            }
+        for name, pool in self._sync_pools.items():
+            snapshot[f"{name}_sync"] = {
+                "max_connections": pool.max_connections,
+                "open": len(pool._connections),
+                **pool.wait_stats.to_dict(),
+            }
+        return snapshot
+
+
+# =============================================================================
+# Global Instance
+# =============================================================================
+
+_manager: Optional[RedisConnectionManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_redis_manager() -> RedisConnectionManager:
+    """
+    Get or create the process-wide Redis connection manager.
+
+    The API lifespan calls ``startup()``/``shutdown()`` on this instance;
+    workers and scripts simply use it lazily.
+    """
+    global _manager
+
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = RedisConnectionManager()
+    return _manager
+
+
+def get_async_redis(purpose: str = "default") -> aioredis.Redis:
+    """Get the shared async Redis client for a purpose."""
+    return get_redis_manager().client(purpose)
+
+
+def get_sync_redis(purpose: str = "default") -> redis.Redis:
+    """Get the shared synchronous Redis client for a purpose."""
+    return get_redis_manager().sync_client(purpose)
+
+
+async def close_redis_manager() -> None:
+    """Shut down the global manager and release all pools."""
+    global _manager
+
+    if _manager is not None:
+        await _manager.shutdown()
+        _manager = None
+
+
+def reset_redis_manager() -> None:
+    """Drop the global manager without closing it (for testing)."""
+    global _manager
+    _manager = None
+
+
+__all__ = [
+    "RedisPoolConfig",
+    "PoolWaitStats",
+    "InstrumentedBlockingConnectionPool",
+    "InstrumentedSyncBlockingConnectionPool",
+    "RedisConnectionManager",
+    "DEFAULT_POOL_LIMITS",
+    "get_redis_manager",
+    "get_async_redis",
+    "get_sync_redis",
+    "close_redis_manager",
+    "reset_redis_manager",
+]
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Clip Radar Endpoint Latency Benchmark
+
+Fires concurrent requests at the read-only /clip-radar endpoints of a running
+API and reports throughput and latency percentiles per endpoint. Run it
+before and after a change against the same Redis data set to compare.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_clip_radar.py
+
+    # Heavier load against another host:
+    python scripts/bench_clip_radar.py --base-url http://api:8000 \\
+        --concurrency 100 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+API_PREFIX = "/api/v1/clip-radar"
+
+# Filtered and unfiltered viral reads plus the cheap status/health reads
+ENDPOINTS = {
+    "viral": f"{API_PREFIX}/viral?limit=20",
+    "viral_by_game": f"{API_PREFIX}/viral?limit=20&game_id=509658",
+    "status": f"{API_PREFIX}/status",
+    "health": f"{API_PREFIX}/health",
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def bench_endpoint(
+    client: httpx.AsyncClient,
+    path: str,
+    total_requests: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """
+    Hit one endpoint with a fixed number of requests at a fixed concurrency.
+
+    Args:
+        client: Shared HTTP client
+        path: Endpoint path including query string
+        total_requests: Requests to send
+        concurrency: Requests in flight at once
+
+    Returns:
+        Dict with throughput, error count and latency percentiles (ms)
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = total_requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "max_ms": max(latencies, default=0.0),
+    }
+
+
+async def run(base_url: str, total_requests: int, concurrency: int, warmup: int) -> int:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as client:
+        print(f"Clip Radar benchmark: {base_url} "
+              f"({total_requests} requests/endpoint, concurrency {concurrency})")
+        print(f"{'endpoint':<15} {'rps':>8} {'mean':>8} {'p50':>8} {'p95':>8} "
+              f"{'p99':>8} {'max':>8} {'errors':>7}")
+
+        failed = False
+        for name, path in ENDPOINTS.items():
+            if warmup:
+                await bench_endpoint(client, path, warmup, min(warmup, concurrency))
+            result = await bench_endpoint(client, path, total_requests, concurrency)
+            failed = failed or result["errors"] > 0
+            print(
+                f"{name:<15} {result['rps']:>8.0f} {result['mean_ms']:>7.1f}ms "
+                f"{result['p50_ms']:>6.1f}ms {result['p95_ms']:>6.1f}ms "
+                f"{result['p99_ms']:>6.1f}ms {result['max_ms']:>6.1f}ms {result['errors']:>7}"
+            )
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark /clip-radar endpoint latency")
+    parser.add_argument(
+        "--base-url",
+        default=os.getenv("API_BASE_URL", "http://localhost:8000"),
+        help="API base URL (default: $API_BASE_URL or http://localhost:8000)",
+    )
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent requests")
+    parser.add_argument("--warmup", type=int, default=20, help="Warmup requests per endpoint")
+    args = parser.parse_args()
+
+    return asyncio.run(run(args.base_url, args.requests, args.concurrency, args.warmup))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Depth Engine Benchmark
+
+Compares depth inference throughput and latency between the pre-engine
+path (the Hugging Face depth-estimation pipeline, one image at a time as
+the forked `rq worker` ran it) and the micro-batched DepthEngine on each
+backend, driven by --concurrency threads the way the alert animation
+worker's job threads drive it:
+
+    pipeline        transformers pipeline, sequential (baseline)
+    torch           DepthEngine + PyTorch backend
+    onnx            DepthEngine + ONNX Runtime, fp32
+    onnx-int8       DepthEngine + ONNX Runtime, dynamic int8 quantization
+
+Every engine variant's depth maps are checked against the baseline's
+(Pearson correlation and mean absolute error on the normalized maps), so a
+quantized model that drifts shows up before DEPTH_ONNX_QUANTIZE is turned
+on. Exits non-zero when any variant's worst-case correlation falls below
+--min-similarity. ONNX models are exported on first run.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_depth_engine.py
+
+    python scripts/bench_depth_engine.py --images ./samples --concurrency 4 \\
+        --variants onnx onnx-int8 --min-similarity 0.98
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.alert_animation.depth_engine import (  # noqa: E402
+    DEPTH_MODEL_ID,
+    DEPTH_THREADS,
+    DepthEngine,
+    OnnxDepthBackend,
+    TorchDepthBackend,
+    export_depth_onnx,
+    onnx_model_path,
+)
+
+VARIANTS = ("torch", "onnx", "onnx-int8")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def synthetic_images(count: int, size: int) -> List[Image.Image]:
+    """Gradient backgrounds with overlapping shapes so depth is not flat."""
+    rng = np.random.default_rng(7)
+    images = []
+    for _ in range(count):
+        ramp = np.linspace(0, 255, size, dtype=np.float32)
+        base = np.stack([np.add.outer(ramp, ramp) / 2] * 3, axis=-1) * rng.uniform(0.4, 1.0, 3)
+        image = Image.fromarray(base.astype(np.uint8))
+        draw = ImageDraw.Draw(image)
+        for _ in range(6):
+            x, y = rng.integers(0, size, 2)
+            r = int(rng.integers(size // 12, size // 4))
+            color = tuple(int(c) for c in rng.integers(0, 256, 3))
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=color)
+        images.append(image)
+    return images
+
+
+def load_images(directory: str, count: int) -> List[Image.Image]:
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.lower().endswith((".png", ".jpg", ".jpeg", ".webp"))
+    )[:count]
+    return [Image.open(os.path.join(directory, name)).convert("RGB") for name in names]
+
+
+def load_backend(variant: str):
+    """Load a backend directly (no silent fallback), exporting ONNX if needed."""
+    if variant == "torch":
+        return TorchDepthBackend()
+    quantize = variant == "onnx-int8"
+    path = onnx_model_path(quantize)
+    if not os.path.exists(path):
+        path = export_depth_onnx(quantize=quantize)
+    return OnnxDepthBackend(path, quantized=quantize)
+
+
+_depth_pipeline = None
+
+
+def get_depth_pipeline():
+    """Lazy-load the reference Hugging Face depth-estimation pipeline."""
+    global _depth_pipeline
+    if _depth_pipeline is None:
+        from transformers import pipeline
+
+        _depth_pipeline = pipeline(task="depth-estimation", model=DEPTH_MODEL_ID, device="cpu")
+    return _depth_pipeline
+
+
+def pipeline_depth(image: Image.Image) -> np.ndarray:
+    """The pre-engine inference path, normalized as it was."""
+    depth = np.array(get_depth_pipeline()(image)["depth"]).astype(np.float32)
+    return (depth - depth.min()) / (depth.max() - depth.min() + 1e-8)
+
+
+def run(infer: Callable[[Image.Image], np.ndarray], images: List[Image.Image], concurrency: int):
+    latencies: List[float] = [0.0] * len(images)
+    depths: List[np.ndarray] = [None] * len(images)
+
+    def one(index: int) -> None:
+        started = time.perf_counter()
+        depths[index] = infer(images[index])
+        latencies[index] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(len(images))))
+    return depths, latencies, time.perf_counter() - started
+
+
+def similarity(reference: List[np.ndarray], depths: List[np.ndarray]) -> Dict[str, float]:
+    correlations, errors = [], []
+    for expected, actual in zip(reference, depths):
+        correlations.append(float(np.corrcoef(expected.ravel(), actual.ravel())[0, 1]))
+        errors.append(float(np.abs(expected - actual).mean()))
+    return {"min_corr": min(correlations), "mean_corr": float(np.mean(correlations)), "mae": float(np.mean(errors))}
+
+
+def report(name: str, latencies: List[float], wall: float, extra: str = "") -> None:
+    print(
+        f"{name:<11} {len(latencies) / wall:>8.2f} img/s  "
+        f"p50 {percentile(latencies, 50) * 1000:>7.0f}ms  "
+        f"p95 {percentile(latencies, 95) * 1000:>7.0f}ms  {extra}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", help="Directory of sample images (default: synthetic)")
+    parser.add_argument("--count", type=int, default=16, help="Images per run")
+    parser.add_argument("--size", type=int, default=768, help="Synthetic image size")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent requests to the engine")
+    parser.add_argument("--max-batch", type=int, default=4)
+    parser.add_argument("--window-ms", type=float, default=20)
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=["onnx", "onnx-int8"])
+    parser.add_argument("--min-similarity", type=float, default=0.98, help="Minimum per-image correlation")
+    args = parser.parse_args()
+
+    images = load_images(args.images, args.count) if args.images else synthetic_images(args.count, args.size)
+    print(f"{len(images)} images, concurrency {args.concurrency}, DEPTH_THREADS={DEPTH_THREADS}\n")
+
+    pipeline_depth(images[0])  # load + warm up
+    reference, latencies, wall = run(pipeline_depth, images, 1)
+    report("pipeline", latencies, wall)
+
+    failed = False
+    for variant in args.variants:
+        engine = DepthEngine(load_backend(variant), max_batch=args.max_batch, window_ms=args.window_ms)
+        try:
+            engine.infer(images[0])
+            engine.batches = engine.images = 0
+            depths, latencies, wall = run(engine.infer, images, args.concurrency)
+            batch_size = engine.images / max(engine.batches, 1)
+        finally:
+            engine.close()
+
+        scores = similarity(reference, depths)
+        failed |= scores["min_corr"] < args.min_similarity
+        report(
+            variant, latencies, wall,
+            f"batch {batch_size:.1f}  corr min {scores['min_corr']:.4f} "
+            f"mean {scores['mean_corr']:.4f}  mae {scores['mae']:.4f}",
+        )
+
+    if failed:
+        print(f"\nFAIL: a variant's depth correlation fell below {args.min_similarity}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
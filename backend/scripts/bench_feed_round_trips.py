@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Community/Social Round-Trip Benchmark
+
+Counts PostgREST round trips (and wall time at a simulated per-query
+latency) for the community and social list views that render one row per
+user, post or creator:
+
+    spotlight       CommunityFeedService.get_spotlight_creators
+    feed page       CommunityFeedService.list_posts (author + like enrichment)
+    comments        CommunityEngagementService.list_comments
+    followers       CommunityEngagementService.get_followers
+    friends         SocialService.get_friends_list
+    user search     SocialService.search_users
+
+The services run against an in-memory Supabase stand-in that applies
+eq/in_/order/limit filters and sleeps --latency-ms per query, so the
+counts are what a real page costs. Run it on a tree before the batch
+loaders to get the per-row baseline.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_feed_round_trips.py
+
+    python scripts/bench_feed_round_trips.py --rows 50 --latency-ms 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.community_engagement_service import CommunityEngagementService  # noqa: E402
+from backend.services.community_feed_service import CommunityFeedService  # noqa: E402
+from backend.services.social_service import SocialService  # noqa: E402
+
+NOW = "2026-01-01T00:00:00+00:00"
+
+
+class _Result:
+    def __init__(self, data: Any, count: int):
+        self.data = data
+        self.count = count
+
+
+class _Query:
+    """Chainable query over one table's rows; filters what it understands."""
+
+    def __init__(self, client: "CountingClient", rows: List[dict]):
+        self._client = client
+        self._rows = rows
+        self._limit = None
+        self._single = False
+
+    def _filter(self, predicate: Callable[[dict], bool]) -> "_Query":
+        self._rows = [row for row in self._rows if predicate(row)]
+        return self
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        return self._filter(lambda row: row.get(column) == value)
+
+    def neq(self, column, value):
+        return self._filter(lambda row: row.get(column) != value)
+
+    def in_(self, column, values):
+        wanted = set(values)
+        return self._filter(lambda row: row.get(column) in wanted)
+
+    def is_(self, column, value):
+        return self._filter(lambda row: row.get(column) is None)
+
+    def ilike(self, column, pattern):
+        needle = pattern.strip("%").lower()
+        return self._filter(lambda row: needle in (row.get(column) or "").lower())
+
+    def or_(self, expression):
+        return self  # approximate: callers re-check the pair
+
+    def contains(self, column, values):
+        return self._filter(lambda row: set(values) <= set(row.get(column) or []))
+
+    def order(self, column, desc=False):
+        self._rows = sorted(self._rows, key=lambda row: row.get(column) or "", reverse=desc)
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def range(self, start, end):
+        self._rows = self._rows[start:end + 1]
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def execute(self):
+        self._client.round_trips += 1
+        if self._client.latency:
+            time.sleep(self._client.latency)  # the Supabase client blocks
+        rows = self._rows[:self._limit] if self._limit else self._rows
+        if self._single:
+            return _Result(rows[0] if rows else None, len(rows))
+        return _Result(list(rows), len(self._rows))
+
+
+class CountingClient:
+    """In-memory Supabase stand-in that counts executed queries."""
+
+    def __init__(self, tables: Dict[str, List[dict]], rpcs: Dict[str, List[dict]], latency: float):
+        self.tables = tables
+        self.rpcs = rpcs
+        self.latency = latency
+        self.round_trips = 0
+
+    def table(self, name):
+        return _Query(self, list(self.tables.get(name, [])))
+
+    def rpc(self, name, params=None):
+        return _Query(self, list(self.rpcs.get(name, [])))
+
+
+def build_dataset(rows: int) -> Tuple[Dict[str, List[dict]], Dict[str, List[dict]]]:
+    viewer = "viewer"
+    users = [{"id": f"user-{i}", "display_name": f"Creator {i}", "avatar_url": None,
+              "created_at": NOW} for i in range(rows)]
+    users.append({"id": viewer, "display_name": "Viewer", "avatar_url": None, "created_at": NOW})
+    posts = [{
+        "id": f"post-{i}-{j}", "user_id": f"user-{i}", "asset_id": f"asset-{i}-{j}",
+        "title": "Overlay", "asset_type": "overlay", "asset_url": "https://cdn/x.png",
+        "tags": [], "like_count": j, "comment_count": 0, "view_count": 0, "is_hidden": False,
+        "is_featured": False, "created_at": f"2026-01-01T00:00:{j:02d}+00:00", "updated_at": NOW,
+    } for i in range(rows) for j in range(6)]
+    tables = {
+        "users": users,
+        "community_posts": posts,
+        "community_likes": [{"user_id": viewer, "post_id": f"post-{i}-0"} for i in range(0, rows, 2)],
+        "community_follows": [{"follower_id": f"user-{i}", "following_id": viewer,
+                               "created_at": NOW} for i in range(rows)]
+                             + [{"follower_id": viewer, "following_id": "user-1", "created_at": NOW}],
+        "community_comments": [{"id": f"c-{i}", "post_id": "post-0-0", "user_id": f"user-{i}",
+                                "content": "nice", "is_edited": False, "created_at": NOW,
+                                "updated_at": NOW} for i in range(rows)],
+        "friendships": [{"id": f"f-{i}", "user_id": viewer, "friend_id": f"user-{i}",
+                         "status": "accepted", "created_at": NOW} for i in range(rows)],
+        "blocked_users": [],
+    }
+    rpcs = {"get_spotlight_creators": [{"user_id": f"user-{i}", "follower_count": 1,
+                                        "following_count": 0} for i in range(rows)]}
+    return tables, rpcs
+
+
+async def measure(
+    name: str, client: CountingClient, fn: Callable[[], Awaitable[Any]], rows: Callable[[Any], list],
+) -> None:
+    client.round_trips = 0
+    started = time.perf_counter()
+    result = await fn()
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"{name:>12}: {client.round_trips:4d} round trips  {elapsed:8.1f} ms  ({len(rows(result))} rows)")
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    tables, rpcs = build_dataset(args.rows)
+    client = CountingClient(tables, rpcs, args.latency_ms / 1000)
+    feed = CommunityFeedService(supabase_client=client)
+    engagement = CommunityEngagementService(supabase_client=client)
+    social = SocialService()
+    social._supabase = client
+
+    n = args.rows
+    print(f"Round trips per page: {args.rows} rows, {args.latency_ms:.1f} ms per query")
+    first = lambda result: result[0]  # noqa: E731
+    await measure("spotlight", client, lambda: feed.get_spotlight_creators(limit=n, viewer_id="viewer"), list)
+    await measure("feed page", client, lambda: feed.list_posts(limit=n, sort="recent", viewer_id="viewer"), first)
+    await measure("comments", client, lambda: engagement.list_comments("post-0-0", 1, n, viewer_id="viewer"), first)
+    await measure("followers", client, lambda: engagement.get_followers("viewer", 1, n), first)
+    await measure("friends", client, lambda: social.get_friends_list("viewer"), lambda r: r["friends"])
+    await measure("user search", client, lambda: social.search_users("viewer", "creator", limit=n), lambda r: r["users"])
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Count DB round trips per community/social page")
+    parser.add_argument("--rows", type=int, default=20, help="Creators/posts/users per page")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Simulated latency per query")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
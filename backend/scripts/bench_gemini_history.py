@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Gemini Multi-Turn History Benchmark
+
+Replays an N-turn coach refinement session and measures what the Gemini
+conversation history costs on each turn:
+
+    session     bytes and time for each SessionManager save (json.dumps of
+                the session), after the worker appends a turn and again
+                when the refine route bumps refinements_used
+    job         bytes of the refinement job's parameters (history included)
+    request     time to resolve the history and build the Gemini request body
+
+for two history formats:
+
+    inline      base64 image + thought signature inside every model turn
+                (the format before the history blob store)
+    refs        content-addressed references resolved from the blob store
+                (Redis stand-in with --redis-latency-ms per round trip;
+                the resolving worker starts with a cold LRU)
+
+Peak Python memory for the whole session is tracked with tracemalloc (for
+refs this includes the in-process Redis stand-in's copy of every blob).
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_gemini_history.py
+
+    python scripts/bench_gemini_history.py --turns 10 --image-kb 1500 --redis-latency-ms 1
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.coach.models import CoachSession  # noqa: E402
+from backend.services.gemini_history_store import GeminiHistoryStore  # noqa: E402
+from backend.services.nano_banana_client import NanoBananaClient  # noqa: E402
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class LatencyRedis:
+    """In-memory binary Redis stand-in that sleeps per round trip."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.data: Dict[str, bytes] = {}
+
+    async def set(self, key, value, ex=None, nx=False):
+        await asyncio.sleep(self.latency)
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def expire(self, key, ttl):
+        await asyncio.sleep(self.latency)
+        return key in self.data
+
+    async def mget(self, keys):
+        await asyncio.sleep(self.latency)
+        return [self.data.get(key) for key in keys]
+
+
+async def run_session(mode: str, turns: int, image_kb: int, latency: float) -> Dict[str, List[float]]:
+    client = NanoBananaClient(api_key="benchmark")
+    redis = LatencyRedis(latency)
+    writer = GeminiHistoryStore(redis_client=redis)
+    session = CoachSession(session_id="bench", user_id="user")
+    stats: Dict[str, List[float]] = {
+        "session_bytes": [], "save_ms": [], "job_bytes": [], "request_ms": [],
+    }
+
+    def save() -> None:
+        started = time.perf_counter()
+        data = json.dumps(session.to_dict())
+        stats["save_ms"].append((time.perf_counter() - started) * 1000)
+        stats["session_bytes"].append(len(data))
+
+    for turn in range(turns):
+        image = os.urandom(image_kb * 1024)
+        signature = os.urandom(512)
+
+        # Worker: generation finished, append to the session history
+        session.gemini_history.append({"role": "user", "text": f"prompt {turn}"})
+        if mode == "inline":
+            session.gemini_history.append({
+                "role": "model",
+                "image_data": base64.b64encode(image).decode(),
+                "image_mime_type": "image/png",
+                "thought_signature": base64.b64encode(signature).decode(),
+            })
+        else:
+            session.gemini_history.append(await writer.model_turn(
+                image, image_url=f"https://cdn/{turn}.png", thought_signature=signature,
+            ))
+        save()
+
+        # Refine route: job parameters carry the history; session saved again
+        parameters = {"is_refinement": True, "conversation_history": session.gemini_history}
+        stats["job_bytes"].append(len(json.dumps(parameters)))
+        session.refinements_used += 1
+        save()
+
+        # Worker: the refinement calls Gemini (a fresh process, cold LRU)
+        started = time.perf_counter()
+        history = parameters["conversation_history"]
+        if mode == "refs":
+            history = await GeminiHistoryStore(redis_client=redis).resolve_history(history)
+        contents = client._build_multi_turn_contents(history, "refine", 1280, 720)
+        json.dumps({"contents": contents})
+        stats["request_ms"].append((time.perf_counter() - started) * 1000)
+
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=10, help="Refinement turns in the session")
+    parser.add_argument("--image-kb", type=int, default=1500, help="Generated image size")
+    parser.add_argument("--redis-latency-ms", type=float, default=1.0, help="Simulated Redis round trip")
+    args = parser.parse_args()
+
+    print(f"{args.turns} turns, {args.image_kb} KB images, Redis RTT {args.redis_latency_ms} ms\n")
+    print(f"{'mode':<7} {'session (last)':>15} {'saves total':>12} {'save ms (last)':>15} "
+          f"{'job (last)':>12} {'request p50/p95 ms':>19} {'peak MB':>8}")
+
+    for mode in ("inline", "refs"):
+        tracemalloc.start()
+        stats = asyncio.run(run_session(mode, args.turns, args.image_kb, args.redis_latency_ms / 1000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{mode:<7} {stats['session_bytes'][-1] / 1024:>12.1f} KB "
+            f"{sum(stats['session_bytes']) / 1024 / 1024:>9.1f} MB "
+            f"{stats['save_ms'][-1]:>15.2f} "
+            f"{stats['job_bytes'][-1] / 1024:>9.1f} KB "
+            f"{percentile(stats['request_ms'], 50):>9.1f}/{percentile(stats['request_ms'], 95):<9.1f} "
+            f"{peak / 1024 / 1024:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
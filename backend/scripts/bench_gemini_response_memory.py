@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Gemini Response Peak-Memory Benchmark
+
+Serves a generateContent response with an --image-mb inline image from a
+local aiohttp server. --jobs concurrent requests fetch and decode it in two
+ways:
+
+    json        await response.json() then base64-decode
+                (the path before streaming decode)
+    stream      NanoBananaClient._execute_generation, which decodes the
+                inline image as it streams in (InlineDataDecoder)
+
+Each mode runs in its own subprocess, so the reported peaks do not mix. For
+each mode it reports:
+- tracemalloc peak (Python allocations, including aiohttp's body buffers)
+- max RSS
+- wall time
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_gemini_response_memory.py
+
+    python scripts/bench_gemini_response_memory.py --jobs 8 --image-mb 3
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.nano_banana_client import NanoBananaClient  # noqa: E402
+
+MODES = ("json", "stream")
+
+
+def response_body(image_mb: float) -> bytes:
+    image = os.urandom(int(image_mb * 1024 * 1024))
+    return json.dumps({
+        "candidates": [{"content": {"role": "model", "parts": [
+            {"inlineData": {"mimeType": "image/png", "data": base64.b64encode(image).decode()},
+             "thoughtSignature": base64.b64encode(os.urandom(1024)).decode()},
+        ]}, "finishReason": "STOP"}],
+    }).encode()
+
+
+async def run(mode: str, jobs: int, image_mb: float) -> None:
+    body = response_body(image_mb)
+
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_post("/v1beta/models/{model}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    port = runner.addresses[0][1]
+
+    client = NanoBananaClient(api_key="bench", model="bench")
+    client.BASE_URL = f"http://127.0.0.1:{port}/v1beta"
+    url = f"{client.BASE_URL}/models/bench:generateContent"
+
+    async def one() -> bytes:
+        if mode == "json":
+            session = await client._get_session()
+            async with session.post(url, json={}) as response:
+                data = await response.json()
+            return client._extract_image_data(data)[0]
+        result = await client._execute_generation(prompt="bench", model_name="bench", seed=1, width=64, height=64)
+        return result.image_data
+
+    await one()  # warm up the connection pool
+    # The server's body is setup, not part of what is measured
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    images = await asyncio.gather(*(one() for _ in range(jobs)))
+    wall = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await client.close()
+    await runner.cleanup()
+
+    image_bytes = len(images[0])
+    maxrss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "mode": mode,
+        "peak_mb": (peak - baseline) / 1024 / 1024,
+        "per_job_x_image": (peak - baseline) / jobs / image_bytes,
+        "maxrss_mb": maxrss_kb / 1024,
+        "wall_ms": wall * 1000,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=8, help="Concurrent generation responses")
+    parser.add_argument("--image-mb", type=float, default=2.0, help="Decoded inline image size")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(run(args.mode, args.jobs, args.image_mb))
+        return
+
+    print(f"{args.jobs} concurrent responses, {args.image_mb} MB images\n")
+    print(f"{'mode':<8} {'traced peak':>12} {'per job':>12} {'max RSS':>10} {'wall':>9}")
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--jobs", str(args.jobs), "--image-mb", str(args.image_mb)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:<8} {result['peak_mb']:>9.1f} MB {result['per_job_x_image']:>8.1f}x img "
+            f"{result['maxrss_mb']:>7.0f} MB {result['wall_ms']:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+API Middleware Overhead Benchmark
+
+Builds the real application with create_app(), mounts two benchmark routes
+behind the full middleware stack and drives them in-process through
+httpx's ASGI transport, so the numbers isolate per-request middleware cost
+from network and server overhead:
+
+    /api/v1/_bench/ping  trivial JSON route
+    /api/v1/_bench/sse   short text/event-stream response (--events events)
+
+Both routes live under /api/ so the rate limiter runs; the anonymous limit
+is raised for the run so every request is admitted. Run it on two
+checkouts to compare stacks.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_middleware.py
+
+    python scripts/bench_middleware.py --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+# Admit every benchmark request; must be set before the middleware imports
+os.environ.setdefault("RATE_LIMIT_API_ANON", "1000000000")
+
+import httpx  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+
+from api.main import create_app  # noqa: E402
+
+PING_PATH = "/api/v1/_bench/ping"
+SSE_PATH = "/api/v1/_bench/sse"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def build_app(events: int):
+    """The production app plus the two benchmark routes."""
+    app = create_app()
+
+    @app.get(PING_PATH)
+    async def bench_ping() -> Dict[str, bool]:
+        return {"ok": True}
+
+    @app.get(SSE_PATH)
+    async def bench_sse() -> StreamingResponse:
+        async def stream():
+            for i in range(events):
+                yield f"event: tick\ndata: {{\"n\": {i}, \"pad\": \"{'x' * 200}\"}}\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    # Match the benchmark routes first so route-table scans are not measured
+    routes = app.router.routes
+    routes[:0] = [routes.pop(), routes.pop()]
+    return app
+
+
+async def bench_endpoint(
+    client: httpx.AsyncClient,
+    path: str,
+    total: int,
+    concurrency: int,
+) -> Dict[str, float]:
+    """Issue `total` requests with `concurrency` workers and summarise."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "rps": total / elapsed,
+        "mean": statistics.fmean(latencies),
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "errors": errors,
+    }
+
+
+async def run(args: argparse.Namespace) -> int:
+    # Per-request client logging would dominate the measurement
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    app = build_app(args.events)
+    transport = httpx.ASGITransport(app=app, client=("10.0.0.1", 50000))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up imports, route caches and the rate limit store
+        for path in (PING_PATH, SSE_PATH):
+            await bench_endpoint(client, path, min(200, args.requests), args.concurrency)
+
+        print(f"Middleware benchmark: {args.requests} requests/route, "
+              f"concurrency {args.concurrency}, {args.events} SSE events/response")
+        failed = False
+        for name, path in (("trivial", PING_PATH), ("sse", SSE_PATH)):
+            result = await bench_endpoint(client, path, args.requests, args.concurrency)
+            failed = failed or result["errors"] > 0
+            print(f"{name:>8}: {result['rps']:8.0f} req/s  mean {result['mean']:6.2f} ms  "
+                  f"p50 {result['p50']:6.2f} ms  p99 {result['p99']:6.2f} ms  "
+                  f"errors {result['errors']}")
+
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark API middleware overhead")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--events", type=int, default=20, help="Events per SSE response")
+    args = parser.parse_args()
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
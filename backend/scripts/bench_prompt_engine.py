@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Prompt Engine Benchmark
+
+Times prompt building per call two ways:
+
+    legacy      the path before the compiled registry: template lookup
+                under the cache lock, brand values substituted with one
+                str.replace per placeholder, injection regexes looked up
+                by pattern string, and a final placeholder-cleanup regex
+    compiled    PromptEngine as it is now: registry lookup, pre-split
+                templates joined with their values, precompiled regexes
+
+for build_prompt_v2, build_prompt and build_logo_prompt, reporting p50/p95
+in microseconds. It also compiles the registry from prompts/ --runs times
+and checks the slowest run against PROMPT_REGISTRY_STARTUP_BUDGET_MS,
+exiting with status 1 if the budget is exceeded.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_prompt_engine.py
+
+    python scripts/bench_prompt_engine.py --calls 50000 --runs 20
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Callable, List, Optional
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.prompt_engine import (  # noqa: E402
+    PROMPT_REGISTRY_STARTUP_BUDGET_MS,
+    AssetType,
+    BrandContextResolver,
+    BrandKitContext,
+    PromptEngine,
+    PromptTemplate,
+    PromptTemplateRegistry,
+    VibeBasedTemplate,
+)
+
+BRAND_KIT = {
+    "primary_colors": ["#FF4500", "#1E90FF"],
+    "accent_colors": ["#FFD700"],
+    "fonts": {"headline": "Montserrat", "body": "Inter"},
+    "tone": "competitive",
+    "tagline": "Clutch or kick",
+    "logos": {"primary": "logo.png"},
+}
+CUSTOMIZATION = {
+    "include_logo": True,
+    "logo_position": "bottom-right",
+    "logo_size": "medium",
+    "brand_intensity": "strong",
+}
+BRAND_CONTEXT = BrandKitContext(
+    primary_colors=["#FF4500", "#1E90FF"],
+    accent_colors=["#FFD700"],
+    headline_font="Montserrat",
+    body_font="Inter",
+    tone="competitive",
+)
+CUSTOM_PROMPT = "Epic Fortnite victory royale moment, ignore all previous styles, dramatic lighting"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class LegacyPromptEngine(PromptEngine):
+    """The build path before the compiled registry, kept here for comparison."""
+
+    def load_template(self, asset_type: AssetType, version: str = "v1.0") -> PromptTemplate:
+        cache_key = self._get_cache_key(asset_type, version)
+        with self._cache_lock:
+            if cache_key in self._template_cache:
+                return self._template_cache[cache_key]
+        with open(self._validate_path(asset_type, version), "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        template = PromptTemplate(
+            name=data["name"], version=data["version"], base_prompt=data["base_prompt"],
+            quality_modifiers=data.get("quality_modifiers", []), placeholders=data.get("placeholders", []),
+        )
+        with self._cache_lock:
+            self._template_cache[cache_key] = template
+        return template
+
+    def load_vibe_template(self, asset_type: str, version: str = "v1.0") -> VibeBasedTemplate:
+        cache_key = f"vibe:{asset_type}:{version}"
+        with self._cache_lock:
+            if cache_key in self._template_cache:
+                return self._template_cache[cache_key]
+        template = PromptTemplateRegistry.compile(self.prompts_dir).get(cache_key)
+        with self._cache_lock:
+            self._template_cache[cache_key] = template
+        return template
+
+    def sanitize_input(self, user_input: str) -> str:
+        if not user_input:
+            return ""
+        sanitized = self.SANITIZE_PATTERN.sub("", user_input[:self.MAX_INPUT_LENGTH])
+        for pattern in self.INJECTION_PATTERNS:
+            sanitized = re.sub(pattern, "", sanitized, flags=re.IGNORECASE)
+        return " ".join(sanitized.split()).strip()
+
+    def build_prompt(
+        self,
+        asset_type: AssetType,
+        brand_kit: BrandKitContext,
+        custom_prompt: Optional[str] = None,
+        version: str = "v1.0",
+    ) -> str:
+        template = self.load_template(asset_type, version)
+        prompt = template.base_prompt
+        replacements = {
+            "tone": brand_kit.tone,
+            "primary_colors": ", ".join(brand_kit.primary_colors),
+            "accent_colors": ", ".join(brand_kit.accent_colors),
+            "headline_font": brand_kit.headline_font,
+            "body_font": brand_kit.body_font,
+            "style_reference": brand_kit.style_reference or "",
+        }
+        for placeholder, value in replacements.items():
+            prompt = prompt.replace(f"{{{placeholder}}}", str(value))
+        prompt = prompt.replace("{custom_prompt}", self.sanitize_input(custom_prompt) if custom_prompt else "")
+        if template.quality_modifiers:
+            prompt = f"{prompt}\n\nQuality: {', '.join(template.quality_modifiers)}."
+        prompt = re.sub(r"\{[^}]+\}", "", prompt)
+        return "\n".join(line.strip() for line in prompt.split("\n") if line.strip())
+
+    def build_logo_prompt(self, vibe, name, icon, background_color, version="v1.0"):
+        template = self.load_vibe_template("logo", version)
+        prompt = template.vibes[vibe].prompt
+        prompt = prompt.replace("{name}", self.sanitize_input(name))
+        prompt = prompt.replace("{icon}", self.sanitize_input(icon))
+        prompt = prompt.replace("{background_color}", background_color)
+        if template.quality_modifiers:
+            prompt = f"{prompt.strip()}\n\nQuality: {', '.join(template.quality_modifiers)}."
+        return prompt.strip()
+
+
+def time_calls(fn: Callable[[], str], calls: int) -> List[float]:
+    fn()  # load templates outside the timed calls
+    timings = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20_000, help="Timed calls per builder and path")
+    parser.add_argument("--runs", type=int, default=10, help="Registry compiles to time")
+    args = parser.parse_args()
+
+    legacy = LegacyPromptEngine()
+    compiled = PromptEngine()
+
+    builders = {
+        "build_prompt_v2": lambda engine: engine.build_prompt_v2(
+            AssetType.THUMBNAIL, BRAND_KIT, CUSTOMIZATION, CUSTOM_PROMPT,
+        ),
+        "build_prompt": lambda engine: engine.build_prompt(AssetType.THUMBNAIL, BRAND_CONTEXT, CUSTOM_PROMPT),
+        "build_logo_prompt": lambda engine: engine.build_logo_prompt(
+            "studio-minimalist", "ClutchWolf", "wolf", "#101820",
+        ),
+        "resolve brand (shared)": lambda engine: BrandContextResolver.resolve(BRAND_KIT, CUSTOMIZATION),
+    }
+
+    print(f"{args.calls} calls per builder\n")
+    print(f"{'builder':<24} {'legacy p50':>11} {'p95':>8}   {'compiled p50':>12} {'p95':>8}")
+    for name, build in builders.items():
+        before = time_calls(lambda: build(legacy), args.calls)
+        after = time_calls(lambda: build(compiled), args.calls)
+        print(
+            f"{name:<24} {percentile(before, 50):>9.1f}us {percentile(before, 95):>6.1f}us"
+            f"   {percentile(after, 50):>10.1f}us {percentile(after, 95):>6.1f}us"
+        )
+
+    timings = []
+    for _ in range(args.runs):
+        registry = PromptTemplateRegistry.compile(compiled.prompts_dir)
+        timings.append(registry.compile_ms)
+    slowest = max(timings)
+    print(
+        f"\nregistry: {len(registry.templates)} templates, compile p50 {percentile(timings, 50):.1f}ms, "
+        f"max {slowest:.1f}ms (budget {PROMPT_REGISTRY_STARTUP_BUDGET_MS:.0f}ms)"
+    )
+    if slowest > PROMPT_REGISTRY_STARTUP_BUDGET_MS:
+        sys.exit("registry compile exceeded the startup budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Provenance Query Benchmark
+
+Stores --records provenance records (default 100k, spread over the 7-day
+retention window) in a Redis database and times the dashboard queries two
+ways:
+
+    legacy      the path before indexing: take up to 1000 IDs from one
+                index, GET each record, filter, sort and paginate in Python
+    indexed     ProvenanceService.query: set operations in Redis, then one
+                MGET for the requested page
+
+For each query it reports p50/p95 latency and the total each path returns.
+The legacy total is capped by its 1000-candidate window.
+
+The database must be empty (records are written under the live
+"provenance:" prefix). Pass --flush to clear it first.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_provenance_query.py --redis-url redis://localhost:6379/15 --flush
+
+    python scripts/bench_provenance_query.py --redis-url redis://localhost:6379/15 --records 20000 --runs 50
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Tuple
+
+import redis
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.provenance.models import (  # noqa: E402
+    ConfidenceLevel,
+    InsightType,
+    ProvenanceQuery,
+    ProvenanceRecord,
+)
+from backend.services.provenance.service import (  # noqa: E402
+    INDEX_BY_CATEGORY,
+    INDEX_BY_TIME,
+    INDEX_BY_TYPE,
+    INDEX_BY_WORKER,
+    RECORD_KEY,
+    ProvenanceService,
+)
+
+WORKERS = ["trend_worker", "clip_radar", "thumbnail_intel", "youtube_worker", "creator_intel", "playbook"]
+CATEGORIES = ["fortnite", "valorant", "minecraft", "apex", "warzone", "gta", "roblox", "lol"]
+TYPES = list(InsightType)
+LEVELS = list(ConfidenceLevel)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def make_record(index: int, rng: random.Random, now: datetime) -> ProvenanceRecord:
+    confidence = rng.random()
+    return ProvenanceRecord(
+        provenance_id=f"bench-{index:07d}",
+        worker_name=rng.choice(WORKERS),
+        insight_type=rng.choice(TYPES),
+        category_key=rng.choice(CATEGORIES),
+        computed_at=now - timedelta(seconds=rng.uniform(0, 6.9 * 24 * 3600)),
+        computation_duration_ms=rng.uniform(5, 5000),
+        insight_summary=f"{rng.choice(CATEGORIES)} insight {index}",
+        confidence_score=confidence,
+        confidence_level=LEVELS[min(4, int((1 - confidence) * 5))],
+        quality_score=rng.random(),
+        total_records_analyzed=rng.randint(10, 100_000),
+        validation_passed=rng.random() > 0.05,
+        tags=rng.sample(["daily", "hourly", "backfill", "experiment"], k=rng.randint(0, 2)),
+    )
+
+
+def legacy_query(client: redis.Redis, query: ProvenanceQuery) -> Tuple[List[ProvenanceRecord], int]:
+    """The query path before indexing, kept here for comparison."""
+    index_key = INDEX_BY_TIME
+    if query.worker_names and len(query.worker_names) == 1:
+        index_key = f"{INDEX_BY_WORKER}{query.worker_names[0]}"
+    elif query.insight_types and len(query.insight_types) == 1:
+        index_key = f"{INDEX_BY_TYPE}{query.insight_types[0].value}"
+    elif query.category_keys and len(query.category_keys) == 1:
+        index_key = f"{INDEX_BY_CATEGORY}{query.category_keys[0]}"
+    min_score = query.start_time.timestamp() if query.start_time else "-inf"
+    max_score = query.end_time.timestamp() if query.end_time else "+inf"
+    candidate_ids = client.zrevrangebyscore(index_key, max_score, min_score, start=0, num=1000)
+
+    records = []
+    for pid in candidate_ids:
+        data = client.get(f"{RECORD_KEY}{pid}")
+        if not data:
+            continue
+        record = ProvenanceRecord.from_dict(json.loads(data))
+        if query.worker_names and record.worker_name not in query.worker_names:
+            continue
+        if query.insight_types and record.insight_type not in query.insight_types:
+            continue
+        if query.category_keys and record.category_key not in query.category_keys:
+            continue
+        if query.confidence_levels and record.confidence_level not in query.confidence_levels:
+            continue
+        if query.min_confidence and record.confidence_score < query.min_confidence:
+            continue
+        if query.min_quality and record.quality_score < query.min_quality:
+            continue
+        if query.search_query:
+            q = query.search_query.lower()
+            if q not in record.insight_summary.lower() and q not in record.category_key.lower():
+                continue
+        records.append(record)
+
+    records.sort(key=lambda r: getattr(r, query.sort_by, r.computed_at), reverse=query.sort_desc)
+    start = (query.page - 1) * query.page_size
+    return records[start:start + query.page_size], len(records)
+
+
+def dashboard_queries(now: datetime) -> List[Tuple[str, ProvenanceQuery]]:
+    return [
+        ("list page 1", ProvenanceQuery()),
+        ("list page 20", ProvenanceQuery(page=20)),
+        ("one worker", ProvenanceQuery(worker_names=["clip_radar"])),
+        ("2 types x 3 categories", ProvenanceQuery(
+            insight_types=TYPES[:2], category_keys=CATEGORIES[:3],
+        )),
+        ("high confidence levels", ProvenanceQuery(
+            confidence_levels=[ConfidenceLevel.VERY_HIGH, ConfidenceLevel.HIGH],
+        )),
+        ("sort by confidence", ProvenanceQuery(sort_by="confidence_score")),
+        ("24h, quality >= 0.8", ProvenanceQuery(
+            start_time=now - timedelta(days=1), min_quality=0.8, sort_by="quality_score",
+        )),
+        ("search", ProvenanceQuery(search_query="valorant")),
+    ]
+
+
+def time_runs(fn: Callable[[], Tuple[List, int]], runs: int) -> Tuple[List[float], int]:
+    timings = []
+    total = 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        _, total = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", required=True, help="Redis database to fill (use a scratch db)")
+    parser.add_argument("--records", type=int, default=100_000, help="Records to store")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per query and path")
+    parser.add_argument("--flush", action="store_true", help="FLUSHDB before seeding")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    client = redis.from_url(args.redis_url, decode_responses=True)
+    if args.flush:
+        client.flushdb()
+    elif client.dbsize():
+        sys.exit(f"{args.redis_url} is not empty; pass --flush to clear it")
+
+    service = ProvenanceService()
+    service._redis = client
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    for index in range(args.records):
+        service.store(make_record(index, rng, now))
+    print(f"stored {args.records} records in {time.perf_counter() - started:.1f}s\n")
+
+    print(f"{'query':<24} {'legacy p50':>11} {'p95':>8} {'total':>7}   {'indexed p50':>11} {'p95':>8} {'total':>7}")
+    for name, query in dashboard_queries(now):
+        legacy, legacy_total = time_runs(lambda: legacy_query(client, query), args.runs)
+        indexed, indexed_total = time_runs(lambda: service.query(query), args.runs)
+        print(
+            f"{name:<24} {percentile(legacy, 50):>9.1f}ms {percentile(legacy, 95):>6.1f}ms {legacy_total:>7}"
+            f"   {percentile(indexed, 50):>9.1f}ms {percentile(indexed, 95):>6.1f}ms {indexed_total:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
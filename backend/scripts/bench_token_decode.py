@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Access Token Decode Micro-Benchmark
+
+Compares the per-request cost of authenticating a bearer token:
+
+    two-decode    rate limiter decode (PyJWT) + get_current_user decode (jose),
+                  the cost before the verified token cache
+    cold          one verified decode that populates the cache
+    hot           a repeat token served from the verified token cache
+    expired       rejecting an expired access token
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/bench_token_decode.py
+
+    python scripts/bench_token_decode.py --iterations 50000 --tokens 1000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import jwt as pyjwt  # noqa: E402
+
+from backend.services.exceptions import TokenExpiredError  # noqa: E402
+from backend.services.jwt_service import JWTService, VerifiedTokenCache  # noqa: E402
+
+SECRET = "benchmark-secret-key-that-is-at-least-32-characters-long"
+
+
+def time_per_call(fn: Callable[[int], None], iterations: int, repeats: int = 5) -> List[float]:
+    """Microseconds per call for each of `repeats` runs."""
+    results = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for i in range(iterations):
+            fn(i)
+        results.append((time.perf_counter() - started) / iterations * 1e6)
+    return results
+
+
+def report(name: str, samples: List[float], baseline: float = 0.0) -> float:
+    best = min(samples)
+    speedup = f"  ({baseline / best:5.1f}x)" if baseline else ""
+    print(f"{name:>12}: {best:8.2f} us/request  (median {statistics.median(samples):.2f}){speedup}")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark access token decoding")
+    parser.add_argument("--iterations", type=int, default=20000, help="Decodes per run")
+    parser.add_argument("--tokens", type=int, default=100, help="Distinct hot tokens (clients)")
+    args = parser.parse_args()
+
+    uncached = JWTService(secret_key=SECRET)
+    cache = VerifiedTokenCache(max_size=max(args.tokens, 1))
+    cached = JWTService(secret_key=SECRET, token_cache=cache)
+
+    tokens = [
+        uncached.create_access_token(user_id=f"user-{i}", tier="pro", email=f"u{i}@example.com")
+        for i in range(args.tokens)
+    ]
+    expired = uncached.create_access_token(
+        user_id="user-x", tier="pro", email="x@example.com", expires_delta=timedelta(seconds=-60),
+    )
+
+    def two_decode(i: int) -> None:
+        token = tokens[i % len(tokens)]
+        pyjwt.decode(token, SECRET, algorithms=["HS256"], options={"verify_exp": False})
+        uncached.decode_access_token(token)
+
+    def cold(i: int) -> None:
+        cache.clear()
+        cached.decode_access_token(tokens[i % len(tokens)])
+
+    def hot(i: int) -> None:
+        cached.decode_access_token(tokens[i % len(tokens)])
+
+    def reject_expired(i: int) -> None:
+        try:
+            cached.decode_access_token(expired)
+        except TokenExpiredError:
+            pass
+
+    print(f"Token decode benchmark: {args.iterations} decodes x 5 runs, {args.tokens} hot tokens")
+    baseline = report("two-decode", time_per_call(two_decode, args.iterations))
+    report("cold", time_per_call(cold, args.iterations), baseline)
+    for token in tokens:
+        cached.decode_access_token(token)
+    report("hot", time_per_call(hot, args.iterations), baseline)
+    report("expired", time_per_call(reject_expired, args.iterations))
+    print(f"cache: {len(cache)} entries, {cache.hits} hits, {cache.misses} misses")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
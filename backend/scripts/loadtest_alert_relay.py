@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Alert Relay Load Test
+
+Holds a large number of idle SSE subscribers across one or more simulated
+pods and measures trigger-to-delivery latency through Redis pub/sub.
+
+Each pod is an AlertRelayService with its own node ID and pub/sub
+subscription against the same Redis. Every connection runs the real
+event_generator loop (with a request stub that never disconnects), so
+memory, keepalive wheel cost and fan-out are measured end to end; only
+the HTTP/SSE framing is left out.
+
+Triggers are sent from the first pod, so with --pods > 1 most deliveries
+cross pods.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/loadtest_alert_relay.py --redis-url redis://localhost:6379/0
+
+    # 50k idle connections over 4 pods, 2000 triggers
+    python scripts/loadtest_alert_relay.py --connections 50000 --pods 4 --triggers 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import redis.asyncio as aioredis  # noqa: E402
+
+from backend.services.alert_relay_service import WHEEL_SLOTS, AlertRelayService  # noqa: E402
+
+
+class _IdleRequest:
+    """Request stub for event_generator: the client never disconnects."""
+
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def consume(
+    relay: AlertRelayService,
+    alert_id: str,
+    latencies: List[float],
+    counters: Dict[str, int],
+) -> None:
+    """Run one idle SSE stream, recording trigger latency and pings."""
+    async for message in relay.event_generator(alert_id, _IdleRequest()):
+        data = message["data"]
+        if message["event"] == "ping":
+            counters["pings"] += 1
+            continue
+        sent_at = data.get("payload", {}).get("sent_at")
+        if sent_at is not None:
+            latencies.append((time.perf_counter() - sent_at) * 1000)
+
+
+async def run(args: argparse.Namespace) -> int:
+    client = aioredis.from_url(args.redis_url, decode_responses=True, max_connections=64)
+    await client.ping()
+
+    pods = [
+        AlertRelayService(
+            redis_client=client,
+            node_id=f"loadtest-{i}",
+            keepalive_interval=args.keepalive,
+        )
+        for i in range(args.pods)
+    ]
+    for pod in pods:
+        if not await pod.start():
+            print("Failed to subscribe to the relay channel", file=sys.stderr)
+            return 1
+
+    alert_ids = [f"alert-{i}" for i in range(args.alerts)]
+    latencies: List[float] = []
+    counters = {"pings": 0}
+
+    print(f"Alert relay load test: {args.connections} connections, {args.alerts} alerts, "
+          f"{args.pods} pod(s), {args.triggers} triggers")
+
+    baseline_rss = rss_mb()
+    started = time.perf_counter()
+    tasks = [
+        asyncio.create_task(consume(
+            pods[i % args.pods], alert_ids[i % args.alerts], latencies, counters,
+        ))
+        for i in range(args.connections)
+    ]
+    # Let every stream register before measuring
+    while sum(p.get_connection_count() for p in pods) < args.connections:
+        await asyncio.sleep(0.05)
+    setup = time.perf_counter() - started
+    connected_rss = rss_mb()
+
+    # Let presence heartbeats land so remote alerts are routable
+    for pod in pods:
+        await pod._heartbeat()
+
+    print(f"setup: {setup:.2f}s, peak RSS {connected_rss:.0f} MB "
+          f"(+{(connected_rss - baseline_rss) * 1024 / args.connections:.2f} KB/connection)")
+
+    # Keepalive wheel cost: one full rotation on the first pod
+    tick_times: List[float] = []
+    pinged = 0
+    for _ in range(WHEEL_SLOTS):
+        tick_started = time.perf_counter()
+        pinged += pods[0]._tick()
+        tick_times.append((time.perf_counter() - tick_started) * 1000)
+    print(f"wheel rotation: {pinged} pings, max tick {max(tick_times):.2f} ms, "
+          f"total {sum(tick_times):.2f} ms")
+
+    # Triggers from the first pod at a fixed rate
+    sender = pods[0]
+    interval = 1.0 / args.rate if args.rate else 0.0
+    expected = 0
+    per_alert = max(1, args.connections // args.alerts)
+    trigger_started = time.perf_counter()
+    for _ in range(args.triggers):
+        alert_id = random.choice(alert_ids)
+        if await sender.trigger(alert_id, payload={"sent_at": time.perf_counter()}):
+            expected += per_alert
+        if interval:
+            await asyncio.sleep(interval)
+    trigger_elapsed = time.perf_counter() - trigger_started
+
+    deadline = time.perf_counter() + args.drain_timeout
+    while len(latencies) < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.05)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for pod in pods:
+        await pod.shutdown()
+    await client.aclose()
+
+    dropped = sum(p.get_stats()["dropped_events"] for p in pods)
+    print(f"triggers: {args.triggers} in {trigger_elapsed:.2f}s "
+          f"({args.triggers / trigger_elapsed:.0f}/s), "
+          f"deliveries {len(latencies)}/{expected}, dropped {dropped}, pings {counters['pings']}")
+    if latencies:
+        print(f"trigger-to-delivery: mean {statistics.fmean(latencies):.2f} ms, "
+              f"p50 {percentile(latencies, 50):.2f} ms, p95 {percentile(latencies, 95):.2f} ms, "
+              f"p99 {percentile(latencies, 99):.2f} ms, max {max(latencies):.2f} ms")
+
+    return 0 if len(latencies) >= expected else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the alert relay")
+    parser.add_argument(
+        "--redis-url",
+        default=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+        help="Redis URL (default: $REDIS_URL or redis://localhost:6379/0)",
+    )
+    parser.add_argument("--connections", type=int, default=50000, help="Idle SSE connections")
+    parser.add_argument("--alerts", type=int, default=25000, help="Distinct alert IDs")
+    parser.add_argument("--pods", type=int, default=2, help="Simulated relay pods")
+    parser.add_argument("--triggers", type=int, default=1000, help="Triggers to send")
+    parser.add_argument("--rate", type=float, default=200.0, help="Triggers per second (0 = unthrottled)")
+    parser.add_argument("--keepalive", type=float, default=30.0, help="Keepalive interval seconds")
+    parser.add_argument("--drain-timeout", type=float, default=10.0, help="Seconds to wait for deliveries")
+    args = parser.parse_args()
+
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Login Burst Load Test
+
+Measures how a burst of concurrent logins affects an unrelated endpoint.
+A small FastAPI app is served in-process through httpx's ASGI transport
+with two routes:
+
+    POST /login   verifies a bcrypt hash (cost 12 by default)
+    GET  /ping    trivial JSON response, probed at a steady rate
+
+Each mode fires --logins concurrent logins while /ping is probed on a
+fixed schedule, and reports /ping and /login latency percentiles. Probe
+latency is measured from each probe's scheduled send time, so probes the
+event loop was too busy to send count as slow rather than vanishing
+(coordinated omission):
+
+    inline    PasswordService.verify_password called in the async handler
+              (the behaviour before the password hash pool)
+    pooled    PasswordService.verify_password_async via PasswordHashPool;
+              logins beyond the admission limit are shed with a 503
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/loadtest_password_hashing.py
+
+    python scripts/loadtest_password_hashing.py --logins 64 --workers 2 --max-pending 32
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from api.main import password_hashing_busy_handler  # noqa: E402
+from backend.services.exceptions import PasswordHashingBusyError  # noqa: E402
+from backend.services.password_service import PasswordHashPool, PasswordService  # noqa: E402
+
+PASSWORD = "Burst-Test-Passw0rd!"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def build_app(service: PasswordService, hashed: str, pooled: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
+
+    @app.get("/ping")
+    async def ping() -> Dict[str, bool]:
+        return {"ok": True}
+
+    @app.post("/login")
+    async def login() -> Dict[str, bool]:
+        if pooled:
+            ok = await service.verify_password_async(PASSWORD, hashed)
+        else:
+            ok = service.verify_password(PASSWORD, hashed)
+        return {"ok": ok}
+
+    return app
+
+
+async def run_mode(
+    name: str,
+    app: FastAPI,
+    logins: int,
+    probe_interval: float,
+    burst: bool = True,
+) -> Dict[str, object]:
+    """Fire the login burst while probing /ping; return latency samples."""
+    transport = httpx.ASGITransport(app=app)
+    ping_ms: List[float] = []
+    login_ms: List[float] = []
+    statuses: Dict[int, int] = {}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping")
+        done = asyncio.Event()
+
+        async def probe() -> None:
+            scheduled = time.perf_counter()
+            while True:
+                await client.get("/ping")
+                now = time.perf_counter()
+                # Every slot up to now was due; each one waited until now
+                while scheduled <= now:
+                    ping_ms.append((now - scheduled) * 1000)
+                    scheduled += probe_interval
+                if done.is_set():
+                    return
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+
+        async def one_login() -> None:
+            started = time.perf_counter()
+            response = await client.post("/login")
+            login_ms.append((time.perf_counter() - started) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        if burst:
+            await asyncio.gather(*(one_login() for _ in range(logins)))
+        else:
+            await asyncio.sleep(1.0)
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    return {
+        "name": name, "ping": ping_ms, "login": login_ms,
+        "statuses": statuses, "elapsed": elapsed,
+    }
+
+
+def report(result: Dict[str, object]) -> None:
+    ping, login = result["ping"], result["login"]
+    line = (
+        f"{result['name']:>9}: /ping p50 {percentile(ping, 50):7.1f} ms  p99 {percentile(ping, 99):7.1f} ms"
+        f"  max {max(ping or [0]):7.1f} ms  ({len(ping)} probes)"
+    )
+    if login:
+        statuses = ", ".join(f"{code}x{count}" for code, count in sorted(result["statuses"].items()))
+        line += (
+            f"\n{'':>9}  /login p50 {percentile(login, 50):7.1f} ms  p99 {percentile(login, 99):7.1f} ms"
+            f"  [{statuses}]  burst {result['elapsed']:.2f}s"
+        )
+    print(line)
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    service = PasswordService(cost_factor=args.cost)
+    hashed = service.hash_password(PASSWORD)
+    interval = args.probe_interval_ms / 1000
+
+    pool = PasswordHashPool(workers=args.workers, max_pending=args.max_pending, kind=args.executor)
+    pool.warmup()
+    pooled_service = PasswordService(cost_factor=args.cost, hash_pool=pool)
+
+    print(
+        f"Login burst: {args.logins} concurrent logins, bcrypt cost {args.cost}, "
+        f"pool {args.executor} x{pool.workers}, admission limit {pool.max_pending}"
+    )
+    report(await run_mode("idle", build_app(service, hashed, pooled=False), 0, interval, burst=False))
+    report(await run_mode("inline", build_app(service, hashed, pooled=False), args.logins, interval))
+    report(await run_mode("pooled", build_app(pooled_service, hashed, pooled=True), args.logins, interval))
+    print(f"pool stats: {pool.stats()}")
+    pool.shutdown()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Unrelated endpoint latency under a login burst")
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent logins in the burst")
+    parser.add_argument("--cost", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=2, help="Password hash pool workers")
+    parser.add_argument("--max-pending", type=int, default=16, help="Pool admission limit")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process")
+    parser.add_argument("--probe-interval-ms", type=float, default=5.0, help="Delay between /ping probes")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Gemini Admission Simulation
+
+Runs a burst of generations from several simulated workers against a fake
+Gemini endpoint (a local aiohttp server) that answers 429 whenever more than
+--capacity requests are in flight, and compares:
+
+    baseline    admission off: every client retries on its own schedule
+                (the behaviour before the admission controller)
+    aimd        every call takes a slot from one shared GeminiAdmissionController
+
+The requests use the real NanoBananaClient. The burst mixes paid interactive,
+free interactive and batch priorities. For each mode it reports:
+- completed and failed requests
+- upstream calls and 429s
+- p50/p95 latency per priority
+- wall time and the final AIMD limit
+
+Workers share an in-memory controller by default. Pass --redis-url to share
+one through Redis, as separate processes would.
+
+Usage:
+    cd /var/www/aurastream/backend
+    python scripts/sim_gemini_admission.py
+
+    python scripts/sim_gemini_admission.py --requests 120 --capacity 6 --workers 4 \\
+        --latency-ms 300 --retry-scale 0.25
+"""
+
+import argparse
+import asyncio
+import base64
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.services.gemini_admission import (  # noqa: E402
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PAID,
+    GeminiAdmissionController,
+)
+from backend.services.nano_banana_client import GenerationRequest, NanoBananaClient  # noqa: E402
+
+MODEL = "gemini-sim"
+PRIORITY_MIX = [(PRIORITY_PAID, 0.3), (PRIORITY_INTERACTIVE, 0.3), (PRIORITY_BATCH, 0.4)]
+IMAGE = base64.b64encode(b"\x89PNG sim").decode()
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class FakeGemini:
+    """generateContent endpoint with a hard concurrency capacity."""
+
+    def __init__(self, capacity: int, latency_ms: float):
+        self.capacity = capacity
+        self.latency = latency_ms / 1000
+        self.in_flight = 0
+        self.calls = 0
+        self.rejected = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        if self.in_flight >= self.capacity:
+            self.rejected += 1
+            return web.json_response({"error": {"status": "RESOURCE_EXHAUSTED"}}, status=429,
+                                     headers={"Retry-After": "0"})
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency * random.uniform(0.7, 1.3))
+        finally:
+            self.in_flight -= 1
+        return web.json_response({"candidates": [{"content": {"parts": [{"inlineData": {"data": IMAGE}}]}}]})
+
+    async def start(self) -> web.AppRunner:
+        app = web.Application()
+        app.router.add_post("/v1beta/models/{model}", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner
+
+
+async def run_mode(mode: str, args: argparse.Namespace) -> Dict:
+    gemini = FakeGemini(args.capacity, args.latency_ms)
+    runner = await gemini.start()
+    port = runner.addresses[0][1]
+
+    if mode == "baseline":
+        admission = GeminiAdmissionController(backend="off")
+    elif args.redis_url:
+        import redis.asyncio as redis
+        client = redis.from_url(args.redis_url, decode_responses=True)
+        await client.delete(*[f"gemini:admission:{MODEL}{suffix}" for suffix in ("", ":leases", ":queue", ":seen")])
+        admission = GeminiAdmissionController(redis_client=client, backend="redis", cooldown_ms=args.cooldown_ms)
+    else:
+        admission = GeminiAdmissionController(backend="memory", cooldown_ms=args.cooldown_ms)
+
+    clients = []
+    for _ in range(args.workers):
+        client = NanoBananaClient(api_key="sim", model=MODEL)
+        client.BASE_URL = f"http://127.0.0.1:{port}/v1beta"
+        client.RETRY_DELAYS = [delay * args.retry_scale for delay in NanoBananaClient.RETRY_DELAYS]
+        clients.append(client)
+
+    rng = random.Random(args.seed)
+    priorities = rng.choices([p for p, _ in PRIORITY_MIX], [w for _, w in PRIORITY_MIX], k=args.requests)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    failed: Dict[str, int] = defaultdict(int)
+
+    async def one(index: int, priority: str) -> None:
+        client = clients[index % len(clients)]
+        started = time.perf_counter()
+        try:
+            await client.generate(GenerationRequest(prompt="sim", width=64, height=64, model=MODEL, priority=priority))
+            latencies[priority].append(time.perf_counter() - started)
+        except Exception:
+            failed[priority] += 1
+
+    import backend.services.nano_banana_client as nano_banana_client
+    original = nano_banana_client.get_gemini_admission
+    nano_banana_client.get_gemini_admission = lambda: admission
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i, p) for i, p in enumerate(priorities)))
+    finally:
+        wall = time.perf_counter() - started
+        nano_banana_client.get_gemini_admission = original
+        for client in clients:
+            await client.close()
+        await runner.cleanup()
+
+    return {
+        "latencies": latencies,
+        "failed": failed,
+        "calls": gemini.calls,
+        "rejected": gemini.rejected,
+        "wall": wall,
+        "limit": await admission.get_limit(MODEL) if admission.enabled else None,
+    }
+
+
+def report(mode: str, result: Dict) -> None:
+    done = sum(len(v) for v in result["latencies"].values())
+    failed = sum(result["failed"].values())
+    limit = f"{result['limit']:.1f}" if result["limit"] is not None else "-"
+    print(
+        f"{mode:<9} done {done:>4}  failed {failed:>4}  upstream {result['calls']:>5}  "
+        f"429s {result['rejected']:>5}  wall {result['wall']:>6.1f}s  final limit {limit}"
+    )
+    for priority, _ in PRIORITY_MIX:
+        values = result["latencies"][priority]
+        print(
+            f"  {priority:<12} ok {len(values):>4}  failed {result['failed'][priority]:>4}  "
+            f"p50 {percentile(values, 50):>6.2f}s  p95 {percentile(values, 95):>6.2f}s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=120, help="Requests in the burst")
+    parser.add_argument("--workers", type=int, default=4, help="Simulated worker processes")
+    parser.add_argument("--capacity", type=int, default=6, help="Concurrent calls the fake endpoint accepts")
+    parser.add_argument("--latency-ms", type=float, default=300, help="Mean fake generation latency")
+    parser.add_argument("--retry-scale", type=float, default=0.25, help="Scale for the client's RETRY_DELAYS")
+    parser.add_argument("--cooldown-ms", type=int, help="AIMD decrease cooldown (default: --latency-ms)")
+    parser.add_argument("--redis-url", help="Share the controller through Redis instead of memory")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    # One decrease per round trip; a longer cooldown lets the limit overshoot
+    if args.cooldown_ms is None:
+        args.cooldown_ms = int(args.latency_ms)
+
+    print(
+        f"{args.requests} requests from {args.workers} workers, capacity {args.capacity}, "
+        f"latency {args.latency_ms:.0f}ms\n"
+    )
+    for mode in ("baseline", "aimd"):
+        report(mode, asyncio.run(run_mode(mode, args)))
+
+
+if __name__ == "__main__":
+    main()
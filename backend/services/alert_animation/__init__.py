@@ -29,6 +29,8 @@ from backend.services.alert_animation.animation_engine import (
     AnimationTrack,
     AnimationTimeline,
     DepthParallaxEngine,
+    ParallaxPlan,
+    build_parallax_plan,
     create_designer_animation,
 )
 
@@ -51,5 +53,7 @@ __all__ = [
     "AnimationTrack",
     "AnimationTimeline",
     "DepthParallaxEngine",
+    "ParallaxPlan",
+    "build_parallax_plan",
     "create_designer_animation",
 ]
@@ -7,15 +7,18 @@ Professional-grade animation system with:
 - Depth-aware parallax calculations
 - Smooth easing functions
 - Frame-perfect timing
+- Precomputed parallax plans (whole-timeline layer offsets as arrays)
 
 This module provides the mathematical foundation for designer-quality animations.
 """
 
 import math
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 class EasingType(str, Enum):
     """Professional easing function types."""
@@ -360,6 +363,80 @@ class AnimationTrack:
         return func(t)
 
 
+def layer_parallax_factors(layer_count: int) -> List[float]:
+    """Parallax multiplier per depth layer, from 0.2 (background) to 1.0 (foreground)."""
+    if layer_count <= 1:
+        return [0.6] * layer_count
+    return [round(0.2 + (i / (layer_count - 1)) * 0.8, 3) for i in range(layer_count)]
+
+
+def depth_layer_boundaries(depth: np.ndarray, layer_count: int) -> Tuple[List[float], np.ndarray]:
+    """
+    Quantile layer thresholds and per-layer pixel counts from one sort.
+    
+    The sorted depth values act as a cumulative histogram: the thresholds
+    are its quantiles and each layer's count is the distance between two
+    binary searches, instead of a mask pass per layer.
+    
+    Args:
+        depth: Depth map (0-1)
+        layer_count: Number of layers
+    
+    Returns:
+        (layer_count + 1 ascending thresholds, pixel count per layer). Layer
+        i covers [boundaries[i], boundaries[i + 1]), so pixels at the top
+        threshold are in no layer's count.
+    """
+    ordered = np.sort(depth, axis=None)
+    percentiles = [(i / layer_count) * 100 for i in range(layer_count + 1)]
+    boundaries = [float(b) for b in np.percentile(ordered, percentiles)]
+    counts = np.diff(np.searchsorted(ordered, np.asarray(boundaries, dtype=ordered.dtype), side="left"))
+    return boundaries, counts
+
+
+def quantize_depth_layers(depth: np.ndarray, boundaries: Sequence[float]) -> np.ndarray:
+    """
+    Assign every pixel to its depth layer.
+    
+    Layer i covers [boundaries[i], boundaries[i + 1]); pixels at the top
+    boundary are folded into the last layer so every pixel moves with one.
+    
+    Returns:
+        uint8 layer index map, same shape as depth
+    """
+    layer_map = np.zeros(depth.shape, dtype=np.uint8)
+    above = np.empty(depth.shape, dtype=bool)
+    for threshold in boundaries[1:-1]:
+        np.greater_equal(depth, threshold, out=above)
+        layer_map += above
+    return layer_map
+
+
+def _smooth_series(targets: np.ndarray, start: float, factor: float) -> np.ndarray:
+    """
+    Apply `current += (target - current) * factor` over a whole target series.
+    
+    Uses the closed form current[n] = decay**(n+1) * start
+    + factor * sum(decay**(n-k) * target[k]), evaluated in blocks short
+    enough that decay**-k stays finite.
+    """
+    if factor >= 1:
+        return targets.astype(np.float64)
+    if factor <= 0:
+        return np.full(len(targets), float(start))
+    
+    decay = 1.0 - factor
+    block = max(1, int(200 / -math.log10(decay)))
+    smoothed = np.empty(len(targets))
+    current = float(start)
+    for begin in range(0, len(targets), block):
+        chunk = targets[begin:begin + block]
+        powers = decay ** np.arange(len(chunk))
+        smoothed[begin:begin + len(chunk)] = powers * (decay * current + factor * np.cumsum(chunk / powers))
+        current = smoothed[begin + len(chunk) - 1]
+    return smoothed
+
+
 class DepthParallaxEngine:
     """
     Depth-aware parallax calculation engine.
@@ -423,6 +500,40 @@ class DepthParallaxEngine:
         
         return offsets
     
+    def plan_layer_offsets(
+        self,
+        inputs_x: np.ndarray,
+        inputs_y: np.ndarray,
+        parallax_factors: Sequence[float],
+    ) -> np.ndarray:
+        """
+        Calculate layer offsets for a whole input timeline in one call.
+        
+        Equivalent to calling calculate_layer_offsets once per frame; the
+        smoothed offset carries over from earlier calls and into later ones.
+        
+        Args:
+            inputs_x: Horizontal input per frame (-1 to 1)
+            inputs_y: Vertical input per frame (-1 to 1)
+            parallax_factors: Parallax factor per layer
+        
+        Returns:
+            (frames, layers, 2) array of (offset_x, offset_y)
+        """
+        targets_x = np.asarray(inputs_x, dtype=np.float64) * self.max_offset
+        targets_y = np.asarray(inputs_y, dtype=np.float64) * self.max_offset
+        current_x = _smooth_series(targets_x, self._current_offset_x, self.smooth_factor)
+        current_y = _smooth_series(targets_y, self._current_offset_y, self.smooth_factor)
+        
+        if len(targets_x):
+            self._target_offset_x = float(targets_x[-1])
+            self._target_offset_y = float(targets_y[-1])
+            self._current_offset_x = float(current_x[-1])
+            self._current_offset_y = float(current_y[-1])
+        
+        factors = np.asarray(parallax_factors, dtype=np.float64)
+        return np.stack([np.multiply.outer(current_x, factors), np.multiply.outer(current_y, factors)], axis=-1)
+    
     def calculate_3d_transform(
         self,
         input_x: float,
@@ -442,6 +553,31 @@ class DepthParallaxEngine:
         Returns:
             Dict with rotateX, rotateY, translateZ, scale
         """
+        return self._depth_transform(input_x, input_y, depth_value, config)
+    
+    def plan_3d_transforms(
+        self,
+        inputs_x: np.ndarray,
+        inputs_y: np.ndarray,
+        depth_value: float,
+        config: Dict[str, Any],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate the 3D transform for every frame of an input timeline.
+        
+        Returns:
+            Dict of transform property -> per-frame array
+        """
+        inputs_x = np.asarray(inputs_x, dtype=np.float64)
+        inputs_y = np.asarray(inputs_y, dtype=np.float64)
+        transform = self._depth_transform(inputs_x, inputs_y, depth_value, config)
+        return {
+            name: np.broadcast_to(np.asarray(value, dtype=np.float64), inputs_x.shape).copy()
+            for name, value in transform.items()
+        }
+    
+    def _depth_transform(self, input_x, input_y, depth_value, config):
+        """Transform math shared by the per-call and whole-timeline paths."""
         effect_type = config.get("type", "parallax")
         intensity = config.get("intensity", 0.5)
         
@@ -456,7 +592,7 @@ class DepthParallaxEngine:
             rotate_y = input_x * max_angle_y * intensity
             
             # Scale based on hover intensity
-            hover_intensity = math.sqrt(input_x**2 + input_y**2)
+            hover_intensity = np.hypot(input_x, input_y)
             scale = 1 + (scale_on_hover - 1) * hover_intensity * intensity
             
             return {
@@ -496,6 +632,97 @@ class DepthParallaxEngine:
             }
 
 
+@dataclass
+class ParallaxPlan:
+    """
+    Depth-effect motion precomputed for every frame of an animation.
+    
+    Built once per animation config and shared by the server-side exporter
+    (layer offsets) and the OBS HTML blob (per-frame transforms), so
+    neither evaluates the parallax engine per frame.
+    """
+    duration_ms: float
+    inputs: np.ndarray  # (frames, 2) driving input, -1 to 1
+    parallax_factors: np.ndarray  # (layers,)
+    layer_offsets: np.ndarray  # (frames, layers, 2) pixels
+    transforms: Dict[str, np.ndarray] = field(default_factory=dict)  # property -> (frames,)
+    
+    @property
+    def frame_count(self) -> int:
+        return len(self.inputs)
+    
+    def frame_at(self, time_ms: float) -> int:
+        """Index of the planned frame nearest to a time."""
+        if self.frame_count <= 1 or self.duration_ms <= 0:
+            return 0
+        progress = min(max(time_ms / self.duration_ms, 0.0), 1.0)
+        return int(round(progress * (self.frame_count - 1)))
+    
+    def to_dict(self, precision: int = 2) -> Dict[str, Any]:
+        """JSON-ready plan (rounded nested lists) for embedding in HTML."""
+        return {
+            "durationMs": self.duration_ms,
+            "frames": self.frame_count,
+            "parallaxFactors": self.parallax_factors.tolist(),
+            "layerOffsets": np.round(self.layer_offsets, precision).tolist(),
+            "transforms": {
+                name: np.round(values, precision).tolist()
+                for name, values in self.transforms.items()
+            },
+        }
+
+
+def auto_parallax_input(frame_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pointer stand-in for renders with no viewer input (exports, OBS): one
+    slow figure-eight sweep over the animation.
+    """
+    phase = np.linspace(0.0, 2 * math.pi, frame_count)
+    return np.sin(phase), 0.5 * np.sin(2 * phase)
+
+
+def build_parallax_plan(
+    config: Dict[str, Any],
+    frame_count: int,
+    layer_count: int = 5,
+    max_offset: float = 50.0,
+    depth_value: float = 1.0,
+) -> ParallaxPlan:
+    """
+    Precompute the depth effect for every frame of an animation config.
+    
+    Args:
+        config: Animation config (uses depth_effect and duration_ms)
+        frame_count: Frames to plan, evenly spaced over the duration
+        layer_count: Depth layers to plan offsets for
+        max_offset: Largest layer offset in pixels
+        depth_value: Depth the whole-image transforms are evaluated at
+    
+    Returns:
+        ParallaxPlan with per-frame layer offsets and transforms
+    """
+    effect = config.get("depth_effect") or {}
+    frame_count = max(1, frame_count)
+    engine = DepthParallaxEngine(
+        layer_count=layer_count,
+        max_offset=max_offset,
+        smooth_factor=effect.get("smooth_factor") or 0.1,
+    )
+    inputs_x, inputs_y = auto_parallax_input(frame_count)
+    
+    # Layer offsets follow the effect's intensity and direction
+    gain = effect.get("intensity", 0.5) * (-1 if effect.get("invert") else 1)
+    factors = np.asarray(layer_parallax_factors(layer_count), dtype=np.float64)
+    
+    return ParallaxPlan(
+        duration_ms=float(config.get("duration_ms", 3000)),
+        inputs=np.stack([inputs_x, inputs_y], axis=-1),
+        parallax_factors=factors,
+        layer_offsets=engine.plan_layer_offsets(inputs_x * gain, inputs_y * gain, factors),
+        transforms=engine.plan_3d_transforms(inputs_x, inputs_y, depth_value, effect) if effect else {},
+    )
+
+
 class AnimationTimeline:
     """
     Master animation timeline.
@@ -0,0 +1,370 @@
+"""
+Depth Inference Engine
+
+Runs Depth Anything V2 Small for the alert animation worker:
+
+- ONNX Runtime backend (exported once from the Hugging Face checkpoint and
+  cached on disk, optionally int8 dynamic-quantized), with the PyTorch
+  model as a fallback backend
+- Loaded once at worker start (preload_depth_engine) instead of per job
+- Micro-batching: requests arriving within DEPTH_BATCH_WINDOW_MS of each
+  other run as one batch (grouped by input size)
+- A fixed thread budget (DEPTH_THREADS) for the inference runtime
+
+Pre/post-processing mirrors the Hugging Face DPT image processor, so both
+backends produce the same depth map as the old pipeline up to runtime
+numerics (see scripts/bench_depth_engine.py for the similarity check).
+
+Usage:
+    engine = get_depth_engine()
+    depth = engine.infer(image)   # float32 HxW in [0, 1], blocks the calling thread
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+DEPTH_MODEL_ID = "depth-anything/Depth-Anything-V2-Small-hf"
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# onnx (default) or torch
+DEPTH_ENGINE_BACKEND = os.getenv("DEPTH_ENGINE_BACKEND", "onnx")
+
+# Where the exported ONNX model is cached (a persistent volume in Docker)
+DEPTH_ONNX_DIR = os.path.expanduser(os.getenv("DEPTH_ONNX_DIR", "~/.cache/aurastream/depth"))
+
+# int8 dynamic quantization; validate with bench_depth_engine.py before enabling
+DEPTH_ONNX_QUANTIZE = os.getenv("DEPTH_ONNX_QUANTIZE", "false").lower() == "true"
+
+# Intra-op threads for the inference runtime
+DEPTH_THREADS = int(os.getenv("DEPTH_THREADS", str(min(4, os.cpu_count() or 1))))
+
+# How long the first request of a batch waits for company, and the batch cap
+DEPTH_BATCH_WINDOW_MS = float(os.getenv("DEPTH_BATCH_WINDOW_MS", "20"))
+DEPTH_MAX_BATCH = int(os.getenv("DEPTH_MAX_BATCH", "4"))
+
+# DPT image processor settings for Depth Anything V2
+INPUT_SIZE = 518
+SIZE_MULTIPLE = 14
+IMAGE_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(3, 1, 1)
+IMAGE_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32).reshape(3, 1, 1)
+
+
+# =============================================================================
+# Pre/Post-processing
+# =============================================================================
+
+def _constrain_to_multiple(value: float) -> int:
+    return max(SIZE_MULTIPLE, int(round(value / SIZE_MULTIPLE)) * SIZE_MULTIPLE)
+
+
+def model_input_size(width: int, height: int) -> Tuple[int, int]:
+    """
+    Model input (width, height) for an image: aspect kept, scaled by the
+    factor closest to 1 that reaches INPUT_SIZE on one side, multiple of 14.
+    """
+    scale_height = INPUT_SIZE / height
+    scale_width = INPUT_SIZE / width
+    if abs(1 - scale_width) < abs(1 - scale_height):
+        scale_height = scale_width
+    else:
+        scale_width = scale_height
+    return _constrain_to_multiple(scale_width * width), _constrain_to_multiple(scale_height * height)
+
+
+def preprocess(image: Image.Image) -> np.ndarray:
+    """Resize and normalize an image to a (3, H, W) float32 model input."""
+    resized = image.convert("RGB").resize(model_input_size(*image.size), Image.Resampling.BICUBIC)
+    pixels = np.asarray(resized, dtype=np.float32).transpose(2, 0, 1)
+    pixels *= 1 / 255.0
+    pixels -= IMAGE_MEAN
+    pixels /= IMAGE_STD
+    return pixels
+
+
+def postprocess(prediction: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """Resize a predicted depth map to the source size and normalize to [0, 1]."""
+    depth = Image.fromarray(np.ascontiguousarray(prediction, dtype=np.float32), mode="F")
+    depth = np.asarray(depth.resize(size, Image.Resampling.BICUBIC), dtype=np.float32).copy()
+    low, high = depth.min(), depth.max()
+    depth -= low
+    depth /= high - low + 1e-8
+    return depth
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+def onnx_model_path(quantized: bool = DEPTH_ONNX_QUANTIZE) -> str:
+    """Path of the exported (optionally quantized) ONNX model."""
+    name = "depth_anything_v2_small_int8.onnx" if quantized else "depth_anything_v2_small.onnx"
+    return os.path.join(DEPTH_ONNX_DIR, name)
+
+
+def export_depth_onnx(quantize: bool = DEPTH_ONNX_QUANTIZE, opset: int = 17) -> str:
+    """
+    Export Depth Anything V2 Small to ONNX (and int8-quantize it if asked).
+
+    Needs torch and transformers; run once per model volume.
+
+    Args:
+        quantize: Also write the int8 dynamic-quantized model
+        opset: ONNX opset version
+
+    Returns:
+        Path of the model the engine should load
+    """
+    import torch
+    from transformers import AutoModelForDepthEstimation
+
+    os.makedirs(DEPTH_ONNX_DIR, exist_ok=True)
+    fp32_path = onnx_model_path(quantized=False)
+
+    if not os.path.exists(fp32_path):
+        model = AutoModelForDepthEstimation.from_pretrained(DEPTH_MODEL_ID).eval()
+
+        class _PredictedDepth(torch.nn.Module):
+            def __init__(self, inner):
+                super().__init__()
+                self.inner = inner
+
+            def forward(self, pixel_values):
+                return self.inner(pixel_values=pixel_values).predicted_depth
+
+        logger.info(f"Exporting {DEPTH_MODEL_ID} to {fp32_path}")
+        tmp_path = f"{fp32_path}.tmp"
+        with torch.no_grad():
+            torch.onnx.export(
+                _PredictedDepth(model),
+                (torch.randn(1, 3, INPUT_SIZE, INPUT_SIZE),),
+                tmp_path,
+                input_names=["pixel_values"],
+                output_names=["predicted_depth"],
+                dynamic_axes={
+                    "pixel_values": {0: "batch", 2: "height", 3: "width"},
+                    "predicted_depth": {0: "batch", 1: "height", 2: "width"},
+                },
+                opset_version=opset,
+            )
+        os.replace(tmp_path, fp32_path)
+
+    if not quantize:
+        return fp32_path
+
+    int8_path = onnx_model_path(quantized=True)
+    if not os.path.exists(int8_path):
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        logger.info(f"Quantizing depth model to {int8_path}")
+        tmp_path = f"{int8_path}.tmp"
+        quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+        os.replace(tmp_path, int8_path)
+    return int8_path
+
+
+class OnnxDepthBackend:
+    """ONNX Runtime session over the exported model."""
+
+    name = "onnx"
+
+    def __init__(self, model_path: str, threads: int = DEPTH_THREADS, quantized: bool = False):
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.model_path = model_path
+        self.quantized = quantized
+        self._session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def run(self, batch: np.ndarray) -> np.ndarray:
+        """(B, 3, H, W) float32 -> (B, h, w) predicted depth."""
+        return self._session.run(None, {self._input_name: batch})[0]
+
+
+class TorchDepthBackend:
+    """The PyTorch checkpoint, batched; fallback when ONNX is unavailable."""
+
+    name = "torch"
+    quantized = False
+
+    def __init__(self, threads: int = DEPTH_THREADS):
+        import torch
+        from transformers import AutoModelForDepthEstimation
+
+        torch.set_num_threads(threads)
+        self._torch = torch
+        self._model = AutoModelForDepthEstimation.from_pretrained(DEPTH_MODEL_ID).eval()
+
+    def run(self, batch: np.ndarray) -> np.ndarray:
+        with self._torch.inference_mode():
+            return self._model(pixel_values=self._torch.from_numpy(batch)).predicted_depth.numpy()
+
+
+def load_depth_backend(backend: str = DEPTH_ENGINE_BACKEND, quantize: bool = DEPTH_ONNX_QUANTIZE):
+    """Load the configured backend, falling back to PyTorch if ONNX cannot load."""
+    if backend == "onnx":
+        try:
+            path = onnx_model_path(quantize)
+            if not os.path.exists(path):
+                path = export_depth_onnx(quantize=quantize)
+            return OnnxDepthBackend(path, quantized=quantize)
+        except Exception as e:
+            logger.warning(f"ONNX depth backend unavailable, using PyTorch: {e}")
+    return TorchDepthBackend()
+
+
+# =============================================================================
+# Micro-batching Engine
+# =============================================================================
+
+class DepthEngine:
+    """
+    Micro-batches depth requests from many threads onto one backend.
+
+    Callers block in infer() (from executor threads); a single dispatcher
+    thread collects requests for up to window_ms after the first one
+    arrives (or until max_batch), groups them by input size and runs
+    each group as one batch. Pre/post-processing stays on the callers'
+    threads so it runs in parallel.
+    """
+
+    def __init__(
+        self,
+        backend,
+        max_batch: int = DEPTH_MAX_BATCH,
+        window_ms: float = DEPTH_BATCH_WINDOW_MS,
+    ):
+        self.backend = backend
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, Future]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._dispatch_loop, name="depth-engine", daemon=True)
+        self._thread.start()
+        self.batches = 0
+        self.images = 0
+
+    @property
+    def variant(self) -> Dict[str, object]:
+        """Backend and quantization actually in use (after any fallback)."""
+        return {"backend": self.backend.name, "quantized": self.backend.quantized}
+
+    def submit(self, pixel_values: np.ndarray) -> Future:
+        """Queue a preprocessed (3, H, W) input; resolves to its (h, w) prediction."""
+        future: Future = Future()
+        self._queue.put((pixel_values, future))
+        return future
+
+    def infer(self, image: Image.Image) -> np.ndarray:
+        """Estimate normalized depth (float32, source size) for one image."""
+        prediction = self.submit(preprocess(image)).result()
+        return postprocess(prediction, image.size)
+
+    def close(self) -> None:
+        """Stop the dispatcher after the queued requests are served."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.window
+            stopping = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._run_batch(batch)
+            if stopping:
+                return
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, Future]]) -> None:
+        groups: Dict[Tuple[int, ...], List[Tuple[np.ndarray, Future]]] = {}
+        for pixel_values, future in batch:
+            groups.setdefault(pixel_values.shape, []).append((pixel_values, future))
+
+        for items in groups.values():
+            try:
+                predictions = self.backend.run(np.stack([pixel_values for pixel_values, _ in items]))
+            except Exception as e:
+                logger.error(f"Depth batch of {len(items)} failed: {e}")
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.images += len(items)
+            for (_, future), prediction in zip(items, predictions):
+                future.set_result(prediction)
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_depth_engine: Optional[DepthEngine] = None
+_depth_engine_lock = threading.Lock()
+
+
+def get_depth_engine() -> DepthEngine:
+    """Get the process-wide depth engine, loading the model on first use."""
+    global _depth_engine
+    if _depth_engine is None:
+        with _depth_engine_lock:
+            if _depth_engine is None:
+                backend = load_depth_backend()
+                logger.info(
+                    f"Depth engine ready: backend={backend.name}, threads={DEPTH_THREADS}, "
+                    f"max_batch={DEPTH_MAX_BATCH}, window={DEPTH_BATCH_WINDOW_MS}ms"
+                )
+                _depth_engine = DepthEngine(backend)
+    return _depth_engine
+
+
+def preload_depth_engine() -> DepthEngine:
+    """Load the model and run one warm-up inference (call at worker start)."""
+    started = time.monotonic()
+    engine = get_depth_engine()
+    engine.infer(Image.new("RGB", (INPUT_SIZE, INPUT_SIZE)))
+    logger.info(f"Depth engine warmed up in {time.monotonic() - started:.1f}s")
+    return engine
+
+
+__all__ = [
+    "DepthEngine",
+    "OnnxDepthBackend",
+    "TorchDepthBackend",
+    "export_depth_onnx",
+    "get_depth_engine",
+    "load_depth_backend",
+    "model_input_size",
+    "onnx_model_path",
+    "postprocess",
+    "preload_depth_engine",
+    "preprocess",
+]
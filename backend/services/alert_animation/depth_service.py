@@ -9,40 +9,118 @@ Generates high-quality depth maps using Depth Anything V2 with:
 
 Model: depth-anything/Depth-Anything-V2-Small (25M params)
 Performance: ~2-3 seconds on CPU for 512x512 image
+
+Depth maps are content-addressed: the result for a source image (its
+SHA-256) plus processing options is cached in Redis as the PNG and layer
+data, so re-animating the same image skips inference and refinement.
+Image decoding, refinement, layering and PNG encoding run in the executor,
+reusing per-thread float32 scratch buffers. Inference goes through the
+shared, micro-batched depth engine (depth_engine.py).
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import logging
+import os
+import threading
 from io import BytesIO
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from PIL import Image
 import numpy as np
 
+from backend.services.alert_animation.animation_engine import depth_layer_boundaries, layer_parallax_factors
+from backend.services.alert_animation.depth_engine import DEPTH_MODEL_ID, get_depth_engine
+
 logger = logging.getLogger(__name__)
 
-# Lazy-load the model to avoid startup overhead
-_depth_pipeline = None
+# Bump when inference or refinement changes so stale cached maps are ignored
+# (2: inference moved to the micro-batched ONNX/PyTorch depth engine)
+DEPTH_PIPELINE_VERSION = 2
 
+DEPTH_CACHE_PREFIX = "alert_animation:depth:"
+DEPTH_CACHE_TTL = int(os.getenv("DEPTH_CACHE_TTL", str(7 * 24 * 3600)))
 
-def get_depth_pipeline():
-    """Lazy-load Depth Anything V2 pipeline."""
-    global _depth_pipeline
-    if _depth_pipeline is None:
-        try:
-            from transformers import pipeline
-            
-            logger.info("Loading Depth Anything V2 model...")
-            # Use the correct model ID from HuggingFace
-            _depth_pipeline = pipeline(
-                task="depth-estimation",
-                model="depth-anything/Depth-Anything-V2-Small-hf",
-                device="cpu",
-            )
-            logger.info("Depth Anything V2 model loaded successfully")
-        except Exception as e:
-            logger.error(f"Failed to load Depth Anything V2: {e}")
-            raise
-    
-    return _depth_pipeline
+# Larger maps are still generated, just not cached
+DEPTH_CACHE_MAX_BYTES = int(os.getenv("DEPTH_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+
+DEFAULT_DEPTH_OPTIONS: Dict[str, Any] = {
+    "edge_refinement": True,
+    "layer_count": 5,
+    "smooth_factor": 0.3,
+    "preserve_edges": True,
+}
+
+
+def normalize_depth_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Apply defaults and coerce types so equal requests produce equal cache keys."""
+    merged = {**DEFAULT_DEPTH_OPTIONS, **(options or {})}
+    return {
+        "edge_refinement": bool(merged["edge_refinement"]),
+        "layer_count": int(merged["layer_count"]),
+        "smooth_factor": float(merged["smooth_factor"]),
+        "preserve_edges": bool(merged["preserve_edges"]),
+    }
+
+
+def depth_cache_key(
+    image_bytes: bytes,
+    options: Dict[str, Any],
+    engine_variant: Dict[str, Any],
+) -> str:
+    """
+    Content address for a depth map: source image hash + normalized options.
+
+    The variant also covers the inference backend and quantization, since
+    an int8 ONNX model produces slightly different maps than fp32 PyTorch.
+
+    Args:
+        image_bytes: Raw bytes of the source image as downloaded
+        options: Options from normalize_depth_options()
+        engine_variant: DepthEngine.variant of the loaded engine, which is
+            PyTorch whenever the configured ONNX backend failed to load
+
+    Returns:
+        Redis key for the cached depth map
+    """
+    image_digest = hashlib.sha256(image_bytes).hexdigest()
+    variant = json.dumps(
+        {
+            **options,
+            **engine_variant,
+            "model": DEPTH_MODEL_ID,
+            "version": DEPTH_PIPELINE_VERSION,
+        },
+        sort_keys=True,
+    )
+    variant_digest = hashlib.sha256(variant.encode()).hexdigest()[:16]
+    return f"{DEPTH_CACHE_PREFIX}{image_digest}:{variant_digest}"
+
+
+class _RefineScratch:
+    """Float32 work buffers for one image size, reused by every refinement on a thread."""
+
+    def __init__(self, shape: Tuple[int, ...]):
+        self.shape = shape
+        self.depth = np.empty(shape, dtype=np.float32)
+        self.gray = np.empty(shape, dtype=np.float32)
+        self.smooth = np.empty(shape, dtype=np.float32)
+        self.edges = np.empty(shape, dtype=np.float32)
+        self.tmp_a = np.empty(shape, dtype=np.float32)
+        self.tmp_b = np.empty(shape, dtype=np.float32)
+
+
+_scratch_local = threading.local()
+
+
+def _scratch_for(shape: Tuple[int, ...]) -> _RefineScratch:
+    """Get this thread's scratch buffers, reallocating only when the size changes."""
+    scratch = getattr(_scratch_local, "buffers", None)
+    if scratch is None or scratch.shape != shape:
+        scratch = _RefineScratch(shape)
+        _scratch_local.buffers = scratch
+    return scratch
 
 
 class DepthMapService:
@@ -54,10 +132,12 @@ class DepthMapService:
     - Edge-aware refinement for crisp layer boundaries
     - Depth layer segmentation for parallax effects
     - Smooth gradient generation for professional animations
+    - Content-addressed cache of finished depth maps
     """
     
-    def __init__(self):
+    def __init__(self, cache_client=None):
         self._storage = None
+        self._cache = cache_client
     
     @property
     def storage(self):
@@ -67,6 +147,13 @@ class DepthMapService:
             self._storage = get_storage_service()
         return self._storage
     
+    def _get_cache(self):
+        """Lazy-load the Redis client (sync: called from executor threads)."""
+        if self._cache is None:
+            from backend.database.redis_pool import get_sync_redis
+            self._cache = get_sync_redis("default")
+        return self._cache
+    
     async def generate_depth_map(
         self,
         source_url: str,
@@ -77,6 +164,9 @@ class DepthMapService:
         """
         Generate enterprise-quality depth map for an image.
         
+        A source image already processed with the same options is served
+        from the depth cache without running the model.
+        
         Args:
             source_url: URL of the source image
             user_id: User ID for storage path
@@ -90,31 +180,33 @@ class DepthMapService:
         Returns:
             dict with depth_map_url, layer_data, and metadata
         """
-        options = options or {}
+        options = normalize_depth_options(options)
+        loop = asyncio.get_running_loop()
         
         # Download source image
         image_bytes = await self._download_image(source_url)
-        image = Image.open(BytesIO(image_bytes)).convert("RGB")
-        original_size = image.size
-        
-        # Generate raw depth map
-        depth_raw = await self._estimate_depth(image)
-        
-        # Apply enterprise-grade refinements
-        depth_refined = self._refine_depth_map(
-            depth_raw,
-            image,
-            edge_refinement=options.get("edge_refinement", True),
-            smooth_factor=options.get("smooth_factor", 0.3),
-            preserve_edges=options.get("preserve_edges", True),
+        cache_key, cached = await loop.run_in_executor(
+            None, self._lookup_cached_depth, image_bytes, options
         )
         
-        # Generate depth layers for parallax
-        layer_count = options.get("layer_count", 5)
-        layer_data = self._generate_depth_layers(depth_refined, layer_count)
-        
-        # Convert to PNG bytes
-        depth_bytes = self._depth_to_png(depth_refined)
+        if cached is not None:
+            depth_bytes = cached["depth_png"]
+            layer_data = cached["layer_data"]
+            original_size = tuple(cached["original_size"])
+        else:
+            image = await loop.run_in_executor(None, self._decode_image, image_bytes)
+            original_size = image.size
+            
+            # Generate raw depth map
+            depth_raw = await self._estimate_depth(image)
+            
+            # Refine, segment into layers and encode off the event loop
+            depth_bytes, layer_data = await loop.run_in_executor(
+                None, self._postprocess_depth, depth_raw, image, options
+            )
+            await loop.run_in_executor(
+                None, self._store_cached_depth, cache_key, depth_bytes, layer_data, original_size
+            )
         
         # Upload to storage
         storage_path = f"{user_id}/animations/{project_id}/depth_map.png"
@@ -131,37 +223,107 @@ class DepthMapService:
             "original_size": original_size,
             "layer_data": layer_data,
             "metadata": {
-                "model": "depth-anything/Depth-Anything-V2-Small-hf",
-                "edge_refinement": options.get("edge_refinement", True),
-                "layer_count": layer_count,
-                "smooth_factor": options.get("smooth_factor", 0.3),
+                "model": DEPTH_MODEL_ID,
+                "edge_refinement": options["edge_refinement"],
+                "layer_count": options["layer_count"],
+                "smooth_factor": options["smooth_factor"],
+                "cached": cached is not None,
             },
         }
     
+    # =========================================================================
+    # Depth Cache
+    # =========================================================================
+    
+    def _lookup_cached_depth(
+        self,
+        image_bytes: bytes,
+        options: Dict[str, Any],
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Hash the source image and look up its depth map (runs in executor)."""
+        cache_key = depth_cache_key(image_bytes, options, self._engine_variant())
+        try:
+            raw = self._get_cache().get(cache_key)
+        except Exception as e:
+            logger.warning(f"Depth cache lookup failed: {e}")
+            return cache_key, None
+        if raw is None:
+            return cache_key, None
+        
+        entry = json.loads(raw)
+        entry["depth_png"] = base64.b64decode(entry["depth_png"])
+        logger.info(f"Depth cache hit for {cache_key}")
+        return cache_key, entry
+    
+    @staticmethod
+    def _engine_variant() -> Dict[str, Any]:
+        """Backend in use; get_depth_engine() loads the model if the worker did not preload it."""
+        return get_depth_engine().variant
+    
+    def _store_cached_depth(
+        self,
+        cache_key: str,
+        depth_bytes: bytes,
+        layer_data: Dict[str, Any],
+        original_size: Tuple[int, int],
+    ) -> None:
+        """Cache a finished depth map; failures only cost a future recompute."""
+        if len(depth_bytes) > DEPTH_CACHE_MAX_BYTES:
+            return
+        entry = {
+            "depth_png": base64.b64encode(depth_bytes).decode("ascii"),
+            "layer_data": layer_data,
+            "original_size": list(original_size),
+        }
+        try:
+            self._get_cache().set(cache_key, json.dumps(entry), ex=DEPTH_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Depth cache store failed: {e}")
+    
+    # =========================================================================
+    # Inference
+    # =========================================================================
+    
+    @staticmethod
+    def _decode_image(image_bytes: bytes) -> Image.Image:
+        return Image.open(BytesIO(image_bytes)).convert("RGB")
+    
     async def _estimate_depth(self, image: Image.Image) -> np.ndarray:
         """
         Estimate depth using Depth Anything V2.
         
-        Runs in thread pool as it's CPU-bound.
-        """
-        import asyncio
-        
-        def _run_inference():
-            pipeline = get_depth_pipeline()
-            result = pipeline(image)
-            depth = result["depth"]
-            
-            if isinstance(depth, Image.Image):
-                depth = np.array(depth)
-            
-            # Normalize to 0-1 range
-            depth = depth.astype(np.float32)
-            depth = (depth - depth.min()) / (depth.max() - depth.min() + 1e-8)
-            
-            return depth
+        Runs on an executor thread, where the shared depth engine may batch
+        it with other concurrent requests.
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _run_inference)
+        Returns:
+            float32 depth map at the source size, normalized to 0-1
+        """
+        loop = asyncio.get_running_loop()
+        # get_depth_engine() loads the model if the worker did not preload it
+        return await loop.run_in_executor(None, lambda: get_depth_engine().infer(image))
+    
+    # =========================================================================
+    # Refinement (CPU-bound; called from executor threads)
+    # =========================================================================
+    
+    def _postprocess_depth(
+        self,
+        depth_raw: np.ndarray,
+        image: Image.Image,
+        options: Dict[str, Any],
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Refine, segment and encode a raw depth map in one pass over scratch buffers."""
+        scratch = _scratch_for(depth_raw.shape)
+        depth = self._refine_into(
+            scratch,
+            depth_raw,
+            image,
+            edge_refinement=options["edge_refinement"],
+            smooth_factor=options["smooth_factor"],
+            preserve_edges=options["preserve_edges"],
+        )
+        layer_data = self._generate_depth_layers(depth, options["layer_count"])
+        return self._depth_to_png(depth, scratch.tmp_a), layer_data
     
     def _refine_depth_map(
         self,
@@ -177,120 +339,160 @@ class DepthMapService:
         1. Edge-aware bilateral filtering for smooth gradients
         2. Edge detection from source for crisp boundaries
         3. Guided filtering to align depth edges with image edges
+        
+        Returns a new array; the input is left untouched.
         """
-        # Convert source to grayscale for edge detection
-        source_gray = np.array(source_image.convert("L")).astype(np.float32) / 255.0
+        scratch = _scratch_for(depth.shape)
+        return self._refine_into(
+            scratch, depth, source_image, edge_refinement, smooth_factor, preserve_edges
+        ).copy()
+    
+    def _refine_into(
+        self,
+        scratch: _RefineScratch,
+        depth: np.ndarray,
+        source_image: Image.Image,
+        edge_refinement: bool,
+        smooth_factor: float,
+        preserve_edges: bool,
+    ) -> np.ndarray:
+        """Run the refinement chain in place; returns scratch.depth."""
+        result = scratch.depth
+        np.copyto(result, depth, casting="unsafe")
         
         # Step 1: Bilateral-like smoothing (preserves edges)
         if smooth_factor > 0:
-            depth = self._bilateral_smooth(depth, smooth_factor)
+            self._bilateral_smooth(scratch, smooth_factor)
         
         # Step 2: Edge refinement using source image edges
         if edge_refinement and preserve_edges:
-            # Detect edges in source image
-            source_edges = self._detect_edges(source_gray)
-            
-            # Detect edges in depth map
-            depth_edges = self._detect_edges(depth)
+            # Source grayscale, then edges in source image and depth map
+            np.divide(np.asarray(source_image.convert("L")), np.float32(255.0), out=scratch.gray)
+            self._detect_edges(scratch.gray, out=scratch.edges, tmp=scratch.tmp_a)
+            self._detect_edges(result, out=scratch.tmp_a, tmp=scratch.tmp_b)
             
             # Blend depth edges with source edges for alignment
             edge_weight = 0.7
-            combined_edges = edge_weight * source_edges + (1 - edge_weight) * depth_edges
+            scratch.edges *= edge_weight
+            scratch.tmp_a *= 1 - edge_weight
+            scratch.edges += scratch.tmp_a
             
             # Apply edge-aware sharpening
-            depth = self._edge_aware_sharpen(depth, combined_edges)
+            self._edge_aware_sharpen(scratch)
         
         # Step 3: Normalize and enhance contrast
-        depth = self._enhance_depth_contrast(depth)
-        
-        return depth
+        return self._enhance_depth_contrast(result, out=result, tmp=scratch.tmp_a)
     
-    def _bilateral_smooth(
-        self,
-        depth: np.ndarray,
-        smooth_factor: float,
-    ) -> np.ndarray:
+    def _bilateral_smooth(self, scratch: _RefineScratch, smooth_factor: float) -> None:
         """
-        Apply bilateral-like smoothing that preserves edges.
+        Apply bilateral-like smoothing that preserves edges (in place).
         
         Uses a simplified approach with Gaussian + edge preservation.
         """
         from scipy import ndimage
         
-        # Gaussian smoothing
-        sigma = smooth_factor * 5
-        smoothed = ndimage.gaussian_filter(depth, sigma=sigma)
+        depth = scratch.depth
         
-        # Preserve edges by blending based on gradient magnitude
-        gradient_x = ndimage.sobel(depth, axis=1)
-        gradient_y = ndimage.sobel(depth, axis=0)
-        gradient_mag = np.sqrt(gradient_x**2 + gradient_y**2)
+        # Gaussian smoothing
+        ndimage.gaussian_filter(depth, sigma=smooth_factor * 5, output=scratch.smooth)
         
-        # Normalize gradient magnitude
-        gradient_mag = gradient_mag / (gradient_mag.max() + 1e-8)
+        # Preserve edges by blending based on normalized gradient magnitude
+        edge_mask = self._detect_edges(depth, out=scratch.tmp_a, tmp=scratch.tmp_b)
         
         # Blend: keep original at edges, use smoothed elsewhere
         edge_threshold = 0.1
-        edge_mask = np.clip(gradient_mag / edge_threshold, 0, 1)
-        
-        result = edge_mask * depth + (1 - edge_mask) * smoothed
+        edge_mask /= edge_threshold
+        np.clip(edge_mask, 0, 1, out=edge_mask)
         
-        return result
+        # mask * depth + (1 - mask) * smoothed
+        np.subtract(depth, scratch.smooth, out=scratch.tmp_b)
+        scratch.tmp_b *= edge_mask
+        np.add(scratch.smooth, scratch.tmp_b, out=depth)
     
-    def _detect_edges(self, image: np.ndarray) -> np.ndarray:
-        """Detect edges using Sobel operator."""
+    def _detect_edges(
+        self,
+        image: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        tmp: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Detect edges using Sobel operator (normalized gradient magnitude)."""
         from scipy import ndimage
         
-        gradient_x = ndimage.sobel(image, axis=1)
-        gradient_y = ndimage.sobel(image, axis=0)
-        edges = np.sqrt(gradient_x**2 + gradient_y**2)
+        if out is None:
+            out = np.empty(image.shape, dtype=np.float32)
+        if tmp is None:
+            tmp = np.empty(image.shape, dtype=np.float32)
+        
+        ndimage.sobel(image, axis=1, output=out)
+        ndimage.sobel(image, axis=0, output=tmp)
+        np.multiply(out, out, out=out)
+        np.multiply(tmp, tmp, out=tmp)
+        out += tmp
+        np.sqrt(out, out=out)
         
         # Normalize
-        edges = edges / (edges.max() + 1e-8)
+        out /= out.max() + 1e-8
         
-        return edges
+        return out
     
-    def _edge_aware_sharpen(
-        self,
-        depth: np.ndarray,
-        edges: np.ndarray,
-    ) -> np.ndarray:
+    def _edge_aware_sharpen(self, scratch: _RefineScratch) -> None:
         """
-        Sharpen depth map along detected edges.
+        Sharpen depth map along detected edges (in place).
         
         This creates crisp layer boundaries for parallax effects.
         """
         from scipy import ndimage
         
-        # Unsharp mask
-        blurred = ndimage.gaussian_filter(depth, sigma=1.5)
-        sharpened = depth + 0.5 * (depth - blurred)
+        depth = scratch.depth
+        
+        # Unsharp mask: sharpened = depth + 0.5 * (depth - blurred)
+        detail = ndimage.gaussian_filter(depth, sigma=1.5, output=scratch.tmp_b)
+        np.subtract(depth, detail, out=detail)
+        detail *= 0.5
         
         # Apply sharpening only at edges
-        edge_strength = np.clip(edges * 2, 0, 1)
-        result = edge_strength * sharpened + (1 - edge_strength) * depth
+        edge_strength = scratch.edges
+        edge_strength *= 2
+        np.clip(edge_strength, 0, 1, out=edge_strength)
+        detail *= edge_strength
+        depth += detail
         
         # Clamp to valid range
-        result = np.clip(result, 0, 1)
-        
-        return result
+        np.clip(depth, 0, 1, out=depth)
     
-    def _enhance_depth_contrast(self, depth: np.ndarray) -> np.ndarray:
+    def _enhance_depth_contrast(
+        self,
+        depth: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        tmp: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         Enhance depth contrast for better layer separation.
         
         Uses histogram equalization with clipping to avoid over-enhancement.
         """
-        # Simple contrast stretch
-        p_low, p_high = np.percentile(depth, [2, 98])
-        depth_stretched = np.clip((depth - p_low) / (p_high - p_low + 1e-8), 0, 1)
+        if out is None:
+            out = np.empty(depth.shape, dtype=np.float32)
+        
+        # Simple contrast stretch (percentile may reorder tmp freely)
+        if tmp is None:
+            tmp = np.empty(depth.shape, dtype=np.float32)
+        np.copyto(tmp, depth, casting="unsafe")
+        p_low, p_high = np.percentile(tmp, [2, 98], overwrite_input=True)
+        np.subtract(depth, np.float32(p_low), out=out, casting="unsafe")
+        out /= np.float32(p_high - p_low + 1e-8)
+        np.clip(out, 0, 1, out=out)
         
         # Apply slight S-curve for more natural depth perception
         # S-curve: y = 0.5 + 0.5 * tanh(k * (x - 0.5))
         k = 2.0  # Curve steepness
-        depth_curved = 0.5 + 0.5 * np.tanh(k * (depth_stretched - 0.5))
+        out -= 0.5
+        out *= k
+        np.tanh(out, out=out)
+        out *= 0.5
+        out += 0.5
         
-        return depth_curved
+        return out
     
     def _generate_depth_layers(
         self,
@@ -308,37 +510,24 @@ class DepthMapService:
         Returns:
             dict with layer boundaries, parallax factors, and statistics
         """
-        # Calculate layer boundaries using quantiles for even distribution
-        boundaries = []
-        for i in range(layer_count + 1):
-            percentile = (i / layer_count) * 100
-            boundary = np.percentile(depth, percentile)
-            boundaries.append(float(boundary))
-        
-        # Calculate parallax multipliers
+        # Quantile boundaries (even distribution) and layer coverage from one sort
+        boundaries, counts = depth_layer_boundaries(depth, layer_count)
+        coverage = counts / depth.size
+        
         # Background (far) moves less, foreground (near) moves more
-        parallax_factors = []
-        for i in range(layer_count):
-            # Linear interpolation from 0.2 (background) to 1.0 (foreground)
-            factor = 0.2 + (i / (layer_count - 1)) * 0.8 if layer_count > 1 else 0.6
-            parallax_factors.append(round(factor, 3))
-        
-        # Calculate layer statistics
-        layer_stats = []
-        for i in range(layer_count):
-            low = boundaries[i]
-            high = boundaries[i + 1]
-            mask = (depth >= low) & (depth < high)
-            coverage = float(np.mean(mask))
-            
-            layer_stats.append({
+        parallax_factors = layer_parallax_factors(layer_count)
+        
+        layer_stats = [
+            {
                 "index": i,
-                "depth_min": round(low, 4),
-                "depth_max": round(high, 4),
+                "depth_min": round(boundaries[i], 4),
+                "depth_max": round(boundaries[i + 1], 4),
                 "parallax_factor": parallax_factors[i],
-                "coverage_percent": round(coverage * 100, 2),
+                "coverage_percent": round(float(coverage[i]) * 100, 2),
                 "label": self._get_layer_label(i, layer_count),
-            })
+            }
+            for i in range(layer_count)
+        ]
         
         return {
             "layer_count": layer_count,
@@ -346,8 +535,8 @@ class DepthMapService:
             "parallax_factors": parallax_factors,
             "layers": layer_stats,
             "depth_range": {
-                "min": float(depth.min()),
-                "max": float(depth.max()),
+                "min": boundaries[0],
+                "max": boundaries[-1],
                 "mean": float(depth.mean()),
                 "std": float(depth.std()),
             },
@@ -368,10 +557,11 @@ class DepthMapService:
         else:
             return f"Foreground {index - total // 2 + 1}"
     
-    def _depth_to_png(self, depth: np.ndarray) -> bytes:
+    def _depth_to_png(self, depth: np.ndarray, tmp: Optional[np.ndarray] = None) -> bytes:
         """Convert depth array to high-quality PNG bytes."""
         # Convert to 8-bit
-        depth_8bit = (depth * 255).astype(np.uint8)
+        scaled = np.multiply(depth, 255, out=tmp) if tmp is not None else depth * 255
+        depth_8bit = scaled.astype(np.uint8)
         
         # Create image
         image = Image.fromarray(depth_8bit, mode="L")
@@ -402,18 +592,24 @@ class DepthMapService:
         Uses smaller image size for faster processing (~1 second).
         """
         image_bytes = await self._download_image(source_url)
-        image = Image.open(BytesIO(image_bytes)).convert("RGB")
+        loop = asyncio.get_running_loop()
+        
+        def _decode_preview() -> Image.Image:
+            image = self._decode_image(image_bytes)
+            # Resize for faster processing
+            image.thumbnail((preview_size, preview_size), Image.Resampling.LANCZOS)
+            return image
         
-        # Resize for faster processing
-        image.thumbnail((preview_size, preview_size), Image.Resampling.LANCZOS)
+        image = await loop.run_in_executor(None, _decode_preview)
         
         # Generate depth
         depth = await self._estimate_depth(image)
         
         # Quick refinement
-        depth = self._enhance_depth_contrast(depth)
+        def _finish_preview() -> bytes:
+            return self._depth_to_png(self._enhance_depth_contrast(depth, out=depth))
         
-        return self._depth_to_png(depth)
+        return await loop.run_in_executor(None, _finish_preview)
 
 
 # Singleton instance
@@ -3,6 +3,10 @@ Server-side animation export using FFmpeg.
 
 Used as fallback for browsers that don't support WebM alpha (Safari, mobile).
 Most exports happen client-side using MediaRecorder API.
+
+Depth effects come from a ParallaxPlan computed once per export (and per
+OBS blob): parallax exports composite depth layers, built in one pass
+from the depth map, at the plan's per-frame offsets.
 """
 
 import asyncio
@@ -11,11 +15,16 @@ import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
-from typing import Optional
-from PIL import Image
+from typing import List, Optional
+from PIL import Image, ImageChops
 import numpy as np
 import math
 
+from backend.services.alert_animation.animation_engine import (
+    build_parallax_plan,
+    depth_layer_boundaries,
+    quantize_depth_layers,
+)
 from backend.services.storage_service import get_storage_service
 
 logger = logging.getLogger(__name__)
@@ -23,6 +32,12 @@ logger = logging.getLogger(__name__)
 # Thread pool for CPU-bound operations
 _executor = ThreadPoolExecutor(max_workers=2)
 
+# Depth layers composited for server-side parallax
+EXPORT_DEPTH_LAYERS = 5
+
+# Planned frames per second embedded in OBS blobs (nearest frame is shown)
+OBS_PLAN_FPS = 30
+
 
 async def run_in_executor(func, *args, **kwargs):
     """Run a sync function in a thread pool executor."""
@@ -138,11 +153,53 @@ class AnimationExportService:
             depth = depth.resize((width, height), Image.Resampling.LANCZOS)
             depth = np.array(depth) / 255.0
         
+        # Plan the whole timeline's layer offsets and cut the layers once
+        layers = None
+        plan = None
+        depth_effect = config.get("depth_effect") or {}
+        if depth is not None and depth_effect.get("type") == "parallax":
+            plan = build_parallax_plan(config, num_frames, layer_count=EXPORT_DEPTH_LAYERS)
+            layers = self._build_depth_layers(source, depth, EXPORT_DEPTH_LAYERS)
+        
         for i in range(num_frames):
             t = i / max(num_frames - 1, 1)  # Normalized time 0-1
-            frame = self._render_frame(source, depth, config, t, width, height)
+            offsets = plan.layer_offsets[i] if plan is not None else None
+            frame = self._render_frame(source, depth, config, t, width, height, layers, offsets)
             frame.save(output_dir / f"frame_{i:05d}.png")
     
+    def _build_depth_layers(
+        self,
+        source: Image.Image,
+        depth: np.ndarray,
+        layer_count: int,
+    ) -> List[Image.Image]:
+        """Split the source into per-layer RGBA images (back to front) by depth."""
+        boundaries, _ = depth_layer_boundaries(depth, layer_count)
+        layer_map = quantize_depth_layers(depth, boundaries)
+        alpha = source.getchannel("A")
+        
+        layers = []
+        for i in range(layer_count):
+            layer = source.copy()
+            mask = Image.fromarray(np.where(layer_map == i, 255, 0).astype(np.uint8), mode="L")
+            layer.putalpha(ImageChops.multiply(alpha, mask))
+            layers.append(layer)
+        return layers
+    
+    def _composite_parallax(
+        self,
+        layers: List[Image.Image],
+        offsets: np.ndarray,
+    ) -> Image.Image:
+        """Composite depth layers back to front, each shifted by its offset."""
+        frame = Image.new("RGBA", layers[0].size, (0, 0, 0, 0))
+        for layer, (dx, dy) in zip(layers, offsets):
+            shifted = layer.transform(
+                layer.size, Image.AFFINE, (1, 0, -dx, 0, 1, -dy), resample=Image.Resampling.BILINEAR,
+            )
+            frame.alpha_composite(shifted)
+        return frame
+    
     def _render_frame(
         self,
         source: Image.Image,
@@ -151,12 +208,17 @@ class AnimationExportService:
         t: float,
         width: int,
         height: int,
+        layers: Optional[List[Image.Image]] = None,
+        layer_offsets: Optional[np.ndarray] = None,
     ) -> Image.Image:
         """Render a single animation frame."""
         frame = Image.new("RGBA", (width, height), (0, 0, 0, 0))
         
-        # Start with source
-        img = source.copy()
+        # Start with source (depth layers at this frame's planned offsets)
+        if layers and layer_offsets is not None:
+            img = self._composite_parallax(layers, layer_offsets)
+        else:
+            img = source.copy()
         
         # Apply entry animation
         entry = config.get("entry")
@@ -340,6 +402,8 @@ def generate_obs_html_blob(
     
     The generated HTML includes:
     - Embedded animation configuration
+    - Precomputed depth-effect transforms (ParallaxPlan) when the project
+      has a depth map and depth effect
     - Minimal animation engine (placeholder - real implementation would bundle full engine)
     - SSE connection for receiving triggers
     - Debug overlay (optional)
@@ -359,6 +423,15 @@ def generate_obs_html_blob(
     """
     import json
     
+    parallax_plan = None
+    if depth_map_url and animation_config.get("depth_effect"):
+        duration_ms = animation_config.get("duration_ms", 3000)
+        plan = build_parallax_plan(animation_config, int(duration_ms / 1000 * OBS_PLAN_FPS))
+        # The blob animates one image, so only the whole-image transforms are embedded
+        parallax_plan = {
+            key: value for key, value in plan.to_dict().items() if key != "layerOffsets"
+        }
+    
     config_json = json.dumps({
         "alertId": alert_id,
         "alertName": alert_name,
@@ -367,6 +440,7 @@ def generate_obs_html_blob(
         "sourceUrl": source_url,
         "depthMapUrl": depth_map_url,
         "animationConfig": animation_config,
+        "parallaxPlan": parallax_plan,
     }, indent=2)
     
     # Escape for embedding in HTML
@@ -513,6 +587,13 @@ def generate_obs_html_blob(
             }}
           }}
           
+          // Apply depth effect from the precomputed plan
+          const plan = this.config.parallaxPlan;
+          if (plan) {{
+            const frame = Math.min(plan.frames - 1, Math.round(progress * (plan.frames - 1)));
+            document.getElementById('alert-image').style.transform = this.depthTransform(plan.transforms, frame);
+          }}
+          
           if (progress < 1) {{
             this.animationFrame = requestAnimationFrame(animate);
           }} else {{
@@ -532,6 +613,7 @@ def generate_obs_html_blob(
         const container = document.getElementById('alert-container');
         container.classList.remove('visible');
         container.style.transform = '';
+        document.getElementById('alert-image').style.transform = '';
         
         this.isPlaying = false;
         console.log('[AuraStream] Alert finished');
@@ -540,6 +622,13 @@ def generate_obs_html_blob(
       easeOut(t) {{
         return 1 - Math.pow(1 - t, 2);
       }}
+      
+      depthTransform(transforms, frame) {{
+        const value = (name, fallback) => (transforms[name] ? transforms[name][frame] : fallback);
+        return `perspective(${{value('perspective', 1000)}}px) ` +
+          `translate3d(${{value('translateX', 0)}}px, ${{value('translateY', 0)}}px, ${{value('translateZ', 0)}}px) ` +
+          `rotateX(${{value('rotateX', 0)}}deg) rotateY(${{value('rotateY', 0)}}deg) scale(${{value('scale', 1)}})`;
+      }}
     }}
     
     // Initialize engine
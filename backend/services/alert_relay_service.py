@@ -2,68 +2,328 @@
 Alert Relay Service
 
 Lightweight SSE relay for forwarding alert triggers to OBS browser sources.
-Stateless design for horizontal scaling.
 
-For multi-instance deployments, use Redis pub/sub instead of in-memory queues.
+Multi-instance design:
+- Each pod keeps a local registry of alert_id -> subscribers (one per open
+  SSE stream; many streams may watch the same alert).
+- Triggers are published once to a Redis channel. Every pod holds a single
+  pub/sub subscription to that channel and routes events to its local
+  subscribers, so a trigger reaches browser sources on any pod.
+- Each subscriber has a bounded buffer that drops the oldest event when a
+  slow client falls behind, so one stalled OBS source cannot grow memory.
+- Keepalive pings come from a single timer wheel per pod instead of a
+  per-connection timeout, and the same tick refreshes this pod's presence
+  in Redis so other pods can tell whether an alert is connected anywhere.
+
+Without Redis the relay degrades to single-instance, in-process delivery.
 """
 
 import asyncio
+import json
 import logging
+import os
+import time
+import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Set
 
+import redis.asyncio as redis
 from fastapi import Request
 
 logger = logging.getLogger(__name__)
 
-# In-memory connections (for single instance; use Redis pub/sub for multi-instance)
-_connections: Dict[str, asyncio.Queue] = {}
 
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Redis pub/sub channel carrying triggers for every alert
+RELAY_CHANNEL = "alert_relay:events"
+
+# Sorted set of live pods (score = last heartbeat, epoch seconds)
+RELAY_NODES_KEY = "alert_relay:nodes"
+
+# Set of alert IDs with at least one subscriber on a pod
+RELAY_NODE_ALERTS_KEY = "alert_relay:node:{node_id}"
+
+# Events buffered per SSE stream before the oldest is dropped
+QUEUE_SIZE = int(os.getenv("ALERT_RELAY_QUEUE_SIZE", "32"))
+
+# Seconds between keepalive pings on each stream
+KEEPALIVE_INTERVAL = float(os.getenv("ALERT_RELAY_KEEPALIVE_SECONDS", "30"))
+
+# Timer wheel resolution; pings are spread across this many ticks
+WHEEL_SLOTS = 30
+
+# A pod's presence expires after missing this many heartbeats
+PRESENCE_TTL_INTERVALS = 3
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# =============================================================================
+# Subscriber
+# =============================================================================
+
+class RelaySubscriber:
+    """
+    One SSE stream listening for an alert's events.
+
+    Holds a bounded drop-oldest buffer and an event used to wake the stream
+    when something arrives. Keepalive pings get a single slot of their own,
+    so a burst of pings never pushes real triggers out of the buffer.
+    """
+
+    __slots__ = ("alert_id", "slot", "dropped", "_events", "_ping", "_ready")
+
+    def __init__(self, alert_id: str, max_size: int = QUEUE_SIZE) -> None:
+        self.alert_id = alert_id
+        self.slot = 0
+        self.dropped = 0
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_size)
+        self._ping: Optional[Dict[str, Any]] = None
+        self._ready = asyncio.Event()
+
+    def put_nowait(self, event: Dict[str, Any]) -> None:
+        """Buffer an event, discarding the oldest one if the buffer is full."""
+        if event.get("type") == "ping":
+            # A newer ping replaces a pending one instead of taking a buffer slot
+            self._ping = event
+        else:
+            if len(self._events) == self._events.maxlen:
+                self.dropped += 1
+            self._events.append(event)
+        self._ready.set()
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for and return the next buffered event, pings last."""
+        while not self._events and self._ping is None:
+            self._ready.clear()
+            await self._ready.wait()
+        if self._events:
+            return self._events.popleft()
+        ping, self._ping = self._ping, None
+        return ping
+
+    def qsize(self) -> int:
+        return len(self._events) + (self._ping is not None)
+
+
+# =============================================================================
+# Relay Service
+# =============================================================================
 
 class AlertRelayService:
     """Service for managing SSE connections and broadcasting triggers."""
-    
-    def __init__(self):
-        self.connections = _connections
-    
-    async def connect(self, alert_id: str) -> asyncio.Queue:
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        node_id: Optional[str] = None,
+        queue_size: int = QUEUE_SIZE,
+        keepalive_interval: float = KEEPALIVE_INTERVAL,
+    ) -> None:
+        """
+        Initialize the relay.
+
+        Args:
+            redis_client: Async Redis client for pub/sub and presence
+                (defaults to the shared ``sse`` pool)
+            node_id: Identifier for this pod (random by default)
+            queue_size: Per-stream buffer size before dropping oldest events
+            keepalive_interval: Seconds between keepalive pings per stream
+        """
+        self._redis = redis_client
+        self.node_id = node_id or uuid.uuid4().hex[:12]
+        self.queue_size = queue_size
+        self.keepalive_interval = keepalive_interval
+
+        self.connections: Dict[str, Set[RelaySubscriber]] = {}
+        self.dropped_events = 0
+
+        self._wheel: List[Set[RelaySubscriber]] = [set() for _ in range(WHEEL_SLOTS)]
+        self._cursor = 0
+
+        self._listener_task: Optional[asyncio.Task] = None
+        self._wheel_task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Lazy-load the shared SSE Redis client."""
+        if self._redis is None:
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("sse")
+        return self._redis
+
+    @property
+    def _node_alerts_key(self) -> str:
+        return RELAY_NODE_ALERTS_KEY.format(node_id=self.node_id)
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        """Start the pub/sub listener and keepalive wheel on the running loop."""
+        if self._listener_task is None or self._listener_task.done():
+            self._subscribed = asyncio.Event()
+            self._listener_task = asyncio.create_task(self._listen())
+        if self._wheel_task is None or self._wheel_task.done():
+            self._wheel_task = asyncio.create_task(self._run_wheel())
+
+    async def start(self, timeout: float = 5.0) -> bool:
+        """
+        Start background tasks and wait for the Redis subscription.
+
+        Args:
+            timeout: Seconds to wait for the subscription to be ready
+
+        Returns:
+            bool: True if subscribed to the relay channel
+        """
+        self._ensure_started()
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def shutdown(self) -> None:
+        """Stop background tasks and withdraw this pod's presence."""
+        for task in (self._listener_task, self._wheel_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._listener_task = None
+        self._wheel_task = None
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.delete(self._node_alerts_key)
+            pipe.zrem(RELAY_NODES_KEY, self.node_id)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Failed to withdraw relay presence: {e}")
+
+    # -------------------------------------------------------------------------
+    # Local registry
+    # -------------------------------------------------------------------------
+
+    async def connect(self, alert_id: str) -> RelaySubscriber:
         """
         Register a new SSE connection for an alert.
-        
+
         Args:
             alert_id: The unique identifier of the alert
-            
+
         Returns:
-            asyncio.Queue: Queue for receiving events
+            RelaySubscriber: Buffer for receiving events
         """
-        queue: asyncio.Queue = asyncio.Queue()
-        self.connections[alert_id] = queue
-        logger.info(f"SSE connection opened for alert {alert_id}")
-        return queue
-    
-    async def disconnect(self, alert_id: str) -> None:
+        self._ensure_started()
+
+        subscriber = RelaySubscriber(alert_id, self.queue_size)
+        subscribers = self.connections.setdefault(alert_id, set())
+        first_local = not subscribers
+        subscribers.add(subscriber)
+
+        # Schedule the first keepalive one full interval from now
+        subscriber.slot = (self._cursor - 1) % WHEEL_SLOTS
+        self._wheel[subscriber.slot].add(subscriber)
+
+        if first_local:
+            try:
+                await self.redis.sadd(self._node_alerts_key, alert_id)
+            except Exception as e:
+                logger.warning(f"Failed to publish relay presence for alert {alert_id}: {e}")
+
+        logger.debug(f"SSE connection opened for alert {alert_id} ({len(subscribers)} local)")
+        return subscriber
+
+    async def disconnect(self, subscriber: RelaySubscriber) -> None:
         """
-        Remove SSE connection.
-        
+        Remove an SSE connection.
+
         Args:
-            alert_id: The unique identifier of the alert
+            subscriber: The subscriber returned by connect()
         """
-        if alert_id in self.connections:
+        alert_id = subscriber.alert_id
+        self._wheel[subscriber.slot].discard(subscriber)
+        self.dropped_events += subscriber.dropped
+
+        subscribers = self.connections.get(alert_id)
+        if subscribers is None or subscriber not in subscribers:
+            return
+        subscribers.discard(subscriber)
+
+        if not subscribers:
             del self.connections[alert_id]
-            logger.info(f"SSE connection closed for alert {alert_id}")
-    
-    def is_connected(self, alert_id: str) -> bool:
+            try:
+                await self.redis.srem(self._node_alerts_key, alert_id)
+            except Exception as e:
+                logger.warning(f"Failed to withdraw relay presence for alert {alert_id}: {e}")
+
+        logger.debug(f"SSE connection closed for alert {alert_id}")
+
+    def is_connected_locally(self, alert_id: str) -> bool:
         """
-        Check if an alert has an active connection.
-        
+        Check if an alert has an active connection on this pod.
+
         Args:
             alert_id: The unique identifier of the alert
-            
+
         Returns:
-            bool: True if connected, False otherwise
+            bool: True if connected here, False otherwise
         """
         return alert_id in self.connections
-    
+
+    async def is_connected(self, alert_id: str) -> bool:
+        """
+        Check if an alert has an active connection on any pod.
+
+        Args:
+            alert_id: The unique identifier of the alert
+
+        Returns:
+            bool: True if connected, False otherwise
+        """
+        if self.is_connected_locally(alert_id):
+            return True
+
+        try:
+            min_score = time.time() - self.keepalive_interval * PRESENCE_TTL_INTERVALS
+            nodes = await self.redis.zrangebyscore(RELAY_NODES_KEY, min_score, "+inf")
+            nodes = [n for n in nodes if n != self.node_id]
+            if not nodes:
+                return False
+
+            pipe = self.redis.pipeline(transaction=False)
+            for node_id in nodes:
+                pipe.sismember(RELAY_NODE_ALERTS_KEY.format(node_id=node_id), alert_id)
+            return any(await pipe.execute())
+        except Exception as e:
+            logger.warning(f"Failed to check relay presence for alert {alert_id}: {e}")
+            return False
+
+    def _deliver_local(self, alert_id: str, event: Dict[str, Any]) -> int:
+        """Buffer an event for every local subscriber of an alert."""
+        subscribers = self.connections.get(alert_id)
+        if not subscribers:
+            return 0
+        for subscriber in subscribers:
+            subscriber.put_nowait(event)
+        return len(subscribers)
+
+    # -------------------------------------------------------------------------
+    # Triggers
+    # -------------------------------------------------------------------------
+
     async def trigger(
         self,
         alert_id: str,
@@ -71,57 +331,177 @@ class AlertRelayService:
         payload: Optional[Dict] = None,
     ) -> bool:
         """
-        Send trigger event to connected alert.
-        
+        Send trigger event to every connection for an alert, on any pod.
+
         Args:
             alert_id: The unique identifier of the alert
             event_type: Type of event (trigger, test, config_update, ping)
             payload: Optional additional data to send
-            
+
         Returns:
             bool: True if event was sent, False if no connection exists
         """
-        if alert_id not in self.connections:
+        if not await self.is_connected(alert_id):
             logger.warning(f"No connection for alert {alert_id}")
             return False
-        
+
         event = {
             "type": event_type,
             "alertId": alert_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _now_iso(),
             "payload": payload or {},
         }
-        
-        await self.connections[alert_id].put(event)
+
+        try:
+            # Every pod, including this one, delivers via its subscription
+            await self.redis.publish(RELAY_CHANNEL, json.dumps(event))
+            if not self._subscribed.is_set():
+                # Our own subscription is (re)connecting; don't lose local streams
+                self._deliver_local(alert_id, event)
+        except Exception as e:
+            logger.warning(f"Relay publish failed, delivering locally only: {e}")
+            if not self._deliver_local(alert_id, event):
+                return False
+
         logger.info(f"Trigger sent to alert {alert_id}: {event_type}")
         return True
-    
+
+    async def _listen(self) -> None:
+        """Route events from the pod's single pub/sub subscription."""
+        backoff = 1.0
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(RELAY_CHANNEL)
+                self._subscribed.set()
+                backoff = 1.0
+
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is None or message.get("type") != "message":
+                        continue
+                    self._route(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._subscribed.clear()
+                logger.warning(f"Alert relay subscription lost, retrying in {backoff:.0f}s: {e}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _route(self, data: Any) -> None:
+        """Deliver one published event to local subscribers."""
+        try:
+            event = json.loads(data)
+            alert_id = event["alertId"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("Discarding malformed alert relay message")
+            return
+        self._deliver_local(alert_id, event)
+
+    # -------------------------------------------------------------------------
+    # Keepalive
+    # -------------------------------------------------------------------------
+
+    def _tick(self) -> int:
+        """
+        Advance the timer wheel one slot and ping the streams due in it.
+
+        Subscribers stay in their slot, so each is pinged once per rotation.
+
+        Returns:
+            int: Number of streams pinged
+        """
+        slot = self._wheel[self._cursor]
+        self._cursor = (self._cursor + 1) % WHEEL_SLOTS
+        if not slot:
+            return 0
+
+        ping = {"type": "ping", "timestamp": _now_iso()}
+        for subscriber in slot:
+            subscriber.put_nowait(ping)
+        return len(slot)
+
+    async def _heartbeat(self) -> None:
+        """Refresh this pod's presence so other pods can route triggers here."""
+        ttl = int(self.keepalive_interval * PRESENCE_TTL_INTERVALS)
+        now = time.time()
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zadd(RELAY_NODES_KEY, {self.node_id: now})
+            pipe.zremrangebyscore(RELAY_NODES_KEY, "-inf", now - ttl)
+            if self.connections:
+                # Re-add in case the set expired while Redis was unreachable
+                pipe.sadd(self._node_alerts_key, *self.connections.keys())
+                pipe.expire(self._node_alerts_key, ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Alert relay heartbeat failed: {e}")
+
+    async def _run_wheel(self) -> None:
+        """Drive the keepalive wheel and presence heartbeat."""
+        tick_seconds = self.keepalive_interval / WHEEL_SLOTS
+        next_tick = time.monotonic()
+        await self._heartbeat()
+
+        while True:
+            next_tick += tick_seconds
+            await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+            self._tick()
+            if self._cursor == 0:
+                await self._heartbeat()
+
     async def broadcast_ping(self) -> int:
         """
         Send ping to all connections (keepalive).
-        
+
         Returns:
             int: Number of connections pinged
         """
         count = 0
-        for alert_id, queue in self.connections.items():
-            await queue.put({
-                "type": "ping",
-                "alertId": alert_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
-            count += 1
+        for alert_id in self.connections:
+            ping = {"type": "ping", "alertId": alert_id, "timestamp": _now_iso()}
+            count += self._deliver_local(alert_id, ping)
         return count
-    
+
+    # -------------------------------------------------------------------------
+    # Stats and streaming
+    # -------------------------------------------------------------------------
+
     def get_connection_count(self) -> int:
         """
-        Get the number of active connections.
-        
+        Get the number of active connections on this pod.
+
         Returns:
             int: Number of active connections
         """
-        return len(self.connections)
-    
+        return sum(len(subscribers) for subscribers in self.connections.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get relay statistics for this pod.
+
+        Returns:
+            dict: Connection, alert and dropped-event counts
+        """
+        live_dropped = sum(
+            s.dropped for subscribers in self.connections.values() for s in subscribers
+        )
+        return {
+            "node_id": self.node_id,
+            "active_connections": self.get_connection_count(),
+            "active_alerts": len(self.connections),
+            "dropped_events": self.dropped_events + live_dropped,
+            "subscribed": self._subscribed.is_set(),
+        }
+
     async def event_generator(
         self,
         alert_id: str,
@@ -129,40 +509,30 @@ class AlertRelayService:
     ) -> AsyncGenerator[dict, None]:
         """
         Generate SSE events for a connection.
-        
+
         Args:
             alert_id: The unique identifier of the alert
             request: FastAPI request object for disconnect detection
-            
+
         Yields:
             dict: SSE event data with 'event' and 'data' keys
         """
-        queue = await self.connect(alert_id)
-        
+        subscriber = await self.connect(alert_id)
+
         try:
             while True:
                 # Check if client disconnected
                 if await request.is_disconnected():
                     break
-                
-                try:
-                    # Wait for event with timeout (for keepalive)
-                    event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield {
-                        "event": event["type"],
-                        "data": event,
-                    }
-                except asyncio.TimeoutError:
-                    # Send keepalive ping
-                    yield {
-                        "event": "ping",
-                        "data": {
-                            "type": "ping",
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                        },
-                    }
+
+                # Wakes at least once per keepalive interval via the wheel
+                event = await subscriber.get()
+                yield {
+                    "event": event["type"],
+                    "data": event,
+                }
         finally:
-            await self.disconnect(alert_id)
+            await self.disconnect(subscriber)
 
 
 # Singleton instance
@@ -172,7 +542,7 @@ _relay_service: Optional[AlertRelayService] = None
 def get_alert_relay_service() -> AlertRelayService:
     """
     Get or create the relay service singleton.
-    
+
     Returns:
         AlertRelayService: The singleton relay service instance
     """
@@ -180,3 +550,11 @@ def get_alert_relay_service() -> AlertRelayService:
     if _relay_service is None:
         _relay_service = AlertRelayService()
     return _relay_service
+
+
+async def shutdown_alert_relay_service() -> None:
+    """Stop the relay singleton's background tasks, if it was started."""
+    global _relay_service
+    if _relay_service is not None:
+        await _relay_service.shutdown()
+        _relay_service = None
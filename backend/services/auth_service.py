@@ -21,7 +21,7 @@ from typing import Optional, Tuple
 from dataclasses import dataclass
 
 from backend.api.config import get_settings
-from backend.services.jwt_service import JWTService, TokenPayload
+from backend.services.jwt_service import JWTService, TokenPayload, get_verified_token_cache
 from backend.services.password_service import PasswordService, password_service as default_password_service
 from backend.services.exceptions import (
     InvalidCredentialsError,
@@ -206,7 +206,7 @@ class AuthService:
             raise EmailExistsError(email)
         
         # Hash password
-        password_hash = self.password_service.hash_password(password)
+        password_hash = await self.password_service.hash_password_async(password)
         
         # Create user in database
         now = datetime.now(timezone.utc).isoformat()
@@ -264,7 +264,7 @@ class AuthService:
         user_row = result.data[0]
         
         # Verify password
-        if not self.password_service.verify_password(password, user_row.get("password_hash", "")):
+        if not await self.password_service.verify_password_async(password, user_row.get("password_hash", "")):
             raise InvalidCredentialsError()
         
         # Update last_login_at timestamp (if column exists)
@@ -341,8 +341,12 @@ class AuthService:
             token_jti: JWT ID to blacklist (optional, for token revocation)
         
         Note:
-            Invalidates the specific token in the token store if available.
+            Invalidates the specific token in the token store if available,
+            and drops it from the verified access token cache.
         """
+        if token_jti:
+            get_verified_token_cache().invalidate(token_jti)
+        
         if token_jti and self.token_store:
             try:
                 await self.token_store.invalidate_token(token_jti)
@@ -523,7 +527,7 @@ class AuthService:
             raise WeakPasswordError(validation.failed_requirements)
         
         # Hash new password
-        password_hash = self.password_service.hash_password(new_password)
+        password_hash = await self.password_service.hash_password_async(new_password)
         
         # Update password in database
         now = datetime.now(timezone.utc).isoformat()
@@ -566,7 +570,7 @@ class AuthService:
             raise UserNotFoundError()
         
         password_hash = result.data[0].get("password_hash", "")
-        return self.password_service.verify_password(password, password_hash)
+        return await self.password_service.verify_password_async(password, password_hash)
     
     async def verify_email(self, user_id: str) -> None:
         """
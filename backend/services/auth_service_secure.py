@@ -257,7 +257,7 @@ class SecureAuthService:
         if existing.data:
             raise EmailExistsError(email)
         
-        password_hash = self.password_service.hash_password(password)
+        password_hash = await self.password_service.hash_password_async(password)
         
         now = datetime.now(timezone.utc).isoformat()
         result = self.supabase.table("users").insert({
@@ -302,7 +302,7 @@ class SecureAuthService:
         
         user_row = result.data[0]
         
-        if not self.password_service.verify_password(password, user_row.get("password_hash", "")):
+        if not await self.password_service.verify_password_async(password, user_row.get("password_hash", "")):
             raise InvalidCredentialsError()
         
         # Update last_login_at
@@ -475,7 +475,7 @@ class SecureAuthService:
         if not validation.is_valid:
             raise WeakPasswordError(validation.failed_requirements)
         
-        password_hash = self.password_service.hash_password(new_password)
+        password_hash = await self.password_service.hash_password_async(new_password)
         
         # FIRST: Attempt to invalidate all sessions BEFORE changing password
         # This ensures we don't change the password if we can't invalidate sessions
@@ -537,7 +537,7 @@ class SecureAuthService:
         if not result.data:
             raise UserNotFoundError()
         password_hash = result.data[0].get("password_hash", "")
-        return self.password_service.verify_password(password, password_hash)
+        return await self.password_service.verify_password_async(password, password_hash)
     
     async def verify_email(self, user_id: str) -> None:
         """Mark a user's email as verified."""
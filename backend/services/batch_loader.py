@@ -0,0 +1,300 @@
+"""
+Request-Scoped Batch Loaders for Aurastream.
+
+DataLoader-style batching for the single-row lookups the community and
+social services repeat across handlers (user summaries, follow edges,
+likes, blocks, friendships, recent posts).
+
+Every load() issued within one event-loop tick is coalesced into a single
+`in_()` query, and each key is fetched at most once per request:
+
+    loaders = get_request_loaders(self.db)
+    users, following = await asyncio.gather(
+        loaders.users.load_many(creator_ids),
+        loaders.follows.load_many([(viewer_id, c) for c in creator_ids]),
+    )                                   # two queries, however many creators
+
+Loaders are scoped to the HTTP request by RequestContextMiddleware (via
+loader_scope()), so results are never shared between requests. Outside a
+request, get_request_loaders() returns a fresh set, which still batches
+within the calling method.
+
+Write paths clear the affected keys so a request that writes then reads
+sees its own change.
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any, Awaitable, Callable, Dict, Generic, Hashable, Iterable, Iterator,
+    List, Optional, Set, Tuple, TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# PostgREST puts in_() lists in the URL; keep each query comfortably short
+MAX_BATCH_SIZE = 100
+
+# Posts shown per creator in spotlight cards
+RECENT_POSTS_PER_USER = 4
+
+
+# =============================================================================
+# Generic Batch Loader
+# =============================================================================
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce lookups issued in the same event-loop tick into one batch call.
+
+    The batch function receives the distinct keys and returns a dict of
+    results; keys it leaves out resolve to `default`. Results are cached
+    for the loader's lifetime (one request).
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]],
+        default: Optional[V] = None,
+        name: str = "loader",
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        self._batch_fn = batch_fn
+        self._default = default
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self._cache: Dict[K, asyncio.Future] = {}
+        self._queue: List[K] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+
+    def load(self, key: K) -> "asyncio.Future[V]":
+        """Schedule a key for the current tick's batch; await the result."""
+        future = self._cache.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._cache[key] = future
+            self._queue.append(key)
+            if len(self._queue) == 1:
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> List[V]:
+        """Load several keys in one batch, preserving order."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache with a value the caller already has."""
+        if key not in self._cache:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: Optional[K] = None) -> None:
+        """Forget one cached key (or all of them) after a write."""
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self.max_batch_size):
+            chunk = [(key, self._cache[key]) for key in keys[start:start + self.max_batch_size]]
+            task = asyncio.ensure_future(self._run(chunk))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, chunk: List[Tuple[K, asyncio.Future]]) -> None:
+        self.batches += 1
+        try:
+            results = await self._batch_fn([key for key, _ in chunk])
+        except Exception as e:
+            logger.error(f"Batch loader '{self.name}' failed for {len(chunk)} keys: {e}")
+            for key, future in chunk:
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in chunk:
+            if not future.done():
+                future.set_result(results.get(key, self._default))
+
+
+def _group_pairs(keys: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Group (a, b) keys by a, so each group is one eq(a).in_(b...) query."""
+    groups: Dict[str, List[str]] = {}
+    for first, second in keys:
+        groups.setdefault(first, []).append(second)
+    return groups
+
+
+def relationship_key(user_id: str, other_id: str) -> Tuple[str, str]:
+    """Order-independent key for a friendship between two users."""
+    return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+
+# =============================================================================
+# Request Loaders
+# =============================================================================
+
+class RequestLoaders:
+    """
+    The batch loaders for one request, bound to one Supabase client.
+
+    Attributes:
+        users: user_id -> {"id", "display_name", "avatar_url"} or None
+        follows: (follower_id, following_id) -> bool
+        likes: (user_id, post_id) -> bool
+        recent_posts: user_id -> newest visible posts (id, asset_url, asset_type)
+        blocks: (user_id, by_user_id) -> True if by_user_id blocked user_id
+        relationships: relationship_key(a, b) -> friendships row or None
+    """
+
+    def __init__(self, db: Any):
+        self.db = db
+        self.users: BatchLoader[str, Optional[dict]] = BatchLoader(self._load_users, name="users")
+        self.follows: BatchLoader[Tuple[str, str], bool] = BatchLoader(
+            self._load_follows, default=False, name="follows")
+        self.likes: BatchLoader[Tuple[str, str], bool] = BatchLoader(
+            self._load_likes, default=False, name="likes")
+        self.recent_posts: BatchLoader[str, List[dict]] = BatchLoader(
+            self._load_recent_posts, name="recent_posts")
+        self.blocks: BatchLoader[Tuple[str, str], bool] = BatchLoader(
+            self._load_blocks, default=False, name="blocks")
+        self.relationships: BatchLoader[Tuple[str, str], Optional[dict]] = BatchLoader(
+            self._load_relationships, name="relationships")
+
+    async def _load_users(self, user_ids: List[str]) -> Dict[str, dict]:
+        result = self.db.table("users").select("id, display_name, avatar_url").in_("id", user_ids).execute()
+        return {row["id"]: row for row in result.data or []}
+
+    async def _load_follows(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        found: Dict[Tuple[str, str], bool] = {}
+        for follower_id, following_ids in _group_pairs(keys).items():
+            result = self.db.table("community_follows").select("following_id").eq(
+                "follower_id", follower_id).in_("following_id", following_ids).execute()
+            for row in result.data or []:
+                found[(follower_id, row["following_id"])] = True
+        return found
+
+    async def _load_likes(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        found: Dict[Tuple[str, str], bool] = {}
+        for user_id, post_ids in _group_pairs(keys).items():
+            result = self.db.table("community_likes").select("post_id").eq(
+                "user_id", user_id).in_("post_id", post_ids).execute()
+            for row in result.data or []:
+                found[(user_id, row["post_id"])] = True
+        return found
+
+    async def _load_recent_posts(self, user_ids: List[str]) -> Dict[str, List[dict]]:
+        posts: Dict[str, List[dict]] = {user_id: [] for user_id in user_ids}
+        # One query for everyone; the row cap keeps a prolific creator from
+        # returning their whole history, and anyone it crowded out is topped up.
+        cap = len(user_ids) * RECENT_POSTS_PER_USER * 4
+        result = self.db.table("community_posts").select("id, user_id, asset_url, asset_type").in_(
+            "user_id", user_ids).eq("is_hidden", False).order("created_at", desc=True).limit(cap).execute()
+        rows = result.data or []
+        for row in rows:
+            bucket = posts.get(row["user_id"])
+            if bucket is not None and len(bucket) < RECENT_POSTS_PER_USER:
+                bucket.append(row)
+        if len(rows) >= cap:
+            for user_id, bucket in posts.items():
+                if len(bucket) < RECENT_POSTS_PER_USER:
+                    extra = self.db.table("community_posts").select("id, user_id, asset_url, asset_type").eq(
+                        "user_id", user_id).eq("is_hidden", False).order(
+                        "created_at", desc=True).limit(RECENT_POSTS_PER_USER).execute()
+                    posts[user_id] = list(extra.data or [])
+        return posts
+
+    async def _load_blocks(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], bool]:
+        found: Dict[Tuple[str, str], bool] = {}
+        # Keys are (blocked user, blocker); group on whichever side repeats more
+        by_blocked = _group_pairs(keys)
+        by_blocker = _group_pairs((by_user_id, user_id) for user_id, by_user_id in keys)
+        if len(by_blocked) <= len(by_blocker):
+            for user_id, blocker_ids in by_blocked.items():
+                result = self.db.table("blocked_users").select("user_id").eq(
+                    "blocked_user_id", user_id).in_("user_id", blocker_ids).execute()
+                for row in result.data or []:
+                    found[(user_id, row["user_id"])] = True
+        else:
+            for by_user_id, user_ids in by_blocker.items():
+                result = self.db.table("blocked_users").select("blocked_user_id").eq(
+                    "user_id", by_user_id).in_("blocked_user_id", user_ids).execute()
+                for row in result.data or []:
+                    found[(row["blocked_user_id"], by_user_id)] = True
+        return found
+
+    async def _load_relationships(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], dict]:
+        found: Dict[Tuple[str, str], dict] = {}
+        # Keys are sorted pairs; anchor each on whichever user it shares most
+        # with the rest (the viewer), so a page is one query, not one per row
+        seen = Counter(user for key in keys for user in key)
+        anchored = ((a, b) if seen[a] >= seen[b] else (b, a) for a, b in keys)
+        for user_id, other_ids in _group_pairs(anchored).items():
+            others = ",".join(other_ids)
+            result = self.db.table("friendships").select("*").or_(
+                f"and(user_id.eq.{user_id},friend_id.in.({others})),"
+                f"and(friend_id.eq.{user_id},user_id.in.({others}))"
+            ).execute()
+            for row in result.data or []:
+                found[relationship_key(row["user_id"], row["friend_id"])] = row
+        return found
+
+
+# =============================================================================
+# Request Scope
+# =============================================================================
+
+_loader_scope: ContextVar[Optional[Dict[int, RequestLoaders]]] = ContextVar(
+    "batch_loader_scope", default=None
+)
+
+
+@contextmanager
+def loader_scope() -> Iterator[None]:
+    """Give the enclosed request its own loaders (entered per HTTP request)."""
+    token = _loader_scope.set({})
+    try:
+        yield
+    finally:
+        _loader_scope.reset(token)
+
+
+def get_request_loaders(db: Any) -> RequestLoaders:
+    """
+    Get the current request's loaders for a Supabase client.
+
+    Args:
+        db: The Supabase client the loaders should query
+
+    Returns:
+        The request's RequestLoaders, or a fresh set outside a request
+    """
+    scope = _loader_scope.get()
+    if scope is None:
+        return RequestLoaders(db)
+    loaders = scope.get(id(db))
+    if loaders is None or loaders.db is not db:
+        loaders = scope[id(db)] = RequestLoaders(db)
+    return loaders
+
+
+__all__ = [
+    "BatchLoader",
+    "RequestLoaders",
+    "RECENT_POSTS_PER_USER",
+    "get_request_loaders",
+    "loader_scope",
+    "relationship_key",
+]
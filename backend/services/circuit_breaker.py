@@ -21,7 +21,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, Dict
 import redis.asyncio as redis
-import os
+
+from backend.database.redis_pool import get_async_redis
 
 logger = logging.getLogger(__name__)
 
@@ -67,12 +68,15 @@ class CircuitBreaker:
     ):
         self.service_name = service_name
         self.config = config or CircuitBreakerConfig()
-        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._redis_url = redis_url
         self._redis_client: Optional[redis.Redis] = None
     
     async def _get_redis(self) -> redis.Redis:
         if self._redis_client is None:
-            self._redis_client = redis.from_url(self._redis_url, decode_responses=True)
+            if self._redis_url:
+                self._redis_client = redis.from_url(self._redis_url, decode_responses=True)
+            else:
+                self._redis_client = get_async_redis("coordination")
         return self._redis_client
     
     def _key(self, suffix: str) -> str:
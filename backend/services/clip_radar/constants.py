@@ -20,6 +20,7 @@ TRACKED_CATEGORIES = {
 POLL_INTERVAL_MINUTES = 5
 CLIP_LOOKBACK_MINUTES = 360  # Look at clips from last 6 hours
 MAX_CLIPS_PER_CATEGORY = 100
+CLIP_POLL_MAX_CONCURRENCY = 5  # Concurrent category fetches (within the Helix rate budget)
 
 # Velocity thresholds for "viral" detection
 VIRAL_VELOCITY_THRESHOLD = 3.0   # views/minute to be considered viral
@@ -31,6 +32,8 @@ REDIS_KEY_PREFIX = "clip_radar:"
 REDIS_CLIP_VIEWS_KEY = f"{REDIS_KEY_PREFIX}clip_views"  # Hash: clip_id -> view_count
 REDIS_CLIP_DATA_KEY = f"{REDIS_KEY_PREFIX}clip_data"    # Hash: clip_id -> JSON data
 REDIS_VIRAL_CLIPS_KEY = f"{REDIS_KEY_PREFIX}viral"      # Sorted set by velocity
+REDIS_VIRAL_DATA_KEY = f"{REDIS_VIRAL_CLIPS_KEY}:data"   # Hash: clip_id -> viral clip JSON
+REDIS_VIRAL_GAME_KEY = f"{REDIS_VIRAL_CLIPS_KEY}:game"   # Sorted set per game: {key}:{game_id}
 REDIS_LAST_POLL_KEY = f"{REDIS_KEY_PREFIX}last_poll"    # String: timestamp
 
 # Data retention
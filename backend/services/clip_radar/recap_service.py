@@ -5,6 +5,7 @@ Compresses 24 hours of Redis clip data into PostgreSQL daily recaps.
 Runs at 6am daily to create previous day's recap.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone, timedelta, date
@@ -40,12 +41,10 @@ class ClipRadarRecapService:
     
     @property
     def redis(self):
-        """Lazy load Redis client."""
+        """Lazy load the shared async Redis client."""
         if self._redis is None:
-            import redis
-            import os
-            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("default")
         return self._redis
     
     @property
@@ -82,7 +81,7 @@ class ClipRadarRecapService:
         
         # Update daily stats
         stats_key = f"{REDIS_DAILY_STATS_KEY}:{today}"
-        current_stats = self.redis.get(stats_key)
+        current_stats = await self.redis.get(stats_key)
         
         if current_stats:
             stats = json.loads(current_stats)
@@ -148,15 +147,18 @@ class ClipRadarRecapService:
                 stats["category_failures"][gid] = stats["category_failures"].get(gid, 0) + 1
         
         # Store with 48h TTL (enough time for recap job)
-        self.redis.setex(stats_key, 48 * 3600, json.dumps(stats))
-        
-        # Track top clips per category (only successful ones)
-        for game_id, cs in category_stats.items():
-            if cs.get("fetch_success", True):
-                await self._track_category_clips(today, game_id, cs, hour)
-        
-        # Track viral clips
-        await self._track_viral_clips(today, viral_clips)
+        await self.redis.setex(stats_key, 48 * 3600, json.dumps(stats))
+        
+        # Track top clips per category (only successful ones) and viral
+        # clips; each update is an independent key, so run them concurrently
+        await asyncio.gather(
+            *(
+                self._track_category_clips(today, game_id, cs, hour)
+                for game_id, cs in category_stats.items()
+                if cs.get("fetch_success", True)
+            ),
+            self._track_viral_clips(today, viral_clips),
+        )
         
         # Log with failure info
         if failed_categories:
@@ -280,7 +282,7 @@ class ClipRadarRecapService:
         """
         
         # Execute the Lua script atomically
-        self.redis.eval(
+        await self.redis.eval(
             lua_script,
             1,  # Number of keys
             cat_key,  # KEYS[1]
@@ -297,7 +299,7 @@ class ClipRadarRecapService:
     async def _track_viral_clips(self, date_key: str, viral_clips: List[Dict[str, Any]]):
         """Track viral clips for the day."""
         clips_key = f"{REDIS_DAILY_CLIPS_KEY}:{date_key}"
-        current = self.redis.get(clips_key)
+        current = await self.redis.get(clips_key)
         
         if current:
             data = json.loads(current)
@@ -328,7 +330,7 @@ class ClipRadarRecapService:
         data["clips"].sort(key=lambda x: x["velocity"], reverse=True)
         data["clips"] = data["clips"][:50]
         
-        self.redis.setex(clips_key, 48 * 3600, json.dumps(data))
+        await self.redis.setex(clips_key, 48 * 3600, json.dumps(data))
     
     async def create_daily_recap(self, recap_date: Optional[date] = None) -> Dict[str, Any]:
         """
@@ -346,28 +348,26 @@ class ClipRadarRecapService:
         date_key = recap_date.strftime("%Y-%m-%d")
         logger.info(f"Creating daily recap for {date_key}")
         
-        # Get daily stats from Redis
-        stats_key = f"{REDIS_DAILY_STATS_KEY}:{date_key}"
-        stats_raw = self.redis.get(stats_key)
+        # Daily stats, viral clips and every category in one MGET
+        game_ids = list(TRACKED_CATEGORIES)
+        stats_raw, clips_raw, *category_rows = await self.redis.mget(
+            f"{REDIS_DAILY_STATS_KEY}:{date_key}",
+            f"{REDIS_DAILY_CLIPS_KEY}:{date_key}",
+            *(f"{REDIS_DAILY_CATEGORY_KEY}:{date_key}:{game_id}" for game_id in game_ids),
+        )
         
         if not stats_raw:
             logger.warning(f"No stats found for {date_key}")
             return {"error": "No data for this date"}
         
         stats = json.loads(stats_raw)
-        
-        # Get viral clips
-        clips_key = f"{REDIS_DAILY_CLIPS_KEY}:{date_key}"
-        clips_raw = self.redis.get(clips_key)
         viral_clips = json.loads(clips_raw)["clips"] if clips_raw else []
         
-        # Get category data
-        category_stats = {}
-        for game_id in TRACKED_CATEGORIES:
-            cat_key = f"{REDIS_DAILY_CATEGORY_KEY}:{date_key}:{game_id}"
-            cat_raw = self.redis.get(cat_key)
-            if cat_raw:
-                category_stats[game_id] = json.loads(cat_raw)
+        category_stats = {
+            game_id: json.loads(cat_raw)
+            for game_id, cat_raw in zip(game_ids, category_rows)
+            if cat_raw
+        }
         
         # Create main daily recap
         daily_recap = {
@@ -474,18 +474,23 @@ class ClipRadarRecapService:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
         cutoff_key = cutoff.strftime("%Y-%m-%d")
         
-        # Scan and delete old keys
-        for key in self.redis.scan_iter(f"{REDIS_KEY_PREFIX}*"):
+        # Scan for old keys, then delete them in one round trip
+        old_keys = []
+        async for key in self.redis.scan_iter(f"{REDIS_KEY_PREFIX}*"):
             # Extract date from key if present
             parts = key.split(":")
             for part in parts:
                 if len(part) == 10 and part < cutoff_key:
                     try:
                         datetime.strptime(part, "%Y-%m-%d")
-                        self.redis.delete(key)
-                        logger.debug(f"Deleted old Redis key: {key}")
+                        old_keys.append(key)
+                        break
                     except ValueError:
                         pass
+        
+        if old_keys:
+            await self.redis.delete(*old_keys)
+            logger.debug(f"Deleted {len(old_keys)} old Redis keys")
 
 
 # Singleton
@@ -2,8 +2,11 @@
 Clip Radar Service - Core velocity tracking logic
 """
 
+import asyncio
 import json
 import logging
+import time
+import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict
 
@@ -12,12 +15,15 @@ from backend.services.clip_radar.constants import (
     TRACKED_CATEGORIES,
     CLIP_LOOKBACK_MINUTES,
     MAX_CLIPS_PER_CATEGORY,
+    CLIP_POLL_MAX_CONCURRENCY,
     VIRAL_VELOCITY_THRESHOLD,
     HIGH_VELOCITY_THRESHOLD,
     MINIMUM_VIEWS_FOR_VIRAL,
     REDIS_CLIP_VIEWS_KEY,
     REDIS_CLIP_DATA_KEY,
     REDIS_VIRAL_CLIPS_KEY,
+    REDIS_VIRAL_DATA_KEY,
+    REDIS_VIRAL_GAME_KEY,
     REDIS_LAST_POLL_KEY,
     CLIP_TTL_HOURS,
 )
@@ -46,12 +52,10 @@ class ClipRadarService:
     
     @property
     def redis(self):
-        """Lazy load Redis client."""
+        """Lazy load the shared async Redis client."""
         if self._redis is None:
-            import redis
-            import os
-            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("default")
         return self._redis
     
     @property
@@ -65,6 +69,11 @@ class ClipRadarService:
         """
         Poll all tracked categories for fresh clips and update velocity.
         
+        Categories are fetched concurrently (bounded by CLIP_POLL_MAX_CONCURRENCY
+        and the collector's shared Helix rate budget), and each category's
+        clips are processed with a single batched Redis script call, so poll
+        duration stays roughly flat as categories are added.
+        
         Returns:
             Dict mapping game_id to CategoryClipStats
             
@@ -74,79 +83,25 @@ class ClipRadarService:
         logger.info("Starting clip radar poll...")
         
         now = datetime.now(timezone.utc)
-        started_at = (now - timedelta(minutes=CLIP_LOOKBACK_MINUTES)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        poll_started = time.perf_counter()
+        semaphore = asyncio.Semaphore(CLIP_POLL_MAX_CONCURRENCY)
+        
+        category_results = await asyncio.gather(*(
+            self._poll_category(game_id, game_name, now, semaphore)
+            for game_id, game_name in TRACKED_CATEGORIES.items()
+        ))
         
         results: Dict[str, CategoryClipStats] = {}
         all_viral: List[ViralClip] = []
         failed_categories: List[str] = []
         
-        for game_id, game_name in TRACKED_CATEGORIES.items():
-            try:
-                clips = await self.twitch.fetch_clips(
-                    game_id=game_id,
-                    period="day",  # API will filter by started_at
-                    limit=MAX_CLIPS_PER_CATEGORY,
-                )
-                
-                # Filter to clips within our lookback window
-                fresh_clips = [
-                    c for c in clips 
-                    if (now - c.created_at).total_seconds() < CLIP_LOOKBACK_MINUTES * 60
-                ]
-                
-                # Process clips and calculate velocity
-                tracked_clips = []
-                category_viral = []
-                
-                for clip in fresh_clips:
-                    tracked = await self._process_clip(clip, game_name)
-                    tracked_clips.append(tracked)
-                    
-                    # Check if viral
-                    if self._is_viral(tracked):
-                        viral = ViralClip(
-                            **{k: v for k, v in tracked.__dict__.items()},
-                            alert_reason=self._get_viral_reason(tracked),
-                        )
-                        category_viral.append(viral)
-                        all_viral.append(viral)
-                
-                # Calculate category stats
-                total_views = sum(c.view_count for c in tracked_clips)
-                avg_velocity = (
-                    sum(c.velocity for c in tracked_clips) / len(tracked_clips)
-                    if tracked_clips else 0
-                )
-                
-                top_clip = max(tracked_clips, key=lambda c: c.velocity) if tracked_clips else None
-                
-                results[game_id] = CategoryClipStats(
-                    game_id=game_id,
-                    game_name=game_name,
-                    total_clips=len(tracked_clips),
-                    total_views=total_views,
-                    avg_velocity=avg_velocity,
-                    top_clip=top_clip,
-                    viral_clips=category_viral,
-                    fetch_error=None,
-                    fetch_success=True,
-                )
-                
-                logger.info(f"  {game_name}: {len(tracked_clips)} clips, {len(category_viral)} viral")
-                
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Failed to poll clips for {game_name}: {error_msg}")
-                failed_categories.append(game_id)
-                results[game_id] = CategoryClipStats(
-                    game_id=game_id,
-                    game_name=game_name,
-                    total_clips=0,
-                    total_views=0,
-                    avg_velocity=0,
-                    fetch_error=error_msg,
-                    fetch_success=False,
-                )
+        for stats in category_results:
+            results[stats.game_id] = stats
+            all_viral.extend(stats.viral_clips)
+            if not stats.fetch_success:
+                failed_categories.append(stats.game_id)
+        
+        poll_duration_ms = (time.perf_counter() - poll_started) * 1000
         
         # Log summary with failure info
         success_count = len(TRACKED_CATEGORIES) - len(failed_categories)
@@ -163,7 +118,7 @@ class ClipRadarService:
         await self._update_viral_clips(all_viral)
         
         # Record poll timestamp
-        self.redis.set(REDIS_LAST_POLL_KEY, now.isoformat())
+        await self.redis.set(REDIS_LAST_POLL_KEY, now.isoformat())
         
         # Track for daily recap with error info
         recap_error = None
@@ -223,51 +178,177 @@ class ClipRadarService:
             "success_rate": success_rate,
             "recap_tracked": recap_error is None,
             "recap_error": recap_error,
+            "poll_duration_ms": round(poll_duration_ms, 1),
         }
-        self.redis.set(f"{REDIS_LAST_POLL_KEY}:metadata", json.dumps(poll_metadata))
+        await self.redis.set(f"{REDIS_LAST_POLL_KEY}:metadata", json.dumps(poll_metadata))
         
-        logger.info(f"Clip radar poll complete. {len(all_viral)} viral clips detected. Success rate: {success_rate:.1f}%")
+        logger.info(
+            f"Clip radar poll complete in {poll_duration_ms:.0f}ms. "
+            f"{len(all_viral)} viral clips detected. Success rate: {success_rate:.1f}%"
+        )
         return results
     
-    # Lua script for atomic view count update (read-modify-write)
-    # Returns the previous view count while setting the new one
+    async def _poll_category(
+        self,
+        game_id: str,
+        game_name: str,
+        now: datetime,
+        semaphore: asyncio.Semaphore,
+    ) -> CategoryClipStats:
+        """Fetch and process one category's clips, capturing any failure."""
+        try:
+            async with semaphore:
+                clips = await self.twitch.fetch_clips(
+                    game_id=game_id,
+                    period="day",  # API will filter by started_at
+                    limit=MAX_CLIPS_PER_CATEGORY,
+                )
+            
+            # Filter to clips within our lookback window
+            fresh_clips = [
+                c for c in clips 
+                if (now - c.created_at).total_seconds() < CLIP_LOOKBACK_MINUTES * 60
+            ]
+            
+            # Process clips and calculate velocity (one Redis round trip)
+            tracked_clips = await self._process_clips(fresh_clips, game_name)
+            
+            category_viral = [
+                ViralClip(
+                    **{k: v for k, v in tracked.__dict__.items()},
+                    alert_reason=self._get_viral_reason(tracked),
+                )
+                for tracked in tracked_clips
+                if self._is_viral(tracked)
+            ]
+            
+            # Calculate category stats
+            total_views = sum(c.view_count for c in tracked_clips)
+            avg_velocity = (
+                sum(c.velocity for c in tracked_clips) / len(tracked_clips)
+                if tracked_clips else 0
+            )
+            
+            top_clip = max(tracked_clips, key=lambda c: c.velocity) if tracked_clips else None
+            
+            logger.info(f"  {game_name}: {len(tracked_clips)} clips, {len(category_viral)} viral")
+            
+            return CategoryClipStats(
+                game_id=game_id,
+                game_name=game_name,
+                total_clips=len(tracked_clips),
+                total_views=total_views,
+                avg_velocity=avg_velocity,
+                top_clip=top_clip,
+                viral_clips=category_viral,
+                fetch_error=None,
+                fetch_success=True,
+            )
+            
+        except Exception as e:
+            error_msg = str(e)
+            logger.error(f"Failed to poll clips for {game_name}: {error_msg}")
+            return CategoryClipStats(
+                game_id=game_id,
+                game_name=game_name,
+                total_clips=0,
+                total_views=0,
+                avg_velocity=0,
+                fetch_error=error_msg,
+                fetch_success=False,
+            )
+    
+    # Lua script for atomic, batched view count update (read-modify-write).
+    # ARGV holds (clip_id, view_count, initial_data_json) triples. For each
+    # clip it swaps in the new view count, stores the initial metadata if the
+    # clip has not been seen before, and returns (previous_views, previous_data).
     _VIEW_COUNT_LUA_SCRIPT = """
-    local prev = redis.call('HGET', KEYS[1], ARGV[1])
-    redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
-    return prev
+    local out = {}
+    for i = 1, #ARGV, 3 do
+        local clip_id = ARGV[i]
+        out[#out + 1] = redis.call('HGET', KEYS[1], clip_id) or false
+        redis.call('HSET', KEYS[1], clip_id, ARGV[i + 1])
+        local data = redis.call('HGET', KEYS[2], clip_id)
+        if not data then
+            redis.call('HSET', KEYS[2], clip_id, ARGV[i + 2])
+        end
+        out[#out + 1] = data or false
+    end
+    return out
     """
     _view_count_script = None
     
     def _get_view_count_script(self):
-        """Get or register the Lua script for atomic view count updates."""
+        """Get or register the Lua script for batched view count updates."""
         if self._view_count_script is None:
             self._view_count_script = self.redis.register_script(self._VIEW_COUNT_LUA_SCRIPT)
         return self._view_count_script
     
     async def _process_clip(self, clip, game_name: str) -> TrackedClip:
-        """Process a clip and calculate its velocity."""
-        clip_id = clip.id
-        now = datetime.now(timezone.utc)
+        """Process a single clip and calculate its velocity."""
+        tracked = await self._process_clips([clip], game_name)
+        return tracked[0]
+    
+    async def _process_clips(self, clips: list, game_name: str) -> List[TrackedClip]:
+        """
+        Process a batch of clips with a single scripted Redis call.
         
-        # Get previous data for first_seen_at (read-only, no race condition concern)
-        prev_data_str = self.redis.hget(REDIS_CLIP_DATA_KEY, clip_id)
-        first_seen_at = now
-        if prev_data_str:
-            try:
-                prev_data = json.loads(prev_data_str)
-                first_seen_at = datetime.fromisoformat(prev_data.get("first_seen_at", now.isoformat()))
-            except (json.JSONDecodeError, ValueError):
-                pass
+        All clip IDs and current counts go in; all previous counts and
+        first-seen metadata come out, atomically. This prevents races where
+        two workers could read the same prev_views.
+        """
+        if not clips:
+            return []
+        
+        now = datetime.now(timezone.utc)
+        args: list = []
+        for clip in clips:
+            args.extend([
+                clip.id,
+                clip.view_count,
+                json.dumps({
+                    "first_seen_at": now.isoformat(),
+                    "game_id": clip.game_id,
+                    "game_name": game_name,
+                    "broadcaster_name": clip.broadcaster_name,
+                }),
+            ])
         
-        # Atomic read-modify-write of view count using Lua script
-        # This prevents race conditions where two workers could read the same prev_views
         script = self._get_view_count_script()
-        prev_views_str = script(
-            keys=[REDIS_CLIP_VIEWS_KEY],
-            args=[clip_id, clip.view_count]
+        previous = await script(
+            keys=[REDIS_CLIP_VIEWS_KEY, REDIS_CLIP_DATA_KEY],
+            args=args,
         )
-        prev_views = int(prev_views_str) if prev_views_str else None
         
+        tracked_clips = []
+        for i, clip in enumerate(clips):
+            prev_views_str = previous[2 * i]
+            prev_data_str = previous[2 * i + 1]
+            
+            first_seen_at = now
+            if prev_data_str:
+                try:
+                    prev_data = json.loads(prev_data_str)
+                    first_seen_at = datetime.fromisoformat(prev_data.get("first_seen_at", now.isoformat()))
+                except (json.JSONDecodeError, ValueError):
+                    pass
+            
+            prev_views = int(prev_views_str) if prev_views_str else None
+            tracked_clips.append(
+                self._build_tracked_clip(clip, game_name, prev_views, first_seen_at, now)
+            )
+        
+        return tracked_clips
+    
+    def _build_tracked_clip(
+        self,
+        clip,
+        game_name: str,
+        prev_views: Optional[int],
+        first_seen_at: datetime,
+        now: datetime,
+    ) -> TrackedClip:
+        """Calculate velocity for a clip given its previous tracking state."""
         # Calculate velocity (views per minute)
         age_mins = (now - clip.created_at).total_seconds() / 60
         
@@ -288,8 +369,8 @@ class ClipRadarService:
         
         total_gained = clip.view_count - (prev_views or 0) if prev_views else clip.view_count
         
-        tracked = TrackedClip(
-            clip_id=clip_id,
+        return TrackedClip(
+            clip_id=clip.id,
             title=clip.title,
             url=clip.url,
             thumbnail_url=clip.thumbnail_url,
@@ -308,18 +389,6 @@ class ClipRadarService:
             velocity=max(0, velocity),  # Don't allow negative velocity
             total_gained=max(0, total_gained),
         )
-        
-        # Store clip metadata in Redis (view count already updated atomically above)
-        self.redis.hset(REDIS_CLIP_DATA_KEY, clip_id, json.dumps({
-            "first_seen_at": first_seen_at.isoformat(),
-            "game_id": clip.game_id,
-            "game_name": game_name,
-            "broadcaster_name": clip.broadcaster_name,
-        }))
-        
-        # Set TTL on the hash keys (Redis doesn't support per-field TTL, so we'll clean up old entries separately)
-        
-        return tracked
     
     def _is_viral(self, clip: TrackedClip) -> bool:
         """Check if a clip qualifies as viral."""
@@ -340,52 +409,91 @@ class ClipRadarService:
         else:
             return "📊 Gaining traction"
     
+    # Staging keys only live long enough to be renamed over the live keys;
+    # the TTL guards against leaks if a poll dies between build and swap.
+    _VIRAL_STAGING_TTL_SECONDS = 300
+    
+    def _viral_clip_payload(self, clip: ViralClip) -> str:
+        """Serialize a viral clip for the viral data hash."""
+        return json.dumps({
+            "clip_id": clip.clip_id,
+            "title": clip.title,
+            "url": clip.url,
+            "thumbnail_url": clip.thumbnail_url,
+            "broadcaster_name": clip.broadcaster_name,
+            "creator_name": clip.creator_name,
+            "game_id": clip.game_id,
+            "game_name": clip.game_name,
+            "view_count": clip.view_count,
+            "velocity": clip.velocity,
+            "total_gained": clip.total_gained,
+            "age_minutes": clip.age_minutes,
+            "alert_reason": clip.alert_reason,
+            "created_at": clip.created_at.isoformat(),
+            "duration": clip.duration,
+            "language": clip.language,
+        })
+    
     async def _update_viral_clips(self, viral_clips: List[ViralClip]):
-        """Update the sorted set of viral clips atomically using Redis pipeline."""
-        # Use pipeline for atomic update of viral clips
-        pipe = self.redis.pipeline()
+        """
+        Rebuild the viral clip indexes and swap them in atomically.
         
-        # Clear old viral clips
-        pipe.delete(REDIS_VIRAL_CLIPS_KEY)
-        pipe.delete(f"{REDIS_VIRAL_CLIPS_KEY}:data")
+        The global sorted set, one sorted set per game and the data hash are
+        written under staging keys first, then RENAMEd over the live keys in
+        a single MULTI/EXEC. Readers never see a half-built or empty index,
+        and the transaction only holds the renames, not the bulk writes.
+        """
+        staging_suffix = f":staging:{uuid.uuid4().hex[:12]}"
         
-        # Add new viral clips sorted by velocity
+        global_scores: Dict[str, float] = {}
+        game_scores: Dict[str, Dict[str, float]] = {}
+        payloads: Dict[str, str] = {}
         for clip in viral_clips:
-            pipe.zadd(
-                REDIS_VIRAL_CLIPS_KEY,
-                {clip.clip_id: clip.velocity},
-            )
-            # Store full clip data
-            pipe.hset(
-                f"{REDIS_VIRAL_CLIPS_KEY}:data",
-                clip.clip_id,
-                json.dumps({
-                    "clip_id": clip.clip_id,
-                    "title": clip.title,
-                    "url": clip.url,
-                    "thumbnail_url": clip.thumbnail_url,
-                    "broadcaster_name": clip.broadcaster_name,
-                    "creator_name": clip.creator_name,
-                    "game_id": clip.game_id,
-                    "game_name": clip.game_name,
-                    "view_count": clip.view_count,
-                    "velocity": clip.velocity,
-                    "total_gained": clip.total_gained,
-                    "age_minutes": clip.age_minutes,
-                    "alert_reason": clip.alert_reason,
-                    "created_at": clip.created_at.isoformat(),
-                    "duration": clip.duration,
-                    "language": clip.language,
-                })
-            )
-        
-        # Execute all operations atomically
-        pipe.execute()
+            global_scores[clip.clip_id] = clip.velocity
+            game_scores.setdefault(clip.game_id, {})[clip.clip_id] = clip.velocity
+            payloads[clip.clip_id] = self._viral_clip_payload(clip)
+        
+        # live key -> staging key for every index that has data this poll
+        swaps: Dict[str, str] = {}
+        build = self.redis.pipeline(transaction=False)
+        if viral_clips:
+            for live_key, scores in [(REDIS_VIRAL_CLIPS_KEY, global_scores)] + [
+                (f"{REDIS_VIRAL_GAME_KEY}:{gid}", scores) for gid, scores in game_scores.items()
+            ]:
+                staging_key = f"{live_key}{staging_suffix}"
+                build.zadd(staging_key, scores)
+                swaps[live_key] = staging_key
+            staging_data_key = f"{REDIS_VIRAL_DATA_KEY}{staging_suffix}"
+            build.hset(staging_data_key, mapping=payloads)
+            swaps[REDIS_VIRAL_DATA_KEY] = staging_data_key
+            for staging_key in swaps.values():
+                build.expire(staging_key, self._VIRAL_STAGING_TTL_SECONDS)
+            await build.execute()
+        
+        # Indexes with no viral clips this poll are removed in the same swap
+        stale_keys = [
+            key for key in [REDIS_VIRAL_CLIPS_KEY, REDIS_VIRAL_DATA_KEY] + [
+                f"{REDIS_VIRAL_GAME_KEY}:{gid}"
+                for gid in set(TRACKED_CATEGORIES) | set(game_scores)
+            ]
+            if key not in swaps
+        ]
+        
+        swap = self.redis.pipeline(transaction=True)
+        for live_key, staging_key in swaps.items():
+            swap.rename(staging_key, live_key)
+            swap.persist(live_key)
+        if stale_keys:
+            swap.delete(*stale_keys)
+        await swap.execute()
     
     async def get_viral_clips(self, limit: int = 20, game_id: Optional[str] = None) -> List[ViralClip]:
         """
         Get current viral clips sorted by velocity.
         
+        Reads the precomputed per-game index when filtering, so only the
+        requested page is fetched: one ZREVRANGE plus one HMGET.
+        
         Args:
             limit: Maximum clips to return
             game_id: Filter by game (optional)
@@ -393,23 +501,22 @@ class ClipRadarService:
         Returns:
             List of ViralClip objects
         """
-        # Get clip IDs sorted by velocity (descending)
-        clip_ids = self.redis.zrevrange(REDIS_VIRAL_CLIPS_KEY, 0, limit * 2)  # Get extra for filtering
+        index_key = f"{REDIS_VIRAL_GAME_KEY}:{game_id}" if game_id else REDIS_VIRAL_CLIPS_KEY
+        clip_ids = await self.redis.zrevrange(index_key, 0, limit - 1)
+        if not clip_ids:
+            return []
+        
+        rows = await self.redis.hmget(REDIS_VIRAL_DATA_KEY, clip_ids)
         
         viral_clips = []
-        for clip_id in clip_ids:
-            data_str = self.redis.hget(f"{REDIS_VIRAL_CLIPS_KEY}:data", clip_id)
+        for data_str in rows:
+            # A rebuild may swap the indexes between the two reads
             if not data_str:
                 continue
             
             try:
                 data = json.loads(data_str)
-                
-                # Filter by game if specified
-                if game_id and data.get("game_id") != game_id:
-                    continue
-                
-                clip = ViralClip(
+                viral_clips.append(ViralClip(
                     clip_id=data["clip_id"],
                     title=data["title"],
                     url=data["url"],
@@ -426,12 +533,7 @@ class ClipRadarService:
                     velocity=data["velocity"],
                     total_gained=data["total_gained"],
                     alert_reason=data["alert_reason"],
-                )
-                viral_clips.append(clip)
-                
-                if len(viral_clips) >= limit:
-                    break
-                    
+                ))
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(f"Failed to parse viral clip data: {e}")
                 continue
@@ -461,34 +563,44 @@ class ClipRadarService:
         # If game_id specified, fetch just that category
         categories = {game_id: TRACKED_CATEGORIES.get(game_id, "Unknown")} if game_id else TRACKED_CATEGORIES
         
-        all_clips = []
-        for gid, gname in categories.items():
+        semaphore = asyncio.Semaphore(CLIP_POLL_MAX_CONCURRENCY)
+        
+        async def fetch_category(gid: str, gname: str) -> List[TrackedClip]:
             try:
-                clips = await self.twitch.fetch_clips(
-                    game_id=gid,
-                    period="day",
-                    limit=50,
-                )
-                
-                for clip in clips:
-                    if (now - clip.created_at).total_seconds() < max_age_minutes * 60:
-                        tracked = await self._process_clip(clip, gname)
-                        all_clips.append(tracked)
-                        
+                async with semaphore:
+                    clips = await self.twitch.fetch_clips(
+                        game_id=gid,
+                        period="day",
+                        limit=50,
+                    )
+                fresh = [
+                    clip for clip in clips
+                    if (now - clip.created_at).total_seconds() < max_age_minutes * 60
+                ]
+                return await self._process_clips(fresh, gname)
             except Exception as e:
                 logger.warning(f"Failed to fetch clips for {gname}: {e}")
+                return []
+        
+        per_category = await asyncio.gather(*(
+            fetch_category(gid, gname) for gid, gname in categories.items()
+        ))
+        all_clips = [clip for clips in per_category for clip in clips]
         
         # Sort by velocity and return top N
         all_clips.sort(key=lambda c: c.velocity, reverse=True)
         return all_clips[:limit]
     
-    def get_last_poll_time(self) -> Optional[datetime]:
+    async def get_last_poll_time(self) -> Optional[datetime]:
         """Get timestamp of last poll."""
-        ts = self.redis.get(REDIS_LAST_POLL_KEY)
+        ts = await self.redis.get(REDIS_LAST_POLL_KEY)
         if ts:
             return datetime.fromisoformat(ts)
         return None
     
+    # Clip IDs checked per HMGET / HDEL round trip during cleanup
+    _CLEANUP_BATCH_SIZE = 500
+    
     async def cleanup_old_data(self, max_age_hours: int = None):
         """
         Remove clip data older than TTL from Redis.
@@ -507,30 +619,33 @@ class ClipRadarService:
         
         try:
             # Get all clip IDs from the views hash
-            clip_ids = self.redis.hkeys(REDIS_CLIP_VIEWS_KEY)
+            clip_ids = await self.redis.hkeys(REDIS_CLIP_VIEWS_KEY)
             
-            for clip_id in clip_ids:
-                try:
-                    # Get clip data to check age
-                    data_str = self.redis.hget(REDIS_CLIP_DATA_KEY, clip_id)
-                    if data_str:
-                        data = json.loads(data_str)
-                        first_seen = data.get("first_seen_at")
-                        if first_seen:
-                            first_seen_dt = datetime.fromisoformat(first_seen)
-                            if first_seen_dt < cutoff:
-                                # Remove from both hashes
-                                self.redis.hdel(REDIS_CLIP_VIEWS_KEY, clip_id)
-                                self.redis.hdel(REDIS_CLIP_DATA_KEY, clip_id)
-                                cleaned_count += 1
-                    else:
+            for offset in range(0, len(clip_ids), self._CLEANUP_BATCH_SIZE):
+                batch = clip_ids[offset:offset + self._CLEANUP_BATCH_SIZE]
+                rows = await self.redis.hmget(REDIS_CLIP_DATA_KEY, batch)
+                
+                expired = []
+                for clip_id, data_str in zip(batch, rows):
+                    if not data_str:
                         # No data, remove orphaned view count
-                        self.redis.hdel(REDIS_CLIP_VIEWS_KEY, clip_id)
-                        cleaned_count += 1
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    logger.warning(f"Error parsing clip data for {clip_id}: {e}")
-                    error_count += 1
+                        expired.append(clip_id)
+                        continue
+                    try:
+                        first_seen = json.loads(data_str).get("first_seen_at")
+                        if first_seen and datetime.fromisoformat(first_seen) < cutoff:
+                            expired.append(clip_id)
+                    except (json.JSONDecodeError, ValueError) as e:
+                        logger.warning(f"Error parsing clip data for {clip_id}: {e}")
+                        error_count += 1
+                
+                if expired:
+                    # Remove from both hashes
+                    pipe = self.redis.pipeline(transaction=False)
+                    pipe.hdel(REDIS_CLIP_VIEWS_KEY, *expired)
+                    pipe.hdel(REDIS_CLIP_DATA_KEY, *expired)
+                    await pipe.execute()
+                    cleaned_count += len(expired)
                     
             logger.info(
                 f"Cleanup complete: removed {cleaned_count} old clips, "
@@ -541,7 +656,7 @@ class ClipRadarService:
             logger.error(f"Cleanup failed: {e}")
             raise
     
-    def get_poll_health(self) -> Dict:
+    async def get_poll_health(self) -> Dict:
         """
         Get health status of the clip radar polling.
         
@@ -558,15 +673,16 @@ class ClipRadarService:
         }
         
         try:
-            # Get last poll time
-            last_poll = self.get_last_poll_time()
-            if last_poll:
+            # Last poll time and metadata in one round trip
+            last_poll_str, metadata_str = await self.redis.mget(
+                REDIS_LAST_POLL_KEY, f"{REDIS_LAST_POLL_KEY}:metadata"
+            )
+            if last_poll_str:
+                last_poll = datetime.fromisoformat(last_poll_str)
                 health["last_poll"] = last_poll.isoformat()
                 age = (datetime.now(timezone.utc) - last_poll).total_seconds() / 60
                 health["last_poll_age_minutes"] = round(age, 1)
             
-            # Get poll metadata
-            metadata_str = self.redis.get(f"{REDIS_LAST_POLL_KEY}:metadata")
             if metadata_str:
                 metadata = json.loads(metadata_str)
                 health["success_rate"] = metadata.get("success_rate")
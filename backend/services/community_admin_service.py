@@ -9,6 +9,7 @@ from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from backend.database.supabase_client import get_supabase_client
+from backend.services.community_feed_cache import get_community_feed_cache
 from backend.api.schemas.community import (
     CommunityPostResponse, ReportPostRequest, ReportResponse,
 )
@@ -67,6 +68,7 @@ class CommunityAdminService:
         
         update_data = {"is_featured": is_featured, "updated_at": datetime.utcnow().isoformat() + "Z"}
         updated = self.db.table("community_posts").update(update_data).eq("id", post_id).execute()
+        await get_community_feed_cache().invalidate(post_id)
         return self._map_post_response(updated.data[0])
     
     async def toggle_hidden(self, post_id: str, is_hidden: bool) -> CommunityPostResponse:
@@ -77,6 +79,7 @@ class CommunityAdminService:
         
         update_data = {"is_hidden": is_hidden, "updated_at": datetime.utcnow().isoformat() + "Z"}
         updated = self.db.table("community_posts").update(update_data).eq("id", post_id).execute()
+        await get_community_feed_cache().invalidate(post_id)
         return self._map_post_response(updated.data[0])
     
     async def ban_user(self, user_id: str, reason: str) -> None:
@@ -90,6 +93,8 @@ class CommunityAdminService:
             "updated_at": datetime.utcnow().isoformat() + "Z",
         }
         self.db.table("community_user_stats").update(update_data).eq("user_id", user_id).execute()
+        # The user's posts leave the trending/featured feeds
+        await get_community_feed_cache().invalidate()
     
     async def unban_user(self, user_id: str) -> None:
         """Unban a user from community features."""
@@ -99,6 +104,7 @@ class CommunityAdminService:
             "updated_at": datetime.utcnow().isoformat() + "Z",
         }
         self.db.table("community_user_stats").update(update_data).eq("user_id", user_id).execute()
+        await get_community_feed_cache().invalidate()
     
     async def report_post(
         self, reporter_id: str, post_id: str, data: ReportPostRequest
@@ -175,6 +181,7 @@ class CommunityAdminService:
             self.db.table("community_posts").update(
                 {"is_hidden": True, "updated_at": now}
             ).eq("id", post_id).execute()
+            await get_community_feed_cache().invalidate(post_id)
         
         r = updated.data[0]
         reviewed_at = datetime.fromisoformat(r["reviewed_at"].replace("Z", "+00:00")) if r.get("reviewed_at") else None
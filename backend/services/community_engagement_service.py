@@ -8,6 +8,7 @@ from typing import List, Optional, Tuple
 from uuid import uuid4
 
 from backend.database.supabase_client import get_supabase_client
+from backend.services.batch_loader import get_request_loaders
 from backend.api.schemas.community import (
     CreateCommentRequest, UpdateCommentRequest, CommentWithAuthorResponse,
     UserSummary, CommunityUserStatsResponse, CreatorProfileResponse,
@@ -39,14 +40,21 @@ class CommunityEngagementService:
         if result.data and result.data[0].get("is_banned", False):
             raise CommunityUserBannedError(user_id)
     
-    async def _get_user_summary(self, user_id: str) -> UserSummary:
-        """Get minimal user info for display."""
-        result = self.db.table("users").select("id, display_name, avatar_url").eq("id", user_id).execute()
-        if not result.data:
+    @staticmethod
+    def _to_summary(user_id: str, u: Optional[dict]) -> UserSummary:
+        if not u:
             return UserSummary(id=user_id, display_name="Unknown User", avatar_url=None)
-        u = result.data[0]
         return UserSummary(id=u["id"], display_name=u["display_name"], avatar_url=u.get("avatar_url"))
     
+    async def _get_user_summary(self, user_id: str) -> UserSummary:
+        """Get minimal user info for display."""
+        return self._to_summary(user_id, await get_request_loaders(self.db).users.load(user_id))
+    
+    async def _get_user_summaries(self, user_ids: List[str]) -> List[UserSummary]:
+        """Get user summaries for several users in one batched query, preserving order."""
+        rows = await get_request_loaders(self.db).users.load_many(user_ids)
+        return [self._to_summary(user_id, u) for user_id, u in zip(user_ids, rows)]
+    
     async def _get_or_create_user_stats(self, user_id: str) -> dict:
         """Get or create user stats record."""
         result = self.db.table("community_user_stats").select("*").eq("user_id", user_id).execute()
@@ -77,6 +85,7 @@ class CommunityEngagementService:
             return
         now = datetime.utcnow().isoformat() + "Z"
         self.db.table("community_likes").insert({"id": str(uuid4()), "user_id": user_id, "post_id": post_id, "created_at": now}).execute()
+        get_request_loaders(self.db).likes.clear((user_id, post_id))
         try:
             self.db.rpc("increment_post_like_count", {"p_post_id": post_id}).execute()
         except Exception:
@@ -85,6 +94,7 @@ class CommunityEngagementService:
     async def unlike_post(self, user_id: str, post_id: str) -> None:
         """Unlike a post (no error if not liked)."""
         self.db.table("community_likes").delete().eq("user_id", user_id).eq("post_id", post_id).execute()
+        get_request_loaders(self.db).likes.clear((user_id, post_id))
         try:
             self.db.rpc("decrement_post_like_count", {"p_post_id": post_id}).execute()
         except Exception:
@@ -164,11 +174,13 @@ class CommunityEngagementService:
         result = self.db.table("community_comments").select("*").eq("post_id", post_id).order("created_at", desc=False).range(offset, offset + limit - 1).execute()
         post_result = self.db.table("community_posts").select("user_id").eq("id", post_id).execute()
         post_owner_id = post_result.data[0]["user_id"] if post_result.data else None
-        comments = []
-        for c in result.data or []:
-            author = await self._get_user_summary(c["user_id"])
-            comments.append(self._map_comment(c, author, can_edit=viewer_id == c["user_id"],
-                                              can_delete=viewer_id == c["user_id"] or viewer_id == post_owner_id))
+        rows = result.data or []
+        authors = await self._get_user_summaries([c["user_id"] for c in rows])
+        comments = [
+            self._map_comment(c, author, can_edit=viewer_id == c["user_id"],
+                              can_delete=viewer_id == c["user_id"] or viewer_id == post_owner_id)
+            for c, author in zip(rows, authors)
+        ]
         return comments, total
 
     # =========================================================================
@@ -185,6 +197,7 @@ class CommunityEngagementService:
             return
         now = datetime.utcnow().isoformat() + "Z"
         self.db.table("community_follows").insert({"id": str(uuid4()), "follower_id": follower_id, "following_id": following_id, "created_at": now}).execute()
+        get_request_loaders(self.db).follows.clear((follower_id, following_id))
         try:
             await self._get_or_create_user_stats(follower_id)
             await self._get_or_create_user_stats(following_id)
@@ -196,6 +209,7 @@ class CommunityEngagementService:
     async def unfollow_user(self, follower_id: str, following_id: str) -> None:
         """Unfollow a user (no error if not following)."""
         self.db.table("community_follows").delete().eq("follower_id", follower_id).eq("following_id", following_id).execute()
+        get_request_loaders(self.db).follows.clear((follower_id, following_id))
         try:
             self.db.rpc("decrement_following_count", {"p_user_id": follower_id}).execute()
             self.db.rpc("decrement_follower_count", {"p_user_id": following_id}).execute()
@@ -213,7 +227,7 @@ class CommunityEngagementService:
         count_result = self.db.table("community_follows").select("id", count="exact").eq("following_id", user_id).execute()
         total = count_result.count or 0
         result = self.db.table("community_follows").select("follower_id").eq("following_id", user_id).order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-        return [await self._get_user_summary(f["follower_id"]) for f in result.data or []], total
+        return await self._get_user_summaries([f["follower_id"] for f in result.data or []]), total
     
     async def get_following(self, user_id: str, page: int, limit: int) -> Tuple[List[UserSummary], int]:
         """Get users that a user is following with pagination."""
@@ -221,7 +235,7 @@ class CommunityEngagementService:
         count_result = self.db.table("community_follows").select("id", count="exact").eq("follower_id", user_id).execute()
         total = count_result.count or 0
         result = self.db.table("community_follows").select("following_id").eq("follower_id", user_id).order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-        return [await self._get_user_summary(f["following_id"]) for f in result.data or []], total
+        return await self._get_user_summaries([f["following_id"] for f in result.data or []]), total
     
     async def get_user_stats(self, user_id: str) -> CommunityUserStatsResponse:
         """Get user's community statistics."""
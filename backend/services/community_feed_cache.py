@@ -0,0 +1,230 @@
+"""
+Precomputed Community Feeds for Aurastream.
+
+Trending and featured posts are the same for every viewer apart from the
+"viewer liked" bit, so they are materialized once into Redis (ranked post
+rows with their author already attached) instead of being re-ranked and
+re-enriched per request:
+
+    community:feed:generation                  -> invalidation counter
+    community:feed:{gen}:trending:{asset_type} -> {"posts": [...], "total": n}
+    community:feed:{gen}:featured              -> {"posts": [...], "total": n}
+
+The community_feed_refresh orchestrator job rebuilds the unfiltered
+trending feed and the featured feed every FEED_REFRESH_INTERVAL seconds;
+anything it has not built (cold start, per-asset-type feeds) is built on
+first request and lives for FEED_CACHE_TTL seconds.
+
+Hiding or deleting a post bumps the generation, which orphans every cached
+feed at once (they expire on their TTL). A rebuild that was already running
+writes under the old generation, so it can never resurrect a removed post.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+from backend.services.batch_loader import get_request_loaders
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+# Posts materialized per feed (the routes cap limit at 50)
+FEED_CACHE_SIZE = int(os.getenv("COMMUNITY_FEED_CACHE_SIZE", "50"))
+
+# Seconds a materialized feed is served before it must be rebuilt
+FEED_CACHE_TTL = int(os.getenv("COMMUNITY_FEED_CACHE_TTL", "120"))
+
+# How often the orchestrator job rebuilds the hot feeds
+FEED_REFRESH_INTERVAL = int(os.getenv("COMMUNITY_FEED_REFRESH_INTERVAL", "60"))
+
+GENERATION_KEY = "community:feed:generation"
+TRENDING_KEY = "community:feed:{generation}:trending:{asset_type}"
+FEATURED_KEY = "community:feed:{generation}:featured"
+
+
+def _track(feed: str, outcome: str) -> None:
+    try:
+        from backend.api.middleware.prometheus_metrics import track_community_feed_cache
+        track_community_feed_cache(feed, outcome)
+    except Exception:
+        pass
+
+
+# =============================================================================
+# Feed Cache
+# =============================================================================
+
+class CommunityFeedCache:
+    """
+    Materialized trending/featured feeds shared by all viewers.
+
+    Cached entries are {"post": <community_posts row>, "author": <users row>}
+    dicts in rank order; callers overlay per-viewer state themselves.
+    """
+
+    def __init__(self, supabase_client=None, redis_client=None):
+        self._supabase = supabase_client
+        self._redis = redis_client
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def db(self):
+        if self._supabase is None:
+            from backend.database.supabase_client import get_supabase_client
+            self._supabase = get_supabase_client()
+        return self._supabase
+
+    def _get_redis(self):
+        if self._redis is None:
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("default")
+        return self._redis
+
+    async def _generation(self) -> int:
+        return int(await self._get_redis().get(GENERATION_KEY) or 0)
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    async def get_trending(self, limit: int, asset_type: Optional[str] = None) -> Optional[dict]:
+        """
+        Get the top `limit` trending entries, building the feed on a miss.
+
+        Returns:
+            {"posts": [...], "total": n}, or None when the page is larger
+            than the cache or Redis is unavailable (caller serves it live)
+        """
+        return await self._get("trending", limit, asset_type)
+
+    async def get_featured(self, limit: int) -> Optional[dict]:
+        """Get the newest `limit` featured entries; see get_trending."""
+        return await self._get("featured", limit, None)
+
+    async def _get(self, feed: str, limit: int, asset_type: Optional[str]) -> Optional[dict]:
+        if limit > FEED_CACHE_SIZE:
+            _track(feed, "bypass")
+            return None
+        try:
+            generation = await self._generation()
+            key = self._key(feed, generation, asset_type)
+            raw = await self._get_redis().get(key)
+            if raw is not None:
+                _track(feed, "hit")
+                payload = json.loads(raw)
+            else:
+                _track(feed, "miss")
+                payload = await self._build_once(key, feed, asset_type)
+        except Exception as e:
+            logger.warning(f"Community {feed} feed cache unavailable, serving live: {e}")
+            _track(feed, "error")
+            return None
+        posts = payload["posts"][:limit]
+        # Featured reports every featured post; trending reports the page
+        return {"posts": posts, "total": payload["total"] if feed == "featured" else len(posts)}
+
+    @staticmethod
+    def _key(feed: str, generation: int, asset_type: Optional[str]) -> str:
+        if feed == "featured":
+            return FEATURED_KEY.format(generation=generation)
+        return TRENDING_KEY.format(generation=generation, asset_type=asset_type or "all")
+
+    async def _build_once(self, key: str, feed: str, asset_type: Optional[str]) -> dict:
+        """Build a missing feed, sharing one build between concurrent misses."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._build(key, feed, asset_type))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    # -------------------------------------------------------------------------
+    # Builds
+    # -------------------------------------------------------------------------
+
+    async def _build(self, key: str, feed: str, asset_type: Optional[str]) -> dict:
+        if feed == "featured":
+            result = self.db.table("community_posts").select("*", count="exact").eq(
+                "is_featured", True).eq("is_hidden", False).order(
+                "created_at", desc=True).limit(FEED_CACHE_SIZE).execute()
+            posts, total = result.data or [], result.count or 0
+        else:
+            params: Dict[str, Any] = {"p_limit": FEED_CACHE_SIZE}
+            if asset_type:
+                params["p_asset_type"] = asset_type
+            posts = self.db.rpc("get_trending_community_posts", params).execute().data or []
+            total = None
+
+        authors = await get_request_loaders(self.db).users.load_many(
+            list(dict.fromkeys(post["user_id"] for post in posts))
+        )
+        by_id = {author["id"]: author for author in authors if author}
+        entries = [
+            {"post": post, "author": by_id[post["user_id"]]}
+            for post in posts if post["user_id"] in by_id
+        ]
+        payload = {"posts": entries, "total": total}
+        await self._get_redis().set(key, json.dumps(payload, default=str), ex=FEED_CACHE_TTL)
+        return payload
+
+    async def refresh(self) -> Dict[str, int]:
+        """
+        Rebuild the unfiltered trending feed and the featured feed.
+
+        Called by the community_feed_refresh orchestrator job so requests
+        normally find the hot feeds already materialized.
+
+        Returns:
+            Entries materialized per feed
+        """
+        generation = await self._generation()
+        trending = await self._build(self._key("trending", generation, None), "trending", None)
+        featured = await self._build(self._key("featured", generation, None), "featured", None)
+        return {"trending": len(trending["posts"]), "featured": len(featured["posts"])}
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    async def invalidate(self, post_id: Optional[str] = None) -> None:
+        """
+        Drop every materialized feed (a post was edited, hidden, deleted or
+        re-featured, or its author was banned or unbanned).
+
+        Never raises: a failed invalidation leaves the feeds to expire on
+        their TTL rather than failing the moderation action.
+        """
+        try:
+            await self._get_redis().incr(GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate community feeds (post={post_id}): {e}")
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_community_feed_cache: Optional[CommunityFeedCache] = None
+
+
+def get_community_feed_cache() -> CommunityFeedCache:
+    """Get or create the community feed cache singleton."""
+    global _community_feed_cache
+    if _community_feed_cache is None:
+        _community_feed_cache = CommunityFeedCache()
+    return _community_feed_cache
+
+
+__all__ = [
+    "CommunityFeedCache",
+    "FEED_CACHE_SIZE",
+    "FEED_CACHE_TTL",
+    "FEED_REFRESH_INTERVAL",
+    "get_community_feed_cache",
+]
@@ -1,11 +1,20 @@
 """
 Community Feed Service - Feed/listing operations for community gallery.
+
+Author, like and follow lookups go through the request's batch loaders
+(services/batch_loader.py), so a feed page costs a fixed number of
+queries regardless of how many posts or creators it shows. Trending and
+featured pages are served from precomputed feeds (services/community_feed_cache.py)
+with only the viewer's likes looked up per request.
 """
 
+import asyncio
 import logging
 from typing import List, Optional, Tuple
 
 from backend.database.supabase_client import get_supabase_client
+from backend.services.batch_loader import get_request_loaders
+from backend.services.community_feed_cache import CommunityFeedCache, get_community_feed_cache
 from backend.api.schemas.community import (
     CommunityPostWithAuthorResponse,
     UserSummary,
@@ -18,8 +27,9 @@ logger = logging.getLogger(__name__)
 class CommunityFeedService:
     """Service for community feed/listing operations."""
 
-    def __init__(self, supabase_client=None):
+    def __init__(self, supabase_client=None, feed_cache: Optional[CommunityFeedCache] = None):
         self._supabase = supabase_client
+        self._feed_cache = feed_cache
 
     @property
     def db(self):
@@ -27,12 +37,22 @@ class CommunityFeedService:
             self._supabase = get_supabase_client()
         return self._supabase
 
+    @property
+    def feed_cache(self) -> CommunityFeedCache:
+        if self._feed_cache is None:
+            self._feed_cache = get_community_feed_cache()
+        return self._feed_cache
+
+    @staticmethod
+    def _to_summary(row: Optional[dict]) -> Optional[UserSummary]:
+        if not row:
+            return None
+        return UserSummary(id=row["id"], display_name=row["display_name"], avatar_url=row.get("avatar_url"))
+
     async def _get_user_summary(self, user_id: str) -> Optional[UserSummary]:
         """Get minimal user info for display."""
         try:
-            result = self.db.table("users").select("id, display_name, avatar_url").eq("id", user_id).single().execute()
-            if result.data:
-                return UserSummary(id=result.data["id"], display_name=result.data["display_name"], avatar_url=result.data.get("avatar_url"))
+            return self._to_summary(await get_request_loaders(self.db).users.load(user_id))
         except Exception as e:
             logger.error(f"Error fetching user summary for {user_id}: {e}")
         return None
@@ -42,9 +62,9 @@ class CommunityFeedService:
         if not user_ids:
             return {}
         try:
-            result = self.db.table("users").select("id, display_name, avatar_url").in_("id", list(set(user_ids))).execute()
-            return {r["id"]: UserSummary(id=r["id"], display_name=r["display_name"], avatar_url=r.get("avatar_url")) 
-                    for r in (result.data or [])}
+            unique_ids = list(dict.fromkeys(user_ids))
+            rows = await get_request_loaders(self.db).users.load_many(unique_ids)
+            return {user_id: self._to_summary(row) for user_id, row in zip(unique_ids, rows) if row}
         except Exception as e:
             logger.error(f"Error batch fetching user summaries: {e}")
             return {}
@@ -54,8 +74,7 @@ class CommunityFeedService:
         if not viewer_id:
             return False
         try:
-            result = self.db.table("community_likes").select("id").eq("post_id", post_id).eq("user_id", viewer_id).execute()
-            return bool(result.data)
+            return await get_request_loaders(self.db).likes.load((viewer_id, post_id))
         except Exception:
             return False
 
@@ -64,11 +83,19 @@ class CommunityFeedService:
         if not viewer_id or not post_ids:
             return set()
         try:
-            result = self.db.table("community_likes").select("post_id").in_("post_id", post_ids).eq("user_id", viewer_id).execute()
-            return {r["post_id"] for r in (result.data or [])}
+            liked = await get_request_loaders(self.db).likes.load_many(
+                [(viewer_id, post_id) for post_id in post_ids]
+            )
+            return {post_id for post_id, is_liked in zip(post_ids, liked) if is_liked}
         except Exception:
             return set()
 
+    async def _is_following(self, viewer_id: Optional[str], user_id: str) -> bool:
+        """Check if the viewer follows a user (never true for the user themself)."""
+        if not viewer_id or viewer_id == user_id:
+            return False
+        return await get_request_loaders(self.db).follows.load((viewer_id, user_id))
+
     async def _enrich_posts(self, posts: List[dict], viewer_id: Optional[str]) -> List[CommunityPostWithAuthorResponse]:
         """Add author info and like status to posts using batch queries."""
         if not posts:
@@ -78,28 +105,42 @@ class CommunityFeedService:
         user_ids = [post["user_id"] for post in posts]
         post_ids = [post["id"] for post in posts]
         
-        user_map = await self._batch_get_user_summaries(user_ids)
-        liked_posts = await self._batch_check_viewer_likes(post_ids, viewer_id)
+        user_map, liked_posts = await asyncio.gather(
+            self._batch_get_user_summaries(user_ids),
+            self._batch_check_viewer_likes(post_ids, viewer_id),
+        )
         
         enriched = []
         for post in posts:
             author = user_map.get(post["user_id"])
             if not author:
                 continue
-            is_liked = post["id"] in liked_posts
-            enriched.append(CommunityPostWithAuthorResponse(
-                id=post["id"], user_id=post["user_id"], asset_id=post["asset_id"],
-                title=post["title"], description=post.get("description"),
-                prompt_used=post.get("prompt_used"), show_prompt=post.get("show_prompt", True),
-                tags=post.get("tags", []), asset_type=post["asset_type"], asset_url=post["asset_url"],
-                like_count=post.get("like_count", 0), comment_count=post.get("comment_count", 0),
-                view_count=post.get("view_count", 0), is_featured=post.get("is_featured", False),
-                inspired_by_post_id=post.get("inspired_by_post_id"),
-                created_at=post["created_at"], updated_at=post["updated_at"],
-                author=author, is_liked=is_liked,
-            ))
+            enriched.append(self._to_post_response(post, author, post["id"] in liked_posts))
         return enriched
 
+    @staticmethod
+    def _to_post_response(post: dict, author: UserSummary, is_liked: bool) -> CommunityPostWithAuthorResponse:
+        return CommunityPostWithAuthorResponse(
+            id=post["id"], user_id=post["user_id"], asset_id=post["asset_id"],
+            title=post["title"], description=post.get("description"),
+            prompt_used=post.get("prompt_used"), show_prompt=post.get("show_prompt", True),
+            tags=post.get("tags", []), asset_type=post["asset_type"], asset_url=post["asset_url"],
+            like_count=post.get("like_count", 0), comment_count=post.get("comment_count", 0),
+            view_count=post.get("view_count", 0), is_featured=post.get("is_featured", False),
+            inspired_by_post_id=post.get("inspired_by_post_id"),
+            created_at=post["created_at"], updated_at=post["updated_at"],
+            author=author, is_liked=is_liked,
+        )
+
+    async def _overlay_viewer(self, cached: dict, viewer_id: Optional[str]) -> List[CommunityPostWithAuthorResponse]:
+        """Build responses from precomputed feed entries plus the viewer's likes (one query)."""
+        entries = cached["posts"]
+        liked_posts = await self._batch_check_viewer_likes([e["post"]["id"] for e in entries], viewer_id)
+        return [
+            self._to_post_response(e["post"], self._to_summary(e["author"]), e["post"]["id"] in liked_posts)
+            for e in entries
+        ]
+
     async def list_posts(
         self, page: int = 1, limit: int = 20, sort: POST_SORT_OPTIONS = "trending",
         asset_type: Optional[str] = None, tags: Optional[List[str]] = None,
@@ -135,14 +176,20 @@ class CommunityFeedService:
     async def get_featured_posts(
         self, limit: int = 10, viewer_id: Optional[str] = None,
     ) -> Tuple[List[CommunityPostWithAuthorResponse], int]:
-        """Get featured/spotlight posts."""
+        """Get featured/spotlight posts (precomputed; see community_feed_cache)."""
+        cached = await self.feed_cache.get_featured(limit)
+        if cached is not None:
+            return await self._overlay_viewer(cached, viewer_id), cached["total"]
         result = self.db.table("community_posts").select("*", count="exact").eq("is_featured", True).eq("is_hidden", False).order("created_at", desc=True).limit(limit).execute()
         return await self._enrich_posts(result.data or [], viewer_id), result.count or 0
 
     async def get_trending_posts(
         self, limit: int = 20, asset_type: Optional[str] = None, viewer_id: Optional[str] = None,
     ) -> Tuple[List[CommunityPostWithAuthorResponse], int]:
-        """Get trending posts using RPC get_trending_community_posts."""
+        """Get trending posts (precomputed from RPC get_trending_community_posts)."""
+        cached = await self.feed_cache.get_trending(limit, asset_type)
+        if cached is not None:
+            return await self._overlay_viewer(cached, viewer_id), cached["total"]
         try:
             params = {"p_limit": limit}
             if asset_type:
@@ -208,37 +255,37 @@ class CommunityFeedService:
             result = self.db.table("community_user_stats").select("user_id, post_count, total_likes_received, follower_count, following_count").order("total_likes_received", desc=True).limit(limit).execute()
             creators = result.data or []
 
-        enriched = []
-        for creator in creators:
-            user_id = creator.get("user_id") or creator.get("id")
-            if not user_id:
-                continue
+        creators = [c for c in creators if c.get("user_id") or c.get("id")]
+        user_ids = [c.get("user_id") or c.get("id") for c in creators]
 
-            # Get user info
-            user = await self._get_user_summary(user_id)
+        # One query each for users, recent posts and follow edges
+        loaders = get_request_loaders(self.db)
+        follow_keys = [(viewer_id, user_id) for user_id in user_ids if viewer_id and viewer_id != user_id]
+        user_map, recent_posts, follows = await asyncio.gather(
+            self._batch_get_user_summaries(user_ids),
+            loaders.recent_posts.load_many(user_ids),
+            loaders.follows.load_many(follow_keys),
+        )
+        followed = {key[1] for key, is_following in zip(follow_keys, follows) if is_following}
+
+        enriched = []
+        for creator, user_id, posts in zip(creators, user_ids, recent_posts):
+            user = user_map.get(user_id)
             if not user:
                 continue
 
-            # Get recent assets
-            recent_posts = self.db.table("community_posts").select("id, asset_url, asset_type").eq("user_id", user_id).eq("is_hidden", False).order("created_at", desc=True).limit(4).execute()
             recent_assets = [
                 {"id": p["id"], "url": p["asset_url"], "type": p["asset_type"]}
-                for p in (recent_posts.data or [])
+                for p in posts
             ]
 
-            # Check if viewer follows this creator
-            is_following = False
-            if viewer_id and viewer_id != user_id:
-                follow_check = self.db.table("community_follows").select("id").eq("follower_id", viewer_id).eq("followed_id", user_id).execute()
-                is_following = bool(follow_check.data)
-
             enriched.append({
                 "id": user_id,
                 "display_name": user.display_name,
                 "avatar_url": user.avatar_url,
                 "follower_count": creator.get("follower_count", 0),
                 "following_count": creator.get("following_count", 0),
-                "is_following": is_following,
+                "is_following": user_id in followed,
                 "recent_assets": recent_assets,
             })
 
@@ -258,10 +305,7 @@ class CommunityFeedService:
         }
 
         # Check if viewer follows this user
-        is_following = False
-        if viewer_id and viewer_id != user_id:
-            follow_check = self.db.table("community_follows").select("id").eq("follower_id", viewer_id).eq("followed_id", user_id).execute()
-            is_following = bool(follow_check.data)
+        is_following = await self._is_following(viewer_id, user_id)
 
         # Get joined date from users table
         user_result = self.db.table("users").select("created_at").eq("id", user_id).single().execute()
@@ -279,15 +323,17 @@ class CommunityFeedService:
         try:
             self.db.table("community_follows").insert({
                 "follower_id": follower_id,
-                "followed_id": followed_id,
+                "following_id": followed_id,
             }).execute()
         except Exception as e:
             # Likely already following (unique constraint)
             logger.debug(f"Follow failed (may already exist): {e}")
+        get_request_loaders(self.db).follows.clear((follower_id, followed_id))
 
     async def unfollow_user(self, follower_id: str, followed_id: str) -> None:
         """Unfollow a user."""
-        self.db.table("community_follows").delete().eq("follower_id", follower_id).eq("followed_id", followed_id).execute()
+        self.db.table("community_follows").delete().eq("follower_id", follower_id).eq("following_id", followed_id).execute()
+        get_request_loaders(self.db).follows.clear((follower_id, followed_id))
 
 
 _community_feed_service: Optional[CommunityFeedService] = None
@@ -9,6 +9,7 @@ from typing import Optional
 from uuid import uuid4
 
 from backend.database.supabase_client import get_supabase_client
+from backend.services.community_feed_cache import get_community_feed_cache
 from backend.api.schemas.community import (
     CreatePostRequest, UpdatePostRequest, CommunityPostResponse,
     CommunityPostWithAuthorResponse, UserSummary,
@@ -160,6 +161,7 @@ class CommunityPostService:
         updated = self.db.table("community_posts").update(update_data).eq("id", post_id).execute()
         if not updated.data:
             raise CommunityPostNotFoundError(post_id)
+        await get_community_feed_cache().invalidate(post_id)
         
         author = await self._get_user_summary(user_id)
         return self._map_post_with_author_response(updated.data[0], author, is_liked=False)
@@ -173,6 +175,7 @@ class CommunityPostService:
             raise CommunityPostNotOwnedError(post_id)
         
         self.db.table("community_posts").delete().eq("id", post_id).execute()
+        await get_community_feed_cache().invalidate(post_id)
 
 
 # Singleton instance
@@ -35,7 +35,6 @@ Usage:
 
 import asyncio
 import logging
-import os
 import uuid
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -44,6 +43,8 @@ from typing import AsyncIterator, Optional
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 logger = logging.getLogger(__name__)
 
 # Lock key prefix for all distributed locks
@@ -116,19 +117,25 @@ class DistributedLock:
         Initialize the distributed lock service.
         
         Args:
-            redis_url: Redis connection URL. Defaults to REDIS_URL env var
-                      or redis://localhost:6379
+            redis_url: Dedicated Redis connection URL. Defaults to the shared
+                      "coordination" pool from the connection manager.
         """
-        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._redis_url = redis_url
         self._client: Optional[redis.Redis] = None
         self._locks: dict[str, LockInfo] = {}
         
-        logger.debug(f"DistributedLock initialized with Redis URL: {self._redis_url.split('@')[-1]}")
+        logger.debug(
+            "DistributedLock initialized with "
+            f"{'dedicated Redis URL' if redis_url else 'shared coordination pool'}"
+        )
     
     async def _get_client(self) -> redis.Redis:
-        """Get or create Redis client."""
+        """Get the Redis client (shared pool unless a dedicated URL was given)."""
         if self._client is None:
-            self._client = redis.from_url(self._redis_url, decode_responses=True)
+            if self._redis_url:
+                self._client = redis.from_url(self._redis_url, decode_responses=True)
+            else:
+                self._client = get_async_redis("coordination")
         return self._client
     
     def _get_lock_key(self, lock_name: str) -> str:
@@ -438,7 +445,8 @@ class DistributedLock:
             await self.release(lock_name)
         
         if self._client is not None:
-            await self._client.aclose()
+            if self._redis_url:
+                await self._client.aclose()
             self._client = None
             logger.info("DistributedLock connection closed")
 
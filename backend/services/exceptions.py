@@ -220,6 +220,23 @@ class RateLimitExceededError(StreamerStudioError):
         )
 
 
+class PasswordHashingBusyError(StreamerStudioError):
+    """
+    Raised when the password hashing pool is at its admission limit.
+    
+    Login and signup shed load with a 503 instead of queueing without
+    bound; clients should retry after the given delay.
+    """
+    
+    def __init__(self, retry_after: int = 1):
+        super().__init__(
+            message="Authentication is busy. Please try again shortly.",
+            code="AUTH_BUSY",
+            status_code=503,
+            details={"retry_after_seconds": retry_after}
+        )
+
+
 class AuthorizationError(StreamerStudioError):
     """
     Raised when user is not authorized to access a resource.
@@ -806,6 +823,7 @@ __all__ = [
     "WeakPasswordError",
     "ValidationError",
     "RateLimitExceededError",
+    "PasswordHashingBusyError",
     "AuthorizationError",
     # Brand Kit Exceptions
     "BrandKitError",
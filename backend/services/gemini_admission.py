@@ -0,0 +1,459 @@
+"""
+Gemini Admission Controller
+
+Generation, thumbnail recreate, logo generation, Aura Lab, the profile
+creator and vision analysis all draw on the same Gemini quota. Each client
+used to retry on its own schedule, so a burst of 429s turned into a retry
+storm. Every call now takes a slot from a cluster-wide, per-model
+concurrency limit before it goes out:
+
+- AIMD: the limit grows by INCREASE/limit per success (about +INCREASE per
+  full window of calls) and is multiplied by DECREASE on a 429 or timeout,
+  at most once per cooldown so one burst of failures counts once.
+- Priority: waiters are admitted in priority order (paid interactive, then
+  free interactive, then batch jobs such as thumbnail intel vision), FIFO
+  within a priority.
+- Leases expire, so a worker that dies mid-call frees its slot.
+
+State lives in Redis and is updated by Lua scripts so all workers share one
+view of the quota. An in-memory backend implements the same algorithm for
+single-process development and the simulation harness
+(scripts/sim_gemini_admission.py). If Redis is unreachable, calls are
+admitted without a slot rather than failing.
+
+Redis layout (per model):
+    gemini:admission:{model}          - hash: limit, decreased_at
+    gemini:admission:{model}:leases   - zset: lease_id -> expires_at_ms
+    gemini:admission:{model}:queue    - zset: waiter_id -> priority rank, enqueued_ms
+    gemini:admission:{model}:seen     - zset: waiter_id -> last poll ms
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from backend.services.exceptions import GenerationTimeoutError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+ADMISSION_KEY_PREFIX = "gemini:admission:"
+
+# "redis" (cluster-wide), "memory" (per process) or "off"
+GEMINI_ADMISSION_BACKEND = os.getenv("GEMINI_ADMISSION_BACKEND", "redis").lower()
+
+GEMINI_ADMISSION_INITIAL_LIMIT = float(os.getenv("GEMINI_ADMISSION_INITIAL_LIMIT", "8"))
+GEMINI_ADMISSION_MIN_LIMIT = float(os.getenv("GEMINI_ADMISSION_MIN_LIMIT", "1"))
+GEMINI_ADMISSION_MAX_LIMIT = float(os.getenv("GEMINI_ADMISSION_MAX_LIMIT", "32"))
+GEMINI_ADMISSION_INCREASE = float(os.getenv("GEMINI_ADMISSION_INCREASE", "1"))
+GEMINI_ADMISSION_DECREASE = float(os.getenv("GEMINI_ADMISSION_DECREASE", "0.5"))
+# At most one decrease per cooldown. Keep it at or below a call round trip:
+# longer lets the limit grow past capacity while 429s are ignored
+GEMINI_ADMISSION_COOLDOWN_MS = int(os.getenv("GEMINI_ADMISSION_COOLDOWN_MS", "2000"))
+
+# Longer than the slowest client timeout (120s generation)
+GEMINI_ADMISSION_LEASE_MS = int(os.getenv("GEMINI_ADMISSION_LEASE_MS", "180000"))
+
+GEMINI_ADMISSION_POLL_MS = int(os.getenv("GEMINI_ADMISSION_POLL_MS", "50"))
+
+# Waiters that stop polling (crashed, cancelled) leave the queue after this
+WAITER_TTL_MS = 5000
+
+PRIORITY_PAID = "paid"
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BATCH = "batch"
+
+PRIORITY_RANKS: Dict[str, int] = {
+    PRIORITY_PAID: 0,
+    PRIORITY_INTERACTIVE: 1,
+    PRIORITY_BATCH: 2,
+}
+
+# Seconds a caller waits for a slot before giving up with a RateLimitError
+ACQUIRE_TIMEOUTS: Dict[str, float] = {
+    PRIORITY_PAID: float(os.getenv("GEMINI_ADMISSION_TIMEOUT", "60")),
+    PRIORITY_INTERACTIVE: float(os.getenv("GEMINI_ADMISSION_TIMEOUT", "60")),
+    PRIORITY_BATCH: float(os.getenv("GEMINI_ADMISSION_BATCH_TIMEOUT", "600")),
+}
+
+PAID_TIERS = frozenset({"pro", "studio", "unlimited"})
+
+OUTCOME_SUCCESS = "success"
+OUTCOME_OVERLOAD = "overload"
+OUTCOME_NEUTRAL = "neutral"
+
+
+def priority_for_tier(tier: Optional[str]) -> str:
+    """Admission priority for an interactive call made for a user of this tier."""
+    return PRIORITY_PAID if tier in PAID_TIERS else PRIORITY_INTERACTIVE
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Whether a failed call means Gemini is over capacity (shrink the limit)."""
+    if isinstance(error, (RateLimitError, GenerationTimeoutError, asyncio.TimeoutError)):
+        return True
+    # google-genai APIError carries the HTTP status as .code
+    if getattr(error, "code", None) == 429:
+        return True
+    return "RESOURCE_EXHAUSTED" in str(error)
+
+
+@dataclass
+class AdmissionLease:
+    """A slot held for one Gemini call."""
+    model: str
+    lease_id: str
+    priority: str
+    limit: float
+    waited_ms: int
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+# KEYS: state, leases, queue, seen
+# ARGV: waiter_id, now_ms, lease_ms, queue_score, waiter_ttl_ms, initial_limit
+# Returns {admitted, limit, in_flight}
+_ACQUIRE_LUA = """
+local now = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now)
+local stale_before = now - tonumber(ARGV[5])
+local stale = redis.call('ZRANGEBYSCORE', KEYS[4], '-inf', stale_before)
+if #stale > 0 then
+    redis.call('ZREM', KEYS[3], unpack(stale))
+    redis.call('ZREMRANGEBYSCORE', KEYS[4], '-inf', stale_before)
+end
+local limit = tonumber(redis.call('HGET', KEYS[1], 'limit') or ARGV[6])
+local in_flight = redis.call('ZCARD', KEYS[2])
+local score = redis.call('ZSCORE', KEYS[3], ARGV[1])
+if not score then
+    score = ARGV[4]
+    redis.call('ZADD', KEYS[3], score, ARGV[1])
+end
+local ahead = redis.call('ZCOUNT', KEYS[3], '-inf', '(' .. score)
+if in_flight + ahead < math.floor(limit) then
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    redis.call('ZREM', KEYS[4], ARGV[1])
+    redis.call('ZADD', KEYS[2], now + tonumber(ARGV[3]), ARGV[1])
+    return {1, tostring(limit), in_flight + 1}
+end
+redis.call('ZADD', KEYS[4], now, ARGV[1])
+return {0, tostring(limit), in_flight}
+"""
+
+# KEYS: state, leases
+# ARGV: lease_id, outcome, now_ms, initial, min, max, increase, decrease, cooldown_ms
+# Returns the new limit
+_RELEASE_LUA = """
+redis.call('ZREM', KEYS[2], ARGV[1])
+local limit = tonumber(redis.call('HGET', KEYS[1], 'limit') or ARGV[4])
+local now = tonumber(ARGV[3])
+if ARGV[2] == 'success' then
+    limit = math.min(tonumber(ARGV[6]), limit + tonumber(ARGV[7]) / limit)
+elseif ARGV[2] == 'overload' then
+    local last = tonumber(redis.call('HGET', KEYS[1], 'decreased_at') or '0')
+    if now - last >= tonumber(ARGV[9]) then
+        limit = math.max(tonumber(ARGV[5]), limit * tonumber(ARGV[8]))
+        redis.call('HSET', KEYS[1], 'decreased_at', now)
+    end
+end
+redis.call('HSET', KEYS[1], 'limit', tostring(limit))
+return tostring(limit)
+"""
+
+
+@dataclass
+class _AimdParams:
+    initial: float = GEMINI_ADMISSION_INITIAL_LIMIT
+    min: float = GEMINI_ADMISSION_MIN_LIMIT
+    max: float = GEMINI_ADMISSION_MAX_LIMIT
+    increase: float = GEMINI_ADMISSION_INCREASE
+    decrease: float = GEMINI_ADMISSION_DECREASE
+    cooldown_ms: int = GEMINI_ADMISSION_COOLDOWN_MS
+    lease_ms: int = GEMINI_ADMISSION_LEASE_MS
+
+
+class _RedisAdmissionBackend:
+    """Cluster-wide state, updated atomically by Lua scripts."""
+
+    def __init__(self, redis_client=None):
+        self._redis = redis_client
+        self._acquire_script = None
+        self._release_script = None
+
+    @property
+    def redis(self):
+        """Lazy load the shared coordination Redis client."""
+        if self._redis is None:
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("coordination")
+        return self._redis
+
+    @staticmethod
+    def _keys(model: str) -> Tuple[str, str, str, str]:
+        base = f"{ADMISSION_KEY_PREFIX}{model}"
+        return base, f"{base}:leases", f"{base}:queue", f"{base}:seen"
+
+    async def try_acquire(
+        self, model: str, waiter_id: str, queue_score: int, now_ms: int, params: _AimdParams
+    ) -> Tuple[bool, float]:
+        if self._acquire_script is None:
+            self._acquire_script = self.redis.register_script(_ACQUIRE_LUA)
+        admitted, limit, _ = await self._acquire_script(
+            keys=list(self._keys(model)),
+            args=[waiter_id, now_ms, params.lease_ms, queue_score, WAITER_TTL_MS, params.initial],
+        )
+        return bool(int(admitted)), float(limit)
+
+    async def release(
+        self, model: str, lease_id: str, outcome: str, now_ms: int, params: _AimdParams
+    ) -> float:
+        if self._release_script is None:
+            self._release_script = self.redis.register_script(_RELEASE_LUA)
+        state, leases, _, _ = self._keys(model)
+        limit = await self._release_script(
+            keys=[state, leases],
+            args=[
+                lease_id, outcome, now_ms, params.initial, params.min, params.max,
+                params.increase, params.decrease, params.cooldown_ms,
+            ],
+        )
+        return float(limit)
+
+    async def abandon(self, model: str, waiter_id: str) -> None:
+        _, _, queue, seen = self._keys(model)
+        pipe = self.redis.pipeline()
+        pipe.zrem(queue, waiter_id)
+        pipe.zrem(seen, waiter_id)
+        await pipe.execute()
+
+    async def get_limit(self, model: str, params: _AimdParams) -> float:
+        limit = await self.redis.hget(self._keys(model)[0], "limit")
+        return float(limit) if limit is not None else params.initial
+
+
+class _MemoryAdmissionBackend:
+    """Per-process state with the same algorithm as the Lua scripts."""
+
+    def __init__(self):
+        self._limits: Dict[str, float] = {}
+        self._decreased_at: Dict[str, int] = {}
+        self._leases: Dict[str, Dict[str, int]] = {}
+        self._queues: Dict[str, Dict[str, int]] = {}
+        self._seen: Dict[str, Dict[str, int]] = {}
+
+    async def try_acquire(
+        self, model: str, waiter_id: str, queue_score: int, now_ms: int, params: _AimdParams
+    ) -> Tuple[bool, float]:
+        leases = self._leases.setdefault(model, {})
+        queue = self._queues.setdefault(model, {})
+        seen = self._seen.setdefault(model, {})
+
+        for lease_id in [lid for lid, expires in leases.items() if expires <= now_ms]:
+            del leases[lease_id]
+        for stale in [wid for wid, at in seen.items() if at <= now_ms - WAITER_TTL_MS]:
+            queue.pop(stale, None)
+            del seen[stale]
+
+        limit = self._limits.get(model, params.initial)
+        score = queue.setdefault(waiter_id, queue_score)
+        ahead = sum(1 for other in queue.values() if other < score)
+        if len(leases) + ahead < int(limit):
+            del queue[waiter_id]
+            seen.pop(waiter_id, None)
+            leases[waiter_id] = now_ms + params.lease_ms
+            return True, limit
+        seen[waiter_id] = now_ms
+        return False, limit
+
+    async def release(
+        self, model: str, lease_id: str, outcome: str, now_ms: int, params: _AimdParams
+    ) -> float:
+        self._leases.get(model, {}).pop(lease_id, None)
+        limit = self._limits.get(model, params.initial)
+        if outcome == OUTCOME_SUCCESS:
+            limit = min(params.max, limit + params.increase / limit)
+        elif outcome == OUTCOME_OVERLOAD:
+            if now_ms - self._decreased_at.get(model, 0) >= params.cooldown_ms:
+                limit = max(params.min, limit * params.decrease)
+                self._decreased_at[model] = now_ms
+        self._limits[model] = limit
+        return limit
+
+    async def abandon(self, model: str, waiter_id: str) -> None:
+        self._queues.get(model, {}).pop(waiter_id, None)
+        self._seen.get(model, {}).pop(waiter_id, None)
+
+    async def get_limit(self, model: str, params: _AimdParams) -> float:
+        return self._limits.get(model, params.initial)
+
+
+# ============================================================================
+# Controller
+# ============================================================================
+
+class GeminiAdmissionController:
+    """
+    Shared AIMD concurrency limit for Gemini calls.
+
+    Usage:
+        admission = get_gemini_admission()
+        async with admission.slot(model, priority_for_tier(user_tier)):
+            response = await call_gemini()
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        backend: str = GEMINI_ADMISSION_BACKEND,
+        initial_limit: float = GEMINI_ADMISSION_INITIAL_LIMIT,
+        min_limit: float = GEMINI_ADMISSION_MIN_LIMIT,
+        max_limit: float = GEMINI_ADMISSION_MAX_LIMIT,
+        increase: float = GEMINI_ADMISSION_INCREASE,
+        decrease: float = GEMINI_ADMISSION_DECREASE,
+        cooldown_ms: int = GEMINI_ADMISSION_COOLDOWN_MS,
+        lease_ms: int = GEMINI_ADMISSION_LEASE_MS,
+        poll_ms: int = GEMINI_ADMISSION_POLL_MS,
+    ):
+        """
+        Args:
+            redis_client: Async Redis client (uses the coordination pool if not provided)
+            backend: "redis", "memory" or "off"
+            initial_limit: Concurrency limit for a model with no history
+            min_limit: Floor the limit never shrinks below
+            max_limit: Ceiling the limit never grows above
+            increase: Additive increase per full window of successful calls
+            decrease: Multiplicative decrease on overload
+            cooldown_ms: Minimum time between decreases
+            lease_ms: Slot lifetime if never released
+            poll_ms: Mean interval between admission attempts while queued
+        """
+        self.enabled = backend != "off"
+        if backend == "memory":
+            self._backend = _MemoryAdmissionBackend()
+        else:
+            self._backend = _RedisAdmissionBackend(redis_client)
+        self.params = _AimdParams(
+            initial=initial_limit, min=min_limit, max=max_limit, increase=increase,
+            decrease=decrease, cooldown_ms=cooldown_ms, lease_ms=lease_ms,
+        )
+        self.poll_ms = poll_ms
+
+    async def acquire(
+        self, model: str, priority: str = PRIORITY_INTERACTIVE, timeout: Optional[float] = None
+    ) -> Optional[AdmissionLease]:
+        """
+        Wait for a slot.
+
+        Returns:
+            The lease, or None if admission is off or the backend is unreachable
+
+        Raises:
+            RateLimitError: If no slot frees up within the priority's timeout
+        """
+        if not self.enabled:
+            return None
+
+        rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[PRIORITY_INTERACTIVE])
+        timeout = ACQUIRE_TIMEOUTS.get(priority, 60.0) if timeout is None else timeout
+        waiter_id = uuid.uuid4().hex
+        started_ms = _now_ms()
+        queue_score = rank * 10**13 + started_ms
+        deadline = time.monotonic() + timeout
+
+        try:
+            while True:
+                admitted, limit = await self._backend.try_acquire(
+                    model, waiter_id, queue_score, _now_ms(), self.params
+                )
+                if admitted:
+                    return AdmissionLease(model, waiter_id, priority, limit, _now_ms() - started_ms)
+                if time.monotonic() >= deadline:
+                    await self._backend.abandon(model, waiter_id)
+                    logger.warning(
+                        f"Gemini admission timed out: model={model}, priority={priority}, limit={limit:.1f}"
+                    )
+                    raise RateLimitError(retry_after=1)
+                await asyncio.sleep(self.poll_ms / 1000 * random.uniform(0.5, 1.5))
+        except RateLimitError:
+            raise
+        except asyncio.CancelledError:
+            try:
+                await asyncio.shield(self._backend.abandon(model, waiter_id))
+            except Exception:
+                pass
+            raise
+        except Exception as e:
+            logger.warning(f"Gemini admission unavailable, admitting without a slot: {e}")
+            return None
+
+    async def release(self, lease: Optional[AdmissionLease], outcome: str) -> None:
+        """Return a slot and feed the call's outcome into the AIMD limit."""
+        if lease is None:
+            return
+        try:
+            limit = await self._backend.release(lease.model, lease.lease_id, outcome, _now_ms(), self.params)
+        except Exception as e:
+            # The lease expires on its own
+            logger.warning(f"Failed to release Gemini admission slot: {e}")
+            return
+        if outcome == OUTCOME_OVERLOAD:
+            logger.info(f"Gemini overload: model={lease.model}, limit now {limit:.1f}")
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: str = PRIORITY_INTERACTIVE) -> AsyncIterator[Optional[AdmissionLease]]:
+        """Hold a slot for the body; 429s and timeouts shrink the limit."""
+        lease = await self.acquire(model, priority)
+        outcome = OUTCOME_NEUTRAL
+        try:
+            yield lease
+            outcome = OUTCOME_SUCCESS
+        except BaseException as e:
+            if is_overload_error(e):
+                outcome = OUTCOME_OVERLOAD
+            raise
+        finally:
+            await self.release(lease, outcome)
+
+    async def get_limit(self, model: str) -> float:
+        """Current concurrency limit for a model."""
+        return await self._backend.get_limit(model, self.params)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+# Singleton instance
+_gemini_admission: Optional[GeminiAdmissionController] = None
+
+
+def get_gemini_admission() -> GeminiAdmissionController:
+    """Get or create the GeminiAdmissionController singleton."""
+    global _gemini_admission
+    if _gemini_admission is None:
+        _gemini_admission = GeminiAdmissionController()
+    return _gemini_admission
+
+
+__all__ = [
+    "AdmissionLease",
+    "GeminiAdmissionController",
+    "PRIORITY_BATCH",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_PAID",
+    "get_gemini_admission",
+    "is_overload_error",
+    "priority_for_tier",
+]
@@ -0,0 +1,304 @@
+"""
+Gemini Multi-Turn History Store
+
+Refinements continue a Gemini conversation, so coach sessions and
+refinement jobs carry the previous turns. Model turns used to embed the
+generated image (and its thought signature) as base64, which made every
+session save and job row several megabytes. History now holds
+content-addressed references instead:
+
+    {"role": "model", "image_ref": "<sha256>", "image_url": "<storage URL>",
+     "image_mime_type": "image/png", "thought_signature_ref": "<sha256>"}
+
+Each blob is stored once per content hash in Redis, with a per-process LRU
+in front. References are resolved only when a refinement calls Gemini; if
+an image blob has expired it is re-downloaded from its storage URL. Turns
+with inline base64 (sessions saved before this change) resolve as-is.
+
+Redis layout:
+    gemini:blob:{sha256} - raw bytes (expires after GEMINI_BLOB_TTL)
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from backend.database.redis_pool import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+BLOB_KEY_PREFIX = "gemini:blob:"
+
+# Outlives coach sessions (30 minutes) so job-based refinements still resolve
+GEMINI_BLOB_TTL = int(os.getenv("GEMINI_BLOB_TTL", str(24 * 60 * 60)))
+
+# Per-process LRU budget for resolved blobs
+GEMINI_BLOB_CACHE_BYTES = int(os.getenv("GEMINI_BLOB_CACHE_MB", "64")) * 1024 * 1024
+
+DOWNLOAD_TIMEOUT = 30.0
+
+
+def blob_digest(data: bytes) -> str:
+    """Content address for a blob."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class _ByteLRU:
+    """Thread-safe LRU of blobs bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(digest)
+            if data is not None:
+                self._items.move_to_end(digest)
+            return data
+
+    def put(self, digest: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if digest in self._items:
+                self._items.move_to_end(digest)
+                return
+            self._items[digest] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+
+class GeminiHistoryStore:
+    """
+    Content-addressed blob storage for Gemini conversation history.
+    """
+
+    def __init__(self, redis_client=None, cache_bytes: int = GEMINI_BLOB_CACHE_BYTES):
+        """
+        Args:
+            redis_client: Binary async Redis client (uses the blob pool if not provided)
+            cache_bytes: Per-process LRU budget
+        """
+        self._redis = redis_client
+        self._cache = _ByteLRU(cache_bytes)
+
+    @property
+    def redis(self):
+        """Lazy load the shared binary Redis client."""
+        if self._redis is None:
+            self._redis = get_async_redis("blob")
+        return self._redis
+
+    # ------------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------------
+
+    async def put(self, data: bytes) -> str:
+        """
+        Store a blob (once per content) and return its digest.
+
+        Raises:
+            Redis errors, so callers can fall back to inlining
+        """
+        digest = blob_digest(data)
+        key = f"{BLOB_KEY_PREFIX}{digest}"
+        stored = await self.redis.set(key, data, ex=GEMINI_BLOB_TTL, nx=True)
+        if not stored:
+            # Already there (same image again); just keep it alive
+            await self.redis.expire(key, GEMINI_BLOB_TTL)
+        self._cache.put(digest, data)
+        return digest
+
+    async def model_turn(
+        self,
+        image_data: bytes,
+        mime_type: str = "image/png",
+        image_url: Optional[str] = None,
+        thought_signature: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build a model history turn that references its image and signature.
+
+        If Redis is unavailable the blobs are inlined as base64 (the old
+        format), so a refinement never loses its context.
+
+        Args:
+            image_data: Generated image bytes
+            mime_type: Image MIME type
+            image_url: Storage URL of the image (fallback if the blob expires)
+            thought_signature: Gemini thought signature bytes
+
+        Returns:
+            History turn dict
+        """
+        turn: Dict[str, Any] = {"role": "model", "image_mime_type": mime_type}
+        if image_url:
+            turn["image_url"] = image_url
+
+        try:
+            turn["image_ref"] = await self.put(image_data)
+        except Exception as e:
+            logger.warning(f"Failed to store history image blob, inlining: {e}")
+            turn["image_data"] = base64.b64encode(image_data).decode()
+
+        if thought_signature:
+            try:
+                turn["thought_signature_ref"] = await self.put(thought_signature)
+            except Exception as e:
+                logger.warning(f"Failed to store thought signature blob, inlining: {e}")
+                turn["thought_signature"] = base64.b64encode(thought_signature).decode()
+
+        return turn
+
+    # ------------------------------------------------------------------------
+    # Resolving
+    # ------------------------------------------------------------------------
+
+    async def get_many(self, digests: List[str]) -> Dict[str, bytes]:
+        """
+        Load blobs from the LRU, then one MGET for the rest.
+
+        Returns:
+            digest -> bytes for every blob found
+        """
+        found: Dict[str, bytes] = {}
+        missing = []
+        for digest in dict.fromkeys(digests):
+            data = self._cache.get(digest)
+            if data is not None:
+                found[digest] = data
+            else:
+                missing.append(digest)
+
+        if missing:
+            try:
+                values = await self.redis.mget([f"{BLOB_KEY_PREFIX}{digest}" for digest in missing])
+            except Exception as e:
+                logger.warning(f"Failed to load history blobs: {e}")
+                values = [None] * len(missing)
+            for digest, data in zip(missing, values):
+                if data is not None:
+                    self._cache.put(digest, data)
+                    found[digest] = data
+        return found
+
+    async def resolve_history(self, history: List[Any]) -> List[Any]:
+        """
+        Replace references with inline base64 for a Gemini request.
+
+        Turns without references (and non-dict turns) pass through
+        unchanged. If an image is neither in the store nor downloadable
+        the whole history is dropped, so the caller sends a prompt-only
+        request instead of asking Gemini to refine an image it never gets.
+
+        Args:
+            history: Conversation history as stored on the session or job
+
+        Returns:
+            History whose model turns carry image_data/thought_signature as
+            base64, or an empty list when an image cannot be resolved
+        """
+        digests = [
+            turn[field]
+            for turn in history if isinstance(turn, dict)
+            for field in ("image_ref", "thought_signature_ref") if turn.get(field)
+        ]
+        blobs = await self.get_many(digests) if digests else {}
+
+        # Images the store no longer has come back from their storage URLs
+        downloads = {
+            turn["image_url"]
+            for turn in history
+            if isinstance(turn, dict) and not turn.get("image_data") and turn.get("image_url")
+            and blobs.get(turn.get("image_ref")) is None
+        }
+        downloaded = {}
+        if downloads:
+            results = await asyncio.gather(*(self._download(url) for url in downloads))
+            downloaded = dict(zip(downloads, results))
+
+        resolved = []
+        for turn in history:
+            if not isinstance(turn, dict) or not (
+                turn.get("image_ref") or turn.get("thought_signature_ref") or turn.get("image_url")
+            ):
+                resolved.append(turn)
+                continue
+
+            turn = dict(turn)
+            ref = turn.pop("image_ref", None)
+            url = turn.pop("image_url", None)
+            if (ref or url) and not turn.get("image_data"):
+                image = blobs.get(ref) if ref else None
+                if image is None and url:
+                    image = downloaded.get(url)
+                if image is None:
+                    logger.warning(
+                        "History image unavailable, falling back to a prompt-only request"
+                    )
+                    return []
+                turn["image_data"] = base64.b64encode(image).decode()
+
+            sig_ref = turn.pop("thought_signature_ref", None)
+            if sig_ref and not turn.get("thought_signature"):
+                signature = blobs.get(sig_ref)
+                if signature is not None:
+                    turn["thought_signature"] = base64.b64encode(signature).decode()
+                else:
+                    # Gemini may lose reasoning context for this turn
+                    logger.warning(
+                        f"History thought signature {sig_ref[:12]} expired, refining without it"
+                    )
+
+            resolved.append(turn)
+        return resolved
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        """Fetch an image from storage, caching it under its digest."""
+        import httpx
+
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(url, timeout=DOWNLOAD_TIMEOUT)
+                response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Failed to download history image: {e}")
+            return None
+        self._cache.put(blob_digest(response.content), response.content)
+        return response.content
+
+
+# Singleton instance
+_gemini_history_store: Optional[GeminiHistoryStore] = None
+
+
+def get_gemini_history_store() -> GeminiHistoryStore:
+    """Get or create the GeminiHistoryStore singleton."""
+    global _gemini_history_store
+    if _gemini_history_store is None:
+        _gemini_history_store = GeminiHistoryStore()
+    return _gemini_history_store
+
+
+__all__ = [
+    "BLOB_KEY_PREFIX",
+    "GEMINI_BLOB_TTL",
+    "GeminiHistoryStore",
+    "blob_digest",
+    "get_gemini_history_store",
+]
@@ -0,0 +1,198 @@
+"""
+Streaming Decoder for Gemini Inline Image Responses
+
+A generateContent response carries the generated image as a multi-megabyte
+base64 string inside the JSON (candidates[].content.parts[].inlineData.data).
+Reading it with response.json() holds the raw body, its decoded text, the
+parsed string and finally the decoded image at the same time.
+
+InlineDataDecoder consumes the body chunk by chunk instead:
+- The value of every "data" key is base64-decoded as it arrives into a
+  buffer preallocated from Content-Length.
+- Everything else goes into a small JSON skeleton in which each data value
+  is replaced by a placeholder.
+- The skeleton is parsed once at the end. Placeholders map to the decoded
+  blobs by index.
+
+Peak memory for one response is about two copies of the decoded image,
+down from about five.
+
+Usage:
+    decoder = InlineDataDecoder(size_hint=response.content_length)
+    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+        decoder.feed(chunk)
+    data = decoder.result()
+    image = decoder.resolve(data["candidates"][0]["content"]["parts"][0]["inlineData"]["data"])
+"""
+
+import binascii
+import json
+import re
+from typing import Any, List, Optional
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+PLACEHOLDER_PREFIX = "__inline_data_"
+
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+
+class InlineDataDecoder:
+    """
+    Incremental JSON scanner that decodes "data" string values as base64.
+
+    Only the structure around the data values is parsed as JSON, and the
+    scanner assumes a well-formed response body. Anything malformed surfaces
+    as a ValueError from result().
+    """
+
+    def __init__(self, size_hint: Optional[int] = None):
+        """
+        Args:
+            size_hint: Response Content-Length, used to preallocate the first blob
+        """
+        self.blobs: List[bytes] = []
+        self._size_hint = size_hint
+        self._skeleton = bytearray()
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._after_data_key = False
+        self._between = bytearray()
+
+        # Current blob being captured
+        self._capturing = False
+        self._buffer: Optional[bytearray] = None
+        self._length = 0
+        self._pending = b""
+
+    # ------------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------------
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        pos, size = 0, len(chunk)
+        while pos < size:
+            if self._capturing:
+                end = chunk.find(b'"', pos)
+                self._decode(chunk[pos:size if end < 0 else end])
+                if end < 0:
+                    return
+                self._close_blob()
+                pos = end + 1
+            elif self._in_string:
+                pos = self._scan_string(chunk, pos)
+            else:
+                end = chunk.find(b'"', pos)
+                segment = chunk[pos:size if end < 0 else end]
+                self._skeleton += segment
+                if self._after_data_key:
+                    self._between += segment
+                if end < 0:
+                    return
+                self._open_string()
+                pos = end + 1
+
+    def _scan_string(self, chunk: bytes, pos: int) -> int:
+        """Copy string content into the skeleton up to its closing quote."""
+        if self._escape:
+            self._skeleton += chunk[pos:pos + 1]
+            self._escape = False
+            return pos + 1
+        match = _STRING_SPECIAL.search(chunk, pos)
+        if match is None:
+            self._skeleton += chunk[pos:]
+            return len(chunk)
+        end = match.start()
+        self._skeleton += chunk[pos:end + 1]
+        if chunk[end:end + 1] == b"\\":
+            self._escape = True
+        else:
+            self._in_string = False
+            self._after_data_key = self._skeleton[self._string_start:-1] == b"data"
+            self._between.clear()
+        return end + 1
+
+    def _open_string(self) -> None:
+        """Start a string, capturing it if it is the value of a "data" key."""
+        if self._after_data_key and bytes(self._between).strip() == b":":
+            placeholder = f"{PLACEHOLDER_PREFIX}{len(self.blobs)}"
+            self._skeleton += b'"' + placeholder.encode()
+            self._start_blob()
+        else:
+            self._skeleton += b'"'
+            self._in_string = True
+            self._string_start = len(self._skeleton)
+        self._after_data_key = False
+        self._between.clear()
+
+    # ------------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------------
+
+    def _start_blob(self) -> None:
+        self._capturing = True
+        self._length = 0
+        self._pending = b""
+        # Only the first (usually only) image can use the whole-body hint
+        hint = self._size_hint if not self.blobs and self._size_hint else 0
+        self._buffer = bytearray(hint * 3 // 4)
+
+    def _decode(self, segment: bytes) -> None:
+        """Decode whole base64 quads, carrying the remainder to the next chunk."""
+        data = self._pending + segment if self._pending else bytes(segment)
+        if b"\\" in data:
+            # JSON may escape "/" as "\/"; a trailing backslash waits for its pair
+            data = data.replace(b"\\/", b"/")
+        usable = len(data) - data.endswith(b"\\")
+        cut = usable - usable % 4
+        if cut:
+            self._write(binascii.a2b_base64(data[:cut]))
+        self._pending = data[cut:]
+
+    def _write(self, decoded: bytes) -> None:
+        end = self._length + len(decoded)
+        if end <= len(self._buffer):
+            memoryview(self._buffer)[self._length:end] = decoded
+        else:
+            del self._buffer[self._length:]
+            self._buffer += decoded
+        self._length = end
+
+    def _close_blob(self) -> None:
+        if self._pending:
+            self._write(binascii.a2b_base64(self._pending))
+        with memoryview(self._buffer) as view:
+            self.blobs.append(bytes(view[:self._length]))
+        self._buffer = None
+        self._pending = b""
+        self._capturing = False
+        self._skeleton += b'"'
+
+    # ------------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------------
+
+    def result(self) -> Any:
+        """
+        Parse the skeleton once the body has been fed.
+
+        Raises:
+            ValueError: If the body was incomplete or not valid JSON
+        """
+        if self._capturing or self._in_string:
+            raise ValueError("Response body ended inside a string")
+        return json.loads(self._skeleton)
+
+    def resolve(self, value: Any) -> Optional[bytes]:
+        """Decoded bytes for a placeholder from the skeleton, else None."""
+        if isinstance(value, str) and value.startswith(PLACEHOLDER_PREFIX):
+            return self.blobs[int(value[len(PLACEHOLDER_PREFIX):])]
+        return None
+
+
+__all__ = [
+    "InlineDataDecoder",
+    "STREAM_CHUNK_SIZE",
+]
@@ -27,6 +27,7 @@ from typing import Optional
 
 import aiohttp
 
+from backend.services.gemini_admission import PRIORITY_INTERACTIVE, get_gemini_admission
 from backend.services.exceptions import (
     ContentPolicyError,
     GenerationError,
@@ -41,6 +42,7 @@ class VisionAnalysisRequest:
     image_data: bytes          # Raw image bytes
     prompt: str                # Analysis prompt
     mime_type: str = "image/jpeg"
+    priority: str = PRIORITY_INTERACTIVE  # Admission priority for the shared Gemini quota
 
 
 @dataclass  
@@ -147,10 +149,12 @@ class GeminiVisionClient:
         import random
         
         last_exception: Optional[Exception] = None
+        admission = get_gemini_admission()
         
         for attempt in range(self.max_retries):
             try:
-                return await self._execute_analysis(request)
+                async with admission.slot(self.MODEL, request.priority):
+                    return await self._execute_analysis(request)
             
             except ContentPolicyError:
                 # Don't retry content policy violations
@@ -0,0 +1,231 @@
+"""
+Generation Result Cache for Aurastream.
+
+Quick Create templates and prompt-engine builds produce byte-identical
+prompts for the same brand kit, asset type and inputs, so "regenerate" on
+an unchanged, seeded input would pay for the same Gemini call again. This
+cache lets the generation worker serve the earlier image instead.
+
+Only requests that opt in are cached:
+- the job carries an explicit seed (unseeded jobs generate fresh every time)
+- the user's tier is listed in GENERATION_RESULT_CACHE_TIERS
+- the request is not a multi-turn refinement (history refers to earlier
+  turns, not just to the inputs hashed here)
+
+The key is a SHA-256 over the canonical request: model, prompt, dimensions,
+seed, grounding, and the hashes of the input image and media assets. The
+cached value is the raw Gemini image before logo compositing and emote
+processing, so the worker runs those steps and uploads a new storage
+object for each job as usual.
+
+Each entry also names the generation and job that produced it, so a job
+served from the cache records provenance pointing at the original.
+
+Redis layout ("blob" pool):
+    generation:result:{sha256} - hash {image, thought_signature, seed,
+                                       generation_id, job_id}
+"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from backend.services.nano_banana_client import GenerationRequest, GenerationResponse
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULT_CACHE_PREFIX = "generation:result:"
+
+# Seconds a generated image can be served again
+RESULT_CACHE_TTL = int(os.getenv("GENERATION_RESULT_CACHE_TTL", str(24 * 60 * 60)))
+
+# Tiers whose seeded requests use the cache; empty disables it
+RESULT_CACHE_TIERS = frozenset(
+    tier.strip()
+    for tier in os.getenv("GENERATION_RESULT_CACHE_TIERS", "free,pro,studio,unlimited").split(",")
+    if tier.strip()
+)
+
+# Larger images are generated normally and not cached
+RESULT_CACHE_MAX_BYTES = int(os.getenv("GENERATION_RESULT_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+
+def _track(outcome: str, tier: Optional[str]) -> None:
+    try:
+        from backend.api.middleware.prometheus_metrics import track_generation_result_cache
+        track_generation_result_cache(outcome, tier or "unknown")
+    except Exception:
+        pass
+
+
+def _digest(data: Optional[bytes]) -> Optional[str]:
+    return hashlib.sha256(data).hexdigest() if data is not None else None
+
+
+def result_cache_key(request: GenerationRequest) -> str:
+    """
+    Canonical cache key of a generation request.
+
+    Identical inputs give the same key however the request was built;
+    images are represented by their SHA-256.
+    """
+    canonical = {
+        "model": request.model,
+        "prompt": request.prompt,
+        "width": request.width,
+        "height": request.height,
+        "seed": request.seed,
+        "grounding": request.enable_grounding,
+        "input_image": _digest(request.input_image),
+        "input_mime_type": request.input_mime_type if request.input_image is not None else None,
+        "media_assets": [
+            {
+                "image": _digest(asset.image_data),
+                "mime_type": asset.mime_type,
+                "asset_type": asset.asset_type,
+                "display_name": asset.display_name,
+            }
+            for asset in request.media_assets or []
+        ],
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    return f"{RESULT_CACHE_PREFIX}{hashlib.sha256(encoded).hexdigest()}"
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+@dataclass
+class CachedGeneration:
+    """
+    A result served from the cache.
+
+    Attributes:
+        response: Response for this job (fresh generation_id, no inference time)
+        source_generation_id: Generation that produced the image, if recorded
+        source_job_id: Job that produced the image, if recorded
+    """
+    response: GenerationResponse
+    source_generation_id: Optional[str] = None
+    source_job_id: Optional[str] = None
+
+
+class GenerationResultCache:
+    """
+    Generated images for seeded requests, keyed by the canonical request.
+
+    Cache errors are logged and treated as misses; the job then generates
+    as it would without a cache.
+    """
+
+    def __init__(self, redis_client=None, tiers: frozenset = RESULT_CACHE_TIERS):
+        self._redis = redis_client
+        self.tiers = tiers
+
+    @property
+    def redis(self):
+        """Lazy-load the binary Redis client."""
+        if self._redis is None:
+            from backend.database.redis_pool import get_async_redis
+            self._redis = get_async_redis("blob")
+        return self._redis
+
+    def key_for(self, request: GenerationRequest, tier: Optional[str]) -> Optional[str]:
+        """
+        Cache key for a request, or None if the request must not be cached.
+
+        Args:
+            request: Generation request about to be sent
+            tier: Subscription tier of the job's user
+        """
+        if request.seed is None or request.conversation_history:
+            return None
+        if tier not in self.tiers:
+            _track("disabled", tier)
+            return None
+        return result_cache_key(request)
+
+    async def get(self, key: str, tier: Optional[str] = None) -> Optional[CachedGeneration]:
+        """
+        Load a cached result.
+
+        Returns:
+            CachedGeneration for the cached image, or None on a miss
+        """
+        try:
+            image, thought_signature, seed, generation_id, job_id = await self.redis.hmget(
+                key, ["image", "thought_signature", "seed", "generation_id", "job_id"]
+            )
+        except Exception as e:
+            logger.warning(f"Generation result cache read failed: {e}")
+            _track("error", tier)
+            return None
+
+        if not image:
+            _track("miss", tier)
+            return None
+
+        _track("hit", tier)
+        return CachedGeneration(
+            response=GenerationResponse(
+                image_data=image,
+                generation_id=str(uuid.uuid4()),
+                seed=int(seed),
+                inference_time_ms=0,
+                thought_signature=thought_signature or None,
+            ),
+            source_generation_id=generation_id.decode() if generation_id else None,
+            source_job_id=job_id.decode() if job_id else None,
+        )
+
+    async def put(self, key: str, response: GenerationResponse, job_id: Optional[str] = None) -> None:
+        """Store a generated result, and the job that produced it, under its request key."""
+        if len(response.image_data) > RESULT_CACHE_MAX_BYTES:
+            return
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(key, mapping={
+                "image": response.image_data,
+                "thought_signature": response.thought_signature or b"",
+                "seed": str(response.seed),
+                "generation_id": response.generation_id,
+                "job_id": job_id or "",
+            })
+            pipe.expire(key, RESULT_CACHE_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Generation result cache write failed: {e}")
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_generation_result_cache: Optional[GenerationResultCache] = None
+
+
+def get_generation_result_cache() -> GenerationResultCache:
+    """Get or create the generation result cache singleton."""
+    global _generation_result_cache
+    if _generation_result_cache is None:
+        _generation_result_cache = GenerationResultCache()
+    return _generation_result_cache
+
+
+__all__ = [
+    "CachedGeneration",
+    "GenerationResultCache",
+    "RESULT_CACHE_TIERS",
+    "RESULT_CACHE_TTL",
+    "get_generation_result_cache",
+    "result_cache_key",
+]
@@ -358,6 +358,8 @@ class GenerationService:
         # Include media assets in parameters if provided
         if parameters is None:
             parameters = {}
+        # The worker queues the job's Gemini call by tier (paid before free)
+        parameters["user_tier"] = user_tier
         if media_asset_ids:
             parameters["media_asset_ids"] = media_asset_ids
         if media_asset_placements:
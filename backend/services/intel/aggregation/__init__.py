@@ -13,10 +13,16 @@ from backend.services.intel.aggregation.daily import (
     DailyRollup,
     DailyAggregate,
 )
+from backend.services.intel.aggregation.partials import (
+    VideoPartial,
+    HourPartial,
+)
 
 __all__ = [
     "HourlyAggregator",
     "HourlyAggregate",
     "DailyRollup",
     "DailyAggregate",
+    "VideoPartial",
+    "HourPartial",
 ]
@@ -1,20 +1,28 @@
 """
 Creator Intel V2 - Daily Rollup
 
-Rolls up hourly data into daily aggregates.
+Rolls up hourly data into daily aggregates by merging the hourly
+partials written by the HourlyAggregator.
 Called daily at 00:15 UTC to process the previous day's data.
 
 Uses Supabase client for database operations (not asyncpg).
 """
 
-import json
 import logging
+import math
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta, date
 from typing import Any, Dict, List, Optional
 
+import redis.asyncio as redis
 from supabase import Client
 
+from backend.services.intel.aggregation.partials import (
+    HourPartial,
+    VideoPartial,
+    partials_key,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,16 +89,17 @@ class DailyRollup:
     Called daily at 00:15 UTC to process the previous day's data.
     
     Data flow:
-    1. Query hourly data for the previous day via Supabase
-    2. Calculate daily aggregates (peak, avg, trends)
-    3. Insert into intel_daily_metrics table
+    1. Load the previous day's hourly partials from Redis (one HGETALL),
+       falling back to the hourly table for games without partials
+    2. Merge hourly partials into daily aggregates (peak, avg, trends)
+    3. Upsert all categories into intel_daily_metrics in one call
     4. Cleanup old hourly data (>7 days)
     
     Usage:
         from backend.database import get_supabase_client
         
         db = get_supabase_client()
-        rollup = DailyRollup(db)
+        rollup = DailyRollup(db, redis_client)
         await rollup.run()
     """
     
@@ -104,14 +113,17 @@ class DailyRollup:
         "warzone", "gta", "roblox", "league_of_legends"
     ]
     
-    def __init__(self, db: Client) -> None:
+    def __init__(self, db: Client, redis_client: Optional[redis.Redis] = None) -> None:
         """
         Initialize the rollup.
         
         Args:
             db: Supabase client for database operations
+            redis_client: Optional Redis client for reading the hourly
+                partials; without it the hourly table is queried per game
         """
         self.db = db
+        self.redis = redis_client
     
     async def run(self) -> int:
         """
@@ -124,10 +136,14 @@ class DailyRollup:
         
         logger.info(f"Starting daily rollup for {yesterday}")
         
+        hour_partials = await self._load_hour_partials(yesterday)
+        
         rollups = []
         for game_key in self.TRACKED_GAMES:
             try:
-                rollup = await self._rollup_game(game_key, yesterday)
+                rollup = await self._rollup_game(
+                    game_key, yesterday, hour_partials.get(game_key)
+                )
                 if rollup:
                     rollups.append(rollup)
             except Exception as e:
@@ -140,16 +156,45 @@ class DailyRollup:
         # Cleanup old data
         await self._cleanup_old_data(yesterday)
         
-        logger.info(f"Daily rollup complete: {len(rollups)} categories")
+        logger.info(
+            f"Daily rollup complete: {len(rollups)} categories "
+            f"({len(hour_partials)} from hourly partials)"
+        )
         return len(rollups)
     
-    async def _rollup_game(
+    async def _load_hour_partials(self, target_date: date) -> Dict[str, List[HourPartial]]:
+        """
+        Load every category's hourly partials for a day with one HGETALL.
+        
+        Returns an empty dict when Redis is unavailable or the partials have
+        expired, in which case each game falls back to the hourly table.
+        """
+        if self.redis is None:
+            return {}
+        
+        try:
+            raw = await self.redis.hgetall(partials_key(target_date.isoformat()))
+        except Exception as e:
+            logger.warning(f"Failed to load hourly partials for {target_date}: {e}")
+            return {}
+        
+        by_game: Dict[str, List[HourPartial]] = {}
+        for field_name, value in (raw or {}).items():
+            if isinstance(field_name, bytes):
+                field_name = field_name.decode()
+            partial = HourPartial.from_json(value)
+            if partial is None:
+                continue
+            game_key = field_name.rsplit(":", 1)[0]
+            by_game.setdefault(game_key, []).append(partial)
+        return by_game
+    
+    async def _load_hours_from_db(
         self,
         game_key: str,
         target_date: date,
-    ) -> Optional[DailyAggregate]:
-        """Roll up hourly data into daily aggregate."""
-        # Query hourly data for the day
+    ) -> Optional[List[HourPartial]]:
+        """Rebuild a game's hourly partials from the intel_hourly_metrics rows."""
         day_start = datetime.combine(target_date, datetime.min.time()).replace(tzinfo=timezone.utc)
         day_end = day_start + timedelta(days=1)
         
@@ -169,33 +214,50 @@ class DailyRollup:
             logger.error(f"Failed to query hourly data for {game_key}: {e}")
             return None
         
-        if not rows:
+        return [HourPartial.from_hourly_row(row) for row in rows]
+    
+    async def _rollup_game(
+        self,
+        game_key: str,
+        target_date: date,
+        hours: Optional[List[HourPartial]] = None,
+    ) -> Optional[DailyAggregate]:
+        """
+        Roll up a game's hourly partials into a daily aggregate.
+        
+        Args:
+            game_key: The category to roll up
+            target_date: The UTC day being rolled up
+            hours: Hourly partials from Redis; loaded from the hourly
+                table when not provided
+        """
+        if hours is None:
+            hours = await self._load_hours_from_db(game_key, target_date)
+        
+        if not hours:
             return None
         
-        # Parse hour_start for each row
-        for row in rows:
-            if isinstance(row.get("hour_start"), str):
-                row["hour_start"] = datetime.fromisoformat(row["hour_start"].replace("Z", "+00:00"))
-            # Parse language_distribution if it's a string
-            if isinstance(row.get("language_distribution"), str):
-                row["language_distribution"] = json.loads(row["language_distribution"] or "{}")
+        hours = sorted(hours, key=lambda h: h.hour)
         
-        # Calculate daily aggregates
-        total_videos = sum(r["video_count"] for r in rows)
-        viral_counts = [r["viral_count"] for r in rows]
-        avg_views_list = [r["avg_views"] for r in rows]
+        # Merge the day's running sums and language counts
+        merged = VideoPartial()
+        for h in hours:
+            merged = merged.merge(h.videos)
+        
+        viral_counts = [h.viral_count for h in hours]
+        avg_views_list = [h.avg_views for h in hours]
         
         # Find best/worst hours
-        by_views = sorted(rows, key=lambda r: r["avg_views"], reverse=True)
-        best_hour = by_views[0]["hour_start"].hour if by_views else 12
-        worst_hour = by_views[-1]["hour_start"].hour if by_views else 4
+        by_views = sorted(hours, key=lambda h: h.avg_views, reverse=True)
+        best_hour = by_views[0].hour
+        worst_hour = by_views[-1].hour
         peak_views_hour = best_hour
         
         # Calculate trends (compare to previous day)
         prev_day = await self._get_previous_daily(game_key, target_date - timedelta(days=1))
         
-        current_avg_views = sum(avg_views_list) / len(avg_views_list) if avg_views_list else 0
-        current_avg_viral = sum(viral_counts) / len(viral_counts) if viral_counts else 0
+        current_avg_views = sum(avg_views_list) / len(avg_views_list)
+        current_avg_viral = sum(viral_counts) / len(viral_counts)
         
         views_trend = 0.0
         viral_trend = 0.0
@@ -208,45 +270,31 @@ class DailyRollup:
                 viral_trend = ((current_avg_viral - prev_day["avg_viral_count"]) / prev_day["avg_viral_count"]) * 100
         
         # Shorts performance
-        shorts_views = sum(r["shorts_avg_views"] * r["shorts_count"] for r in rows)
-        shorts_count = sum(r["shorts_count"] for r in rows)
-        longform_views = sum(r["longform_avg_views"] * r["longform_count"] for r in rows)
-        longform_count = sum(r["longform_count"] for r in rows)
-        
         shorts_ratio = 1.0
-        if longform_count > 0 and shorts_count > 0:
-            shorts_avg = shorts_views / shorts_count
-            longform_avg = longform_views / longform_count
-            shorts_ratio = shorts_avg / longform_avg if longform_avg > 0 else 1.0
+        if merged.longform_count > 0 and merged.shorts_count > 0:
+            longform_avg = merged.longform_avg_views
+            shorts_ratio = merged.shorts_avg_views / longform_avg if longform_avg > 0 else 1.0
         
         # Language diversity
-        all_langs: Dict[str, int] = {}
-        for r in rows:
-            lang_dist = r.get("language_distribution") or {}
-            if isinstance(lang_dist, str):
-                lang_dist = json.loads(lang_dist)
-            for lang, count in lang_dist.items():
-                all_langs[lang] = all_langs.get(lang, 0) + count
-        
-        dominant_lang = max(all_langs.items(), key=lambda x: x[1])[0] if all_langs else "en"
+        all_langs = merged.language_counts
+        dominant_lang = merged.dominant_language
         
         # Calculate diversity score (0-1, higher = more diverse)
         total_lang_count = sum(all_langs.values())
         diversity_score = 0.0
         if total_lang_count > 0 and len(all_langs) > 1:
             # Shannon diversity index normalized
-            import math
             for count in all_langs.values():
                 p = count / total_lang_count
                 if p > 0:
                     diversity_score -= p * math.log(p)
-            diversity_score = diversity_score / math.log(len(all_langs)) if len(all_langs) > 1 else 0
+            diversity_score = diversity_score / math.log(len(all_langs))
         
         return DailyAggregate(
             category_key=game_key,
             date=target_date,
-            total_videos_seen=total_videos,
-            peak_viral_count=max(viral_counts) if viral_counts else 0,
+            total_videos_seen=merged.video_count,
+            peak_viral_count=max(viral_counts),
             avg_viral_count=current_avg_viral,
             views_trend=round(views_trend, 2),
             viral_trend=round(viral_trend, 2),
@@ -255,7 +303,7 @@ class DailyRollup:
             worst_hour_utc=worst_hour,
             peak_views_hour_utc=peak_views_hour,
             shorts_performance_ratio=round(shorts_ratio, 2),
-            optimal_duration_range=rows[0]["optimal_duration_bucket"] if rows else "unknown",
+            optimal_duration_range=hours[0].optimal_duration_bucket,
             dominant_language=dominant_lang,
             language_diversity_score=round(diversity_score, 3),
         )
@@ -16,9 +16,57 @@ from typing import Any, Dict, List, Optional
 import redis.asyncio as redis
 from supabase import Client
 
+from backend.services.intel.aggregation.partials import (
+    AGG_PARTIALS_TTL,
+    AGG_STATE_TTL,
+    HourPartial,
+    VideoPartial,
+    partial_field,
+    partials_key,
+    state_key,
+)
+from backend.services.intel.collectors.batch_collector import YOUTUBE_HASH_KEY
+
 logger = logging.getLogger(__name__)
 
 
+def _decode(value: Any) -> Optional[str]:
+    """Decode a Redis value that may be bytes."""
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
+
+
+@dataclass
+class _GameSources:
+    """Redis inputs for one game's hourly aggregate."""
+    source_hash: Optional[str]
+    state: Optional[str]
+    viral: Optional[str]
+    format_intel: Optional[str]
+    
+    def reusable_partial(self) -> Optional[VideoPartial]:
+        """
+        The saved video partial, if the collector hash has not changed.
+        
+        Games without a collector hash are always recomputed. Every writer
+        of youtube:games:{game} rewrites the hash with the same TTL, so the
+        hash cannot outlive or lag the videos it describes.
+        """
+        if self.source_hash is None or not self.state:
+            return None
+        try:
+            state = json.loads(self.state)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(state, dict) or state.get("source_hash") != self.source_hash:
+            return None
+        try:
+            return VideoPartial.from_dict(state["videos"])
+        except (KeyError, TypeError):
+            return None
+
+
 @dataclass
 class HourlyAggregate:
     """Hourly aggregated metrics for a category."""
@@ -88,10 +136,11 @@ class HourlyAggregator:
     Called every hour at :05 to capture the previous hour's data.
     
     Data flow:
-    1. Load video data from Redis (youtube:games:{game})
-    2. Load precomputed analysis from Redis (intel:*:precomputed:{game})
-    3. Calculate hourly aggregates
-    4. Insert into intel_hourly_metrics table via Supabase
+    1. MGET collector hashes, saved state and precomputed analysis for all games
+    2. Load video data (youtube:games:{game}) only for games whose hash changed
+    3. Combine video partials with precomputed analysis into hourly aggregates
+    4. Upsert all aggregates into intel_hourly_metrics in one call via Supabase
+    5. Save state and per-hour partials (intel:agg:*) for the next run and daily rollup
     
     Usage:
         from backend.database import get_supabase_client
@@ -122,6 +171,10 @@ class HourlyAggregator:
         """
         Run hourly aggregation for all tracked games.
         
+        Only categories whose collector hash changed since the last run are
+        recomputed from the raw video list; the rest reuse their stored
+        partial. All aggregates are upserted in one call.
+        
         Returns:
             Number of categories aggregated
         """
@@ -131,59 +184,100 @@ class HourlyAggregator:
         
         logger.info(f"Starting hourly aggregation for {hour_start}")
         
+        sources = await self._load_sources(self.TRACKED_GAMES)
+        
+        partials: Dict[str, VideoPartial] = {}
+        changed: List[str] = []
+        for game_key, source in sources.items():
+            partial = source.reusable_partial()
+            if partial is None:
+                changed.append(game_key)
+            else:
+                partials[game_key] = partial
+        
+        fresh = await self._compute_partials(changed)
+        partials.update(fresh)
+        
         aggregates = []
         for game_key in self.TRACKED_GAMES:
+            partial = partials.get(game_key)
+            if partial is None:
+                continue
             try:
-                aggregate = await self._aggregate_game(game_key, hour_start)
-                if aggregate:
-                    aggregates.append(aggregate)
+                aggregates.append(
+                    self._build_aggregate(game_key, hour_start, partial, sources[game_key])
+                )
             except Exception as e:
                 logger.error(f"Failed to aggregate {game_key}: {e}")
         
         # Batch insert to PostgreSQL
         if aggregates:
             await self._insert_aggregates(aggregates)
+            await self._save_partials(hour_start, aggregates, partials, fresh, sources)
         
-        logger.info(f"Hourly aggregation complete: {len(aggregates)} categories")
+        logger.info(
+            f"Hourly aggregation complete: {len(aggregates)} categories "
+            f"({len(fresh)} recomputed, {len(partials) - len(fresh)} unchanged)"
+        )
         return len(aggregates)
     
-    async def _aggregate_game(
-        self,
-        game_key: str,
-        hour_start: datetime,
-    ) -> Optional[HourlyAggregate]:
-        """Aggregate a single game's data for the hour."""
-        # Load from Redis
-        youtube_data = await self.redis.get(f"youtube:games:{game_key}")
-        viral_data = await self.redis.get(f"intel:viral:precomputed:{game_key}")
-        format_data = await self.redis.get(f"intel:format:precomputed:{game_key}")
-        
-        if not youtube_data:
-            return None
-        
-        try:
-            videos = json.loads(youtube_data).get("videos", [])
-        except json.JSONDecodeError:
-            return None
+    async def _load_sources(self, game_keys: List[str]) -> Dict[str, "_GameSources"]:
+        """
+        Load change-detection and analysis inputs for every game in one MGET.
         
-        viral = json.loads(viral_data) if viral_data else {}
-        format_intel = json.loads(format_data) if format_data else {}
+        Reads the collector hash, the saved aggregation state and the
+        precomputed viral/format analysis. The raw video blobs are not read.
+        """
+        keys: List[str] = []
+        for game_key in game_keys:
+            keys.extend([
+                YOUTUBE_HASH_KEY.format(game=game_key),
+                state_key(game_key),
+                f"intel:viral:precomputed:{game_key}",
+                f"intel:format:precomputed:{game_key}",
+            ])
         
-        # Calculate aggregates
-        views = [v.get("view_count", 0) for v in videos]
-        engagements = [v.get("engagement_rate", 0) or 0 for v in videos]
-        durations = [v.get("duration_seconds", 0) for v in videos if v.get("duration_seconds")]
+        values = await self.redis.mget(*keys)
         
-        shorts = [v for v in videos if v.get("is_short")]
-        longform = [v for v in videos if not v.get("is_short")]
+        sources = {}
+        for i, game_key in enumerate(game_keys):
+            source_hash, state, viral, format_intel = values[i * 4:i * 4 + 4]
+            sources[game_key] = _GameSources(
+                source_hash=_decode(source_hash),
+                state=state,
+                viral=viral,
+                format_intel=format_intel,
+            )
+        return sources
+    
+    async def _compute_partials(self, game_keys: List[str]) -> Dict[str, VideoPartial]:
+        """Recompute video partials from the raw YouTube data of changed games."""
+        if not game_keys:
+            return {}
         
-        # Language distribution
-        lang_dist: Dict[str, int] = {}
-        for v in videos:
-            lang = (v.get("default_audio_language") or "en")[:2].lower()
-            lang_dist[lang] = lang_dist.get(lang, 0) + 1
+        blobs = await self.redis.mget(*(f"youtube:games:{g}" for g in game_keys))
         
-        dominant_lang = max(lang_dist.items(), key=lambda x: x[1])[0] if lang_dist else "en"
+        partials = {}
+        for game_key, youtube_data in zip(game_keys, blobs):
+            if not youtube_data:
+                continue
+            try:
+                videos = json.loads(youtube_data).get("videos", [])
+            except json.JSONDecodeError:
+                continue
+            partials[game_key] = VideoPartial.from_videos(videos)
+        return partials
+    
+    def _build_aggregate(
+        self,
+        game_key: str,
+        hour_start: datetime,
+        partial: VideoPartial,
+        source: "_GameSources",
+    ) -> HourlyAggregate:
+        """Combine a video partial with the precomputed analysis for the hour."""
+        viral = json.loads(source.viral) if source.viral else {}
+        format_intel = json.loads(source.format_intel) if source.format_intel else {}
         
         # Get viral data
         viral_data_dict = viral.get("data", {}) if isinstance(viral, dict) else {}
@@ -191,22 +285,22 @@ class HourlyAggregator:
         return HourlyAggregate(
             category_key=game_key,
             hour_start=hour_start,
-            video_count=len(videos),
-            avg_views=sum(views) / len(views) if views else 0,
-            avg_engagement=sum(engagements) / len(engagements) if engagements else 0,
-            total_views=sum(views),
+            video_count=partial.video_count,
+            avg_views=partial.avg_views,
+            avg_engagement=partial.avg_engagement,
+            total_views=partial.total_views,
             viral_count=viral_data_dict.get("viral_video_count", 0),
             rising_count=viral_data_dict.get("rising_video_count", 0),
             avg_velocity=viral_data_dict.get("avg_velocity", 0),
             max_velocity=viral_data_dict.get("max_velocity", 0),
-            shorts_count=len(shorts),
-            shorts_avg_views=sum(v.get("view_count", 0) for v in shorts) / len(shorts) if shorts else 0,
-            longform_count=len(longform),
-            longform_avg_views=sum(v.get("view_count", 0) for v in longform) / len(longform) if longform else 0,
-            avg_duration_seconds=sum(durations) / len(durations) if durations else 0,
+            shorts_count=partial.shorts_count,
+            shorts_avg_views=partial.shorts_avg_views,
+            longform_count=partial.longform_count,
+            longform_avg_views=partial.longform_avg_views,
+            avg_duration_seconds=partial.avg_duration_seconds,
             optimal_duration_bucket=format_intel.get("data", {}).get("optimal_duration_range", "unknown"),
-            language_distribution=lang_dist,
-            dominant_language=dominant_lang,
+            language_distribution=dict(partial.language_counts),
+            dominant_language=partial.dominant_language,
         )
     
     async def _insert_aggregates(self, aggregates: List[HourlyAggregate]) -> None:
@@ -230,6 +324,52 @@ class HourlyAggregator:
             logger.error(f"Failed to insert hourly aggregates: {e}")
             raise
     
+    async def _save_partials(
+        self,
+        hour_start: datetime,
+        aggregates: List[HourlyAggregate],
+        partials: Dict[str, VideoPartial],
+        fresh: Dict[str, VideoPartial],
+        sources: Dict[str, "_GameSources"],
+    ) -> None:
+        """
+        Persist change-detection state and this hour's partials in one pipeline.
+        
+        Best effort: if this fails the next run simply recomputes every
+        category and the daily rollup falls back to the hourly table.
+        """
+        day_key = partials_key(hour_start.date().isoformat())
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            
+            for game_key, partial in fresh.items():
+                source_hash = sources[game_key].source_hash
+                if source_hash is None:
+                    continue
+                pipe.set(
+                    state_key(game_key),
+                    json.dumps({"source_hash": source_hash, "videos": partial.to_dict()}),
+                    ex=AGG_STATE_TTL,
+                )
+            
+            hour_partials = {
+                partial_field(a.category_key, hour_start.hour): HourPartial(
+                    hour=hour_start.hour,
+                    videos=partials[a.category_key],
+                    viral_count=a.viral_count,
+                    avg_views=a.avg_views,
+                    optimal_duration_bucket=a.optimal_duration_bucket,
+                ).to_json()
+                for a in aggregates
+            }
+            pipe.hset(day_key, mapping=hour_partials)
+            pipe.expire(day_key, AGG_PARTIALS_TTL)
+            
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to save hourly aggregation partials: {e}")
+    
     async def get_hourly_data(
         self,
         category_key: str,
@@ -0,0 +1,236 @@
+"""
+Creator Intel V2 - Mergeable Aggregation Partials
+
+Running sums and counts that the hourly and daily tiers combine instead
+of recomputing from raw video lists.
+
+A VideoPartial holds the additive state behind every average the hourly
+aggregate reports, plus a language count sketch. Two partials merge by
+adding fields, so a day is the merge of its hours and an unchanged
+category can reuse the partial computed on a previous run.
+
+Redis layout:
+    intel:agg:state:{category}      -> {"source_hash", "videos"} for change detection
+    intel:agg:partials:{YYYY-MM-DD} -> hash of "{category}:{HH}" -> HourPartial
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Redis keys
+AGG_STATE_KEY = "intel:agg:state:{category_key}"
+AGG_PARTIALS_KEY = "intel:agg:partials:{day}"
+
+# State outlives a missed hourly run; partials outlive the daily rollup
+AGG_STATE_TTL = 48 * 3600
+AGG_PARTIALS_TTL = 3 * 86400
+
+
+def state_key(category_key: str) -> str:
+    """Redis key holding a category's last source hash and video partial."""
+    return AGG_STATE_KEY.format(category_key=category_key)
+
+
+def partials_key(day: str) -> str:
+    """Redis hash holding every category's hourly partials for a UTC day."""
+    return AGG_PARTIALS_KEY.format(day=day)
+
+
+def partial_field(category_key: str, hour: int) -> str:
+    """Hash field for one category-hour within a day's partials."""
+    return f"{category_key}:{hour:02d}"
+
+
+@dataclass
+class VideoPartial:
+    """
+    Additive video metrics for one category over one or more snapshots.
+
+    Every field is a sum or count, so merge() is exact and order-independent.
+    """
+    video_count: int = 0
+    total_views: int = 0
+    engagement_sum: float = 0.0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    shorts_count: int = 0
+    shorts_views: int = 0
+    longform_count: int = 0
+    longform_views: int = 0
+    language_counts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_videos(cls, videos: List[Dict[str, Any]]) -> "VideoPartial":
+        """Build a partial from a raw video list in a single pass."""
+        partial = cls()
+        langs = partial.language_counts
+
+        for v in videos:
+            views = v.get("view_count", 0)
+            partial.video_count += 1
+            partial.total_views += views
+            partial.engagement_sum += v.get("engagement_rate", 0) or 0
+
+            duration = v.get("duration_seconds")
+            if duration:
+                partial.duration_sum += duration
+                partial.duration_count += 1
+
+            if v.get("is_short"):
+                partial.shorts_count += 1
+                partial.shorts_views += views
+            else:
+                partial.longform_count += 1
+                partial.longform_views += views
+
+            lang = (v.get("default_audio_language") or "en")[:2].lower()
+            langs[lang] = langs.get(lang, 0) + 1
+
+        return partial
+
+    @classmethod
+    def from_hourly_row(cls, row: Dict[str, Any]) -> "VideoPartial":
+        """
+        Rebuild a partial from a stored intel_hourly_metrics row.
+
+        Sums are recovered from the stored averages and counts. Used when
+        the Redis partials for a day are no longer available.
+        """
+        video_count = row.get("video_count", 0) or 0
+        shorts_count = row.get("shorts_count", 0) or 0
+        longform_count = row.get("longform_count", 0) or 0
+
+        langs = row.get("language_distribution") or {}
+        if isinstance(langs, str):
+            langs = json.loads(langs or "{}")
+
+        return cls(
+            video_count=video_count,
+            total_views=row.get("total_views", 0) or 0,
+            engagement_sum=(row.get("avg_engagement", 0) or 0) * video_count,
+            duration_sum=(row.get("avg_duration_seconds", 0) or 0) * video_count,
+            duration_count=video_count,
+            shorts_count=shorts_count,
+            shorts_views=(row.get("shorts_avg_views", 0) or 0) * shorts_count,
+            longform_count=longform_count,
+            longform_views=(row.get("longform_avg_views", 0) or 0) * longform_count,
+            language_counts=dict(langs),
+        )
+
+    def merge(self, other: "VideoPartial") -> "VideoPartial":
+        """Return a new partial combining this one with another."""
+        langs = dict(self.language_counts)
+        for lang, count in other.language_counts.items():
+            langs[lang] = langs.get(lang, 0) + count
+
+        return VideoPartial(
+            video_count=self.video_count + other.video_count,
+            total_views=self.total_views + other.total_views,
+            engagement_sum=self.engagement_sum + other.engagement_sum,
+            duration_sum=self.duration_sum + other.duration_sum,
+            duration_count=self.duration_count + other.duration_count,
+            shorts_count=self.shorts_count + other.shorts_count,
+            shorts_views=self.shorts_views + other.shorts_views,
+            longform_count=self.longform_count + other.longform_count,
+            longform_views=self.longform_views + other.longform_views,
+            language_counts=langs,
+        )
+
+    @property
+    def avg_views(self) -> float:
+        return self.total_views / self.video_count if self.video_count else 0
+
+    @property
+    def avg_engagement(self) -> float:
+        return self.engagement_sum / self.video_count if self.video_count else 0
+
+    @property
+    def avg_duration_seconds(self) -> float:
+        return self.duration_sum / self.duration_count if self.duration_count else 0
+
+    @property
+    def shorts_avg_views(self) -> float:
+        return self.shorts_views / self.shorts_count if self.shorts_count else 0
+
+    @property
+    def longform_avg_views(self) -> float:
+        return self.longform_views / self.longform_count if self.longform_count else 0
+
+    @property
+    def dominant_language(self) -> str:
+        if not self.language_counts:
+            return "en"
+        return max(self.language_counts.items(), key=lambda x: x[1])[0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoPartial":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(**data)
+
+
+@dataclass
+class HourPartial:
+    """
+    One category-hour as stored for the daily rollup.
+
+    Carries the video partial plus the hour-level values the daily tier
+    ranks on (viral count, average views, duration bucket).
+    """
+    hour: int
+    videos: VideoPartial
+    viral_count: int
+    avg_views: float
+    optimal_duration_bucket: str
+
+    def to_json(self) -> str:
+        """Serialize for the day's partials hash."""
+        return json.dumps({
+            "hour": self.hour,
+            "videos": self.videos.to_dict(),
+            "viral_count": self.viral_count,
+            "avg_views": self.avg_views,
+            "optimal_duration_bucket": self.optimal_duration_bucket,
+        })
+
+    @classmethod
+    def from_json(cls, raw: Any) -> Optional["HourPartial"]:
+        """Parse a stored partial, returning None if it is unreadable."""
+        if isinstance(raw, bytes):
+            raw = raw.decode()
+        try:
+            data = json.loads(raw)
+            return cls(
+                hour=data["hour"],
+                videos=VideoPartial.from_dict(data["videos"]),
+                viral_count=data["viral_count"],
+                avg_views=data["avg_views"],
+                optimal_duration_bucket=data["optimal_duration_bucket"],
+            )
+        except (TypeError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable hourly partial: {e}")
+            return None
+
+    @classmethod
+    def from_hourly_row(cls, row: Dict[str, Any]) -> "HourPartial":
+        """Rebuild from a stored intel_hourly_metrics row."""
+        hour_start = row["hour_start"]
+        if isinstance(hour_start, str):
+            hour_start = datetime.fromisoformat(hour_start.replace("Z", "+00:00"))
+
+        return cls(
+            hour=hour_start.hour,
+            videos=VideoPartial.from_hourly_row(row),
+            viral_count=row.get("viral_count", 0) or 0,
+            avg_views=row.get("avg_views", 0) or 0,
+            optimal_duration_bucket=row.get("optimal_duration_bucket") or "unknown",
+        )
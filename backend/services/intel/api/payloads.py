@@ -0,0 +1,495 @@
+"""
+Creator Intel V2 - Precomputed Response Payloads
+
+The intel worker publishes a ready-to-serve response body for every
+category and endpoint after each run. Routes stream those bytes as-is,
+answer ``If-None-Match`` revalidations with 304s, and never run analysis
+or reshape data on the request path.
+
+Redis layout (one hash per category and endpoint):
+    intel:payload:v{version}:{category}:{endpoint}
+        etag      - Strong ETag (hash of the identity body)
+        identity  - UTF-8 JSON response body
+        gzip      - Gzip-compressed body (only for payloads worth compressing)
+        built_at  - When the payload was built (ISO format)
+    intel:payload:v{version}:{category}:published - When the category was
+        last published; an endpoint missing while this exists has no data
+
+Bumping PAYLOAD_SCHEMA_VERSION moves readers to a new key space, so a
+response shape change never serves payloads built by an older release.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Type
+
+import redis.asyncio as redis
+from fastapi import Response
+from pydantic import BaseModel
+
+from backend.database.redis_pool import get_async_redis
+from backend.services.intel.api.schemas import (
+    ContentFormatResponse,
+    DescriptionResponse,
+    SemanticResponse,
+    RegionalResponse,
+    LiveStreamResponse,
+    CombinedIntelResponse,
+    IntelConfidence,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+PAYLOAD_SCHEMA_VERSION = 1
+PAYLOAD_KEY = "intel:payload:v{version}:{category}:{endpoint}"
+PUBLISHED_KEY = "intel:payload:v{version}:{category}:published"
+
+# Match the analyzer cache TTL (stale data better than no data)
+PAYLOAD_TTL = 72 * 60 * 60
+
+# Small bodies are not worth the gzip framing overhead
+GZIP_ENABLED = os.getenv("INTEL_PAYLOAD_GZIP", "true").lower() == "true"
+GZIP_MIN_BYTES = int(os.getenv("INTEL_PAYLOAD_GZIP_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6
+
+# Clients may cache briefly, then must revalidate with If-None-Match
+CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+# endpoint -> (precomputed analysis key, response model, analyzer name)
+ANALYZER_ENDPOINTS: Dict[str, Tuple[str, Type[BaseModel], str]] = {
+    "format": ("intel:format:precomputed:{category}", ContentFormatResponse, "content_format"),
+    "description": ("intel:description:precomputed:{category}", DescriptionResponse, "description"),
+    "semantic": ("intel:semantic:precomputed:{category}", SemanticResponse, "semantic"),
+    "regional": ("intel:regional:precomputed:{category}", RegionalResponse, "regional"),
+    "livestream": ("intel:livestream:precomputed:{category}", LiveStreamResponse, "live_stream"),
+}
+
+COMBINED_ENDPOINT = "combined"
+ALL_ENDPOINTS = list(ANALYZER_ENDPOINTS) + [COMBINED_ENDPOINT]
+
+
+def payload_key(category_key: str, endpoint: str) -> str:
+    """Redis key holding the payload for a category and endpoint."""
+    return PAYLOAD_KEY.format(
+        version=PAYLOAD_SCHEMA_VERSION,
+        category=category_key,
+        endpoint=endpoint,
+    )
+
+
+def published_key(category_key: str) -> str:
+    """Redis key marking that a category's payloads have been published."""
+    return PUBLISHED_KEY.format(version=PAYLOAD_SCHEMA_VERSION, category=category_key)
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Check whether an Accept-Encoding header allows a gzip response.
+
+    Honors q-values, so "gzip;q=0" refuses gzip even when "*" is listed.
+
+    Args:
+        accept_encoding: Raw header value
+
+    Returns:
+        True if gzip (directly or via "*") has a non-zero quality
+    """
+    if not accept_encoding:
+        return False
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    if "gzip" in qualities:
+        return qualities["gzip"] > 0
+    return qualities.get("*", 0.0) > 0
+
+
+# ============================================================================
+# Payload
+# ============================================================================
+
+@dataclass(frozen=True)
+class IntelPayload:
+    """
+    A pre-serialized response body with its ETag.
+
+    Attributes:
+        etag: Quoted strong ETag for the identity body
+        body: UTF-8 JSON body, or None when only the gzip body was loaded
+        gzip_body: Gzip-compressed body, if the payload was compressed
+    """
+    etag: str
+    body: Optional[bytes] = None
+    gzip_body: Optional[bytes] = None
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "IntelPayload":
+        """Serialize a response model once, hashing and compressing the bytes."""
+        body = model.model_dump_json().encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        gzip_body = None
+        if GZIP_ENABLED and len(body) >= GZIP_MIN_BYTES:
+            # mtime=0 keeps the compressed bytes deterministic across builds
+            gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+        return cls(etag=etag, body=body, gzip_body=gzip_body)
+
+    def to_mapping(self) -> Dict[str, bytes]:
+        """Fields for the payload hash."""
+        mapping = {
+            "etag": self.etag.encode(),
+            "identity": self.body or b"",
+            "built_at": datetime.now(timezone.utc).isoformat().encode(),
+        }
+        if self.gzip_body:
+            mapping["gzip"] = self.gzip_body
+        return mapping
+
+    def to_response(self, accept_gzip: bool = False) -> Response:
+        """Build a response that streams the stored bytes unchanged."""
+        headers = cache_headers(self.etag)
+        if accept_gzip and self.gzip_body:
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self.gzip_body, media_type="application/json", headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Validator and caching headers shared by 200 and 304 responses."""
+    return {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw header value (may be "*" or a comma-separated list)
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+# ============================================================================
+# Builders
+# ============================================================================
+
+def build_analyzer_response(endpoint: str, raw: Optional[bytes]) -> Optional[BaseModel]:
+    """
+    Build an endpoint's response model from a precomputed analysis result.
+
+    Args:
+        endpoint: Analyzer endpoint name (e.g., "format")
+        raw: Precomputed analysis JSON as stored by the worker or analyzer
+
+    Returns:
+        Response model, or None if there is no usable data
+    """
+    if not raw:
+        return None
+
+    _, model, _ = ANALYZER_ENDPOINTS[endpoint]
+    try:
+        parsed = json.loads(raw)
+        # Handle nested data structure
+        return model(**parsed.get("data", parsed))
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Failed to parse precomputed {endpoint} data: {e}")
+        return None
+
+
+def _freshness_label(score: int) -> str:
+    if score >= 80:
+        return "Fresh"
+    if score >= 60:
+        return "Recent"
+    if score >= 40:
+        return "Stale"
+    if score >= 20:
+        return "Old"
+    return "Expired"
+
+
+def build_combined_response(
+    category_key: str,
+    responses: Dict[str, BaseModel],
+) -> Optional[CombinedIntelResponse]:
+    """
+    Combine per-analyzer responses into the /combined response.
+
+    Args:
+        category_key: Category the responses belong to
+        responses: endpoint -> response model for every available analyzer
+
+    Returns:
+        CombinedIntelResponse, or None if no analyzer has data
+    """
+    if not responses:
+        return None
+
+    by_analyzer = {
+        ANALYZER_ENDPOINTS[endpoint][2]: response
+        for endpoint, response in responses.items()
+    }
+
+    # Overall confidence is the mean of the available analyzers
+    confidence_scores = [response.confidence for response in by_analyzer.values()]
+    avg_confidence = sum(confidence_scores) // len(confidence_scores)
+
+    category_name = category_key.replace("_", " ").title()
+    if "content_format" in by_analyzer:
+        category_name = by_analyzer["content_format"].category_name
+
+    now = datetime.now(timezone.utc).isoformat()
+    return CombinedIntelResponse(
+        category_key=category_key,
+        category_name=category_name,
+        content_format=by_analyzer.get("content_format"),
+        description=by_analyzer.get("description"),
+        semantic=by_analyzer.get("semantic"),
+        regional=by_analyzer.get("regional"),
+        live_stream=by_analyzer.get("live_stream"),
+        confidence=IntelConfidence(
+            score=avg_confidence,
+            label=_freshness_label(avg_confidence),
+            fetched_at=now,
+            hours_old=0,
+        ),
+        analyzers_available=[
+            ANALYZER_ENDPOINTS[endpoint][2]
+            for endpoint in ANALYZER_ENDPOINTS
+            if endpoint in responses
+        ],
+        fetched_at=now,
+    )
+
+
+# ============================================================================
+# Store
+# ============================================================================
+
+class IntelPayloadStore:
+    """
+    Reads and publishes precomputed intel response payloads.
+
+    Uses the binary "intel_payload" Redis pool so gzip bodies round-trip
+    untouched.
+
+    Usage:
+        store = get_intel_payload_store()
+
+        # Worker, after analyzers have written their results
+        await store.publish_category("fortnite")
+
+        # Route
+        payload = await store.get("fortnite", "format", accept_gzip=True)
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis] = None) -> None:
+        self._redis = redis_client
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Lazy load the shared binary Redis client."""
+        if self._redis is None:
+            self._redis = get_async_redis("intel_payload")
+        return self._redis
+
+    async def build_category(self, category_key: str) -> Dict[str, IntelPayload]:
+        """
+        Build every payload for a category from the precomputed analyses.
+
+        This is a read and a reshape only; no analyzer is ever run.
+
+        Args:
+            category_key: Category to build
+
+        Returns:
+            endpoint -> IntelPayload for every endpoint with data
+        """
+        raws = await self.redis.mget([
+            key_template.format(category=category_key)
+            for key_template, _, _ in ANALYZER_ENDPOINTS.values()
+        ])
+
+        responses: Dict[str, BaseModel] = {}
+        for endpoint, raw in zip(ANALYZER_ENDPOINTS, raws):
+            response = build_analyzer_response(endpoint, raw)
+            if response is not None:
+                responses[endpoint] = response
+
+        payloads = {
+            endpoint: IntelPayload.from_model(response)
+            for endpoint, response in responses.items()
+        }
+        combined = build_combined_response(category_key, responses)
+        if combined is not None:
+            payloads[COMBINED_ENDPOINT] = IntelPayload.from_model(combined)
+        return payloads
+
+    async def publish_category(self, category_key: str) -> List[str]:
+        """
+        Build and store every payload for a category.
+
+        All endpoints are replaced in one transaction; endpoints whose
+        analysis is gone have their payload removed.
+
+        Args:
+            category_key: Category to publish
+
+        Returns:
+            Endpoints that were published
+        """
+        payloads = await self.build_category(category_key)
+
+        pipe = self.redis.pipeline(transaction=True)
+        for endpoint in ALL_ENDPOINTS:
+            key = payload_key(category_key, endpoint)
+            pipe.delete(key)
+            payload = payloads.get(endpoint)
+            if payload is not None:
+                pipe.hset(key, mapping=payload.to_mapping())
+                pipe.expire(key, PAYLOAD_TTL)
+        pipe.set(published_key(category_key), datetime.now(timezone.utc).isoformat(), ex=PAYLOAD_TTL)
+        await pipe.execute()
+
+        logger.debug(f"Published {len(payloads)} intel payloads for {category_key}")
+        return list(payloads)
+
+    async def get_etag(self, category_key: str, endpoint: str) -> Optional[str]:
+        """Get the current ETag without loading the body."""
+        etag = await self.redis.hget(payload_key(category_key, endpoint), "etag")
+        return etag.decode() if etag else None
+
+    async def get(
+        self,
+        category_key: str,
+        endpoint: str,
+        accept_gzip: bool = False,
+    ) -> Optional[IntelPayload]:
+        """
+        Load a payload, preferring the gzip body when the client accepts it.
+
+        Args:
+            category_key: Category to load
+            endpoint: Endpoint name (see ALL_ENDPOINTS)
+            accept_gzip: Whether the client accepts gzip
+
+        Returns:
+            IntelPayload, or None if nothing has been published
+        """
+        key = payload_key(category_key, endpoint)
+
+        if accept_gzip:
+            etag, gzip_body = await self.redis.hmget(key, ["etag", "gzip"])
+            if etag and gzip_body:
+                return IntelPayload(etag=etag.decode(), gzip_body=gzip_body)
+
+        etag, body = await self.redis.hmget(key, ["etag", "identity"])
+        if not etag or not body:
+            return None
+        return IntelPayload(etag=etag.decode(), body=body)
+    
+    async def load(
+        self,
+        category_key: str,
+        endpoint: str,
+        accept_gzip: bool = False,
+    ) -> Optional[IntelPayload]:
+        """
+        Load a payload, publishing the category first on a cold miss.
+
+        A category that has never been published (or has expired) is built
+        from the precomputed analyses and stored once, with concurrent
+        misses sharing one publish. An endpoint missing from a published
+        category has no data and is not rebuilt.
+
+        Args:
+            category_key: Category to load
+            endpoint: Endpoint name (see ALL_ENDPOINTS)
+            accept_gzip: Whether the client accepts gzip
+
+        Returns:
+            IntelPayload, or None if the category has no data for the endpoint
+        """
+        payload = await self.get(category_key, endpoint, accept_gzip=accept_gzip)
+        if payload is not None:
+            return payload
+        if await self.redis.exists(published_key(category_key)):
+            return None
+        await self._publish_once(category_key)
+        return await self.get(category_key, endpoint, accept_gzip=accept_gzip)
+
+    async def _publish_once(self, category_key: str) -> List[str]:
+        """Publish a category, sharing one publish between concurrent misses."""
+        task = self._inflight.get(category_key)
+        if task is None:
+            task = asyncio.ensure_future(self.publish_category(category_key))
+            self._inflight[category_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(category_key, None))
+        return await asyncio.shield(task)
+
+
+# Singleton instance
+_intel_payload_store: Optional[IntelPayloadStore] = None
+
+
+def get_intel_payload_store() -> IntelPayloadStore:
+    """Get or create the IntelPayloadStore singleton."""
+    global _intel_payload_store
+    if _intel_payload_store is None:
+        _intel_payload_store = IntelPayloadStore()
+    return _intel_payload_store
+
+
+__all__ = [
+    "PAYLOAD_SCHEMA_VERSION",
+    "ANALYZER_ENDPOINTS",
+    "COMBINED_ENDPOINT",
+    "ALL_ENDPOINTS",
+    "IntelPayload",
+    "IntelPayloadStore",
+    "accepts_gzip",
+    "build_analyzer_response",
+    "build_combined_response",
+    "cache_headers",
+    "etag_matches",
+    "get_intel_payload_store",
+    "payload_key",
+    "published_key",
+]
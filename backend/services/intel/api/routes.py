@@ -6,15 +6,22 @@ FastAPI routes for accessing Creator Intel data.
 
 import json
 import logging
-import os
 import re
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+from backend.services.intel.api.payloads import (
+    COMBINED_ENDPOINT,
+    accepts_gzip,
+    cache_headers,
+    etag_matches,
+    get_intel_payload_store,
+)
 from backend.services.intel.api.schemas import (
     AnalyzeRequest,
     ContentFormatResponse,
@@ -23,7 +30,6 @@ from backend.services.intel.api.schemas import (
     RegionalResponse,
     LiveStreamResponse,
     CombinedIntelResponse,
-    IntelConfidence,
     HealthResponse,
     ComponentHealthSchema,
     OrchestratorStatusResponse,
@@ -43,9 +49,8 @@ router = APIRouter(prefix="/api/v1/intel", tags=["intel"])
 # ============================================================================
 
 async def get_redis_client() -> redis.Redis:
-    """Get Redis client dependency."""
-    redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-    return redis.from_url(redis_url, decode_responses=True)
+    """Get Redis client dependency (shared "intel" pool, no per-request client)."""
+    return get_async_redis("intel")
 
 
 def validate_category_key(category_key: str) -> str:
@@ -58,6 +63,55 @@ def validate_category_key(category_key: str) -> str:
     return category_key
 
 
+def is_tracked_category(category_key: str) -> bool:
+    """Whether the intel workers analyze (and publish payloads for) a category."""
+    from backend.services.intel.collectors.quota_manager import QuotaManager
+    return category_key in QuotaManager.DEFAULT_PRIORITIES
+
+
+# ============================================================================
+# Precomputed Payload Serving
+# ============================================================================
+
+async def _serve_payload(
+    request: Request,
+    category_key: str,
+    endpoint: str,
+    label: str,
+) -> Response:
+    """
+    Serve a precomputed intel payload straight from Redis.
+    
+    Revalidations with a matching If-None-Match get a 304 without loading
+    the body. Otherwise the stored bytes (gzip if accepted) are returned
+    unchanged. If the worker has not published payloads yet, they are built
+    from the precomputed analyses and stored once; analysis never runs here.
+    Unknown categories get a 404 without touching Redis, so made-up URLs
+    never trigger a build or leave keys behind.
+    """
+    validate_category_key(category_key)
+    if not is_tracked_category(category_key):
+        raise HTTPException(404, f"Unknown category: {category_key}")
+    
+    store = get_intel_payload_store()
+    if_none_match = request.headers.get("if-none-match")
+    accept_gzip = accepts_gzip(request.headers.get("accept-encoding"))
+    
+    if if_none_match:
+        etag = await store.get_etag(category_key, endpoint)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=cache_headers(etag))
+    
+    payload = await store.load(category_key, endpoint, accept_gzip=accept_gzip)
+    if payload is None:
+        raise HTTPException(404, f"No {label} data available for {category_key}")
+    if etag_matches(if_none_match, payload.etag):
+        # Cold miss: the ETag check above ran before the payload was published
+        return Response(status_code=304, headers=cache_headers(payload.etag))
+    
+    return payload.to_response(accept_gzip)
+
+
 # ============================================================================
 # Content Format Endpoints
 # ============================================================================
@@ -65,36 +119,14 @@ def validate_category_key(category_key: str) -> str:
 @router.get("/{category_key}/format", response_model=ContentFormatResponse)
 async def get_format_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> ContentFormatResponse:
+    request: Request,
+) -> Response:
     """
     Get content format analysis for a category.
     
     Returns optimal duration, shorts vs long-form comparison, and format insights.
     """
-    cache_key = f"intel:format:precomputed:{category_key}"
-    cached = await redis_client.get(cache_key)
-    
-    if cached:
-        try:
-            data = json.loads(cached)
-            # Handle nested data structure
-            if "data" in data:
-                return ContentFormatResponse(**data["data"])
-            return ContentFormatResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse cached format data: {e}")
-    
-    # Generate on-demand if not cached
-    from backend.services.intel.analyzers.content_format import get_content_format_analyzer
-    
-    analyzer = get_content_format_analyzer()
-    result = await analyzer.analyze_with_cache(category_key)
-    
-    if not result:
-        raise HTTPException(404, f"No format data available for {category_key}")
-    
-    return ContentFormatResponse(**result.data)
+    return await _serve_payload(request, category_key, "format", "format")
 
 
 # ============================================================================
@@ -104,34 +136,14 @@ async def get_format_intel(
 @router.get("/{category_key}/description", response_model=DescriptionResponse)
 async def get_description_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> DescriptionResponse:
+    request: Request,
+) -> Response:
     """
     Get description analysis for a category.
     
     Returns hashtag analysis, timestamp patterns, and sponsor insights.
     """
-    cache_key = f"intel:description:precomputed:{category_key}"
-    cached = await redis_client.get(cache_key)
-    
-    if cached:
-        try:
-            data = json.loads(cached)
-            if "data" in data:
-                return DescriptionResponse(**data["data"])
-            return DescriptionResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse cached description data: {e}")
-    
-    from backend.services.intel.analyzers.description import get_description_analyzer
-    
-    analyzer = get_description_analyzer()
-    result = await analyzer.analyze_with_cache(category_key)
-    
-    if not result:
-        raise HTTPException(404, f"No description data available for {category_key}")
-    
-    return DescriptionResponse(**result.data)
+    return await _serve_payload(request, category_key, "description", "description")
 
 
 # ============================================================================
@@ -141,34 +153,14 @@ async def get_description_intel(
 @router.get("/{category_key}/semantic", response_model=SemanticResponse)
 async def get_semantic_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> SemanticResponse:
+    request: Request,
+) -> Response:
     """
     Get semantic analysis for a category.
     
     Returns topic clusters, tag analysis, and optimal tag count.
     """
-    cache_key = f"intel:semantic:precomputed:{category_key}"
-    cached = await redis_client.get(cache_key)
-    
-    if cached:
-        try:
-            data = json.loads(cached)
-            if "data" in data:
-                return SemanticResponse(**data["data"])
-            return SemanticResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse cached semantic data: {e}")
-    
-    from backend.services.intel.analyzers.semantic import get_semantic_analyzer
-    
-    analyzer = get_semantic_analyzer()
-    result = await analyzer.analyze_with_cache(category_key)
-    
-    if not result:
-        raise HTTPException(404, f"No semantic data available for {category_key}")
-    
-    return SemanticResponse(**result.data)
+    return await _serve_payload(request, category_key, "semantic", "semantic")
 
 
 # ============================================================================
@@ -178,34 +170,14 @@ async def get_semantic_intel(
 @router.get("/{category_key}/regional", response_model=RegionalResponse)
 async def get_regional_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> RegionalResponse:
+    request: Request,
+) -> Response:
     """
     Get regional analysis for a category.
     
     Returns language breakdown, competition scores, and opportunity analysis.
     """
-    cache_key = f"intel:regional:precomputed:{category_key}"
-    cached = await redis_client.get(cache_key)
-    
-    if cached:
-        try:
-            data = json.loads(cached)
-            if "data" in data:
-                return RegionalResponse(**data["data"])
-            return RegionalResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse cached regional data: {e}")
-    
-    from backend.services.intel.analyzers.regional import get_regional_analyzer
-    
-    analyzer = get_regional_analyzer()
-    result = await analyzer.analyze_with_cache(category_key)
-    
-    if not result:
-        raise HTTPException(404, f"No regional data available for {category_key}")
-    
-    return RegionalResponse(**result.data)
+    return await _serve_payload(request, category_key, "regional", "regional")
 
 
 # ============================================================================
@@ -215,34 +187,14 @@ async def get_regional_intel(
 @router.get("/{category_key}/livestream", response_model=LiveStreamResponse)
 async def get_livestream_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> LiveStreamResponse:
+    request: Request,
+) -> Response:
     """
     Get live stream analysis for a category.
     
     Returns premiere analysis, scheduling insights, and duration comparison.
     """
-    cache_key = f"intel:livestream:precomputed:{category_key}"
-    cached = await redis_client.get(cache_key)
-    
-    if cached:
-        try:
-            data = json.loads(cached)
-            if "data" in data:
-                return LiveStreamResponse(**data["data"])
-            return LiveStreamResponse(**data)
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse cached livestream data: {e}")
-    
-    from backend.services.intel.analyzers.live_stream import get_live_stream_analyzer
-    
-    analyzer = get_live_stream_analyzer()
-    result = await analyzer.analyze_with_cache(category_key)
-    
-    if not result:
-        raise HTTPException(404, f"No livestream data available for {category_key}")
-    
-    return LiveStreamResponse(**result.data)
+    return await _serve_payload(request, category_key, "livestream", "livestream")
 
 
 # ============================================================================
@@ -252,110 +204,14 @@ async def get_livestream_intel(
 @router.get("/{category_key}/combined", response_model=CombinedIntelResponse)
 async def get_combined_intel(
     category_key: str,
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> CombinedIntelResponse:
+    request: Request,
+) -> Response:
     """
     Get all intel for a category in one request.
     
     Returns all available analysis types combined.
     """
-    # Fetch all cached intel
-    keys = [
-        f"intel:format:precomputed:{category_key}",
-        f"intel:description:precomputed:{category_key}",
-        f"intel:semantic:precomputed:{category_key}",
-        f"intel:regional:precomputed:{category_key}",
-        f"intel:livestream:precomputed:{category_key}",
-    ]
-    
-    results = await redis_client.mget(keys)
-    
-    # Parse results
-    content_format = None
-    description = None
-    semantic = None
-    regional = None
-    live_stream = None
-    analyzers_available = []
-    
-    for i, (key, data) in enumerate(zip(keys, results)):
-        if not data:
-            continue
-        
-        try:
-            parsed = json.loads(data)
-            inner_data = parsed.get("data", parsed)
-            
-            if "format" in key:
-                content_format = ContentFormatResponse(**inner_data)
-                analyzers_available.append("content_format")
-            elif "description" in key:
-                description = DescriptionResponse(**inner_data)
-                analyzers_available.append("description")
-            elif "semantic" in key:
-                semantic = SemanticResponse(**inner_data)
-                analyzers_available.append("semantic")
-            elif "regional" in key:
-                regional = RegionalResponse(**inner_data)
-                analyzers_available.append("regional")
-            elif "livestream" in key:
-                live_stream = LiveStreamResponse(**inner_data)
-                analyzers_available.append("live_stream")
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Failed to parse {key}: {e}")
-    
-    if not analyzers_available:
-        raise HTTPException(404, f"No intel data available for {category_key}")
-    
-    # Calculate overall confidence
-    confidence_scores = []
-    if content_format:
-        confidence_scores.append(content_format.confidence)
-    if description:
-        confidence_scores.append(description.confidence)
-    if semantic:
-        confidence_scores.append(semantic.confidence)
-    if regional:
-        confidence_scores.append(regional.confidence)
-    if live_stream:
-        confidence_scores.append(live_stream.confidence)
-    
-    avg_confidence = sum(confidence_scores) // len(confidence_scores) if confidence_scores else 0
-    
-    # Determine freshness label
-    if avg_confidence >= 80:
-        label = "Fresh"
-    elif avg_confidence >= 60:
-        label = "Recent"
-    elif avg_confidence >= 40:
-        label = "Stale"
-    elif avg_confidence >= 20:
-        label = "Old"
-    else:
-        label = "Expired"
-    
-    # Get category name
-    category_name = category_key.replace("_", " ").title()
-    if content_format:
-        category_name = content_format.category_name
-    
-    return CombinedIntelResponse(
-        category_key=category_key,
-        category_name=category_name,
-        content_format=content_format,
-        description=description,
-        semantic=semantic,
-        regional=regional,
-        live_stream=live_stream,
-        confidence=IntelConfidence(
-            score=avg_confidence,
-            label=label,
-            fetched_at=datetime.now(timezone.utc).isoformat(),
-            hours_old=0,
-        ),
-        analyzers_available=analyzers_available,
-        fetched_at=datetime.now(timezone.utc).isoformat(),
-    )
+    return await _serve_payload(request, category_key, COMBINED_ENDPOINT, "intel")
 
 
 # ============================================================================
@@ -418,6 +274,12 @@ async def trigger_analysis(
         request.force_refresh,
     )
     
+    # Refresh the served payloads so the new results are visible immediately
+    try:
+        await get_intel_payload_store().publish_category(category_key)
+    except Exception as e:
+        logger.warning(f"Failed to publish intel payloads for {category_key}: {e}")
+    
     return result.to_dict()
 
 
@@ -14,6 +14,11 @@ from backend.services.intel.collectors.batch_collector import (
     BatchCollector,
     BatchCollectionResult,
 )
+from backend.services.intel.collectors.collection_planner import (
+    CollectionPlan,
+    GameCandidate,
+    plan_collection,
+)
 from backend.services.intel.collectors.content_hasher import (
     ContentHasher,
     HashResult,
@@ -27,6 +32,10 @@ __all__ = [
     # Batch collection
     "BatchCollector",
     "BatchCollectionResult",
+    # Collection planning
+    "CollectionPlan",
+    "GameCandidate",
+    "plan_collection",
     # Content hashing
     "ContentHasher",
     "HashResult",
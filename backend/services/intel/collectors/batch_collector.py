@@ -21,6 +21,35 @@ from backend.services.intel.core.exceptions import IntelDataError, IntelQuotaErr
 
 logger = logging.getLogger(__name__)
 
+# Change-detection hash of youtube:games:{game}. Every writer of the game
+# cache must write this too (same TTL), or hourly aggregation reuses stale
+# partials.
+YOUTUBE_HASH_KEY = "youtube:hash:{game}"
+
+
+def video_content_hash(videos: List[Dict]) -> str:
+    """
+    Calculate hash of video content for change detection.
+    
+    Uses video IDs and view counts to detect meaningful changes.
+    
+    Args:
+        videos: List of video dictionaries
+        
+    Returns:
+        16-character hex hash string
+    """
+    # Sort by video_id for consistent ordering
+    sorted_videos = sorted(videos, key=lambda x: x.get("video_id", ""))
+    
+    # Create content string from IDs and view counts
+    content = "|".join(
+        f"{v.get('video_id', '')}:{v.get('view_count', 0)}"
+        for v in sorted_videos
+    )
+    
+    return hashlib.sha256(content.encode()).hexdigest()[:16]
+
 
 @dataclass
 class BatchCollectionResult:
@@ -219,7 +248,7 @@ class BatchCollector:
             
             # Calculate content hash for change detection
             content_hash = self._calculate_content_hash(game_videos)
-            previous_hash = await self.redis.get(f"youtube:hash:{game_key}")
+            previous_hash = await self.redis.get(YOUTUBE_HASH_KEY.format(game=game_key))
             
             # Store in Redis
             await self._store_game_videos(game_key, game_videos)
@@ -418,27 +447,8 @@ class BatchCollector:
         return all_details
     
     def _calculate_content_hash(self, videos: List[Dict]) -> str:
-        """
-        Calculate hash of video content for change detection.
-        
-        Uses video IDs and view counts to detect meaningful changes.
-        
-        Args:
-            videos: List of video dictionaries
-            
-        Returns:
-            16-character hex hash string
-        """
-        # Sort by video_id for consistent ordering
-        sorted_videos = sorted(videos, key=lambda x: x.get("video_id", ""))
-        
-        # Create content string from IDs and view counts
-        content = "|".join(
-            f"{v.get('video_id', '')}:{v.get('view_count', 0)}"
-            for v in sorted_videos
-        )
-        
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        """Calculate hash of video content for change detection."""
+        return video_content_hash(videos)
     
     async def _store_game_videos(
         self,
@@ -465,9 +475,10 @@ class BatchCollector:
             json.dumps(data),
         )
         
-        # Store hash for change detection
+        # Store hash for change detection; it expires with the videos so a
+        # hash never outlives the data it describes
         content_hash = self._calculate_content_hash(videos)
-        await self.redis.set(f"youtube:hash:{game_key}", content_hash)
+        await self.redis.setex(YOUTUBE_HASH_KEY.format(game=game_key), self.CACHE_TTL, content_hash)
         
         logger.debug(f"Stored {len(videos)} videos for {game_key}")
     
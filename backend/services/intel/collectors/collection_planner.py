@@ -0,0 +1,188 @@
+"""
+Creator Intel V2 - Collection Planner
+
+Plans one game-search collection cycle across all tracked games up front.
+
+Each game costs one search (100 units) and its share of the video stats
+lookups (1 unit per 50 IDs). Searching games one by one pays a whole stats
+call per game even when it only fills 35 of 50 IDs; the plan instead merges
+the IDs of every planned game into full 50-ID batches.
+
+Games are ranked by staleness x popularity:
+- staleness: hours since the game was last fetched, relative to its
+  refresh interval (games never fetched count as MAX_STALENESS_HOURS old)
+- popularity: log of the mean view count of the game's cached videos,
+  so a larger audience breaks ties without starving smaller games
+
+and admitted in that order while the whole cycle, merged stats batches
+included, fits in the remaining daily units.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from backend.services.intel.collectors.quota_manager import QuotaManager
+
+logger = logging.getLogger(__name__)
+
+# YouTube videos.list accepts at most 50 IDs per call
+STATS_BATCH_SIZE = 50
+
+# Age assumed for games with no cached fetch (the game cache TTL)
+MAX_STALENESS_HOURS = 72.0
+
+
+@dataclass
+class GameCandidate:
+    """
+    A game that may be searched this cycle.
+
+    Attributes:
+        key: Game key (cache key suffix)
+        query: Search query
+        display: Display name
+        last_fetch: When the cached videos were fetched, None if not cached
+        popularity: Ranking weight, higher is refreshed first
+        min_refresh_hours: Games fetched more recently than this are fresh
+    """
+    key: str
+    query: str
+    display: str
+    last_fetch: Optional[datetime] = None
+    popularity: float = 1.0
+    min_refresh_hours: float = 12.0
+
+    def staleness_hours(self, now: datetime) -> float:
+        """Hours since the last fetch, capped at MAX_STALENESS_HOURS."""
+        if self.last_fetch is None:
+            return MAX_STALENESS_HOURS
+        age = (now - self.last_fetch).total_seconds() / 3600
+        return min(max(age, 0.0), MAX_STALENESS_HOURS)
+
+
+@dataclass
+class CollectionPlan:
+    """
+    Games to search this cycle, in priority order.
+
+    Attributes:
+        games: Planned games, highest score first
+        scores: Map of game_key -> staleness x popularity score
+        skipped: Map of game_key -> reason ("fresh" or "quota")
+        budget: Units the plan was allowed to use
+        results_per_game: Search results requested per game
+    """
+    games: List[GameCandidate] = field(default_factory=list)
+    scores: Dict[str, float] = field(default_factory=dict)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    budget: int = 0
+    results_per_game: int = STATS_BATCH_SIZE
+
+    @property
+    def estimated_units(self) -> int:
+        """Worst-case units for the plan: searches plus merged stats batches."""
+        return estimate_units(len(self.games), self.results_per_game)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "games": [game.key for game in self.games],
+            "scores": {key: round(score, 2) for key, score in self.scores.items()},
+            "skipped": self.skipped,
+            "budget": self.budget,
+            "estimated_units": self.estimated_units,
+        }
+
+
+def estimate_units(game_count: int, results_per_game: int) -> int:
+    """Units to search game_count games and fetch stats in shared batches."""
+    if game_count <= 0:
+        return 0
+    stats_batches = math.ceil(game_count * results_per_game / STATS_BATCH_SIZE)
+    return game_count * QuotaManager.COST_SEARCH + stats_batches * QuotaManager.COST_VIDEO_DETAILS
+
+
+def cached_popularity(videos: Iterable[dict]) -> Optional[float]:
+    """
+    Popularity weight from a game's cached videos.
+
+    Returns:
+        log10 of one plus the mean view count, or None without videos
+    """
+    views = [video.get("view_count") or 0 for video in videos]
+    if not views:
+        return None
+    return math.log10(1 + sum(views) / len(views))
+
+
+def plan_collection(
+    candidates: List[GameCandidate],
+    budget: int,
+    results_per_game: int,
+    now: Optional[datetime] = None,
+    force: bool = False,
+) -> CollectionPlan:
+    """
+    Plan which games to search within the remaining units.
+
+    Args:
+        candidates: Every tracked game
+        budget: Units available to this cycle
+        results_per_game: Search results requested per game
+        now: Reference time for staleness (default: utcnow)
+        force: If True, fresh games are candidates too
+
+    Returns:
+        CollectionPlan with the admitted games in priority order
+    """
+    now = now or datetime.utcnow()
+    plan = CollectionPlan(budget=budget, results_per_game=results_per_game)
+
+    ranked = []
+    for candidate in candidates:
+        staleness = candidate.staleness_hours(now)
+        if not force and staleness < candidate.min_refresh_hours:
+            plan.skipped[candidate.key] = "fresh"
+            continue
+        score = staleness / candidate.min_refresh_hours * candidate.popularity
+        ranked.append((score, candidate))
+
+    ranked.sort(key=lambda item: item[0], reverse=True)
+
+    for score, candidate in ranked:
+        if estimate_units(len(plan.games) + 1, results_per_game) > budget:
+            plan.skipped[candidate.key] = "quota"
+            continue
+        plan.games.append(candidate)
+        plan.scores[candidate.key] = score
+
+    return plan
+
+
+def merge_stat_batches(id_lists: Iterable[List[str]]) -> List[List[str]]:
+    """
+    Merge per-game video IDs into shared stats batches.
+
+    IDs are deduplicated across games, keeping first-seen order, and
+    split into batches of STATS_BATCH_SIZE.
+    """
+    unique_ids = list(dict.fromkeys(video_id for ids in id_lists for video_id in ids))
+    return [
+        unique_ids[i:i + STATS_BATCH_SIZE]
+        for i in range(0, len(unique_ids), STATS_BATCH_SIZE)
+    ]
+
+
+__all__ = [
+    "CollectionPlan",
+    "GameCandidate",
+    "MAX_STALENESS_HOURS",
+    "STATS_BATCH_SIZE",
+    "cached_popularity",
+    "estimate_units",
+    "merge_stat_batches",
+    "plan_collection",
+]
@@ -10,10 +10,11 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 import json
 import logging
-import os
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 from backend.services.intel.core.exceptions import IntelQuotaError, IntelCircuitOpenError
 
 logger = logging.getLogger(__name__)
@@ -241,10 +242,9 @@ class QuotaManager:
         self._initialized = False
     
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
+        """Get the Redis connection, defaulting to the shared "intel" pool."""
         if self._redis is None:
-            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis = get_async_redis("intel")
         return self._redis
     
     async def initialize(self) -> None:
@@ -567,10 +567,8 @@ class QuotaManager:
         }
     
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
 
 
 # Singleton instance
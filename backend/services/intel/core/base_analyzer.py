@@ -12,10 +12,10 @@ from typing import Any, Dict, Generic, Optional, TypeVar
 import hashlib
 import json
 import logging
-import os
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
 from backend.services.intel.core.exceptions import IntelDataError, IntelAnalysisError
 
 logger = logging.getLogger(__name__)
@@ -136,14 +136,13 @@ class BaseAnalyzer(ABC):
     
     async def get_redis(self) -> redis.Redis:
         """
-        Get or create Redis connection.
+        Get the shared Redis connection.
         
         Returns:
-            Async Redis client
+            Async Redis client from the shared "intel" pool
         """
         if self._redis is None:
-            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis = get_async_redis("intel")
         return self._redis
     
     async def load_youtube_data(self, category_key: str) -> Optional[Dict[str, Any]]:
@@ -402,7 +401,5 @@ class BaseAnalyzer(ABC):
             return None
     
     async def close(self) -> None:
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
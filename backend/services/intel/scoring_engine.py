@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Tuple, Any
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 from .category_stats import CategoryStats
 from .stats import (
     calculate_z_score,
@@ -57,16 +59,14 @@ class ScoringEngine:
         self._cache_ttl = timedelta(hours=1)
     
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
+        """Get the shared Redis connection."""
         if self._redis is None:
-            self._redis = redis.from_url(REDIS_URL, decode_responses=True)
+            self._redis = get_async_redis("intel")
         return self._redis
     
     async def close(self) -> None:
-        """Close Redis connection and clear caches."""
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client and clear caches."""
+        self._redis = None
         self._stats_cache.clear()
     
     # =========================================================================
@@ -20,6 +20,8 @@ from typing import Dict, List, Literal, Optional, Set
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -159,16 +161,14 @@ class ViralDetector:
         self._baseline_cache: Dict[str, float] = {}
 
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis connection."""
+        """Get the shared Redis connection."""
         if self._redis is None:
-            self._redis = redis.from_url(REDIS_URL, decode_responses=True)
+            self._redis = get_async_redis("intel")
         return self._redis
 
     async def close(self):
-        """Close Redis connection."""
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
 
     async def analyze_category(self, category_key: str) -> ViralOpportunityAnalysis:
         """
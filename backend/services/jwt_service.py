@@ -19,10 +19,20 @@ Usage:
     
     # Decode and validate tokens
     payload = jwt_service.decode_access_token(access_token)
+
+Verified access tokens can be memoized in a VerifiedTokenCache so hot
+clients skip signature verification and claim parsing on repeat calls:
+
+    jwt_service = JWTService(secret_key=..., token_cache=get_verified_token_cache())
 """
 
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
+import hashlib
+import os
+import threading
+import time
 import uuid
 
 from jose import jwt, JWTError, ExpiredSignatureError
@@ -36,6 +46,9 @@ DEFAULT_ALGORITHM = "HS256"
 DEFAULT_ACCESS_TOKEN_EXPIRE_HOURS = 24
 DEFAULT_REFRESH_TOKEN_EXPIRE_DAYS = 30
 
+# Maximum verified access tokens kept in memory per process
+VERIFIED_TOKEN_CACHE_SIZE = int(os.getenv("JWT_VERIFIED_CACHE_SIZE", "4096"))
+
 
 class TokenPayload(BaseModel):
     """
@@ -59,6 +72,96 @@ class TokenPayload(BaseModel):
     jti: str = Field(..., description="JWT ID for revocation")
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified access tokens.
+    
+    Entries are keyed by the exact token string (scoped to the signing key),
+    so a forged token that reuses a known jti can never hit. A jti index
+    lets logout evict a revoked token. An entry is served only until the
+    token's exp; after that it is dropped and the caller re-verifies,
+    which raises TokenExpiredError as usual.
+    
+    Cached TokenPayload instances are shared between requests and must be
+    treated as read-only.
+    
+    Thread Safety:
+    - All operations are protected by a threading.Lock
+    """
+    
+    def __init__(self, max_size: int = VERIFIED_TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], TokenPayload]" = OrderedDict()
+        self._by_jti: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, namespace: str, token: str) -> Optional[TokenPayload]:
+        """Return the cached payload for a token, or None if absent or expired."""
+        key = (namespace, token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            if payload.exp <= time.time():
+                self._remove(key, payload.jti)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return payload
+    
+    def put(self, namespace: str, token: str, payload: TokenPayload) -> None:
+        """Store a payload that was just verified, evicting the least recent entry."""
+        if self.max_size <= 0:
+            return
+        key = (namespace, token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            self._by_jti[payload.jti] = key
+            while len(self._entries) > self.max_size:
+                old_key, old_payload = self._entries.popitem(last=False)
+                if self._by_jti.get(old_payload.jti) == old_key:
+                    del self._by_jti[old_payload.jti]
+    
+    def invalidate(self, jti: str) -> None:
+        """Drop the entry for a token ID (e.g. on logout)."""
+        with self._lock:
+            key = self._by_jti.get(jti)
+            if key is not None:
+                self._remove(key, jti)
+    
+    def clear(self) -> None:
+        """Drop every entry. Useful for testing."""
+        with self._lock:
+            self._entries.clear()
+            self._by_jti.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remove(self, key: Tuple[str, str], jti: str) -> None:
+        """Remove an entry; caller holds the lock."""
+        self._entries.pop(key, None)
+        if self._by_jti.get(jti) == key:
+            del self._by_jti[jti]
+
+
+# Global verified token cache instance
+_verified_token_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_verified_token_cache() -> VerifiedTokenCache:
+    """Get or create the process-wide verified token cache."""
+    global _verified_token_cache
+    if _verified_token_cache is None:
+        _verified_token_cache = VerifiedTokenCache()
+    return _verified_token_cache
+
+
 class JWTService:
     """
     Service for creating and validating JWT tokens.
@@ -71,6 +174,7 @@ class JWTService:
         algorithm: JWT algorithm (default: HS256)
         access_token_expire_hours: Access token lifetime in hours (default: 24)
         refresh_token_expire_days: Refresh token lifetime in days (default: 30)
+        token_cache: Optional cache of verified access tokens
     """
     
     def __init__(
@@ -78,7 +182,8 @@ class JWTService:
         secret_key: str,
         algorithm: str = DEFAULT_ALGORITHM,
         access_token_expire_hours: int = DEFAULT_ACCESS_TOKEN_EXPIRE_HOURS,
-        refresh_token_expire_days: int = DEFAULT_REFRESH_TOKEN_EXPIRE_DAYS
+        refresh_token_expire_days: int = DEFAULT_REFRESH_TOKEN_EXPIRE_DAYS,
+        token_cache: Optional[VerifiedTokenCache] = None,
     ):
         if not secret_key:
             raise ValueError("JWT secret key cannot be empty")
@@ -87,6 +192,11 @@ class JWTService:
         self.algorithm = algorithm
         self.access_token_expire_hours = access_token_expire_hours
         self.refresh_token_expire_days = refresh_token_expire_days
+        self.token_cache = token_cache
+        # Cache entries verified under one key must never satisfy another
+        self._cache_namespace = hashlib.sha256(
+            f"{algorithm}:{secret_key}".encode()
+        ).hexdigest()[:16]
     
     def create_access_token(
         self,
@@ -202,6 +312,11 @@ class JWTService:
                 # Handle invalid token - require re-login
                 pass
         """
+        if self.token_cache is not None:
+            cached = self.token_cache.get(self._cache_namespace, token)
+            if cached is not None:
+                return cached
+        
         payload_dict = self._decode_token(token)
         
         # Validate token type
@@ -212,7 +327,10 @@ class JWTService:
         if not payload_dict.get("tier") or not payload_dict.get("email"):
             raise TokenInvalidError("Access token missing required claims")
         
-        return TokenPayload(**payload_dict)
+        payload = TokenPayload(**payload_dict)
+        if self.token_cache is not None:
+            self.token_cache.put(self._cache_namespace, token, payload)
+        return payload
     
     def decode_refresh_token(self, token: str) -> TokenPayload:
         """
@@ -316,14 +434,10 @@ class JWTService:
             return payload
             
         except ExpiredSignatureError:
-            # Try to extract expiration time for error details
+            # The signature was verified before exp was checked, so the
+            # claims can be read without decoding the token a second time
             try:
-                expired_payload = jwt.decode(
-                    token,
-                    self.secret_key,
-                    algorithms=[self.algorithm],
-                    options={"verify_exp": False}
-                )
+                expired_payload = jwt.get_unverified_claims(token)
                 expired_at = datetime.fromtimestamp(expired_payload.get("exp", 0), tz=timezone.utc)
                 raise TokenExpiredError(expired_at=expired_at)
             except JWTError:
@@ -478,6 +592,8 @@ def decode_obs_token(token: str) -> OBSTokenPayload:
 __all__ = [
     "JWTService",
     "TokenPayload",
+    "VerifiedTokenCache",
+    "get_verified_token_cache",
     "OBSTokenPayload",
     "DEFAULT_ALGORITHM",
     "DEFAULT_ACCESS_TOKEN_EXPIRE_HOURS",
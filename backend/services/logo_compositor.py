@@ -113,8 +113,9 @@ class LogoCompositor:
             # Calculate position
             x, y = self._calculate_position(base.size, scaled_logo.size, position)
             
-            # Composite
-            result = base.copy()
+            # Composite in place: base is already our own decoded image, so a
+            # copy would only add another full-size RGBA buffer
+            result = base
             result.paste(scaled_logo, (x, y), scaled_logo)
             
             # Convert back to RGB if original was JPEG (no alpha)
@@ -123,14 +124,13 @@ class LogoCompositor:
             # Save to bytes
             output = io.BytesIO()
             result.save(output, format="PNG", optimize=True)
-            output.seek(0)
             
             logger.info(
                 f"Logo composited: position={position}, size={size}, "
                 f"base_size={base.size}, logo_size={scaled_logo.size}"
             )
             
-            return output.read()
+            return output.getvalue()
             
         except Exception as e:
             logger.error(f"Logo compositing failed: {e}")
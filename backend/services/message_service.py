@@ -1,21 +1,66 @@
 """
 Message Service for AuraStream.
 Handles direct messaging between users.
+
+The inbox is built from one get_conversation_summaries RPC (last message
+and unread count per conversation) plus one batched profile fetch. Each
+user's total unread count is cached in Redis and adjusted incrementally by
+send_message / mark_as_read, so get_unread_count is a single read.
+
+Every adjustment also bumps a per-user generation counter. A count rebuilt
+from the database is written only if the counter is still absent and the
+generation has not moved since before the database read, so a send or
+read that lands in between can never be overwritten by the older total.
 """
 
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from backend.database.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+UNREAD_COUNT_KEY = "messages:unread:{user_id}"
+UNREAD_GENERATION_KEY = "messages:unread:gen:{user_id}"
+UNREAD_COUNT_TTL = int(os.getenv("MESSAGE_UNREAD_CACHE_TTL", "86400"))
+
+# Bump the generation, then adjust the cached counter only if it exists (a
+# missing counter is rebuilt from the database on the next read) and never
+# let it go below zero.
+_ADJUST_UNREAD_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+  redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+  return 0
+end
+return value
+"""
+
+# Store a rebuilt counter only if no adjustment ran since the generation
+# was read (ARGV[2]) and no other rebuild stored one first.
+_STORE_UNREAD_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[2] then
+  return 0
+end
+if redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3], 'NX') then
+  return 1
+end
+return 0
+"""
+
 
 class MessageService:
     """Service for direct messaging operations."""
 
-    def __init__(self):
+    def __init__(self, redis_client=None):
         self._supabase = None
+        self._redis = redis_client
 
     @property
     def supabase(self):
@@ -23,6 +68,16 @@ class MessageService:
             self._supabase = get_supabase_client()
         return self._supabase
 
+    def _get_redis(self):
+        """Get the Redis client for the unread counter cache (None if unavailable)."""
+        if self._redis is None:
+            try:
+                from backend.database.redis_pool import get_async_redis
+                self._redis = get_async_redis("default")
+            except Exception as e:
+                logger.warning(f"Unread count cache unavailable: {e}")
+        return self._redis
+
     # ========================================================================
     # Conversations
     # ========================================================================
@@ -56,55 +111,45 @@ class MessageService:
 
     async def get_conversations(self, user_id: str) -> dict:
         """Get all conversations for a user."""
-        result = self.supabase.table("conversations").select("*").or_(
-            f"user1_id.eq.{user_id},user2_id.eq.{user_id}"
-        ).order("updated_at", desc=True).execute()
+        generation = await self._get_unread_generation(user_id)
+        summaries = await self._get_conversation_summaries(user_id)
+        profiles = await self._get_user_profiles(
+            [row["other_user_id"] for row in summaries]
+        )
 
         conversations = []
         total_unread = 0
 
-        for conv in result.data or []:
-            other_user_id = conv["user2_id"] if conv["user1_id"] == user_id else conv["user1_id"]
-
-            # Get other user's profile
-            profile = await self._get_user_profile(other_user_id)
-
-            # Get last message
-            last_msg_result = self.supabase.table("messages").select(
-                "id, content, sender_id, created_at"
-            ).eq("conversation_id", conv["id"]).order("created_at", desc=True).limit(1).execute()
+        for row in summaries:
+            other_user_id = row["other_user_id"]
+            profile = profiles.get(other_user_id)
 
             last_message = None
-            if last_msg_result.data:
-                lm = last_msg_result.data[0]
+            if row.get("last_message_id"):
                 last_message = {
-                    "id": lm["id"],
-                    "content": lm["content"],
-                    "sender_id": lm["sender_id"],
-                    "created_at": lm["created_at"],
+                    "id": row["last_message_id"],
+                    "content": row["last_message_content"],
+                    "sender_id": row["last_message_sender_id"],
+                    "created_at": row["last_message_created_at"],
                 }
 
-            # Get unread count
-            unread_result = self.supabase.table("messages").select(
-                "id", count="exact"
-            ).eq("conversation_id", conv["id"]).eq(
-                "sender_id", other_user_id
-            ).is_("read_at", "null").execute()
-
-            unread_count = unread_result.count or 0
+            unread_count = row.get("unread_count") or 0
             total_unread += unread_count
 
             conversations.append({
-                "conversation_id": conv["id"],
+                "conversation_id": row["conversation_id"],
                 "other_user_id": other_user_id,
                 "other_user_display_name": profile.get("display_name") if profile else None,
                 "other_user_avatar_url": profile.get("avatar_url") if profile else None,
                 "is_online": False,  # Placeholder
                 "last_message": last_message,
                 "unread_count": unread_count,
-                "updated_at": conv["updated_at"],
+                "updated_at": row["updated_at"],
             })
 
+        # Seed the cached counter if it is missing and nothing changed meanwhile
+        await self._store_cached_unread(user_id, total_unread, generation)
+
         return {"conversations": conversations, "total_unread": total_unread}
 
     # ========================================================================
@@ -179,6 +224,8 @@ class MessageService:
             "updated_at": now
         }).eq("id", conv["id"]).execute()
 
+        await self._adjust_cached_unread(recipient_id, 1)
+
         return result.data[0]
 
     async def mark_as_read(self, user_id: str, other_user_id: str) -> dict:
@@ -192,40 +239,117 @@ class MessageService:
             "sender_id", other_user_id
         ).is_("read_at", "null").execute()
 
-        return {"marked_count": len(result.data) if result.data else 0}
+        marked_count = len(result.data) if result.data else 0
+        if marked_count:
+            await self._adjust_cached_unread(user_id, -marked_count)
+
+        return {"marked_count": marked_count}
 
     async def get_unread_count(self, user_id: str) -> int:
         """Get total unread message count for a user."""
-        # Get all conversations
-        convs = self.supabase.table("conversations").select("id, user1_id, user2_id").or_(
-            f"user1_id.eq.{user_id},user2_id.eq.{user_id}"
-        ).execute()
-
-        if not convs.data:
-            return 0
-
-        total = 0
-        for conv in convs.data:
-            other_user_id = conv["user2_id"] if conv["user1_id"] == user_id else conv["user1_id"]
-            result = self.supabase.table("messages").select(
-                "id", count="exact"
-            ).eq("conversation_id", conv["id"]).eq(
-                "sender_id", other_user_id
-            ).is_("read_at", "null").execute()
-            total += result.count or 0
+        cached, generation = await self._get_cached_unread(user_id)
+        if cached is not None:
+            return cached
 
+        summaries = await self._get_conversation_summaries(user_id)
+        total = sum(row.get("unread_count") or 0 for row in summaries)
+        await self._store_cached_unread(user_id, total, generation)
         return total
 
     # ========================================================================
     # Helper Methods
     # ========================================================================
 
-    async def _get_user_profile(self, user_id: str) -> Optional[dict]:
-        """Get user profile by ID."""
+    async def _get_conversation_summaries(self, user_id: str) -> List[dict]:
+        """Get last message and unread count for every conversation in one query."""
+        result = self.supabase.rpc(
+            "get_conversation_summaries", {"p_user_id": user_id}
+        ).execute()
+        return result.data or []
+
+    async def _get_user_profiles(self, user_ids: List[str]) -> Dict[str, dict]:
+        """Get user profiles by ID in one query, keyed by user ID."""
+        if not user_ids:
+            return {}
         result = self.supabase.table("users").select(
             "id, display_name, avatar_url"
-        ).eq("id", user_id).execute()
-        return result.data[0] if result.data else None
+        ).in_("id", list(set(user_ids))).execute()
+        return {row["id"]: row for row in result.data or []}
+
+    async def _get_cached_unread(self, user_id: str) -> Tuple[Optional[int], Optional[str]]:
+        """
+        Read the cached unread counter and its generation in one round trip.
+
+        Returns:
+            (count, generation); count is None on a miss, both are None on a
+            Redis error
+        """
+        redis = self._get_redis()
+        if redis is None:
+            return None, None
+        try:
+            value, generation = await redis.mget([
+                UNREAD_COUNT_KEY.format(user_id=user_id),
+                UNREAD_GENERATION_KEY.format(user_id=user_id),
+            ])
+        except Exception as e:
+            logger.warning(f"Unread count cache read failed: {e}")
+            return None, None
+        count = int(value) if value is not None else None
+        return count, _generation_value(generation)
+
+    async def _get_unread_generation(self, user_id: str) -> Optional[str]:
+        """Read the counter's generation before a rebuild; None on a Redis error."""
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            generation = await redis.get(UNREAD_GENERATION_KEY.format(user_id=user_id))
+        except Exception as e:
+            logger.warning(f"Unread count cache read failed: {e}")
+            return None
+        return _generation_value(generation)
+
+    async def _store_cached_unread(self, user_id: str, count: int, generation: Optional[str]) -> None:
+        """
+        Store an unread count computed from the database.
+
+        Args:
+            user_id: User whose counter was rebuilt
+            count: Total unread count from the database
+            generation: Generation read before the database query (None skips the write)
+        """
+        redis = self._get_redis()
+        if redis is None or generation is None:
+            return
+        try:
+            await redis.eval(
+                _STORE_UNREAD_SCRIPT, 2,
+                UNREAD_COUNT_KEY.format(user_id=user_id),
+                UNREAD_GENERATION_KEY.format(user_id=user_id),
+                count, generation, UNREAD_COUNT_TTL,
+            )
+        except Exception as e:
+            logger.warning(f"Unread count cache write failed: {e}")
+
+    async def _adjust_cached_unread(self, user_id: str, delta: int) -> None:
+        """Apply a delta to the cached unread counter, dropping it if Redis fails."""
+        redis = self._get_redis()
+        if redis is None:
+            return
+        key = UNREAD_COUNT_KEY.format(user_id=user_id)
+        generation_key = UNREAD_GENERATION_KEY.format(user_id=user_id)
+        try:
+            await redis.eval(_ADJUST_UNREAD_SCRIPT, 2, key, generation_key, delta, UNREAD_COUNT_TTL)
+        except Exception as e:
+            logger.warning(f"Unread count cache update failed: {e}")
+            try:
+                # A counter that missed an update must not be served again,
+                # nor rebuilt from a read that started before it
+                await redis.delete(key)
+                await redis.incr(generation_key)
+            except Exception:
+                pass
 
     async def _is_blocked(self, user_id: str, by_user_id: str) -> bool:
         """Check if user is blocked by another user."""
@@ -235,6 +359,13 @@ class MessageService:
         return bool(result.data)
 
 
+def _generation_value(raw) -> str:
+    """Normalize a stored generation (missing counts as "0")."""
+    if raw is None:
+        return "0"
+    return raw.decode() if isinstance(raw, bytes) else str(raw)
+
+
 # Singleton
 _message_service: Optional[MessageService] = None
 
@@ -27,6 +27,8 @@ from typing import List, Optional
 
 import aiohttp
 
+from backend.services.gemini_admission import PRIORITY_INTERACTIVE, get_gemini_admission
+from backend.services.gemini_stream import STREAM_CHUNK_SIZE, InlineDataDecoder
 from backend.services.exceptions import (
     ContentPolicyError,
     GenerationError,
@@ -72,6 +74,8 @@ class GenerationRequest:
     media_assets: Optional[List["MediaAssetInput"]] = None
     # Enable Google Search grounding for real-time information (game content, current events, etc.)
     enable_grounding: bool = False
+    # Admission priority for the shared Gemini quota (see priority_for_tier)
+    priority: str = PRIORITY_INTERACTIVE
 
 
 @dataclass
@@ -209,6 +213,12 @@ class NanoBananaClient:
         # Use request model if specified, otherwise use client default
         model_name = request.model or self.model
         
+        # History stores image references; load the bytes once, not per retry
+        conversation_history = request.conversation_history
+        if conversation_history:
+            from backend.services.gemini_history_store import get_gemini_history_store
+            conversation_history = await get_gemini_history_store().resolve_history(conversation_history)
+        
         # Generate with retry logic
         return await self._request_with_retry(
             prompt=request.prompt,
@@ -218,9 +228,10 @@ class NanoBananaClient:
             height=request.height,
             input_image=request.input_image,
             input_mime_type=request.input_mime_type,
-            conversation_history=request.conversation_history,
+            conversation_history=conversation_history,
             media_assets=request.media_assets,
             enable_grounding=request.enable_grounding,
+            priority=request.priority,
         )
     
     def _build_multi_turn_contents(
@@ -237,7 +248,8 @@ class NanoBananaClient:
         generations without re-uploading images.
         
         Args:
-            conversation_history: List of previous turns (user prompts + model images)
+            conversation_history: List of previous turns (user prompts + model
+                images), with image references already resolved
             refinement_prompt: The new refinement request
             width: Target width
             height: Target height
@@ -320,26 +332,32 @@ Refinement request: """
         conversation_history: Optional[list] = None,
         media_assets: Optional[List["MediaAssetInput"]] = None,
         enable_grounding: bool = False,
+        priority: str = PRIORITY_INTERACTIVE,
     ) -> GenerationResponse:
         """
         Execute generation request with exponential backoff retry.
+        
+        Each attempt holds a slot from the shared Gemini admission limit, so
+        retries queue behind the cluster-wide limit instead of piling on.
         """
         last_exception: Optional[Exception] = None
+        admission = get_gemini_admission()
         
         for attempt in range(self.max_retries):
             try:
-                return await self._execute_generation(
-                    prompt=prompt,
-                    model_name=model_name,
-                    seed=seed,
-                    width=width,
-                    height=height,
-                    input_image=input_image,
-                    input_mime_type=input_mime_type,
-                    conversation_history=conversation_history,
-                    media_assets=media_assets,
-                    enable_grounding=enable_grounding,
-                )
+                async with admission.slot(model_name, priority):
+                    return await self._execute_generation(
+                        prompt=prompt,
+                        model_name=model_name,
+                        seed=seed,
+                        width=width,
+                        height=height,
+                        input_image=input_image,
+                        input_mime_type=input_mime_type,
+                        conversation_history=conversation_history,
+                        media_assets=media_assets,
+                        enable_grounding=enable_grounding,
+                    )
             
             except ContentPolicyError:
                 # Don't retry content policy violations
@@ -489,6 +507,10 @@ Generate a polished, professional result with proper lighting, depth, and visual
             ]
         }
         
+        # Pass an explicit seed through; unseeded requests stay random
+        if seed is not None:
+            request_body["generationConfig"]["seed"] = seed
+        
         # Add Google Search grounding tool if enabled
         # This allows the model to search for real-time information (game content, current events, etc.)
         # to avoid hallucinating details about things like new game locations, skins, POIs
@@ -508,8 +530,12 @@ Generate a polished, professional result with proper lighting, depth, and visual
                 inference_time_ms = int((time.time() - start_time) * 1000)
                 
                 if response.status == 200:
-                    data = await response.json()
-                    image_data, thought_signature = self._extract_image_data(data)
+                    # Decode the inline image as it streams in rather than
+                    # holding the body, its text and the parsed JSON at once
+                    decoder = InlineDataDecoder(size_hint=response.content_length)
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        decoder.feed(chunk)
+                    image_data, thought_signature = self._extract_image_data(decoder.result(), decoder)
                     
                     return GenerationResponse(
                         image_data=image_data,
@@ -554,10 +580,17 @@ Generate a polished, professional result with proper lighting, depth, and visual
                 details={"original_error": str(e)}
             )
     
-    def _extract_image_data(self, data: dict) -> tuple[bytes, Optional[bytes]]:
+    def _extract_image_data(
+        self, data: dict, decoder: Optional[InlineDataDecoder] = None
+    ) -> tuple[bytes, Optional[bytes]]:
         """
         Extract image bytes and thought_signature from Gemini API response.
         
+        Args:
+            data: Parsed response (from the streaming decoder, image data
+                  values are placeholders resolved through decoder)
+            decoder: The InlineDataDecoder that parsed the response, if any
+        
         Returns:
             Tuple of (image_data, thought_signature)
         """
@@ -590,7 +623,7 @@ Generate a polished, professional result with proper lighting, depth, and visual
             if "inlineData" in part:
                 inline_data = part["inlineData"]
                 if "data" in inline_data:
-                    image_data = base64.b64decode(inline_data["data"])
+                    image_data = self._inline_bytes(inline_data["data"], decoder)
                 # Extract thought_signature if present (camelCase from API)
                 if "thoughtSignature" in part:
                     thought_signature = base64.b64decode(part["thoughtSignature"])
@@ -599,7 +632,7 @@ Generate a polished, professional result with proper lighting, depth, and visual
             if "inline_data" in part:
                 inline_data = part["inline_data"]
                 if "data" in inline_data:
-                    image_data = base64.b64decode(inline_data["data"])
+                    image_data = self._inline_bytes(inline_data["data"], decoder)
                 # Extract thought_signature if present (snake_case variant)
                 if "thought_signature" in part:
                     thought_signature = base64.b64decode(part["thought_signature"])
@@ -620,6 +653,15 @@ Generate a polished, professional result with proper lighting, depth, and visual
             message="No image data found in response",
             details={"response": data}
         )
+    
+    @staticmethod
+    def _inline_bytes(value: str, decoder: Optional[InlineDataDecoder]) -> bytes:
+        """Decoded bytes for an inlineData value (streamed placeholder or base64)."""
+        if decoder is not None:
+            decoded = decoder.resolve(value)
+            if decoded is not None:
+                return decoded
+        return base64.b64decode(value)
 
 
 # Factory function for creating client from environment
@@ -230,6 +230,90 @@ class ProvenanceNanoBananaClient:
         
         return response
     
+    async def record_cache_hit(
+        self,
+        request: GenerationRequest,
+        response: GenerationResponse,
+        context: GenerationContext,
+        source_generation_id: Optional[str],
+        source_job_id: Optional[str],
+    ) -> None:
+        """
+        Capture provenance for a job served from the generation result cache.
+
+        No model call is made, so the record carries no cost or latency and
+        names the generation and job whose image was reused. Failures are
+        logged; they never fail the job.
+
+        Args:
+            request: The generation request the cached image matched
+            response: Response served to this job
+            context: Context for provenance (job_id, user_id, etc.)
+            source_generation_id: Generation that produced the cached image
+            source_job_id: Job that produced the cached image
+        """
+        insight_type = ASSET_TYPE_TO_INSIGHT.get(
+            context.asset_type,
+            InsightType.IMAGE_REFINEMENT if context.is_refinement else InsightType.IMAGE_GENERATION
+        )
+        model_name = request.model or self._client.model
+
+        try:
+            with provenance_context(
+                worker_name="generation_worker",
+                execution_id=context.execution_id,
+                insight_type=insight_type,
+                category_key=context.asset_type,
+            ) as prov:
+                prov.add_data_source(
+                    source_type="generation_result_cache",
+                    source_key=f"gemini:{model_name}",
+                    records_used=1,
+                    freshness_seconds=0,
+                    quality_score=1.0,
+                    sample_ids=[source_generation_id] if source_generation_id else [],
+                )
+                prov.start_step(
+                    operation="result_cache_lookup",
+                    description="Serve the image of an identical seeded request",
+                    algorithm="canonical_request_hash",
+                )
+                prov.end_step(
+                    input_count=1,
+                    output_count=1,
+                    parameters={"seed": response.seed, "source_job_id": source_job_id},
+                )
+                prov.set_insight(
+                    insight_id=response.generation_id,
+                    insight_summary=(
+                        f"Served cached {context.asset_type} ({request.width}x{request.height}) "
+                        f"from job {source_job_id or 'unknown'}"
+                    ),
+                    insight_value={
+                        "job_id": context.job_id,
+                        "asset_type": context.asset_type,
+                        "dimensions": f"{request.width}x{request.height}",
+                        "model": model_name,
+                        "seed": response.seed,
+                        "cached": True,
+                        "source_generation_id": source_generation_id,
+                        "source_job_id": source_job_id,
+                        "estimated_cost_usd": 0.0,
+                        "success": True,
+                    },
+                )
+                prov.set_confidence(1.0)
+                prov.set_quality(1.0)
+                prov.set_validation(passed=True, errors=[])
+                prov.add_tag(context.asset_type)
+                prov.add_tag(model_name)
+                prov.add_tag("result_cache_hit")
+                if context.brand_kit_id:
+                    prov.add_tag("branded")
+                prov.set_algorithm_version(self.ALGORITHM_VERSION)
+        except Exception as e:
+            logger.warning(f"Failed to capture cached generation provenance: job_id={context.job_id}: {e}")
+
     async def _capture_provenance(
         self,
         request: GenerationRequest,
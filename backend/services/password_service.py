@@ -3,18 +3,249 @@ Password Service for Aurastream Authentication.
 
 This module provides secure password hashing and validation using bcrypt.
 Security Note: Never log passwords in any function.
+
+A bcrypt hash at cost 12 takes ~250 ms of CPU. Async callers use
+hash_password_async / verify_password_async, which run bcrypt in a
+dedicated, bounded process pool (PasswordHashPool) so a login storm only
+slows logins: the event loop keeps serving other endpoints, and once
+PASSWORD_HASH_MAX_PENDING hashes are queued further requests are shed
+with PasswordHashingBusyError (503) instead of queueing without bound.
 """
 
-import bcrypt
+import asyncio
+import logging
+import multiprocessing
+import os
 import re
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import bcrypt
+
+from backend.services.exceptions import PasswordHashingBusyError
+
+logger = logging.getLogger(__name__)
 
 # Security configuration
 BCRYPT_COST_FACTOR = 12
 MIN_PASSWORD_LENGTH = 8
 MAX_PASSWORD_LENGTH = 128
 
+# Hashing pool configuration
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(2, os.cpu_count() or 1))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 16)))
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "process")  # process | thread
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv("PASSWORD_HASH_RETRY_AFTER", "2"))
+
+
+# =============================================================================
+# bcrypt Primitives (module level so the process pool can pickle them)
+# =============================================================================
+
+def _bcrypt_hash(password: str, cost_factor: int) -> Tuple[str, float]:
+    """Hash a password; returns (hash, seconds spent in bcrypt)."""
+    started = time.perf_counter()
+    salt = bcrypt.gensalt(rounds=cost_factor)
+    hashed = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    return hashed, time.perf_counter() - started
+
+
+def _bcrypt_check(password: str, hashed: str) -> Tuple[bool, float]:
+    """Check a password; returns (matches, seconds spent in bcrypt)."""
+    started = time.perf_counter()
+    try:
+        matches = bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    except (ValueError, TypeError):
+        # Invalid hash format
+        matches = False
+    return matches, time.perf_counter() - started
+
+
+def _warmup() -> None:
+    """No-op submitted at startup so worker processes are spawned eagerly."""
+    return None
+
+
+# =============================================================================
+# Password Hash Pool
+# =============================================================================
+
+class PasswordHashPool:
+    """
+    Bounded executor dedicated to bcrypt.
+    
+    Admission is counted in-process: a job is pending from submission
+    until its result is back, and once `max_pending` jobs are pending new
+    ones are rejected immediately with PasswordHashingBusyError.
+    """
+    
+    def __init__(
+        self,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+        kind: str = PASSWORD_HASH_EXECUTOR,
+        retry_after: int = PASSWORD_HASH_RETRY_AFTER,
+    ):
+        """
+        Initialize the pool (workers start on first use or warmup()).
+        
+        Args:
+            workers: Worker processes (or threads) running bcrypt
+            max_pending: Admission limit for queued + running jobs
+            kind: "process" for a ProcessPoolExecutor, "thread" for threads
+            retry_after: Retry-After seconds reported when shedding load
+        """
+        if kind not in ("process", "thread"):
+            raise ValueError(f"Unknown password hash executor kind: {kind}")
+        self.workers = max(1, workers)
+        self.max_pending = max(1, max_pending)
+        self.kind = kind
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+    
+    @property
+    def pending(self) -> int:
+        """Jobs queued or running right now."""
+        return self._pending
+    
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    # spawn: never fork a process holding the event loop and sockets
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers,
+                        thread_name_prefix="password-hash",
+                    )
+            return self._executor
+    
+    def _reset_broken(self, broken: Executor) -> None:
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False)
+    
+    async def run(self, operation: str, fn: Callable[..., Tuple[Any, float]], *args: Any) -> Any:
+        """
+        Run a bcrypt primitive in the pool, subject to the admission limit.
+        
+        Args:
+            operation: Metric label ("hash" or "verify")
+            fn: Module-level primitive returning (result, run_seconds)
+            *args: Arguments for fn
+            
+        Returns:
+            The primitive's result
+            
+        Raises:
+            PasswordHashingBusyError: If max_pending jobs are already pending
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                admitted = False
+            else:
+                self._pending += 1
+                admitted = True
+        if not admitted:
+            _track(operation, self._pending, rejected=True)
+            raise PasswordHashingBusyError(retry_after=self.retry_after)
+        
+        _track(operation, self._pending)
+        submitted = time.perf_counter()
+        executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                result, run_seconds = await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); replace the pool and retry once
+                logger.warning("Password hash pool broken; restarting workers")
+                self._reset_broken(executor)
+                result, run_seconds = await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+        
+        self.completed += 1
+        total = time.perf_counter() - submitted
+        _track(
+            operation, self._pending,
+            wait_seconds=max(0.0, total - run_seconds), run_seconds=run_seconds,
+        )
+        return result
+    
+    def warmup(self) -> None:
+        """Start every worker now so the first logins skip process spawn."""
+        executor = self._get_executor()
+        for future in [executor.submit(_warmup) for _ in range(self.workers)]:
+            future.result()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Pool configuration and counters, for health checks and load tests."""
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers; the pool restarts lazily if used again."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _track(
+    operation: str,
+    pending: int,
+    wait_seconds: Optional[float] = None,
+    run_seconds: Optional[float] = None,
+    rejected: bool = False,
+) -> None:
+    """Report pool metrics; never lets metrics failures affect auth."""
+    try:
+        from backend.api.middleware.prometheus_metrics import track_password_hash
+        track_password_hash(operation, pending, wait_seconds, run_seconds, rejected)
+    except Exception:
+        pass
+
+
+_password_hash_pool: Optional[PasswordHashPool] = None
+
+
+def get_password_hash_pool() -> PasswordHashPool:
+    """Get the process-wide password hash pool singleton."""
+    global _password_hash_pool
+    if _password_hash_pool is None:
+        _password_hash_pool = PasswordHashPool()
+    return _password_hash_pool
+
+
+def shutdown_password_hash_pool() -> None:
+    """Stop the password hash pool's workers (called on app shutdown)."""
+    global _password_hash_pool
+    if _password_hash_pool is not None:
+        _password_hash_pool.shutdown()
+        _password_hash_pool = None
+
 
 @dataclass
 class PasswordValidationResult:
@@ -28,14 +259,25 @@ class PasswordValidationResult:
 class PasswordService:
     """Service for secure password hashing and validation."""
     
-    def __init__(self, cost_factor: int = BCRYPT_COST_FACTOR):
+    def __init__(
+        self,
+        cost_factor: int = BCRYPT_COST_FACTOR,
+        hash_pool: Optional[PasswordHashPool] = None,
+    ):
         """
         Initialize the password service.
         
         Args:
             cost_factor: bcrypt cost factor (default: 12)
+            hash_pool: Pool for the async methods (default: shared singleton)
         """
         self.cost_factor = cost_factor
+        self._hash_pool = hash_pool
+    
+    @property
+    def hash_pool(self) -> PasswordHashPool:
+        """Pool used by hash_password_async / verify_password_async."""
+        return self._hash_pool or get_password_hash_pool()
     
     def hash_password(self, password: str) -> str:
         """
@@ -50,9 +292,7 @@ class PasswordService:
         Note:
             Each call produces a different hash due to random salt.
         """
-        salt = bcrypt.gensalt(rounds=self.cost_factor)
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed.decode('utf-8')
+        return _bcrypt_hash(password, self.cost_factor)[0]
     
     def verify_password(self, password: str, hashed: str) -> bool:
         """
@@ -65,11 +305,38 @@ class PasswordService:
         Returns:
             True if password matches, False otherwise
         """
-        try:
-            return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
-        except (ValueError, TypeError):
-            # Invalid hash format
-            return False
+        return _bcrypt_check(password, hashed)[0]
+    
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash a password in the password hash pool without blocking the event loop.
+        
+        Args:
+            password: Plain text password to hash
+            
+        Returns:
+            Hashed password string
+            
+        Raises:
+            PasswordHashingBusyError: If the pool is at its admission limit
+        """
+        return await self.hash_pool.run("hash", _bcrypt_hash, password, self.cost_factor)
+    
+    async def verify_password_async(self, password: str, hashed: str) -> bool:
+        """
+        Verify a password in the password hash pool without blocking the event loop.
+        
+        Args:
+            password: Plain text password to verify
+            hashed: Previously hashed password
+            
+        Returns:
+            True if password matches, False otherwise
+            
+        Raises:
+            PasswordHashingBusyError: If the pool is at its admission limit
+        """
+        return await self.hash_pool.run("verify", _bcrypt_check, password, hashed)
     
     def validate_password_strength(self, password: str) -> PasswordValidationResult:
         """
@@ -7,24 +7,46 @@ This service handles prompt template management for AI asset generation:
 - Sanitizing user input to prevent prompt injection
 - Building complete prompts for AI generation
 
+Templates are compiled once into a PromptTemplateRegistry (at API startup
+via PromptEngine.warmup, otherwise on first use): every YAML file under
+prompts/ is parsed and each prompt text is pre-split into literal and
+placeholder segments, so building a prompt is a join.
+
 Security Notes:
 - User input is sanitized to prevent prompt injection attacks
 - Template paths are validated to prevent directory traversal
-- Thread-safe caching is implemented for template loading
+- The compiled registry is immutable and shared across threads
 """
 
+import logging
 import os
 import re
 import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
 
 import yaml
 
 from backend.services.exceptions import TemplateNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Compiling every template should stay well inside API startup
+PROMPT_REGISTRY_STARTUP_BUDGET_MS = float(os.getenv("PROMPT_REGISTRY_STARTUP_BUDGET_MS", "250"))
+
+PLACEHOLDER_PATTERN = re.compile(r'\{([^}]+)\}')
+VERSION_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+$')
+
+PROMPT_TEMPLATE_FIELDS = ('name', 'version', 'base_prompt', 'quality_modifiers', 'placeholders')
+
+# libyaml parses the templates ~10x faster than the pure-Python loader
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AssetType(str, Enum):
     """Supported asset types for generation."""
@@ -111,6 +133,161 @@ class VibeBasedTemplate:
     quality_modifiers: list[str]
 
 
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """
+    Prompt text pre-split at its {placeholder} markers.
+    
+    Attributes:
+        literals: Text around the placeholders (always one more than fields)
+        fields: Placeholder names, in order of appearance
+    """
+    literals: tuple[str, ...]
+    fields: tuple[str, ...]
+    
+    def render(self, values: Mapping[str, str], keep_missing: bool = False) -> str:
+        """
+        Fill the placeholders with values.
+        
+        Args:
+            values: Placeholder name -> text
+            keep_missing: Leave placeholders without a value as "{name}"
+                instead of dropping them
+        """
+        parts = [self.literals[0]]
+        for name, literal in zip(self.fields, self.literals[1:]):
+            value = values.get(name)
+            if value is None:
+                value = f"{{{name}}}" if keep_missing else ""
+            parts.append(value)
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=512)
+def compile_prompt(text: str) -> CompiledPrompt:
+    """Split prompt text into literal and placeholder segments (memoized)."""
+    pieces = PLACEHOLDER_PATTERN.split(text)
+    return CompiledPrompt(literals=tuple(pieces[0::2]), fields=tuple(pieces[1::2]))
+
+
+@dataclass(frozen=True)
+class PromptTemplateRegistry:
+    """
+    Every template under prompts/, parsed and compiled.
+    
+    Keys match PromptEngine's cache keys: "thumbnail:v1.0" for prompt
+    templates, "vibe:logo:v1.0" for vibe-based templates (the Quick Create
+    files compile as "vibe:quick-create:{template_id}"). Files of any other
+    shape are listed in skipped.
+    
+    Attributes:
+        templates: Cache key -> PromptTemplate or VibeBasedTemplate
+        compile_ms: Time taken to build the registry
+        skipped: Files that are not templates
+    """
+    templates: Mapping[str, Union[PromptTemplate, VibeBasedTemplate]]
+    compile_ms: float = 0.0
+    skipped: tuple[str, ...] = ()
+    
+    @classmethod
+    def compile(cls, prompts_dir: Path) -> "PromptTemplateRegistry":
+        """Parse and compile every template in prompts_dir."""
+        started = time.perf_counter()
+        templates: dict[str, Union[PromptTemplate, VibeBasedTemplate]] = {}
+        skipped = []
+        
+        for path in sorted(prompts_dir.glob("*/*.yaml")):
+            asset_type, version = path.parent.name, path.stem
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = yaml.load(f, Loader=YAML_LOADER)
+            except (yaml.YAMLError, IOError) as e:
+                logger.warning(f"Skipping unreadable prompt template {path}: {e}")
+                skipped.append(f"{asset_type}/{path.name}")
+                continue
+            
+            if not isinstance(data, dict):
+                skipped.append(f"{asset_type}/{path.name}")
+            elif "vibes" in data:
+                template = _vibe_template_from_data(data, asset_type, version)
+                for vibe in template.vibes.values():
+                    compile_prompt(vibe.prompt)
+                templates[f"vibe:{asset_type}:{version}"] = template
+            elif all(f in data for f in PROMPT_TEMPLATE_FIELDS):
+                template = _prompt_template_from_data(data)
+                compile_prompt(template.base_prompt)
+                templates[f"{asset_type}:{version}"] = template
+            else:
+                skipped.append(f"{asset_type}/{path.name}")
+        
+        return cls(
+            templates=MappingProxyType(templates),
+            compile_ms=(time.perf_counter() - started) * 1000,
+            skipped=tuple(skipped),
+        )
+    
+    def get(self, key: str) -> Optional[Union[PromptTemplate, VibeBasedTemplate]]:
+        return self.templates.get(key)
+
+
+# Registries are immutable, so engines reading the same directory share one
+_registries: dict[Path, PromptTemplateRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_template_registry(prompts_dir: Path) -> PromptTemplateRegistry:
+    """Get or compile the shared registry for a prompts directory."""
+    prompts_dir = prompts_dir.resolve()
+    registry = _registries.get(prompts_dir)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(prompts_dir)
+            if registry is None:
+                registry = PromptTemplateRegistry.compile(prompts_dir)
+                _registries[prompts_dir] = registry
+    return registry
+
+
+def discard_template_registry(prompts_dir: Path) -> None:
+    """Drop a directory's registry; the next use recompiles it."""
+    with _registries_lock:
+        _registries.pop(prompts_dir.resolve(), None)
+
+
+def _prompt_template_from_data(data: dict) -> PromptTemplate:
+    return PromptTemplate(
+        name=data['name'],
+        version=data['version'],
+        base_prompt=data['base_prompt'],
+        quality_modifiers=data.get('quality_modifiers', []),
+        placeholders=data.get('placeholders', [])
+    )
+
+
+def _vibe_template_from_data(data: dict, asset_type: str, version: str) -> VibeBasedTemplate:
+    vibes = {}
+    for vibe_key, vibe_data in data.get('vibes', {}).items():
+        vibes[vibe_key] = VibeTemplate(
+            key=vibe_key,
+            name=vibe_data.get('name', vibe_key),
+            description=vibe_data.get('description', ''),
+            prompt=vibe_data.get('prompt', ''),
+            preview_tags=vibe_data.get('preview_tags', [])
+        )
+    
+    return VibeBasedTemplate(
+        name=data.get('name', asset_type),
+        version=data.get('version', version),
+        category=data.get('category', 'general'),
+        asset_type=data.get('asset_type', asset_type),
+        dimensions=data.get('dimensions', {'width': 512, 'height': 512}),
+        vibes=vibes,
+        placeholders=data.get('placeholders', []),
+        quality_modifiers=data.get('quality_modifiers', [])
+    )
+
+
 @dataclass
 class BrandKitContext:
     """
@@ -326,6 +503,7 @@ class PromptEngine:
         r'assistant\s*:',
         r'user\s*:',
     ]
+    INJECTION_REGEXES = tuple(re.compile(p, re.IGNORECASE) for p in INJECTION_PATTERNS)
     
     # Token budget guidelines:
     # - Brand context: ~50-80 tokens max
@@ -350,8 +528,10 @@ class PromptEngine:
             "PROMPTS_DIR", 
             "prompts/"
         )
+        # Templates loaded after the registry was compiled
         self._template_cache: dict[str, PromptTemplate] = {}
         self._cache_lock = threading.RLock()
+        self._registry: Optional[PromptTemplateRegistry] = None
     
     @property
     def prompts_dir(self) -> Path:
@@ -360,6 +540,33 @@ class PromptEngine:
         base_path = Path(__file__).parent.parent
         return base_path / self._prompts_dir
     
+    @property
+    def registry(self) -> PromptTemplateRegistry:
+        """The compiled template registry, built on first use."""
+        registry = self._registry
+        if registry is None:
+            registry = self._registry = get_template_registry(self.prompts_dir)
+        return registry
+    
+    def warmup(self) -> PromptTemplateRegistry:
+        """
+        Compile every template now, so the first requests skip YAML parsing.
+        
+        Logs a warning if compiling exceeds PROMPT_REGISTRY_STARTUP_BUDGET_MS.
+        
+        Returns:
+            The compiled registry
+        """
+        registry = self.registry
+        if registry.compile_ms > PROMPT_REGISTRY_STARTUP_BUDGET_MS:
+            logger.warning(
+                f"Compiling {len(registry.templates)} prompt templates took "
+                f"{registry.compile_ms:.0f}ms (budget {PROMPT_REGISTRY_STARTUP_BUDGET_MS:.0f}ms)"
+            )
+        else:
+            logger.info(f"Compiled {len(registry.templates)} prompt templates in {registry.compile_ms:.1f}ms")
+        return registry
+    
     def _get_cache_key(self, asset_type: AssetType, version: str) -> str:
         """Generate cache key for template lookup."""
         return f"{asset_type.value}:{version}"
@@ -381,7 +588,7 @@ class PromptEngine:
             TemplateNotFoundError: If path components are invalid
         """
         # Validate version format (only allow alphanumeric, dots, underscores)
-        if not re.match(r'^[a-zA-Z0-9._-]+$', version):
+        if not VERSION_PATTERN.match(version):
             raise TemplateNotFoundError(
                 asset_type=asset_type.value,
                 version=version,
@@ -411,7 +618,8 @@ class PromptEngine:
         """
         Load a prompt template from YAML file.
         
-        Templates are cached for performance. Thread-safe.
+        Served from the compiled registry; templates added after it was
+        compiled are loaded from disk and cached. Thread-safe.
         
         Args:
             asset_type: Type of asset (thumbnail, overlay, etc.)
@@ -425,7 +633,11 @@ class PromptEngine:
         """
         cache_key = self._get_cache_key(asset_type, version)
         
-        # Check cache first (with lock for thread safety)
+        # Compiled registry first (immutable, no lock needed)
+        template = self.registry.get(cache_key)
+        if isinstance(template, PromptTemplate):
+            return template
+        
         with self._cache_lock:
             if cache_key in self._template_cache:
                 return self._template_cache[cache_key]
@@ -444,7 +656,7 @@ class PromptEngine:
         # Load and parse YAML
         try:
             with open(template_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             raise TemplateNotFoundError(
                 asset_type=asset_type.value,
@@ -459,23 +671,16 @@ class PromptEngine:
             )
         
         # Validate required fields
-        required_fields = ['name', 'version', 'base_prompt', 'quality_modifiers', 'placeholders']
-        for field in required_fields:
-            if field not in data:
+        for required in PROMPT_TEMPLATE_FIELDS:
+            if required not in data:
                 raise TemplateNotFoundError(
                     asset_type=asset_type.value,
                     version=version,
-                    reason=f"Missing required field: {field}"
+                    reason=f"Missing required field: {required}"
                 )
         
         # Create template object
-        template = PromptTemplate(
-            name=data['name'],
-            version=data['version'],
-            base_prompt=data['base_prompt'],
-            quality_modifiers=data.get('quality_modifiers', []),
-            placeholders=data.get('placeholders', [])
-        )
+        template = _prompt_template_from_data(data)
         
         # Cache the template (with lock)
         with self._cache_lock:
@@ -498,8 +703,6 @@ class PromptEngine:
         Returns:
             Prompt string with placeholders replaced
         """
-        prompt = template.base_prompt
-        
         # Map placeholders to brand kit values
         replacements = {
             'tone': brand_kit.tone,
@@ -510,11 +713,9 @@ class PromptEngine:
             'style_reference': brand_kit.style_reference or '',
         }
         
-        # Replace each placeholder
-        for placeholder, value in replacements.items():
-            prompt = prompt.replace(f'{{{placeholder}}}', str(value))
-        
-        return prompt
+        # Other placeholders (e.g. {custom_prompt}) are left for the caller
+        values = {placeholder: str(value) for placeholder, value in replacements.items()}
+        return compile_prompt(template.base_prompt).render(values, keep_missing=True)
     
     def sanitize_input(self, user_input: str) -> str:
         """
@@ -542,8 +743,8 @@ class PromptEngine:
         sanitized = self.SANITIZE_PATTERN.sub('', sanitized)
         
         # Remove potential injection patterns (case-insensitive)
-        for pattern in self.INJECTION_PATTERNS:
-            sanitized = re.sub(pattern, '', sanitized, flags=re.IGNORECASE)
+        for pattern in self.INJECTION_REGEXES:
+            sanitized = pattern.sub('', sanitized)
         
         # Normalize whitespace
         sanitized = ' '.join(sanitized.split())
@@ -581,25 +782,33 @@ class PromptEngine:
         # Load template
         template = self.load_template(asset_type, version)
         
-        # Inject brand kit values
-        prompt = self.inject_brand_kit(template, brand_kit)
-        
         # Handle custom prompt
         sanitized_custom = ""
         if custom_prompt:
             sanitized_custom = self.sanitize_input(custom_prompt)
         
-        # Replace custom_prompt placeholder
-        prompt = prompt.replace('{custom_prompt}', sanitized_custom)
+        values = {
+            'tone': str(brand_kit.tone),
+            'primary_colors': ', '.join(brand_kit.primary_colors),
+            'accent_colors': ', '.join(brand_kit.accent_colors),
+            'headline_font': str(brand_kit.headline_font),
+            'body_font': str(brand_kit.body_font),
+            'style_reference': brand_kit.style_reference or '',
+            'custom_prompt': sanitized_custom,
+        }
+        # Brand values must not carry placeholders of their own
+        for name, value in values.items():
+            if '{' in value:
+                values[name] = PLACEHOLDER_PATTERN.sub('', value)
+        
+        # Fill placeholders; any others in the template are dropped
+        prompt = compile_prompt(template.base_prompt).render(values)
         
         # Append quality modifiers
         if template.quality_modifiers:
-            modifiers_str = ', '.join(template.quality_modifiers)
+            modifiers_str = PLACEHOLDER_PATTERN.sub('', ', '.join(template.quality_modifiers))
             prompt = f"{prompt}\n\nQuality: {modifiers_str}."
         
-        # Clean up any remaining empty placeholders
-        prompt = re.sub(r'\{[^}]+\}', '', prompt)
-        
         # Normalize whitespace in final output
         prompt = '\n'.join(line.strip() for line in prompt.split('\n') if line.strip())
         
@@ -774,9 +983,11 @@ class PromptEngine:
         return "\n".join(prompt_parts)
     
     def clear_cache(self) -> None:
-        """Clear the template cache. Thread-safe."""
+        """Clear the template cache and registry (recompiled on next use). Thread-safe."""
         with self._cache_lock:
             self._template_cache.clear()
+            self._registry = None
+        discard_template_registry(self.prompts_dir)
     
     def load_vibe_template(
         self,
@@ -801,6 +1012,10 @@ class PromptEngine:
         """
         cache_key = f"vibe:{asset_type}:{version}"
         
+        template = self.registry.get(cache_key)
+        if isinstance(template, VibeBasedTemplate):
+            return template
+        
         # Check cache
         with self._cache_lock:
             if cache_key in self._template_cache:
@@ -819,7 +1034,7 @@ class PromptEngine:
         # Load YAML
         try:
             with open(template_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YAML_LOADER)
         except (yaml.YAMLError, IOError) as e:
             raise TemplateNotFoundError(
                 asset_type=asset_type,
@@ -827,27 +1042,7 @@ class PromptEngine:
                 reason=str(e)
             )
         
-        # Parse vibes
-        vibes = {}
-        for vibe_key, vibe_data in data.get('vibes', {}).items():
-            vibes[vibe_key] = VibeTemplate(
-                key=vibe_key,
-                name=vibe_data.get('name', vibe_key),
-                description=vibe_data.get('description', ''),
-                prompt=vibe_data.get('prompt', ''),
-                preview_tags=vibe_data.get('preview_tags', [])
-            )
-        
-        template = VibeBasedTemplate(
-            name=data.get('name', asset_type),
-            version=data.get('version', version),
-            category=data.get('category', 'general'),
-            asset_type=data.get('asset_type', asset_type),
-            dimensions=data.get('dimensions', {'width': 512, 'height': 512}),
-            vibes=vibes,
-            placeholders=data.get('placeholders', []),
-            quality_modifiers=data.get('quality_modifiers', [])
-        )
+        template = _vibe_template_from_data(data, asset_type, version)
         
         # Cache
         with self._cache_lock:
@@ -890,11 +1085,11 @@ class PromptEngine:
         sanitized_name = self.sanitize_input(name)
         sanitized_icon = self.sanitize_input(icon)
         
-        # Build prompt by replacing placeholders
-        prompt = vibe_template.prompt
-        prompt = prompt.replace('{name}', sanitized_name)
-        prompt = prompt.replace('{icon}', sanitized_icon)
-        prompt = prompt.replace('{background_color}', background_color)
+        # Build prompt by filling placeholders
+        prompt = compile_prompt(vibe_template.prompt).render(
+            {'name': sanitized_name, 'icon': sanitized_icon, 'background_color': background_color},
+            keep_missing=True,
+        )
         
         # Add quality modifiers
         if template.quality_modifiers:
@@ -938,9 +1133,10 @@ class PromptEngine:
         
         Returns:
             List of cache keys in format "asset_type:version"
+            (vibe templates as "vibe:asset_type:version")
         """
         with self._cache_lock:
-            return list(self._template_cache.keys())
+            return list(self.registry.templates.keys()) + list(self._template_cache.keys())
 
 
 # Singleton instance for convenience
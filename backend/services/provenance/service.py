@@ -7,11 +7,14 @@ Uses Redis for hot data and PostgreSQL for long-term storage.
 
 import json
 import logging
-import os
+import time
+import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 import redis
 
+from backend.database.redis_pool import get_sync_redis
+
 from .models import (
     ProvenanceRecord,
     ProvenanceQuery,
@@ -28,28 +31,91 @@ RECORD_KEY = f"{PROVENANCE_PREFIX}record:"
 INDEX_BY_WORKER = f"{PROVENANCE_PREFIX}idx:worker:"
 INDEX_BY_TYPE = f"{PROVENANCE_PREFIX}idx:type:"
 INDEX_BY_CATEGORY = f"{PROVENANCE_PREFIX}idx:category:"
+INDEX_BY_CONFIDENCE_LEVEL = f"{PROVENANCE_PREFIX}idx:confidence:"
+INDEX_BY_TAG = f"{PROVENANCE_PREFIX}idx:tag:"
+INDEX_VALIDATED = f"{PROVENANCE_PREFIX}idx:validated"
 INDEX_BY_TIME = f"{PROVENANCE_PREFIX}idx:time"
+INDEX_BY_SCORE = f"{PROVENANCE_PREFIX}idx:score:"
+SEARCH_KEY = f"{PROVENANCE_PREFIX}search"
+TEMP_KEY = f"{PROVENANCE_PREFIX}tmp:"
+ROLLUP_KEY = f"{PROVENANCE_PREFIX}rollup:"
+FACTOR_SAMPLES_KEY = f"{PROVENANCE_PREFIX}factor_samples:"
 STATS_KEY = f"{PROVENANCE_PREFIX}stats"
 FACTOR_STATS_KEY = f"{PROVENANCE_PREFIX}factor_stats"
 
 # TTLs
 RECORD_TTL = 7 * 24 * 60 * 60  # 7 days
 STATS_TTL = 60 * 60  # 1 hour
+TEMP_TTL = 60  # Query scratch sets, deleted at the end of each query
+ROLLUP_TTL = RECORD_TTL + 24 * 60 * 60  # Outlives the records it counts
+
+# Numeric fields with their own sorted set (member -> value), for sorting
+# and range filters; computed_at sorts on INDEX_BY_TIME
+SCORE_FIELDS = ("confidence_score", "quality_score", "computation_duration_ms", "total_records_analyzed")
+
+# Retention trimming of the global indexes (time, scores, search)
+TRIM_INTERVAL_SECONDS = 60
+TRIM_BATCH = 1000
+
+# Text search scans at most this many candidates (in sort order)
+SEARCH_SCAN_LIMIT = 5000
+
+# Records loaded per page when aggregating filters the rollups do not cover
+AGGREGATE_PAGE_SIZE = 1000
+
+# Write-time rollups: one hash per hour and per day, globally and per
+# worker/type/category value. Each holds counts, sums and breakdowns.
+ROLLUP_SUM_FIELDS = (
+    "confidence_score", "quality_score", "computation_duration_ms",
+    "data_freshness_avg_seconds", "total_records_analyzed",
+)
+ROLLUP_GRANULARITIES = {"hour": "%Y%m%d%H", "day": "%Y%m%d"}
+FACTOR_SAMPLES_MAX = 20
 
 
 class ProvenanceService:
-    """Service for managing provenance records."""
+    """
+    Service for managing provenance records.
+    
+    Every filter dimension has a time-scored sorted set per value, and every
+    sortable number has a value-scored sorted set. A query intersects the
+    dimension sets (unioning multiple values of one dimension), narrows by
+    each range filter on its scored set, then intersects with the sort
+    index. Everything runs server-side in one pipeline; only the requested
+    page of records is loaded, with one MGET.
+    
+    Aggregates come from hourly and daily rollup hashes that store()
+    increments in the same pipeline as the record.
+    """
     
     def __init__(self, redis_url: Optional[str] = None):
-        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._redis_url = redis_url
         self._redis: Optional[redis.Redis] = None
+        self._last_trim = 0.0
     
     def _get_redis(self) -> redis.Redis:
-        """Get Redis client."""
+        """Get Redis client (shared sync pool unless a dedicated URL was given)."""
         if self._redis is None:
-            self._redis = redis.from_url(self._redis_url, decode_responses=True)
+            if self._redis_url:
+                self._redis = redis.from_url(self._redis_url, decode_responses=True)
+            else:
+                self._redis = get_sync_redis("default")
         return self._redis
     
+    def _dimension_keys(self, record: ProvenanceRecord) -> List[str]:
+        """Time-scored index keys a record belongs to."""
+        keys = [
+            f"{INDEX_BY_WORKER}{record.worker_name}",
+            f"{INDEX_BY_TYPE}{record.insight_type.value}",
+            f"{INDEX_BY_CONFIDENCE_LEVEL}{record.confidence_level.value}",
+        ]
+        if record.category_key:
+            keys.append(f"{INDEX_BY_CATEGORY}{record.category_key}")
+        keys.extend(f"{INDEX_BY_TAG}{tag}" for tag in dict.fromkeys(record.tags))
+        if record.validation_passed:
+            keys.append(INDEX_VALIDATED)
+        return keys
+    
     def store(self, record: ProvenanceRecord) -> bool:
         """Store a provenance record."""
         try:
@@ -60,24 +126,25 @@ class ProvenanceService:
             record_key = f"{RECORD_KEY}{record.provenance_id}"
             pipe.setex(record_key, RECORD_TTL, json.dumps(record.to_dict()))
             
-            # Index by worker
-            worker_key = f"{INDEX_BY_WORKER}{record.worker_name}"
-            pipe.zadd(worker_key, {record.provenance_id: record.computed_at.timestamp()})
-            pipe.expire(worker_key, RECORD_TTL)
+            # Index by worker, type, category, confidence level, tags and
+            # validation, dropping members older than the record TTL
+            timestamp = record.computed_at.timestamp()
+            cutoff = time.time() - RECORD_TTL
+            for key in self._dimension_keys(record):
+                pipe.zadd(key, {record.provenance_id: timestamp})
+                pipe.zremrangebyscore(key, "-inf", cutoff)
+                pipe.expire(key, RECORD_TTL)
             
-            # Index by type
-            type_key = f"{INDEX_BY_TYPE}{record.insight_type.value}"
-            pipe.zadd(type_key, {record.provenance_id: record.computed_at.timestamp()})
-            pipe.expire(type_key, RECORD_TTL)
+            # Global time index (trimmed by _trim_expired)
+            pipe.zadd(INDEX_BY_TIME, {record.provenance_id: timestamp})
             
-            # Index by category
-            if record.category_key:
-                cat_key = f"{INDEX_BY_CATEGORY}{record.category_key}"
-                pipe.zadd(cat_key, {record.provenance_id: record.computed_at.timestamp()})
-                pipe.expire(cat_key, RECORD_TTL)
+            # Sort indexes and search text
+            for field_name in SCORE_FIELDS:
+                pipe.zadd(f"{INDEX_BY_SCORE}{field_name}", {record.provenance_id: float(getattr(record, field_name))})
+            pipe.hset(SEARCH_KEY, record.provenance_id, f"{record.insight_summary}\n{record.category_key}".lower())
             
-            # Global time index
-            pipe.zadd(INDEX_BY_TIME, {record.provenance_id: record.computed_at.timestamp()})
+            # Hourly and daily rollups for the aggregate endpoints
+            self._queue_rollups(pipe, record)
             
             # Update factor statistics
             for factor in record.decision_factors:
@@ -87,6 +154,7 @@ class ProvenanceService:
                 pipe.expire(factor_key, RECORD_TTL)
             
             pipe.execute()
+            self._trim_expired(client)
             
             logger.debug(f"Stored provenance record: {record.provenance_id}")
             return True
@@ -94,7 +162,142 @@ class ProvenanceService:
         except Exception as e:
             logger.error(f"Failed to store provenance record: {e}")
             return False
-
+    
+    def _trim_expired(self, client: redis.Redis, force: bool = False) -> int:
+        """
+        Drop records past retention from the global indexes.
+        
+        The time index tells which IDs expired; they are removed from it, the
+        score indexes and the search hash. Runs at most once per
+        TRIM_INTERVAL_SECONDS per process unless forced.
+        
+        Returns:
+            Number of IDs trimmed
+        """
+        now = time.time()
+        if not force and now - self._last_trim < TRIM_INTERVAL_SECONDS:
+            return 0
+        self._last_trim = now
+        
+        trimmed = 0
+        cutoff = now - RECORD_TTL
+        while True:
+            expired = client.zrangebyscore(INDEX_BY_TIME, "-inf", cutoff, start=0, num=TRIM_BATCH)
+            if not expired:
+                break
+            pipe = client.pipeline()
+            pipe.zrem(INDEX_BY_TIME, *expired)
+            for field_name in SCORE_FIELDS:
+                pipe.zrem(f"{INDEX_BY_SCORE}{field_name}", *expired)
+            pipe.hdel(SEARCH_KEY, *expired)
+            pipe.execute()
+            trimmed += len(expired)
+            if len(expired) < TRIM_BATCH:
+                break
+        
+        if trimmed:
+            logger.info(f"Trimmed {trimmed} expired provenance records from indexes")
+        return trimmed
+    
+    # ========================================================================
+    # Rollups
+    # ========================================================================
+    
+    def _queue_rollups(self, pipe, record: ProvenanceRecord) -> None:
+        """Queue the rollup increments for a record on the store() pipeline."""
+        computed_at = _as_utc(record.computed_at)
+        increments: Dict[str, float] = {
+            "count": 1,
+            "validated": 1 if record.validation_passed else 0,
+            f"type:{record.insight_type.value}": 1,
+            f"worker:{record.worker_name}": 1,
+            f"confidence:{record.confidence_level.value}": 1,
+            f"hour:{computed_at.strftime('%Y-%m-%d %H:00')}": 1,
+        }
+        if record.category_key:
+            increments[f"category:{record.category_key}"] = 1
+        for field_name in ROLLUP_SUM_FIELDS:
+            increments[f"sum:{field_name}"] = float(getattr(record, field_name))
+        for factor in record.decision_factors:
+            count_field = f"factor:{factor.factor_name}:count"
+            contribution_field = f"factor:{factor.factor_name}:contribution"
+            increments[count_field] = increments.get(count_field, 0) + 1
+            increments[contribution_field] = increments.get(contribution_field, 0.0) + float(factor.contribution)
+        
+        scopes = ["", f":worker:{record.worker_name}", f":type:{record.insight_type.value}"]
+        if record.category_key:
+            scopes.append(f":category:{record.category_key}")
+        
+        for granularity, fmt in ROLLUP_GRANULARITIES.items():
+            bucket = computed_at.strftime(fmt)
+            for scope in scopes:
+                key = f"{ROLLUP_KEY}{granularity}:{bucket}{scope}"
+                for field_name, amount in increments.items():
+                    if isinstance(amount, int):
+                        pipe.hincrby(key, field_name, amount)
+                    else:
+                        pipe.hincrbyfloat(key, field_name, amount)
+                pipe.expire(key, ROLLUP_TTL)
+            
+            # Per-factor rollups for factor analysis
+            for factor in record.decision_factors:
+                key = f"{ROLLUP_KEY}{granularity}:{bucket}:factor:{factor.factor_name}"
+                pipe.hincrby(key, "count", 1)
+                pipe.hincrbyfloat(key, "contribution", factor.contribution)
+                pipe.hincrbyfloat(key, "weight", factor.weight)
+                pipe.hincrby(key, f"type:{record.insight_type.value}", 1)
+                if record.category_key:
+                    pipe.hincrby(key, f"category:{record.category_key}", 1)
+                pipe.expire(key, ROLLUP_TTL)
+        
+        for factor in record.decision_factors:
+            samples_key = f"{FACTOR_SAMPLES_KEY}{factor.factor_name}"
+            pipe.lpush(samples_key, json.dumps({
+                "provenance_id": record.provenance_id,
+                "insight_type": record.insight_type.value,
+                "category": record.category_key,
+                "raw_value": factor.to_dict()["raw_value"],
+                "normalized": factor.normalized_value,
+                "weight": factor.weight,
+                "contribution": factor.contribution,
+                "computed_at": record.computed_at.isoformat(),
+            }))
+            pipe.ltrim(samples_key, 0, FACTOR_SAMPLES_MAX - 1)
+            pipe.expire(samples_key, RECORD_TTL)
+    
+    def _read_rollups(
+        self,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        scopes: Tuple[str, ...] = ("",),
+    ) -> Dict[str, float]:
+        """
+        Sum the rollup hashes covering a time range.
+        
+        Whole days read the day hash, partial days their hour hashes, so a
+        week costs a few dozen HGETALLs in one round trip. Resolution is one
+        hour: the hour containing start_time is included in full.
+        
+        Args:
+            start_time: Range start
+            end_time: Range end (defaults to now)
+            scopes: Rollup scopes to add up, e.g. ":worker:clip_radar"
+                ("" is the global rollup)
+        
+        Returns:
+            Field totals across the buckets and scopes
+        """
+        client = self._get_redis()
+        pipe = client.pipeline(transaction=False)
+        for granularity, bucket in _rollup_buckets(start_time, end_time):
+            for scope in scopes:
+                pipe.hgetall(f"{ROLLUP_KEY}{granularity}:{bucket}{scope}")
+        
+        totals: Dict[str, float] = {}
+        for values in pipe.execute():
+            for field_name, amount in values.items():
+                totals[field_name] = totals.get(field_name, 0) + float(amount)
+        return totals
     
     def get(self, provenance_id: str) -> Optional[ProvenanceRecord]:
         """Get a single provenance record by ID."""
@@ -116,199 +319,291 @@ class ProvenanceService:
         """
         try:
             client = self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            temp_keys: List[str] = []
+            result_key = self._plan_result_set(pipe, query, temp_keys)
             
-            # Determine which index to use as primary
-            candidate_ids = self._get_candidate_ids(client, query)
-            
-            # Load and filter records
-            records = []
-            for pid in candidate_ids:
-                data = client.get(f"{RECORD_KEY}{pid}")
-                if data:
-                    record = ProvenanceRecord.from_dict(json.loads(data))
-                    if self._matches_query(record, query):
-                        records.append(record)
-            
-            # Sort
-            records = self._sort_records(records, query.sort_by, query.sort_desc)
+            start = (query.page - 1) * query.page_size
+            if query.search_query:
+                # Text search filters candidates in sort order from the search hash
+                stop = SEARCH_SCAN_LIMIT - 1
+            else:
+                stop = start + query.page_size - 1
             
-            # Get total before pagination
-            total = len(records)
+            pipe.zcard(result_key)
+            if query.sort_desc:
+                pipe.zrevrange(result_key, 0 if query.search_query else start, stop)
+            else:
+                pipe.zrange(result_key, 0 if query.search_query else start, stop)
+            if temp_keys:
+                pipe.delete(*temp_keys)
+                total, ids, _ = pipe.execute()[-3:]
+            else:
+                total, ids = pipe.execute()[-2:]
             
-            # Paginate
-            start = (query.page - 1) * query.page_size
-            end = start + query.page_size
-            records = records[start:end]
+            if query.search_query:
+                ids = self._search(client, ids, query.search_query)
+                total = len(ids)
+                ids = ids[start:start + query.page_size]
             
-            return records, total
+            return self._load_records(client, ids), total
             
         except Exception as e:
             logger.error(f"Failed to query provenance records: {e}")
             return [], 0
     
-    def _get_candidate_ids(self, client: redis.Redis, query: ProvenanceQuery) -> List[str]:
-        """Get candidate IDs from indexes."""
-        # Time range
-        min_score = query.start_time.timestamp() if query.start_time else "-inf"
-        max_score = query.end_time.timestamp() if query.end_time else "+inf"
-        
-        # Use most selective index
-        if query.worker_names and len(query.worker_names) == 1:
-            key = f"{INDEX_BY_WORKER}{query.worker_names[0]}"
-            return client.zrevrangebyscore(key, max_score, min_score, start=0, num=1000)
-        
-        if query.insight_types and len(query.insight_types) == 1:
-            key = f"{INDEX_BY_TYPE}{query.insight_types[0].value}"
-            return client.zrevrangebyscore(key, max_score, min_score, start=0, num=1000)
-        
-        if query.category_keys and len(query.category_keys) == 1:
-            key = f"{INDEX_BY_CATEGORY}{query.category_keys[0]}"
-            return client.zrevrangebyscore(key, max_score, min_score, start=0, num=1000)
-        
-        # Fall back to global time index
-        return client.zrevrangebyscore(INDEX_BY_TIME, max_score, min_score, start=0, num=1000)
-
-    
-    def _matches_query(self, record: ProvenanceRecord, query: ProvenanceQuery) -> bool:
-        """Check if a record matches query filters."""
-        # Worker filter
-        if query.worker_names and record.worker_name not in query.worker_names:
-            return False
+    def _plan_result_set(self, pipe, query: ProvenanceQuery, temp_keys: List[str]) -> str:
+        """
+        Queue the set operations for a query and return the result key.
         
-        # Type filter
-        if query.insight_types and record.insight_type not in query.insight_types:
-            return False
+        The result is a sorted set of matching IDs scored by the sort field.
+        Scratch keys are appended to temp_keys for the caller to delete.
+        """
+        def temp_key() -> str:
+            key = f"{TEMP_KEY}{uuid.uuid4().hex}"
+            temp_keys.append(key)
+            return key
         
-        # Category filter
-        if query.category_keys and record.category_key not in query.category_keys:
-            return False
+        # Membership filters: any value within a dimension, all dimensions
+        dimensions = [
+            (INDEX_BY_WORKER, query.worker_names),
+            (INDEX_BY_TYPE, [t.value for t in query.insight_types] if query.insight_types else None),
+            (INDEX_BY_CATEGORY, query.category_keys),
+            (INDEX_BY_CONFIDENCE_LEVEL, [c.value for c in query.confidence_levels] if query.confidence_levels else None),
+            (INDEX_BY_TAG, query.tags),
+        ]
+        members: List[str] = []
+        for prefix, values in dimensions:
+            if not values:
+                continue
+            keys = [f"{prefix}{value}" for value in dict.fromkeys(values)]
+            if len(keys) == 1:
+                members.append(keys[0])
+            else:
+                key = temp_key()
+                pipe.zunionstore(key, keys, aggregate="MAX")
+                pipe.expire(key, TEMP_TTL)
+                members.append(key)
+        if query.validation_passed_only:
+            members.append(INDEX_VALIDATED)
         
-        # Confidence level filter
-        if query.confidence_levels and record.confidence_level not in query.confidence_levels:
-            return False
+        # Range filters, each applied on its own scored index
+        ranges = []
+        if query.start_time or query.end_time:
+            ranges.append((
+                INDEX_BY_TIME,
+                query.start_time.timestamp() if query.start_time else None,
+                query.end_time.timestamp() if query.end_time else None,
+            ))
+        if query.min_confidence:
+            ranges.append((f"{INDEX_BY_SCORE}confidence_score", query.min_confidence, None))
+        if query.min_quality:
+            ranges.append((f"{INDEX_BY_SCORE}quality_score", query.min_quality, None))
         
-        # Tags filter
-        if query.tags and not any(t in record.tags for t in query.tags):
-            return False
+        sort_key = (
+            f"{INDEX_BY_SCORE}{query.sort_by}" if query.sort_by in SCORE_FIELDS else INDEX_BY_TIME
+        )
+        # The sort index's range goes last, so its scores carry into the result
+        ranges.sort(key=lambda r: r[0] == sort_key)
         
-        # Time range
-        if query.start_time and record.computed_at < query.start_time:
-            return False
-        if query.end_time and record.computed_at > query.end_time:
-            return False
+        for index_key, low, high in ranges:
+            key = temp_key()
+            pipe.zinterstore(key, {**{member: 0 for member in members}, index_key: 1})
+            pipe.expire(key, TEMP_TTL)
+            if low is not None:
+                pipe.zremrangebyscore(key, "-inf", f"({low}")
+            if high is not None:
+                pipe.zremrangebyscore(key, f"({high}", "+inf")
+            members = [key]
         
-        # Quality filters
-        if query.min_confidence and record.confidence_score < query.min_confidence:
-            return False
-        if query.min_quality and record.quality_score < query.min_quality:
-            return False
-        if query.validation_passed_only and not record.validation_passed:
-            return False
-        
-        # Search
-        if query.search_query:
-            q = query.search_query.lower()
-            if q not in record.insight_summary.lower() and q not in record.category_key.lower():
-                return False
-        
-        return True
+        if not members:
+            return sort_key
+        if ranges and ranges[-1][0] == sort_key:
+            return members[0]
+        result_key = temp_key()
+        pipe.zinterstore(result_key, {**{member: 0 for member in members}, sort_key: 1})
+        pipe.expire(result_key, TEMP_TTL)
+        return result_key
     
-    def _sort_records(self, records: List[ProvenanceRecord], sort_by: str, desc: bool) -> List[ProvenanceRecord]:
-        """Sort records by field."""
-        key_map = {
-            "computed_at": lambda r: r.computed_at,
-            "confidence_score": lambda r: r.confidence_score,
-            "quality_score": lambda r: r.quality_score,
-            "computation_duration_ms": lambda r: r.computation_duration_ms,
-            "total_records_analyzed": lambda r: r.total_records_analyzed,
-        }
-        key_fn = key_map.get(sort_by, key_map["computed_at"])
-        return sorted(records, key=key_fn, reverse=desc)
-
+    def _search(self, client: redis.Redis, ids: List[str], search_query: str) -> List[str]:
+        """IDs (in order) whose summary or category contains the search text."""
+        if not ids:
+            return []
+        needle = search_query.lower()
+        texts = client.hmget(SEARCH_KEY, ids)
+        return [pid for pid, text in zip(ids, texts) if text and needle in text]
+    
+    def _load_records(self, client: redis.Redis, ids: List[str]) -> List[ProvenanceRecord]:
+        """Load records with one MGET, skipping any that have expired."""
+        if not ids:
+            return []
+        values = client.mget([f"{RECORD_KEY}{pid}" for pid in ids])
+        return [ProvenanceRecord.from_dict(json.loads(data)) for data in values if data]
     
     def aggregate(self, query: Optional[ProvenanceQuery] = None) -> ProvenanceAggregation:
-        """Get aggregated statistics for provenance records."""
+        """
+        Get aggregated statistics for provenance records.
+        
+        Answered from the hourly/daily rollups when the query filters on at
+        most one of worker, type or category (any number of values). Other
+        filters fall back to aggregating the matching records.
+        """
         try:
-            client = self._get_redis()
+            query = query or ProvenanceQuery()
+            start_time = query.start_time or datetime.now(timezone.utc) - timedelta(hours=24)
             
-            # Get all matching records (or recent if no query)
-            if query:
-                records, _ = self.query(ProvenanceQuery(
+            dimensions = [
+                (name, values) for name, values in (
+                    ("worker", query.worker_names),
+                    ("type", [t.value for t in query.insight_types] if query.insight_types else None),
+                    ("category", query.category_keys),
+                ) if values
+            ]
+            unindexed = (
+                query.confidence_levels or query.tags or query.min_confidence or query.min_quality
+                or query.validation_passed_only or query.search_query
+            )
+            if len(dimensions) > 1 or unindexed:
+                return self._aggregate_records(self._query_all(ProvenanceQuery(
                     worker_names=query.worker_names,
                     insight_types=query.insight_types,
                     category_keys=query.category_keys,
-                    start_time=query.start_time,
+                    confidence_levels=query.confidence_levels,
+                    tags=query.tags,
+                    start_time=start_time,
                     end_time=query.end_time,
-                    page_size=1000,
-                ))
-            else:
-                # Last 24 hours by default
-                records, _ = self.query(ProvenanceQuery(
-                    start_time=datetime.now(timezone.utc) - timedelta(hours=24),
-                    page_size=1000,
-                ))
-            
-            if not records:
-                return ProvenanceAggregation()
-            
-            agg = ProvenanceAggregation()
-            agg.total_records = len(records)
-            
-            # Counts by dimension
-            for r in records:
-                # By type
-                t = r.insight_type.value
-                agg.records_by_type[t] = agg.records_by_type.get(t, 0) + 1
-                
-                # By worker
-                agg.records_by_worker[r.worker_name] = agg.records_by_worker.get(r.worker_name, 0) + 1
-                
-                # By category
-                if r.category_key:
-                    agg.records_by_category[r.category_key] = agg.records_by_category.get(r.category_key, 0) + 1
-                
-                # By confidence
-                c = r.confidence_level.value
-                agg.records_by_confidence[c] = agg.records_by_confidence.get(c, 0) + 1
+                    min_confidence=query.min_confidence,
+                    min_quality=query.min_quality,
+                    validation_passed_only=query.validation_passed_only,
+                    search_query=query.search_query,
+                    page_size=AGGREGATE_PAGE_SIZE,
+                )))
             
-            # Averages
-            agg.avg_confidence_score = sum(r.confidence_score for r in records) / len(records)
-            agg.avg_quality_score = sum(r.quality_score for r in records) / len(records)
-            agg.avg_computation_time_ms = sum(r.computation_duration_ms for r in records) / len(records)
-            agg.validation_pass_rate = sum(1 for r in records if r.validation_passed) / len(records)
-            agg.avg_data_freshness_seconds = sum(r.data_freshness_avg_seconds for r in records) / len(records)
-            agg.avg_records_analyzed = sum(r.total_records_analyzed for r in records) / len(records)
-            
-            # Top decision factors
-            factor_counts: Dict[str, Dict[str, float]] = {}
-            for r in records:
-                for f in r.decision_factors:
-                    if f.factor_name not in factor_counts:
-                        factor_counts[f.factor_name] = {"count": 0, "total_contribution": 0}
-                    factor_counts[f.factor_name]["count"] += 1
-                    factor_counts[f.factor_name]["total_contribution"] += f.contribution
-            
-            agg.top_decision_factors = sorted(
-                [{"name": k, "count": int(v["count"]), "avg_contribution": v["total_contribution"] / v["count"]}
-                 for k, v in factor_counts.items()],
-                key=lambda x: x["count"],
-                reverse=True
-            )[:10]
+            if dimensions:
+                name, values = dimensions[0]
+                scopes = tuple(f":{name}:{value}" for value in dict.fromkeys(values))
+            else:
+                scopes = ("",)
+            return self._aggregation_from_rollups(self._read_rollups(start_time, query.end_time, scopes))
             
-            # Hourly counts (last 24h)
-            hourly: Dict[str, int] = {}
-            for r in records:
-                hour_key = r.computed_at.strftime("%Y-%m-%d %H:00")
-                hourly[hour_key] = hourly.get(hour_key, 0) + 1
+        except Exception as e:
+            logger.error(f"Failed to aggregate provenance: {e}")
+            return ProvenanceAggregation()
+    
+    def _query_all(self, query: ProvenanceQuery) -> List[ProvenanceRecord]:
+        """Load every record matching a query, one page at a time."""
+        records: List[ProvenanceRecord] = []
+        page = 1
+        while True:
+            query.page = page
+            batch, total = self.query(query)
+            records.extend(batch)
+            # Pages can come back short when records expired since indexing
+            if page * query.page_size >= total:
+                return records
+            page += 1
+    
+    def _aggregation_from_rollups(self, totals: Dict[str, float]) -> ProvenanceAggregation:
+        """Build an aggregation from summed rollup fields."""
+        count = int(totals.get("count", 0))
+        if not count:
+            return ProvenanceAggregation()
+        
+        def breakdown(prefix: str) -> Dict[str, int]:
+            return {
+                field_name[len(prefix):]: int(amount)
+                for field_name, amount in totals.items()
+                if field_name.startswith(prefix) and amount
+            }
+        
+        agg = ProvenanceAggregation()
+        agg.total_records = count
+        agg.records_by_type = breakdown("type:")
+        agg.records_by_worker = breakdown("worker:")
+        agg.records_by_category = breakdown("category:")
+        agg.records_by_confidence = breakdown("confidence:")
+        
+        agg.avg_confidence_score = totals.get("sum:confidence_score", 0) / count
+        agg.avg_quality_score = totals.get("sum:quality_score", 0) / count
+        agg.avg_computation_time_ms = totals.get("sum:computation_duration_ms", 0) / count
+        agg.validation_pass_rate = totals.get("validated", 0) / count
+        agg.avg_data_freshness_seconds = totals.get("sum:data_freshness_avg_seconds", 0) / count
+        agg.avg_records_analyzed = totals.get("sum:total_records_analyzed", 0) / count
+        
+        agg.top_decision_factors = [
+            {"name": f["name"], "count": f["count"], "avg_contribution": f["avg_contribution"]}
+            for f in _factor_totals(totals)[:10]
+        ]
+        agg.hourly_counts = [{"hour": k, "count": v} for k, v in sorted(breakdown("hour:").items())]
+        return agg
+    
+    def _aggregate_records(self, records: List[ProvenanceRecord]) -> ProvenanceAggregation:
+        """Aggregate loaded records (for filters the rollups do not cover)."""
+        if not records:
+            return ProvenanceAggregation()
+        
+        agg = ProvenanceAggregation()
+        agg.total_records = len(records)
+        
+        # Counts by dimension
+        for r in records:
+            # By type
+            t = r.insight_type.value
+            agg.records_by_type[t] = agg.records_by_type.get(t, 0) + 1
             
-            agg.hourly_counts = [{"hour": k, "count": v} for k, v in sorted(hourly.items())]
+            # By worker
+            agg.records_by_worker[r.worker_name] = agg.records_by_worker.get(r.worker_name, 0) + 1
             
-            return agg
+            # By category
+            if r.category_key:
+                agg.records_by_category[r.category_key] = agg.records_by_category.get(r.category_key, 0) + 1
             
+            # By confidence
+            c = r.confidence_level.value
+            agg.records_by_confidence[c] = agg.records_by_confidence.get(c, 0) + 1
+        
+        # Averages
+        agg.avg_confidence_score = sum(r.confidence_score for r in records) / len(records)
+        agg.avg_quality_score = sum(r.quality_score for r in records) / len(records)
+        agg.avg_computation_time_ms = sum(r.computation_duration_ms for r in records) / len(records)
+        agg.validation_pass_rate = sum(1 for r in records if r.validation_passed) / len(records)
+        agg.avg_data_freshness_seconds = sum(r.data_freshness_avg_seconds for r in records) / len(records)
+        agg.avg_records_analyzed = sum(r.total_records_analyzed for r in records) / len(records)
+        
+        # Top decision factors
+        factor_counts: Dict[str, Dict[str, float]] = {}
+        for r in records:
+            for f in r.decision_factors:
+                if f.factor_name not in factor_counts:
+                    factor_counts[f.factor_name] = {"count": 0, "total_contribution": 0}
+                factor_counts[f.factor_name]["count"] += 1
+                factor_counts[f.factor_name]["total_contribution"] += f.contribution
+        
+        agg.top_decision_factors = sorted(
+            [{"name": k, "count": int(v["count"]), "avg_contribution": v["total_contribution"] / v["count"]}
+             for k, v in factor_counts.items()],
+            key=lambda x: x["count"],
+            reverse=True
+        )[:10]
+        
+        # Hourly counts
+        hourly: Dict[str, int] = {}
+        for r in records:
+            hour_key = _as_utc(r.computed_at).strftime("%Y-%m-%d %H:00")
+            hourly[hour_key] = hourly.get(hour_key, 0) + 1
+        
+        agg.hourly_counts = [{"hour": k, "count": v} for k, v in sorted(hourly.items())]
+        
+        return agg
+    
+    def list_factors(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Decision factors used in the last `hours`, most used first."""
+        try:
+            totals = self._read_rollups(datetime.now(timezone.utc) - timedelta(hours=hours))
+            return _factor_totals(totals)
         except Exception as e:
-            logger.error(f"Failed to aggregate provenance: {e}")
-            return ProvenanceAggregation()
-
+            logger.error(f"Failed to list factors: {e}")
+            return []
     
     def get_reasoning_chain(self, provenance_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed reasoning chain for a specific insight."""
@@ -363,46 +658,78 @@ class ProvenanceService:
         """Analyze a specific decision factor across all insights."""
         try:
             start_time = datetime.now(timezone.utc) - timedelta(days=days)
-            records, _ = self.query(ProvenanceQuery(start_time=start_time, page_size=1000))
+            totals = self._read_rollups(start_time, scopes=(f":factor:{factor_name}",))
             
-            factor_data = []
-            for r in records:
-                for f in r.decision_factors:
-                    if f.factor_name == factor_name:
-                        factor_data.append({
-                            "provenance_id": r.provenance_id,
-                            "insight_type": r.insight_type.value,
-                            "category": r.category_key,
-                            "raw_value": f.raw_value,
-                            "normalized": f.normalized_value,
-                            "weight": f.weight,
-                            "contribution": f.contribution,
-                            "computed_at": r.computed_at.isoformat(),
-                        })
-            
-            if not factor_data:
+            occurrences = int(totals.get("count", 0))
+            if not occurrences:
                 return {"factor_name": factor_name, "occurrences": 0}
             
+            client = self._get_redis()
+            samples = [
+                sample for sample in (
+                    json.loads(raw) for raw in client.lrange(f"{FACTOR_SAMPLES_KEY}{factor_name}", 0, -1)
+                )
+                if _as_utc(datetime.fromisoformat(sample["computed_at"])) >= start_time
+            ]
+            
+            def breakdown(prefix: str) -> Dict[str, int]:
+                return {
+                    field_name[len(prefix):]: int(amount)
+                    for field_name, amount in totals.items()
+                    if field_name.startswith(prefix) and amount
+                }
+            
             return {
                 "factor_name": factor_name,
-                "occurrences": len(factor_data),
-                "avg_contribution": sum(d["contribution"] for d in factor_data) / len(factor_data),
-                "avg_weight": sum(d["weight"] for d in factor_data) / len(factor_data),
-                "by_insight_type": self._group_by(factor_data, "insight_type"),
-                "by_category": self._group_by(factor_data, "category"),
-                "recent_samples": factor_data[:20],
+                "occurrences": occurrences,
+                "avg_contribution": totals.get("contribution", 0) / occurrences,
+                "avg_weight": totals.get("weight", 0) / occurrences,
+                "by_insight_type": breakdown("type:"),
+                "by_category": breakdown("category:"),
+                "recent_samples": samples,
             }
         except Exception as e:
             logger.error(f"Failed to analyze factor: {e}")
             return {"factor_name": factor_name, "error": str(e)}
-    
-    def _group_by(self, data: List[Dict], key: str) -> Dict[str, int]:
-        """Group data by a key."""
-        result: Dict[str, int] = {}
-        for d in data:
-            v = d.get(key, "unknown")
-            result[v] = result.get(v, 0) + 1
-        return result
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _rollup_buckets(start_time: datetime, end_time: Optional[datetime] = None) -> List[Tuple[str, str]]:
+    """(granularity, bucket) pairs covering a range: whole days, else hours."""
+    end = _as_utc(end_time) if end_time else datetime.now(timezone.utc)
+    cursor = _as_utc(start_time).replace(minute=0, second=0, microsecond=0)
+    buckets = []
+    while cursor <= end:
+        if cursor.hour == 0 and cursor + timedelta(hours=23) <= end:
+            buckets.append(("day", cursor.strftime(ROLLUP_GRANULARITIES["day"])))
+            cursor += timedelta(days=1)
+        else:
+            buckets.append(("hour", cursor.strftime(ROLLUP_GRANULARITIES["hour"])))
+            cursor += timedelta(hours=1)
+    return buckets
+
+
+def _factor_totals(totals: Dict[str, float]) -> List[Dict[str, Any]]:
+    """Per-factor count and contribution from rollup fields, most used first."""
+    factors: Dict[str, Dict[str, Any]] = {}
+    for field_name, amount in totals.items():
+        if not field_name.startswith("factor:"):
+            continue
+        name, _, metric = field_name[len("factor:"):].rpartition(":")
+        entry = factors.setdefault(name, {"name": name, "count": 0, "total_contribution": 0.0})
+        if metric == "count":
+            entry["count"] = int(amount)
+        else:
+            entry["total_contribution"] = amount
+    for entry in factors.values():
+        entry["avg_contribution"] = entry["total_contribution"] / entry["count"] if entry["count"] else 0
+    return sorted(factors.values(), key=lambda x: x["count"], reverse=True)
 
 
 # Singleton
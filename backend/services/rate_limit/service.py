@@ -72,18 +72,13 @@ class RateLimitService:
             os.getenv("USE_REDIS_RATE_LIMITING", "true").lower() == "true"
         )
         self._memory_store: Dict[str, Dict[str, Any]] = {}
-        self._redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     
     async def _get_redis(self):
         """Get or create Redis connection."""
         if self._redis is None and self._use_redis:
             try:
-                import redis.asyncio as aioredis
-                self._redis = await aioredis.from_url(
-                    self._redis_url,
-                    encoding="utf-8",
-                    decode_responses=True,
-                )
+                from backend.database.redis_pool import get_async_redis
+                self._redis = get_async_redis("rate_limit")
             except Exception as e:
                 logger.warning(f"Redis connection failed, falling back to memory: {e}")
                 self._use_redis = False
@@ -1,12 +1,18 @@
 """
 Social Service for AuraStream.
 Handles friends management and direct messaging.
+
+Profile, block and friendship lookups go through the request's batch
+loaders (services/batch_loader.py), so list views cost one query per
+lookup kind instead of one per row.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from backend.database.supabase_client import get_supabase_client
+from backend.services.batch_loader import get_request_loaders, relationship_key
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +42,29 @@ class SocialService:
             f"user_id.eq.{user_id},friend_id.eq.{user_id}"
         ).eq("status", "accepted").execute()
 
+        # Get pending requests (received)
+        pending_result = self.supabase.table("friendships").select(
+            "id, user_id, created_at"
+        ).eq("friend_id", user_id).eq("status", "pending").execute()
+
+        # Get sent requests
+        sent_result = self.supabase.table("friendships").select(
+            "id, friend_id, created_at"
+        ).eq("user_id", user_id).eq("status", "pending").execute()
+
+        # One batched profile fetch for everyone on the page
+        profile_ids = [
+            f["friend_id"] if f["user_id"] == user_id else f["user_id"]
+            for f in friends_result.data or []
+        ]
+        profile_ids += [r["user_id"] for r in pending_result.data or []]
+        profile_ids += [r["friend_id"] for r in sent_result.data or []]
+        profiles = await self._get_user_profiles(profile_ids)
+
         friends = []
         for f in friends_result.data or []:
             friend_user_id = f["friend_id"] if f["user_id"] == user_id else f["user_id"]
-            profile = await self._get_user_profile(friend_user_id)
+            profile = profiles.get(friend_user_id)
             friends.append({
                 "friendship_id": f["id"],
                 "user_id": friend_user_id,
@@ -49,14 +74,9 @@ class SocialService:
                 "created_at": f["created_at"],
             })
 
-        # Get pending requests (received)
-        pending_result = self.supabase.table("friendships").select(
-            "id, user_id, created_at"
-        ).eq("friend_id", user_id).eq("status", "pending").execute()
-
         pending_requests = []
         for r in pending_result.data or []:
-            profile = await self._get_user_profile(r["user_id"])
+            profile = profiles.get(r["user_id"])
             pending_requests.append({
                 "friendship_id": r["id"],
                 "user_id": r["user_id"],
@@ -65,14 +85,9 @@ class SocialService:
                 "created_at": r["created_at"],
             })
 
-        # Get sent requests
-        sent_result = self.supabase.table("friendships").select(
-            "id, friend_id, created_at"
-        ).eq("user_id", user_id).eq("status", "pending").execute()
-
         sent_requests = []
         for r in sent_result.data or []:
-            profile = await self._get_user_profile(r["friend_id"])
+            profile = profiles.get(r["friend_id"])
             sent_requests.append({
                 "friendship_id": r["id"],
                 "user_id": r["friend_id"],
@@ -124,6 +139,7 @@ class SocialService:
             "created_at": now,
             "updated_at": now,
         }).execute()
+        get_request_loaders(self.supabase).relationships.clear(relationship_key(user_id, friend_id))
 
         return {
             "friendship_id": result.data[0]["id"],
@@ -141,6 +157,7 @@ class SocialService:
 
         if not result.data:
             raise ValueError("Friend request not found")
+        get_request_loaders(self.supabase).relationships.clear()
 
         return {
             "friendship_id": friendship_id,
@@ -156,6 +173,7 @@ class SocialService:
 
         if not result.data:
             raise ValueError("Friend request not found")
+        get_request_loaders(self.supabase).relationships.clear()
 
         return {"message": "Friend request declined"}
 
@@ -167,6 +185,7 @@ class SocialService:
 
         if not result.data:
             raise ValueError("Friendship not found")
+        get_request_loaders(self.supabase).relationships.clear()
 
         return {"message": "Friend removed"}
 
@@ -184,14 +203,19 @@ class SocialService:
             "id, display_name, avatar_url"
         ).ilike("display_name", f"%{query}%").neq("id", user_id).limit(limit + 10).execute()
 
+        candidates = [u for u in result.data or [] if u["id"] not in blocked_ids]
+        # Block and relationship checks for every candidate: one query each
+        loaders = get_request_loaders(self.supabase)
+        blocked_by, relationships = await asyncio.gather(
+            loaders.blocks.load_many([(user_id, u["id"]) for u in candidates]),
+            loaders.relationships.load_many([relationship_key(user_id, u["id"]) for u in candidates]),
+        )
+
         users = []
-        for u in result.data or []:
-            if u["id"] in blocked_ids:
-                continue
-            if await self._is_blocked(user_id, u["id"]):
+        for u, is_blocked, rel in zip(candidates, blocked_by, relationships):
+            if is_blocked:
                 continue
 
-            rel = await self._get_relationship(user_id, u["id"])
             users.append({
                 "id": u["id"],
                 "display_name": u["display_name"],
@@ -232,6 +256,9 @@ class SocialService:
             "blocked_user_id": block_id,
             "created_at": now,
         }).execute()
+        loaders = get_request_loaders(self.supabase)
+        loaders.blocks.clear((block_id, user_id))
+        loaders.relationships.clear(relationship_key(user_id, block_id))
 
         return {"message": "User blocked"}
 
@@ -243,6 +270,7 @@ class SocialService:
 
         if not result.data:
             raise ValueError("User not blocked")
+        get_request_loaders(self.supabase).blocks.clear((block_id, user_id))
 
         return {"message": "User unblocked"}
 
@@ -252,9 +280,11 @@ class SocialService:
             "blocked_user_id, created_at"
         ).eq("user_id", user_id).execute()
 
+        profiles = await self._get_user_profiles([b["blocked_user_id"] for b in result.data or []])
+
         blocked_users = []
         for b in result.data or []:
-            profile = await self._get_user_profile(b["blocked_user_id"])
+            profile = profiles.get(b["blocked_user_id"])
             blocked_users.append({
                 "user_id": b["blocked_user_id"],
                 "display_name": profile.get("display_name") if profile else None,
@@ -269,25 +299,24 @@ class SocialService:
     # ========================================================================
 
     async def _get_user_profile(self, user_id: str) -> Optional[dict]:
-        """Get user profile by ID."""
-        result = self.supabase.table("users").select(
-            "id, display_name, avatar_url"
-        ).eq("id", user_id).execute()
-        return result.data[0] if result.data else None
+        """Get user profile by ID (cached for the request)."""
+        return await get_request_loaders(self.supabase).users.load(user_id)
+
+    async def _get_user_profiles(self, user_ids: List[str]) -> Dict[str, dict]:
+        """Get several user profiles in one batched query, keyed by user ID."""
+        unique_ids = list(dict.fromkeys(user_ids))
+        rows = await get_request_loaders(self.supabase).users.load_many(unique_ids)
+        return {user_id: row for user_id, row in zip(unique_ids, rows) if row}
 
     async def _get_relationship(self, user_id: str, other_id: str) -> Optional[dict]:
         """Get relationship between two users."""
-        result = self.supabase.table("friendships").select("*").or_(
-            f"and(user_id.eq.{user_id},friend_id.eq.{other_id}),and(user_id.eq.{other_id},friend_id.eq.{user_id})"
-        ).execute()
-        return result.data[0] if result.data else None
+        return await get_request_loaders(self.supabase).relationships.load(
+            relationship_key(user_id, other_id)
+        )
 
     async def _is_blocked(self, user_id: str, by_user_id: str) -> bool:
         """Check if user is blocked by another user."""
-        result = self.supabase.table("blocked_users").select("id").eq(
-            "user_id", by_user_id
-        ).eq("blocked_user_id", user_id).execute()
-        return bool(result.data)
+        return await get_request_loaders(self.supabase).blocks.load((user_id, by_user_id))
 
     async def _are_friends(self, user_id: str, other_id: str) -> bool:
         """Check if two users are friends."""
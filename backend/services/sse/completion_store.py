@@ -11,12 +11,13 @@ Redis Keys:
 
 import json
 import logging
-import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 from .types import CompletionData
 
 logger = logging.getLogger(__name__)
@@ -41,15 +42,14 @@ class CompletionStore:
         Initialize the completion store.
         
         Args:
-            redis_client: Optional Redis client. If not provided, creates one from REDIS_URL.
+            redis_client: Optional Redis client. If not provided, uses the shared "sse" pool.
         """
         self._redis = redis_client
     
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis client."""
+        """Get the Redis client, defaulting to the shared "sse" pool."""
         if self._redis is None:
-            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis = get_async_redis("sse")
         return self._redis
     
     def _completion_key(self, stream_id: str) -> str:
@@ -225,10 +225,8 @@ class CompletionStore:
         return await r.exists(self._completion_key(stream_id)) > 0
     
     async def close(self) -> None:
-        """Close the Redis connection."""
-        if self._redis is not None:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
 
 
 # Singleton instance
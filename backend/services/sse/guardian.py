@@ -6,12 +6,13 @@ Runs periodically via the orchestrator to ensure stream reliability.
 """
 
 import logging
-import os
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 from .types import CompletionData, StreamMetadata, StreamState, StreamType
 from .registry import StreamRegistry, get_stream_registry
 from .completion_store import CompletionStore, get_completion_store
@@ -69,10 +70,9 @@ class StreamGuardian:
         return self._completion_store
     
     async def _get_redis(self) -> redis.Redis:
-        """Get or create Redis client."""
+        """Get the Redis client, defaulting to the shared "sse" pool."""
         if self._redis is None:
-            redis_url = os.environ.get("REDIS_URL", "redis://localhost:6379")
-            self._redis = redis.from_url(redis_url, decode_responses=True)
+            self._redis = get_async_redis("sse")
         return self._redis
     
     async def check_orphaned_streams(
@@ -338,10 +338,8 @@ class StreamGuardian:
         }
     
     async def close(self) -> None:
-        """Close connections."""
-        if self._redis is not None:
-            await self._redis.aclose()
-            self._redis = None
+        """Release the Redis client (the pool is owned by the connection manager)."""
+        self._redis = None
 
 
 # Singleton instance
@@ -5,8 +5,10 @@ Analyzes top-performing YouTube gaming thumbnails using Gemini Vision
 to extract layout patterns, color schemes, and design recommendations.
 
 Architecture:
-- collector.py: Fetches top videos per category from YouTube
+- collector.py: Fetches top videos per category from YouTube and bulk-downloads
+  their thumbnails (conditional, downscaled for vision)
 - vision_analyzer.py: Sends thumbnails to Gemini Vision for analysis
+- analysis_cache.py: Per-video analysis cache and in-run image dedup
 - repository.py: Stores/retrieves analysis from database
 - service.py: Main orchestrator service
 
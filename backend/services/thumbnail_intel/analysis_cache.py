@@ -0,0 +1,208 @@
+"""
+Thumbnail Analysis Cache
+
+Top videos and their thumbnails persist across days and categories, so the
+daily run would otherwise send the same images to Gemini Vision again. This
+module lets the analyzer skip those calls:
+
+- ThumbnailAnalysisCache keeps each video's last analysis in Redis, keyed
+  by video_id, together with a perceptual hash (dHash) of the image it was
+  made from. The analysis is reused while the thumbnail's hash stays within
+  PHASH_REUSE_DISTANCE bits, i.e. the creator has not changed it.
+- AnalysisRun is the state of one daily run, shared by all categories. It
+  dedups near-identical images (within PHASH_DEDUP_DISTANCE bits) across
+  videos, so reuploads and cross-category duplicates cost one call, and it
+  counts Gemini calls, cache hits and duplicates for the run report.
+
+Redis layout:
+    thumbnail_intel:analysis:{video_id} - {"phash": "<hex>", "analysis": {...}}
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from backend.database.redis_pool import get_async_redis
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+ANALYSIS_CACHE_PREFIX = "thumbnail_intel:analysis:"
+ANALYSIS_CACHE_TTL = int(os.getenv("THUMBNAIL_ANALYSIS_CACHE_TTL", str(30 * 24 * 60 * 60)))
+
+# Hamming distances between 64-bit dHashes. Re-encodes of one image land
+# within a few bits; a redesigned thumbnail is far beyond either threshold.
+PHASH_REUSE_DISTANCE = int(os.getenv("THUMBNAIL_PHASH_REUSE_DISTANCE", "6"))
+PHASH_DEDUP_DISTANCE = int(os.getenv("THUMBNAIL_PHASH_DEDUP_DISTANCE", "4"))
+
+HASH_SIZE = 8
+
+
+# ============================================================================
+# Perceptual Hash
+# ============================================================================
+
+def perceptual_hash(img_bytes: bytes) -> Optional[int]:
+    """
+    64-bit difference hash of an image.
+
+    The image is reduced to 9x8 grayscale and each bit records whether a
+    pixel is brighter than its right neighbour, so the hash survives
+    rescaling and recompression.
+
+    Returns:
+        Hash as an int, or None if the image cannot be decoded
+    """
+    try:
+        with Image.open(io.BytesIO(img_bytes)) as image:
+            image.draft("L", (HASH_SIZE * 4, HASH_SIZE * 4))
+            pixels = image.convert("L").resize((HASH_SIZE + 1, HASH_SIZE), Image.LANCZOS).tobytes()
+    except Exception as e:
+        logger.debug(f"Could not hash thumbnail: {e}")
+        return None
+
+    value = 0
+    for row in range(HASH_SIZE):
+        offset = row * (HASH_SIZE + 1)
+        for col in range(HASH_SIZE):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hash_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return bin(a ^ b).count("1")
+
+
+# ============================================================================
+# Per-Run State
+# ============================================================================
+
+@dataclass
+class AnalysisRun:
+    """
+    State shared by every category of one daily run.
+
+    In-flight and finished analyses are registered by image hash so a
+    near-duplicate image awaits the same Gemini call instead of making its
+    own.
+    """
+    gemini_calls: int = 0
+    cache_hits: int = 0
+    dedup_hits: int = 0
+    failures: int = 0
+    started_at: float = field(default_factory=time.time)
+    _analyses: List[Tuple[int, "asyncio.Future[Any]"]] = field(default_factory=list)
+
+    def find_duplicate(self, phash: int) -> Optional["asyncio.Future[Any]"]:
+        """Analysis (possibly still running) of a near-identical image."""
+        for seen, analysis in self._analyses:
+            if hash_distance(seen, phash) <= PHASH_DEDUP_DISTANCE:
+                return analysis
+        return None
+
+    def register(self, phash: int, analysis: "asyncio.Future[Any]") -> None:
+        self._analyses.append((phash, analysis))
+
+    def report(self, categories: int) -> Dict[str, Any]:
+        """Counters and wall time for the run."""
+        return {
+            "categories": categories,
+            "gemini_calls": self.gemini_calls,
+            "cache_hits": self.cache_hits,
+            "dedup_hits": self.dedup_hits,
+            "failures": self.failures,
+            "wall_ms": int((time.time() - self.started_at) * 1000),
+        }
+
+
+# ============================================================================
+# Persistent Cache
+# ============================================================================
+
+class ThumbnailAnalysisCache:
+    """
+    Per-video vision analyses in Redis.
+
+    Cache errors are logged and treated as misses; the run then calls
+    Gemini as it would without a cache.
+    """
+
+    def __init__(self, redis_client=None, ttl: int = ANALYSIS_CACHE_TTL):
+        self._redis = redis_client
+        self.ttl = ttl
+
+    @property
+    def redis(self):
+        """Lazy-load the shared intel Redis client."""
+        if self._redis is None:
+            self._redis = get_async_redis("intel")
+        return self._redis
+
+    async def get_many(self, video_ids: List[str]) -> Dict[str, Tuple[int, Dict[str, Any]]]:
+        """
+        Load cached analyses for several videos with one MGET.
+
+        Returns:
+            video_id -> (image hash, analysis fields) for the videos found
+        """
+        if not video_ids:
+            return {}
+        try:
+            values = await self.redis.mget([f"{ANALYSIS_CACHE_PREFIX}{vid}" for vid in video_ids])
+        except Exception as e:
+            logger.warning(f"Thumbnail analysis cache read failed: {e}")
+            return {}
+
+        cached = {}
+        for video_id, raw in zip(video_ids, values):
+            if not raw:
+                continue
+            try:
+                entry = json.loads(raw)
+                cached[video_id] = (int(entry["phash"], 16), entry["analysis"])
+            except (ValueError, KeyError, TypeError):
+                continue
+        return cached
+
+    async def put(self, video_id: str, phash: int, analysis: Any) -> None:
+        """Store a video's analysis (a ThumbnailAnalysis) with its image hash."""
+        entry = {"phash": f"{phash:016x}", "analysis": asdict(analysis)}
+        try:
+            await self.redis.set(f"{ANALYSIS_CACHE_PREFIX}{video_id}", json.dumps(entry), ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Thumbnail analysis cache write failed: {e}")
+
+
+# Singleton instance
+_cache: Optional[ThumbnailAnalysisCache] = None
+
+
+def get_analysis_cache() -> ThumbnailAnalysisCache:
+    """Get or create the thumbnail analysis cache singleton."""
+    global _cache
+    if _cache is None:
+        _cache = ThumbnailAnalysisCache()
+    return _cache
+
+
+__all__ = [
+    "AnalysisRun",
+    "ThumbnailAnalysisCache",
+    "get_analysis_cache",
+    "perceptual_hash",
+    "hash_distance",
+    "PHASH_REUSE_DISTANCE",
+    "PHASH_DEDUP_DISTANCE",
+]
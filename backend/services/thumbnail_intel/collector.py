@@ -6,20 +6,36 @@ and extracts thumbnail URLs for analysis.
 
 Uses game-specific searches to guarantee coverage for all tracked games.
 Filters: English-only, long-form content (no Shorts).
+
+Thumbnails are downloaded in bulk through one keep-alive client with
+bounded concurrency. Each fetch is conditional (ETag / If-Modified-Since
+from the previous day), and images are downscaled in the CPU pool to the
+size the vision prompt needs before they are sent to Gemini.
 """
 
+import hashlib
+import io
+import json
 import logging
 import asyncio
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 import httpx
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from PIL import Image
+
 from backend.services.thumbnail_intel.constants import (
     GAMING_CATEGORIES,
     THUMBNAILS_PER_CATEGORY,
     MIN_VIEW_COUNT,
 )
+from backend.database.redis_pool import get_async_redis
+from backend.services.async_executor import run_cpu_bound
 from backend.services.trends import get_youtube_collector
 
 logger = logging.getLogger(__name__)
@@ -27,6 +43,60 @@ logger = logging.getLogger(__name__)
 # Memory management constants
 MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB max per image to prevent memory issues
 
+# Bulk downloads share one keep-alive client
+DOWNLOAD_CONCURRENCY = int(os.getenv("THUMBNAIL_DOWNLOAD_CONCURRENCY", "8"))
+DOWNLOAD_TIMEOUT = 30.0
+
+# Client of the enclosing download session; task-local so overlapping runs on
+# the shared collector never close each other's client
+_session_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "thumbnail_download_client", default=None
+)
+
+# Validators and prepared image of the last fetch, for conditional requests
+DOWNLOAD_CACHE_PREFIX = "thumbnail_intel:download:"
+DOWNLOAD_CACHE_TTL = int(os.getenv("THUMBNAIL_DOWNLOAD_CACHE_TTL", str(3 * 24 * 60 * 60)))
+
+# Vision input: a 16:9 thumbnail at 768px wide is a single Gemini image tile,
+# enough for layout, colors and thumbnail text
+VISION_MAX_WIDTH = int(os.getenv("THUMBNAIL_VISION_MAX_WIDTH", "768"))
+VISION_JPEG_QUALITY = int(os.getenv("THUMBNAIL_VISION_JPEG_QUALITY", "85"))
+
+
+def prepare_for_vision(
+    img_bytes: bytes,
+    max_width: int = VISION_MAX_WIDTH,
+    quality: int = VISION_JPEG_QUALITY,
+) -> Optional[bytes]:
+    """
+    Downscale and recompress a thumbnail for a vision call.
+    
+    CPU-bound; run it through run_cpu_bound. JPEGs already within max_width
+    are returned unchanged.
+    
+    Returns:
+        JPEG bytes, or None if the image cannot be decoded
+    """
+    try:
+        with Image.open(io.BytesIO(img_bytes)) as image:
+            if image.format == "JPEG" and image.width <= max_width:
+                return img_bytes
+            width, height = image.size
+            if width > max_width:
+                height = max(1, round(height * max_width / width))
+                width = max_width
+            # Lets the JPEG decoder skip detail the resize would discard
+            image.draft("RGB", (width, height))
+            prepared = image.convert("RGB")
+            if prepared.size != (width, height):
+                prepared = prepared.resize((width, height), Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            prepared.save(output, format="JPEG", quality=quality, optimize=True)
+            return output.getvalue()
+    except Exception as e:
+        logger.warning(f"Could not prepare thumbnail for vision: {e}")
+        return None
+
 
 def _is_english_text(text: str) -> bool:
     """Check if text is primarily English."""
@@ -86,6 +156,15 @@ class ThumbnailCollector:
     
     def __init__(self):
         self._youtube = None
+        self._redis = None
+        self.download_stats: Counter = Counter()
+    
+    @property
+    def redis(self):
+        """Lazy-load the binary Redis client for the download cache."""
+        if self._redis is None:
+            self._redis = get_async_redis("blob")
+        return self._redis
     
     @property
     def youtube(self):
@@ -235,9 +314,61 @@ class ThumbnailCollector:
         # Use maxresdefault for best quality
         return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
     
+    @asynccontextmanager
+    async def download_session(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Keep one pooled keep-alive client open for all downloads inside.
+        
+        The client is bound to the current task context, so concurrent runs
+        each get their own. Downloads outside a session open a client per
+        bulk call.
+        """
+        client = _session_client.get()
+        if client is not None:
+            yield client
+            return
+        limits = httpx.Limits(
+            max_connections=DOWNLOAD_CONCURRENCY,
+            max_keepalive_connections=DOWNLOAD_CONCURRENCY,
+        )
+        async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT, limits=limits) as client:
+            token = _session_client.set(client)
+            try:
+                yield client
+            finally:
+                _session_client.reset(token)
+    
+    async def download_thumbnails(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        Download and prepare several thumbnails concurrently.
+        
+        Args:
+            urls: Thumbnail URLs
+            
+        Returns:
+            Vision-ready JPEG bytes (or None on failure) in the order of urls
+        """
+        async with self.download_session() as client:
+            semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+            
+            async def one(url: str) -> Optional[bytes]:
+                async with semaphore:
+                    return await self._download(client, url)
+            
+            before = self.download_stats.copy()
+            images = await asyncio.gather(*(one(url) for url in urls))
+            
+        stats = self.download_stats - before
+        logger.info(
+            f"Downloaded {len(urls)} thumbnails: {stats['not_modified']} not modified, "
+            f"{stats['failed']} failed, {stats['bytes_downloaded'] // 1024}KB downloaded, "
+            f"{stats['bytes_prepared'] // 1024}KB prepared for vision"
+        )
+        return images
+    
     async def download_thumbnail(self, url: str) -> Optional[bytes]:
         """
-        Download thumbnail image bytes.
+        Download one thumbnail, prepared for vision.
         
         Includes size limit check to prevent downloading huge images
         that could cause memory issues.
@@ -248,46 +379,90 @@ class ThumbnailCollector:
         Returns:
             Image bytes or None if download fails or image is too large
         """
+        return (await self.download_thumbnails([url]))[0]
+    
+    async def _download(self, client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        """Fetch a thumbnail, falling back to hqdefault if maxres doesn't exist."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                
-                if response.status_code == 200:
-                    img_bytes = response.content
-                    
-                    # Check image size to prevent memory issues
-                    if len(img_bytes) > MAX_IMAGE_SIZE:
-                        logger.warning(
-                            f"Image too large ({len(img_bytes)} bytes, max {MAX_IMAGE_SIZE}), "
-                            f"skipping: {url}"
-                        )
-                        return None
-                    
-                    return img_bytes
-                
-                # Try fallback to hqdefault if maxres doesn't exist
-                if "maxresdefault" in url:
-                    fallback_url = url.replace("maxresdefault", "hqdefault")
-                    response = await client.get(fallback_url)
-                    if response.status_code == 200:
-                        img_bytes = response.content
-                        
-                        # Check image size for fallback too
-                        if len(img_bytes) > MAX_IMAGE_SIZE:
-                            logger.warning(
-                                f"Fallback image too large ({len(img_bytes)} bytes, max {MAX_IMAGE_SIZE}), "
-                                f"skipping: {fallback_url}"
-                            )
-                            return None
-                        
-                        return img_bytes
-                
-                logger.warning(f"Failed to download thumbnail: {url} (status {response.status_code})")
-                return None
-                
+            image = await self._fetch(client, url)
+            if image is None and "maxresdefault" in url:
+                image = await self._fetch(client, url.replace("maxresdefault", "hqdefault"))
+            if image is None:
+                self.download_stats["failed"] += 1
+                logger.warning(f"Failed to download thumbnail: {url}")
+            return image
         except Exception as e:
+            self.download_stats["failed"] += 1
             logger.error(f"Error downloading thumbnail {url}: {e}")
             return None
+    
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[bytes]:
+        """
+        Conditional GET of one URL.
+        
+        A 304 returns the image prepared on the previous fetch; a 200 is
+        size-checked, prepared in the CPU pool and cached with its validators.
+        """
+        cached_meta, cached_image = await self._load_cached(url)
+        headers = {}
+        if cached_image is not None:
+            if cached_meta.get("etag"):
+                headers["If-None-Match"] = cached_meta["etag"]
+            if cached_meta.get("last_modified"):
+                headers["If-Modified-Since"] = cached_meta["last_modified"]
+        
+        response = await client.get(url, headers=headers)
+        
+        if response.status_code == 304 and cached_image is not None:
+            self.download_stats["not_modified"] += 1
+            return cached_image
+        if response.status_code != 200:
+            return None
+        
+        img_bytes = response.content
+        # Check image size to prevent memory issues
+        if len(img_bytes) > MAX_IMAGE_SIZE:
+            logger.warning(
+                f"Image too large ({len(img_bytes)} bytes, max {MAX_IMAGE_SIZE}), "
+                f"skipping: {url}"
+            )
+            return None
+        
+        prepared = await run_cpu_bound(prepare_for_vision, img_bytes)
+        if prepared is None:
+            return None
+        self.download_stats["bytes_downloaded"] += len(img_bytes)
+        self.download_stats["bytes_prepared"] += len(prepared)
+        
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if etag or last_modified:
+            await self._save_cached(url, {"etag": etag, "last_modified": last_modified}, prepared)
+        return prepared
+    
+    def _cache_keys(self, url: str) -> Tuple[str, str]:
+        digest = hashlib.sha1(url.encode()).hexdigest()
+        return f"{DOWNLOAD_CACHE_PREFIX}{digest}:meta", f"{DOWNLOAD_CACHE_PREFIX}{digest}:image"
+    
+    async def _load_cached(self, url: str) -> Tuple[Dict[str, Any], Optional[bytes]]:
+        """Validators and prepared image from the last fetch of a URL."""
+        try:
+            meta, image = await self.redis.mget(list(self._cache_keys(url)))
+            if meta and image:
+                return json.loads(meta), image
+        except Exception as e:
+            logger.debug(f"Thumbnail download cache read failed: {e}")
+        return {}, None
+    
+    async def _save_cached(self, url: str, meta: Dict[str, Any], image: bytes) -> None:
+        meta_key, image_key = self._cache_keys(url)
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(meta_key, json.dumps(meta), ex=DOWNLOAD_CACHE_TTL)
+            pipe.set(image_key, image, ex=DOWNLOAD_CACHE_TTL)
+            await pipe.execute()
+        except Exception as e:
+            logger.debug(f"Thumbnail download cache write failed: {e}")
 
 
 # Singleton instance
@@ -8,9 +8,9 @@ vision analysis, and storage.
 import gc
 import logging
 import asyncio
-import time
+import os
 from contextlib import contextmanager
-from typing import List, Dict, Optional, Generator
+from typing import Any, Awaitable, Callable, List, Dict, Optional, Generator
 
 from backend.services.thumbnail_intel.collector import (
     ThumbnailCollector,
@@ -26,12 +26,15 @@ from backend.services.thumbnail_intel.repository import (
     ThumbnailIntelRepository,
     get_thumbnail_repository,
 )
+from backend.services.thumbnail_intel.analysis_cache import AnalysisRun
 from backend.services.thumbnail_intel.constants import GAMING_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
-# Memory management constants
-BATCH_SIZE = 10  # Process 10 thumbnails at a time to limit memory usage
+# Categories analyzed at once. Vision calls are bounded separately by the
+# analyzer's semaphore and the Gemini admission controller; this bounds how
+# many categories hold downloaded images at the same time.
+CATEGORY_CONCURRENCY = int(os.getenv("THUMBNAIL_INTEL_CATEGORY_CONCURRENCY", "3"))
 
 
 @contextmanager
@@ -60,6 +63,54 @@ def managed_image_buffer(initial_data: Optional[List[Optional[bytes]]] = None) -
         gc.collect()
 
 
+async def analyze_categories(
+    all_thumbnails: Dict[str, List[ThumbnailData]],
+    process: Callable[[str, List[ThumbnailData]], Awaitable[CategoryThumbnailInsight]],
+    concurrency: int = CATEGORY_CONCURRENCY,
+) -> Dict[str, CategoryThumbnailInsight]:
+    """
+    Run process(category_key, thumbnails) for every category concurrently.
+    
+    A failed category is logged and left out of the results.
+    
+    Args:
+        all_thumbnails: Collected thumbnails per category
+        process: Analyzes and saves one category
+        concurrency: Categories in flight at once
+        
+    Returns:
+        Dict mapping category_key to CategoryThumbnailInsight, in collection order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run_one(category_key: str, thumbnails: List[ThumbnailData]) -> Optional[CategoryThumbnailInsight]:
+        if not thumbnails:
+            logger.warning(f"No thumbnails collected for {category_key}")
+            return None
+        async with semaphore:
+            try:
+                insight = await process(category_key, thumbnails)
+                logger.info(f"Completed analysis for {category_key}")
+                return insight
+            except Exception as e:
+                logger.error(f"Failed to analyze {category_key}: {e}")
+                return None
+    
+    keys = list(all_thumbnails)
+    insights = await asyncio.gather(*(run_one(key, all_thumbnails[key]) for key in keys))
+    return {key: insight for key, insight in zip(keys, insights) if insight is not None}
+
+
+def log_run_report(report: Dict[str, Any], label: str = "") -> None:
+    """Log the per-run Gemini call counts and wall time."""
+    logger.info(
+        f"Thumbnail intelligence complete{label}: {report['categories']} categories "
+        f"analyzed in {report['wall_ms']}ms; {report['gemini_calls']} Gemini calls, "
+        f"{report['cache_hits']} cache hits, {report['dedup_hits']} duplicates, "
+        f"{report['failures']} failed"
+    )
+
+
 class ThumbnailIntelService:
     """
     Main service for thumbnail intelligence.
@@ -80,6 +131,7 @@ class ThumbnailIntelService:
         self.collector = collector or get_thumbnail_collector()
         self.analyzer = analyzer or get_vision_analyzer()
         self.repository = repository or get_thumbnail_repository()
+        self.last_run_report: Optional[Dict[str, Any]] = None
     
     async def run_daily_analysis(self) -> Dict[str, CategoryThumbnailInsight]:
         """
@@ -90,45 +142,25 @@ class ThumbnailIntelService:
         Returns:
             Dict mapping category_key to CategoryThumbnailInsight
         """
-        start_time = time.time()
         logger.info("Starting daily thumbnail intelligence analysis...")
-        
-        results: Dict[str, CategoryThumbnailInsight] = {}
+        run = AnalysisRun()
         
         try:
             # Step 1: Collect thumbnails for all categories
             logger.info("Collecting thumbnails from YouTube...")
             all_thumbnails = await self.collector.collect_all_categories()
             
-            # Step 2: Analyze each category
-            for category_key, thumbnails in all_thumbnails.items():
-                if not thumbnails:
-                    logger.warning(f"No thumbnails collected for {category_key}")
-                    continue
-                
-                try:
-                    insight = await self._analyze_category(
-                        category_key,
-                        thumbnails,
-                    )
-                    results[category_key] = insight
-                    
-                    # Save to database
-                    await self.repository.save_category_insight(insight)
-                    
-                    logger.info(f"Completed analysis for {category_key}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to analyze {category_key}: {e}")
-                
-                # Small delay between categories
-                await asyncio.sleep(1)
+            # Step 2: Analyze categories concurrently, sharing the run's cache and dedup
+            async def process(category_key: str, thumbnails: List[ThumbnailData]) -> CategoryThumbnailInsight:
+                insight = await self._analyze_category(category_key, thumbnails, run)
+                await self.repository.save_category_insight(insight)
+                return insight
             
-            duration = int((time.time() - start_time) * 1000)
-            logger.info(
-                f"Thumbnail intelligence complete: {len(results)} categories "
-                f"analyzed in {duration}ms"
-            )
+            async with self.collector.download_session():
+                results = await analyze_categories(all_thumbnails, process)
+            
+            self.last_run_report = run.report(categories=len(results))
+            log_run_report(self.last_run_report)
             
             return results
             
@@ -140,17 +172,19 @@ class ThumbnailIntelService:
         self,
         category_key: str,
         thumbnails: List[ThumbnailData],
+        run: Optional[AnalysisRun] = None,
     ) -> CategoryThumbnailInsight:
         """
         Analyze thumbnails for a single category.
         
-        Downloads and processes images in batches to prevent memory buildup.
+        Downloads the category's thumbnails in one bulk call; images are
+        downscaled for vision, so the category's buffer stays small.
         Uses context manager pattern to ensure cleanup even on errors.
-        Forces garbage collection after each batch.
         
         Args:
             category_key: Category identifier
             thumbnails: List of ThumbnailData to analyze
+            run: Daily run state shared across categories
             
         Returns:
             CategoryThumbnailInsight with analysis results
@@ -158,46 +192,14 @@ class ThumbnailIntelService:
         category_config = GAMING_CATEGORIES.get(category_key, {})
         category_name = category_config.get("name", category_key)
         
-        # Process thumbnails in batches to limit memory usage
-        logger.info(f"Processing {len(thumbnails)} thumbnails for {category_key} in batches of {BATCH_SIZE}...")
+        logger.info(f"Downloading {len(thumbnails)} thumbnails for {category_key}...")
         
         with managed_image_buffer() as all_thumbnail_images:
-            for batch_start in range(0, len(thumbnails), BATCH_SIZE):
-                batch_end = min(batch_start + BATCH_SIZE, len(thumbnails))
-                batch = thumbnails[batch_start:batch_end]
-                batch_num = (batch_start // BATCH_SIZE) + 1
-                total_batches = (len(thumbnails) + BATCH_SIZE - 1) // BATCH_SIZE
-                
-                logger.debug(f"Processing batch {batch_num}/{total_batches} for {category_key}")
-                
-                # Process batch with its own managed buffer
-                with managed_image_buffer() as batch_images:
-                    for i, thumb in enumerate(batch):
-                        try:
-                            # Download single thumbnail
-                            img_bytes = await self.collector.download_thumbnail(thumb.thumbnail_url_hq)
-                            batch_images.append(img_bytes)
-                            
-                            logger.debug(
-                                f"Downloaded thumbnail {batch_start + i + 1}/{len(thumbnails)} "
-                                f"for {category_key}"
-                            )
-                            
-                            await asyncio.sleep(0.2)  # Rate limit downloads
-                            
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to download thumbnail {batch_start + i + 1} "
-                                f"for {category_key}: {e}"
-                            )
-                            batch_images.append(None)
-                    
-                    # Copy batch results to main list before batch buffer is cleared
-                    all_thumbnail_images.extend(batch_images[:])
-                
-                # Force garbage collection after each batch to free memory
-                gc.collect()
-                logger.debug(f"Completed batch {batch_num}/{total_batches}, memory cleaned up")
+            # Concurrent conditional fetches over the run's pooled client,
+            # downscaled to what the vision prompt needs
+            all_thumbnail_images.extend(
+                await self.collector.download_thumbnails([t.thumbnail_url_hq for t in thumbnails])
+            )
             
             # Analyze with Gemini Vision
             logger.info(f"Analyzing thumbnails for {category_key} with Gemini Vision...")
@@ -206,6 +208,7 @@ class ThumbnailIntelService:
                 category_name=category_name,
                 thumbnails=thumbnails,
                 thumbnail_images=all_thumbnail_images,
+                run=run,
             )
         
         # Final garbage collection after analysis complete
@@ -7,9 +7,7 @@ for every thumbnail analysis.
 
 import gc
 import logging
-import asyncio
-import time
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
 from backend.services.thumbnail_intel.collector import (
     ThumbnailData,
@@ -25,7 +23,12 @@ from backend.services.thumbnail_intel.repository import (
     get_thumbnail_repository,
 )
 from backend.services.thumbnail_intel.constants import GAMING_CATEGORIES
-from backend.services.thumbnail_intel.service import managed_image_buffer, BATCH_SIZE
+from backend.services.thumbnail_intel.analysis_cache import AnalysisRun
+from backend.services.thumbnail_intel.service import (
+    analyze_categories,
+    log_run_report,
+    managed_image_buffer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +45,7 @@ class ProvenanceThumbnailIntelService:
         self.collector = get_thumbnail_collector()
         self.analyzer = get_provenance_vision_analyzer()
         self.repository = get_thumbnail_repository()
+        self.last_run_report: Optional[Dict[str, Any]] = None
     
     async def run_daily_analysis_with_provenance(
         self,
@@ -56,46 +60,30 @@ class ProvenanceThumbnailIntelService:
         Returns:
             Dict mapping category_key to CategoryThumbnailInsight
         """
-        start_time = time.time()
         logger.info("Starting daily thumbnail intelligence analysis with provenance...")
-        
-        results: Dict[str, CategoryThumbnailInsight] = {}
+        run = AnalysisRun()
         
         try:
             # Step 1: Collect thumbnails for all categories
             logger.info("Collecting thumbnails from YouTube...")
             all_thumbnails = await self.collector.collect_all_categories()
             
-            # Step 2: Analyze each category with provenance
-            for category_key, thumbnails in all_thumbnails.items():
-                if not thumbnails:
-                    logger.warning(f"No thumbnails collected for {category_key}")
-                    continue
-                
-                try:
-                    insight = await self._analyze_category_with_provenance(
-                        category_key,
-                        thumbnails,
-                        execution_id=f"{execution_id}:{category_key}",
-                    )
-                    results[category_key] = insight
-                    
-                    # Save to database
-                    await self.repository.save_category_insight(insight)
-                    
-                    logger.info(f"Completed analysis for {category_key} (with provenance)")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to analyze {category_key}: {e}")
-                
-                # Small delay between categories
-                await asyncio.sleep(1)
+            # Step 2: Analyze categories concurrently with provenance
+            async def process(category_key: str, thumbnails: List[ThumbnailData]) -> CategoryThumbnailInsight:
+                insight = await self._analyze_category_with_provenance(
+                    category_key,
+                    thumbnails,
+                    execution_id=f"{execution_id}:{category_key}",
+                    run=run,
+                )
+                await self.repository.save_category_insight(insight)
+                return insight
             
-            duration = int((time.time() - start_time) * 1000)
-            logger.info(
-                f"Thumbnail intelligence complete: {len(results)} categories "
-                f"analyzed in {duration}ms (with provenance)"
-            )
+            async with self.collector.download_session():
+                results = await analyze_categories(all_thumbnails, process)
+            
+            self.last_run_report = run.report(categories=len(results))
+            log_run_report(self.last_run_report, label=" (with provenance)")
             
             return results
             
@@ -108,6 +96,7 @@ class ProvenanceThumbnailIntelService:
         category_key: str,
         thumbnails: List[ThumbnailData],
         execution_id: str,
+        run: Optional[AnalysisRun] = None,
     ) -> CategoryThumbnailInsight:
         """
         Analyze thumbnails for a single category with provenance capture.
@@ -115,26 +104,12 @@ class ProvenanceThumbnailIntelService:
         category_config = GAMING_CATEGORIES.get(category_key, {})
         category_name = category_config.get("name", category_key)
         
-        logger.info(f"Processing {len(thumbnails)} thumbnails for {category_key}...")
+        logger.info(f"Downloading {len(thumbnails)} thumbnails for {category_key}...")
         
         with managed_image_buffer() as all_thumbnail_images:
-            for batch_start in range(0, len(thumbnails), BATCH_SIZE):
-                batch_end = min(batch_start + BATCH_SIZE, len(thumbnails))
-                batch = thumbnails[batch_start:batch_end]
-                
-                with managed_image_buffer() as batch_images:
-                    for i, thumb in enumerate(batch):
-                        try:
-                            img_bytes = await self.collector.download_thumbnail(thumb.thumbnail_url_hq)
-                            batch_images.append(img_bytes)
-                            await asyncio.sleep(0.2)
-                        except Exception as e:
-                            logger.warning(f"Failed to download thumbnail: {e}")
-                            batch_images.append(None)
-                    
-                    all_thumbnail_images.extend(batch_images[:])
-                
-                gc.collect()
+            all_thumbnail_images.extend(
+                await self.collector.download_thumbnails([t.thumbnail_url_hq for t in thumbnails])
+            )
             
             # Analyze with provenance-enabled analyzer
             insight = await self.analyzer.analyze_category_with_provenance(
@@ -143,6 +118,7 @@ class ProvenanceThumbnailIntelService:
                 thumbnails=thumbnails,
                 thumbnail_images=all_thumbnail_images,
                 execution_id=execution_id,
+                run=run,
             )
         
         gc.collect()
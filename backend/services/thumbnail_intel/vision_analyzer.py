@@ -10,20 +10,32 @@ Uses Gemini Vision to analyze thumbnail images and extract:
 Architecture (v2 - Per-Thumbnail Analysis):
 - Each thumbnail gets its own Gemini Vision call for accurate analysis
 - Category patterns are aggregated from individual results
-- 80 total calls (10 thumbnails × 8 categories) instead of 8 batched calls
+- At most 80 calls (10 thumbnails × 8 categories) instead of 8 batched calls;
+  unchanged thumbnails reuse their cached analysis and near-duplicate images
+  share one call (see analysis_cache.py)
 """
 
 import logging
 import asyncio
 import json
 import os
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
 from collections import Counter
 
 from google import genai
 from google.genai import types
 
+from backend.services.async_executor import run_cpu_bound
+from backend.services.gemini_admission import PRIORITY_BATCH, get_gemini_admission
+from backend.services.thumbnail_intel.analysis_cache import (
+    PHASH_REUSE_DISTANCE,
+    AnalysisRun,
+    ThumbnailAnalysisCache,
+    get_analysis_cache,
+    hash_distance,
+    perceptual_hash,
+)
 from backend.services.thumbnail_intel.constants import GEMINI_VISION_MODEL
 from backend.services.thumbnail_intel.collector import ThumbnailData
 
@@ -32,6 +44,9 @@ logger = logging.getLogger(__name__)
 # Concurrency limit to avoid rate limiting (Gemini allows ~60 RPM on free tier)
 MAX_CONCURRENT_CALLS = 5
 
+# Recipe text of analyses made without Gemini (never cached)
+FALLBACK_RECIPE = "Analysis unavailable"
+
 
 # ============================================================================
 # Helper Functions for New Fields
@@ -159,7 +174,7 @@ class ThumbnailVisionAnalyzer:
     - Concurrent calls with rate limiting
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ThumbnailAnalysisCache] = None):
         api_key = os.getenv("GOOGLE_API_KEY")
         if api_key:
             self._client = genai.Client(api_key=api_key)
@@ -170,8 +185,9 @@ class ThumbnailVisionAnalyzer:
             self._client = None
             self.enabled = False
         
-        # Semaphore for rate limiting concurrent calls
+        # Semaphore for rate limiting concurrent calls (shared by all categories)
         self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+        self.cache = cache or get_analysis_cache()
     
     async def analyze_category_thumbnails(
         self,
@@ -179,17 +195,21 @@ class ThumbnailVisionAnalyzer:
         category_name: str,
         thumbnails: List[ThumbnailData],
         thumbnail_images: List[bytes],
+        run: Optional[AnalysisRun] = None,
     ) -> CategoryThumbnailInsight:
         """
         Analyze all thumbnails for a category and generate insights.
         
         V2: Makes individual Gemini calls per thumbnail, then aggregates.
+        Thumbnails whose cached analysis still matches the image, and
+        near-duplicates of images already analyzed in this run, skip the call.
         
         Args:
             category_key: Internal category identifier
             category_name: Display name for category
             thumbnails: List of ThumbnailData with metadata
             thumbnail_images: List of image bytes (same order as thumbnails)
+            run: Daily run state shared across categories (a fresh one if omitted)
             
         Returns:
             CategoryThumbnailInsight with analysis and recommendations
@@ -201,14 +221,20 @@ class ThumbnailVisionAnalyzer:
             # Step 1: Analyze each thumbnail individually (concurrent with rate limiting)
             logger.info(f"Analyzing {len(thumbnails)} thumbnails individually for {category_key}...")
             
+            run = run or AnalysisRun()
+            cached = await self.cache.get_many([
+                thumb.video_id for thumb, img_bytes in zip(thumbnails, thumbnail_images) if img_bytes
+            ])
+            
             tasks = []
             for i, (thumb, img_bytes) in enumerate(zip(thumbnails, thumbnail_images)):
                 if img_bytes:
-                    tasks.append(self._analyze_single_thumbnail(
+                    tasks.append(self._analyze_with_reuse(
                         thumb=thumb,
                         img_bytes=img_bytes,
-                        category_name=category_name,
                         index=i + 1,
+                        run=run,
+                        cached=cached.get(thumb.video_id),
                     ))
                 else:
                     # No image - create fallback analysis
@@ -253,11 +279,70 @@ class ThumbnailVisionAnalyzer:
             logger.error(f"Vision analysis failed for {category_key}: {e}")
             return self._fallback_insight(category_key, category_name, thumbnails)
     
+    async def _analyze_with_reuse(
+        self,
+        thumb: ThumbnailData,
+        img_bytes: bytes,
+        index: int,
+        run: AnalysisRun,
+        cached: Optional[Tuple[int, Dict[str, Any]]],
+    ) -> ThumbnailAnalysis:
+        """
+        Analyze a thumbnail, reusing its cached or a duplicate's analysis.
+        
+        Reused analyses keep their vision fields and take this video's
+        metadata (title, views, channel). The prompt sees only the image,
+        so the image hash covers every input to the analysis.
+        """
+        phash = await run_cpu_bound(perceptual_hash, img_bytes)
+        
+        if phash is not None and cached and hash_distance(phash, cached[0]) <= PHASH_REUSE_DISTANCE:
+            try:
+                analysis = ThumbnailAnalysis(**cached[1])
+                run.cache_hits += 1
+                return self._rebind_analysis(analysis, thumb)
+            except TypeError:
+                pass  # Cached under an older schema; analyze again
+        
+        if phash is not None:
+            duplicate = run.find_duplicate(phash)
+            if duplicate is not None:
+                run.dedup_hits += 1
+                return self._rebind_analysis(await asyncio.shield(duplicate), thumb)
+        
+        run.gemini_calls += 1
+        call = asyncio.ensure_future(self._analyze_single_thumbnail(
+            thumb=thumb,
+            img_bytes=img_bytes,
+            index=index,
+        ))
+        if phash is not None:
+            run.register(phash, call)
+        analysis = await call
+        
+        if analysis.layout_recipe == FALLBACK_RECIPE:
+            run.failures += 1
+        elif phash is not None:
+            await self.cache.put(thumb.video_id, phash, analysis)
+        return analysis
+    
+    def _rebind_analysis(self, analysis: ThumbnailAnalysis, thumb: ThumbnailData) -> ThumbnailAnalysis:
+        """Copy of an analysis carrying another video's metadata."""
+        return replace(
+            analysis,
+            video_id=thumb.video_id,
+            title=thumb.title,
+            thumbnail_url=thumb.thumbnail_url_hq,
+            view_count=thumb.view_count,
+            hashtags=extract_hashtags(thumb.title),
+            channel_name=thumb.channel_title,
+            published_at=thumb.published_at.isoformat() if thumb.published_at else None,
+        )
+    
     async def _analyze_single_thumbnail(
         self,
         thumb: ThumbnailData,
         img_bytes: bytes,
-        category_name: str,
         index: int,
     ) -> ThumbnailAnalysis:
         """
@@ -268,7 +353,7 @@ class ThumbnailVisionAnalyzer:
         """
         async with self._semaphore:
             try:
-                prompt = self._build_single_thumbnail_prompt(thumb, category_name)
+                prompt = self._build_single_thumbnail_prompt()
                 
                 contents = [
                     types.Part.from_text(text=prompt),
@@ -316,11 +401,13 @@ class ThumbnailVisionAnalyzer:
                     },
                 )
                 
-                response = await self._client.aio.models.generate_content(
-                    model=self.model_name,
-                    contents=contents,
-                    config=config,
-                )
+                # Batch work: queued behind interactive generations for the shared quota
+                async with get_gemini_admission().slot(self.model_name, PRIORITY_BATCH):
+                    response = await self._client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=contents,
+                        config=config,
+                    )
                 
                 # Parse the structured JSON response
                 analysis = self._parse_single_thumbnail_response(response.text, thumb)
@@ -336,19 +423,18 @@ class ThumbnailVisionAnalyzer:
                 logger.warning(f"Failed to analyze thumbnail {index}: {e}")
                 return self._create_fallback_analysis_sync(thumb)
     
-    def _build_single_thumbnail_prompt(
-        self,
-        thumb: ThumbnailData,
-        category_name: str,
-    ) -> str:
-        """Build prompt for analyzing a single thumbnail."""
-        return f"""You are a YouTube thumbnail design expert. Analyze this {category_name} gaming thumbnail.
-
-Video: "{thumb.title}" by {thumb.channel_title} ({thumb.view_count:,} views)
+    def _build_single_thumbnail_prompt(self) -> str:
+        """
+        Build prompt for analyzing a single thumbnail.
+        
+        Category and video metadata are left out: analyses are cached and
+        shared by image hash, across videos and categories.
+        """
+        return """You are a YouTube thumbnail design expert. Analyze this gaming thumbnail.
 
 Provide a detailed JSON analysis:
 
-{{
+{
   "layout_type": "face-left-text-right|centered-character|split-screen|action-scene|item-focus|text-dominant",
   "text_placement": "top-left|top-center|top-right|bottom-left|bottom-center|bottom-right|none",
   "focal_point": "character-face|action-scene|game-item|text|multiple",
@@ -361,17 +447,17 @@ Provide a detailed JSON analysis:
   "has_border": false,
   "has_glow_effects": true,
   "has_arrows_circles": false,
-  "face_details": {{
+  "face_details": {
     "expression": "shocked|excited|smiling|serious|screaming|neutral|null",
     "position": "left-third|center|right-third|null",
     "size": "large|medium|small|null",
     "looking_direction": "camera|left|right|up|down|null"
-  }},
+  },
   "layout_recipe": "Step-by-step how to recreate this layout (max 100 chars)",
   "color_recipe": "How to recreate this color scheme (max 100 chars)",
   "why_it_works": "Why this thumbnail is effective (max 150 chars)",
   "difficulty": "easy|medium|hard"
-}}
+}
 
 Rules:
 - Be specific about colors (use actual hex codes you see)
@@ -478,8 +564,8 @@ Rules:
             has_border=False,
             has_glow_effects=False,
             has_arrows_circles=False,
-            layout_recipe="Analysis unavailable",
-            color_recipe="Analysis unavailable",
+            layout_recipe=FALLBACK_RECIPE,
+            color_recipe=FALLBACK_RECIPE,
             why_it_works="High view count indicates effective design",
             difficulty="medium",
             text_content=None,
@@ -25,6 +25,7 @@ from .vision_analyzer import (
     ThumbnailAnalysis,
     get_vision_analyzer,
 )
+from .analysis_cache import AnalysisRun
 from .collector import ThumbnailData
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,7 @@ class ProvenanceThumbnailVisionAnalyzer:
         thumbnails: List[ThumbnailData],
         thumbnail_images: List[bytes],
         execution_id: str,
+        run: Optional[AnalysisRun] = None,
     ) -> CategoryThumbnailInsight:
         """
         Analyze thumbnails with full provenance capture.
@@ -66,6 +68,7 @@ class ProvenanceThumbnailVisionAnalyzer:
             category_name=category_name,
             thumbnails=thumbnails,
             thumbnail_images=thumbnail_images,
+            run=run,
         )
         
         # Capture provenance for the category analysis
@@ -29,6 +29,8 @@ from typing import List, Dict, Any, Optional, Tuple, Set
 from datetime import datetime, timedelta
 
 import redis.asyncio as redis
+
+from backend.database.redis_pool import get_async_redis
 import os
 
 logger = logging.getLogger(__name__)
@@ -396,13 +398,11 @@ class TitleIntelAnalyzer:
     
     async def _get_redis(self) -> redis.Redis:
         if self._redis is None:
-            self._redis = redis.from_url(REDIS_URL, decode_responses=True)
+            self._redis = get_async_redis("intel")
         return self._redis
     
     async def close(self):
-        if self._redis:
-            await self._redis.aclose()
-            self._redis = None
+        self._redis = None
     
     async def analyze_game(self, game_key: str) -> Optional[GameTitleIntel]:
         """Analyze title patterns for a specific game with enterprise-grade metrics."""
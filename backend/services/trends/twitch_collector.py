@@ -21,6 +21,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Literal
@@ -28,6 +29,8 @@ from typing import Optional, List, Literal
 import httpx
 import redis.asyncio as redis
 
+from backend.database.redis_pool import get_async_redis
+
 from backend.services.distributed_lock import DistributedLock
 from backend.services.exceptions import StreamerStudioError
 
@@ -182,6 +185,104 @@ class TwitchClip:
     duration: float
 
 
+# =============================================================================
+# Helix Rate Budget
+# =============================================================================
+
+
+class HelixRateBudget:
+    """
+    Shared request budget for the Twitch Helix API.
+    
+    Combines a token bucket (Helix app tokens get 800 points per minute)
+    with a cap on in-flight requests, so callers can fan out concurrently
+    (e.g. Clip Radar polling every category at once) without tripping 429s.
+    The bucket is re-synced from the ``Ratelimit-Remaining`` and
+    ``Ratelimit-Reset`` headers Twitch returns on every response.
+    
+    Usage:
+        async with budget:
+            response = await client.get(...)
+        budget.update_from_headers(response.headers)
+    """
+    
+    def __init__(
+        self,
+        points_per_minute: int = 800,
+        max_concurrency: int = 8,
+    ):
+        self.capacity = float(points_per_minute)
+        self.refill_per_second = points_per_minute / 60.0
+        self.max_concurrency = max_concurrency
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _bind_loop(self) -> None:
+        """(Re)create asyncio primitives for the running loop.
+        
+        Workers call ``asyncio.run`` once per cycle while the collector is a
+        process singleton, so primitives must not outlive their loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+    
+    @property
+    def available(self) -> float:
+        """Points currently available (after refill)."""
+        self._refill()
+        return self._tokens
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._last_refill = now
+    
+    async def acquire(self, points: int = 1) -> None:
+        """Wait until ``points`` are available, then consume them."""
+        self._bind_loop()
+        async with self._lock:
+            self._refill()
+            if self._tokens < points:
+                wait = (points - self._tokens) / self.refill_per_second
+                logger.debug(f"Helix rate budget exhausted, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= points
+    
+    def update_from_headers(self, headers) -> None:
+        """Clamp the local bucket to the server-reported remaining points."""
+        remaining = headers.get("Ratelimit-Remaining") if headers else None
+        if remaining is None:
+            return
+        try:
+            remaining_points = float(remaining)
+        except (TypeError, ValueError):
+            return
+        self._refill()
+        self._tokens = min(self._tokens, remaining_points)
+    
+    async def __aenter__(self) -> "HelixRateBudget":
+        self._bind_loop()
+        await self._semaphore.acquire()
+        try:
+            await self.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+
 # =============================================================================
 # Twitch Collector Service
 # =============================================================================
@@ -233,14 +334,14 @@ class TwitchCollector:
         Args:
             client_id: Twitch application client ID (defaults to env var)
             client_secret: Twitch application client secret (defaults to env var)
-            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+            redis_url: Dedicated Redis connection URL (defaults to the shared pool)
             
         Raises:
             TwitchConfigError: If required credentials are not provided
         """
         self.client_id = client_id or os.getenv("TWITCH_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("TWITCH_CLIENT_SECRET")
-        self._redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
+        self._redis_url = redis_url
         
         # Validate configuration
         if not self.client_id:
@@ -254,6 +355,9 @@ class TwitchCollector:
         # Distributed lock for token refresh
         self._lock = DistributedLock(redis_url=self._redis_url)
         
+        # Shared Helix budget for every request made through this collector
+        self.rate_budget = HelixRateBudget()
+        
         logger.info("TwitchCollector initialized with Redis token caching")
     
     # =========================================================================
@@ -261,9 +365,12 @@ class TwitchCollector:
     # =========================================================================
     
     async def _get_redis_client(self) -> redis.Redis:
-        """Get or create Redis client for token caching."""
+        """Get Redis client for token caching (shared pool by default)."""
         if self._redis_client is None:
-            self._redis_client = redis.from_url(self._redis_url, decode_responses=True)
+            if self._redis_url:
+                self._redis_client = redis.from_url(self._redis_url, decode_responses=True)
+            else:
+                self._redis_client = get_async_redis("default")
         return self._redis_client
     
     # =========================================================================
@@ -463,12 +570,14 @@ class TwitchCollector:
         
         async with httpx.AsyncClient() as client:
             try:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=self._get_headers(access_token),
-                    timeout=30.0,
-                )
+                async with self.rate_budget:
+                    response = await client.get(
+                        url,
+                        params=params,
+                        headers=self._get_headers(access_token),
+                        timeout=30.0,
+                    )
+                self.rate_budget.update_from_headers(response.headers)
                 
                 # Handle rate limiting
                 if response.status_code == 429:
@@ -960,6 +1069,7 @@ __all__ = [
     # Main class
     "TwitchCollector",
     "get_twitch_collector",
+    "HelixRateBudget",
     # Data classes
     "TwitchAccessToken",
     "TwitchStream",
@@ -355,19 +355,19 @@ class YouTubeCollector:
         logger.info(f"Fetched stats for {len(all_videos)} videos")
         return all_videos
     
-    async def search_videos(
+    async def search_video_ids(
         self,
         query: str,
         category: Optional[TrendCategory] = None,
         max_results: int = 20,
         order: str = "date",
         published_after: Optional[datetime] = None,
-    ) -> List[YouTubeVideoResponse]:
+    ) -> List[str]:
         """
-        Search for videos matching a query.
+        Search for video IDs matching a query, without fetching their stats.
         
-        Uses the YouTube search.list endpoint to find videos.
-        Note: Search costs 100 quota units per call.
+        Costs 100 quota units. Callers that search several queries can merge
+        the returned IDs into shared fetch_video_stats batches of 50.
         
         Args:
             query: Search query string
@@ -377,20 +377,11 @@ class YouTubeCollector:
             published_after: Only return videos published after this datetime (default: 7 days ago)
         
         Returns:
-            List of YouTubeVideoResponse objects matching the search query.
-            Note: Search results have limited statistics; use fetch_video_stats
-            for complete data.
+            Video IDs in search result order.
         
         Raises:
             YouTubeAPIError: If API request fails
             YouTubeQuotaExceededError: If daily quota is exceeded
-        
-        Example:
-            results = await collector.search_videos("minecraft tutorial", category="gaming")
-            
-            # Get full stats for search results
-            video_ids = [v.video_id for v in results]
-            full_stats = await collector.fetch_video_stats(video_ids)
         """
         from datetime import timedelta
         
@@ -432,34 +423,81 @@ class YouTubeCollector:
             
             data = response.json()
             
-            # Search results have different structure - extract video IDs
-            video_ids = []
-            for item in data.get("items", []):
-                video_id = item.get("id", {}).get("videoId")
-                if video_id:
-                    video_ids.append(video_id)
-            
-            if not video_ids:
-                logger.info(f"No videos found for query: {query}")
-                return []
-            
-            # Fetch full video details with statistics
-            videos = await self.fetch_video_stats(video_ids)
-            
-            # Add category to results if specified
-            if category:
-                for video in videos:
-                    video.category = category
-            
-            logger.info(f"Found {len(videos)} videos for query: {query}")
-            return videos
-            
         except httpx.TimeoutException as e:
             logger.error(f"YouTube API timeout during search: {e}")
             raise YouTubeAPIError(f"Request timed out: {e}") from e
         except httpx.RequestError as e:
             logger.error(f"YouTube API request error during search: {e}")
             raise YouTubeAPIError(f"Request failed: {e}") from e
+        
+        # Search results have different structure - extract video IDs
+        video_ids = []
+        for item in data.get("items", []):
+            video_id = item.get("id", {}).get("videoId")
+            if video_id:
+                video_ids.append(video_id)
+        
+        if not video_ids:
+            logger.info(f"No videos found for query: {query}")
+        return video_ids
+    
+    async def search_videos(
+        self,
+        query: str,
+        category: Optional[TrendCategory] = None,
+        max_results: int = 20,
+        order: str = "date",
+        published_after: Optional[datetime] = None,
+    ) -> List[YouTubeVideoResponse]:
+        """
+        Search for videos matching a query.
+        
+        Uses the YouTube search.list endpoint to find videos.
+        Note: Search costs 100 quota units per call.
+        
+        Args:
+            query: Search query string
+            category: Optional category filter ("gaming", "entertainment", "music", "education")
+            max_results: Maximum number of results (1-50, default: 20)
+            order: Sort order - "date" (newest), "viewCount", "relevance", "rating" (default: "date")
+            published_after: Only return videos published after this datetime (default: 7 days ago)
+        
+        Returns:
+            List of YouTubeVideoResponse objects matching the search query.
+            Note: Search results have limited statistics; use fetch_video_stats
+            for complete data.
+        
+        Raises:
+            YouTubeAPIError: If API request fails
+            YouTubeQuotaExceededError: If daily quota is exceeded
+        
+        Example:
+            results = await collector.search_videos("minecraft tutorial", category="gaming")
+            
+            # Get full stats for search results
+            video_ids = [v.video_id for v in results]
+            full_stats = await collector.fetch_video_stats(video_ids)
+        """
+        video_ids = await self.search_video_ids(
+            query,
+            category=category,
+            max_results=max_results,
+            order=order,
+            published_after=published_after,
+        )
+        if not video_ids:
+            return []
+        
+        # Fetch full video details with statistics
+        videos = await self.fetch_video_stats(video_ids)
+        
+        # Add category to results if specified
+        if category:
+            for video in videos:
+                video.category = category
+        
+        logger.info(f"Found {len(videos)} videos for query: {query}")
+        return videos
     
     # ========================================================================
     # Helper Methods
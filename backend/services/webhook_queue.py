@@ -281,15 +281,9 @@ def get_webhook_queue() -> WebhookQueueService:
     global _webhook_queue
     
     if _webhook_queue is None:
-        from backend.api.config import get_settings
-        settings = get_settings()
+        from backend.database.redis_pool import get_sync_redis
         
-        redis_client = redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-        )
-        
-        _webhook_queue = WebhookQueueService(redis_client)
+        _webhook_queue = WebhookQueueService(get_sync_redis("default"))
     
     return _webhook_queue
 
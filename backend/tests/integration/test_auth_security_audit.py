@@ -1018,20 +1018,12 @@ class TestSecurityHeaders:
         AUDIT: Security headers should be applied to all responses.
         """
         from backend.api.middleware.security_headers import SecurityHeadersMiddleware
-        from starlette.requests import Request
         from starlette.responses import Response
-        from unittest.mock import MagicMock, AsyncMock
+        from starlette.testclient import TestClient
         
-        middleware = SecurityHeadersMiddleware(app=MagicMock())
+        middleware = SecurityHeadersMiddleware(app=Response(content="test"))
         
-        # Create mock request and response
-        mock_request = MagicMock(spec=Request)
-        mock_response = Response(content="test")
-        
-        async def mock_call_next(request):
-            return mock_response
-        
-        response = await middleware.dispatch(mock_request, mock_call_next)
+        response = TestClient(middleware).get("/")
         
         # Check required security headers
         required_headers = [
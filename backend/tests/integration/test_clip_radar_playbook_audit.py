@@ -23,6 +23,20 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
+def _async_redis_mock():
+    """Create a mock of the shared async Redis client."""
+    redis = AsyncMock()
+    redis.get.return_value = None
+    redis.zrevrange.return_value = []
+    redis.hkeys.return_value = []
+    # pipeline() and register_script() are synchronous on redis.asyncio
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[None, None]))
+    return redis
+
+
 # =============================================================================
 # SECTION 1: CLIP RADAR SILENT FAILURE TESTS
 # =============================================================================
@@ -33,17 +47,7 @@ class TestClipRadarSilentFailures:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        redis = MagicMock()
-        redis.hget.return_value = None
-        redis.hset.return_value = True
-        redis.set.return_value = True
-        redis.get.return_value = None
-        redis.delete.return_value = True
-        redis.zadd.return_value = True
-        redis.zrevrange.return_value = []
-        redis.setex.return_value = True
-        redis.scan_iter.return_value = iter([])
-        return redis
+        return _async_redis_mock()
     
     @pytest.fixture
     def mock_twitch_collector(self):
@@ -316,7 +320,7 @@ class TestDataIntegrity:
         from backend.services.clip_radar.recap_service import ClipRadarRecapService
         
         # Create mock Redis with test data
-        mock_redis = MagicMock()
+        mock_redis = _async_redis_mock()
         mock_supabase = MagicMock()
         
         # Simulate Redis data
@@ -351,10 +355,11 @@ class TestDataIntegrity:
             ]
         }
         
-        mock_redis.get.side_effect = lambda key: {
+        redis_data = {
             f"clip_radar:daily_stats:{test_date}": json.dumps(redis_stats),
             f"clip_radar:daily_clips:{test_date}": json.dumps(redis_clips),
-        }.get(key)
+        }
+        mock_redis.mget.side_effect = lambda *keys: [redis_data.get(k) for k in keys]
         
         # Track what gets inserted
         inserted_data = {}
@@ -393,13 +398,13 @@ class TestDataIntegrity:
         from backend.services.clip_radar.recap_service import ClipRadarRecapService
         from backend.services.clip_radar.constants import TRACKED_CATEGORIES
         
-        mock_redis = MagicMock()
+        mock_redis = _async_redis_mock()
         mock_supabase = MagicMock()
         
         test_date = "2025-01-01"
         
         # Main stats exist
-        mock_redis.get.side_effect = lambda key: {
+        redis_data = {
             f"clip_radar:daily_stats:{test_date}": json.dumps({
                 "date": test_date,
                 "polls_count": 10,
@@ -409,7 +414,8 @@ class TestDataIntegrity:
                 "peak_velocity": 10.0,
             }),
             f"clip_radar:daily_clips:{test_date}": json.dumps({"clips": []}),
-        }.get(key)
+        }
+        mock_redis.mget.side_effect = lambda *keys: [redis_data.get(k) for k in keys]
         
         # Track category upsert failures
         category_upsert_calls = []
@@ -585,11 +591,7 @@ class TestEdgeCases:
         """
         from backend.services.clip_radar.service import ClipRadarService
         
-        mock_redis = MagicMock()
-        mock_redis.hget.return_value = None
-        mock_redis.set.return_value = True
-        mock_redis.delete.return_value = True
-        mock_redis.zadd.return_value = True
+        mock_redis = _async_redis_mock()
         
         mock_twitch = AsyncMock()
         mock_twitch.fetch_clips.return_value = []  # No clips
@@ -563,7 +563,7 @@ class TestAggregationDataIntegrity:
         from backend.services.intel.aggregation.hourly import HourlyAggregator
         
         # Redis returns None for all games
-        mock_redis.get.return_value = None
+        mock_redis.mget.side_effect = lambda *keys: [None] * len(keys)
         
         aggregator = HourlyAggregator(mock_redis, mock_supabase)
         
@@ -587,7 +587,9 @@ class TestAggregationDataIntegrity:
         from backend.services.intel.aggregation.hourly import HourlyAggregator
         
         # Return malformed JSON
-        mock_redis.get.return_value = "not valid json {"
+        mock_redis.mget.side_effect = lambda *keys: [
+            "not valid json {" if k.startswith("youtube:games:") else None for k in keys
+        ]
         
         aggregator = HourlyAggregator(mock_redis, mock_supabase)
         
@@ -612,11 +614,14 @@ class TestAggregationDataIntegrity:
         from backend.services.intel.aggregation.hourly import HourlyAggregator
         
         # Return valid Redis data
-        mock_redis.get.return_value = json.dumps({
+        youtube_data = json.dumps({
             "videos": [
                 {"video_id": "v1", "view_count": 1000, "engagement_rate": 0.05}
             ]
         })
+        mock_redis.mget.side_effect = lambda *keys: [
+            youtube_data if k.startswith("youtube:games:") else None for k in keys
+        ]
         
         # Make DB fail
         mock_supabase.table.return_value.upsert.return_value.execute.side_effect = Exception(
@@ -0,0 +1,199 @@
+"""
+Unit tests for the alert relay service.
+
+Tests the pod-local subscriber registry, Redis fan-out and presence,
+bounded drop-oldest buffers and the keepalive timer wheel. No live Redis
+server is required.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.services.alert_relay_service import (
+    RELAY_CHANNEL,
+    WHEEL_SLOTS,
+    AlertRelayService,
+    RelaySubscriber,
+)
+
+
+@pytest.fixture
+def mock_redis():
+    redis = AsyncMock()
+    redis.zrangebyscore.return_value = []
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis
+
+
+@pytest.fixture
+def relay(mock_redis, monkeypatch):
+    """Relay with background tasks disabled; tests drive routing and ticks."""
+    monkeypatch.setattr(AlertRelayService, "_ensure_started", lambda self: None)
+    service = AlertRelayService(redis_client=mock_redis, node_id="node-a", queue_size=3)
+    service._subscribed.set()
+    return service
+
+
+class TestRelaySubscriber:
+    """Tests for the bounded per-connection buffer."""
+
+    @pytest.mark.asyncio
+    async def test_drops_oldest_when_full(self):
+        subscriber = RelaySubscriber("alert-1", max_size=2)
+        for i in range(3):
+            subscriber.put_nowait({"n": i})
+
+        assert subscriber.dropped == 1
+        assert (await subscriber.get())["n"] == 1
+        assert (await subscriber.get())["n"] == 2
+
+    @pytest.mark.asyncio
+    async def test_pings_do_not_evict_triggers(self):
+        subscriber = RelaySubscriber("alert-1", max_size=2)
+        subscriber.put_nowait({"type": "trigger", "n": 0})
+        subscriber.put_nowait({"type": "trigger", "n": 1})
+        for i in range(5):
+            subscriber.put_nowait({"type": "ping", "n": i})
+
+        assert subscriber.dropped == 0
+        assert subscriber.qsize() == 3
+        assert [(await subscriber.get())["n"] for _ in range(3)] == [0, 1, 4]
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_event(self):
+        subscriber = RelaySubscriber("alert-1")
+        waiter = asyncio.create_task(subscriber.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        subscriber.put_nowait({"type": "trigger"})
+
+        assert (await asyncio.wait_for(waiter, 1))["type"] == "trigger"
+
+
+class TestLocalRegistry:
+    """Tests for many subscribers per alert on one pod."""
+
+    @pytest.mark.asyncio
+    async def test_reconnect_does_not_replace_existing_stream(self, relay, mock_redis):
+        first = await relay.connect("alert-1")
+        second = await relay.connect("alert-1")
+
+        assert relay.get_connection_count() == 2
+        mock_redis.sadd.assert_awaited_once_with("alert_relay:node:node-a", "alert-1")
+
+        await relay.disconnect(first)
+        assert relay.is_connected_locally("alert-1")
+        mock_redis.srem.assert_not_awaited()
+
+        await relay.disconnect(second)
+        assert not relay.is_connected_locally("alert-1")
+        mock_redis.srem.assert_awaited_once_with("alert_relay:node:node-a", "alert-1")
+
+    @pytest.mark.asyncio
+    async def test_routed_event_reaches_every_local_stream(self, relay):
+        first = await relay.connect("alert-1")
+        second = await relay.connect("alert-1")
+        other = await relay.connect("alert-2")
+
+        relay._route(json.dumps({"type": "trigger", "alertId": "alert-1"}))
+
+        assert first.qsize() == 1
+        assert second.qsize() == 1
+        assert other.qsize() == 0
+
+
+class TestTrigger:
+    """Tests for cross-pod trigger delivery."""
+
+    @pytest.mark.asyncio
+    async def test_trigger_publishes_once_for_local_connection(self, relay, mock_redis):
+        await relay.connect("alert-1")
+
+        assert await relay.trigger("alert-1", "test")
+
+        channel, message = mock_redis.publish.await_args.args
+        assert channel == RELAY_CHANNEL
+        assert json.loads(message)["type"] == "test"
+        mock_redis.zrangebyscore.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_trigger_reaches_alert_on_another_pod(self, relay, mock_redis):
+        mock_redis.zrangebyscore.return_value = ["node-a", "node-b"]
+        mock_redis.pipeline.return_value.execute.return_value = [True]
+
+        assert await relay.trigger("alert-9")
+
+        mock_redis.pipeline.return_value.sismember.assert_called_once_with(
+            "alert_relay:node:node-b", "alert-9"
+        )
+        mock_redis.publish.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_trigger_without_any_connection(self, relay, mock_redis):
+        assert not await relay.trigger("alert-9")
+        mock_redis.publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_falls_back_to_local_delivery(self, relay, mock_redis):
+        subscriber = await relay.connect("alert-1")
+        mock_redis.publish.side_effect = ConnectionError("redis down")
+
+        assert await relay.trigger("alert-1")
+        assert (await subscriber.get())["alertId"] == "alert-1"
+
+
+class TestKeepaliveWheel:
+    """Tests for the timer-wheel keepalive."""
+
+    @pytest.mark.asyncio
+    async def test_each_stream_pinged_once_per_rotation(self, relay):
+        subscribers = [await relay.connect(f"alert-{i}") for i in range(5)]
+
+        pinged = sum(relay._tick() for _ in range(WHEEL_SLOTS))
+
+        assert pinged == 5
+        assert all(s.qsize() == 1 for s in subscribers)
+
+    @pytest.mark.asyncio
+    async def test_first_ping_waits_a_full_interval(self, relay):
+        subscriber = await relay.connect("alert-1")
+
+        for _ in range(WHEEL_SLOTS - 1):
+            relay._tick()
+        assert subscriber.qsize() == 0
+
+        relay._tick()
+        assert (await subscriber.get())["type"] == "ping"
+
+    @pytest.mark.asyncio
+    async def test_disconnect_removes_from_wheel(self, relay):
+        subscriber = await relay.connect("alert-1")
+        await relay.disconnect(subscriber)
+
+        assert sum(relay._tick() for _ in range(WHEEL_SLOTS)) == 0
+
+
+class TestEventGenerator:
+    """Tests for the SSE event stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_events_and_disconnects(self, relay):
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+
+        stream = relay.event_generator("alert-1", request)
+        first = asyncio.create_task(stream.__anext__())
+        await asyncio.sleep(0)
+        relay._route(json.dumps({"type": "trigger", "alertId": "alert-1"}))
+
+        event = await asyncio.wait_for(first, 1)
+        await stream.aclose()
+
+        assert event["event"] == "trigger"
+        assert relay.get_connection_count() == 0
@@ -0,0 +1,184 @@
+"""
+Unit tests for the pure-ASGI middleware stack.
+
+Tests the shared request context, streaming-aware compression, and the
+rate limiter's single token decode, driving each middleware through a
+small Starlette app so responses flow through real ASGI messages.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from backend.api.middleware import api_rate_limit
+from backend.api.middleware.api_rate_limit import APIRateLimitMiddleware
+from backend.api.middleware.compression import CompressionMiddleware
+from backend.api.middleware.request_context import (
+    RequestContextMiddleware,
+    get_request_context,
+    resolve_principal,
+)
+from backend.api.middleware.security_headers import SecurityHeadersMiddleware
+
+
+async def _whoami(request: Request) -> JSONResponse:
+    ctx = get_request_context(request)
+    return JSONResponse({
+        "request_id": request.state.request_id,
+        "ctx_request_id": ctx.request_id,
+        "user_id": ctx.user_id,
+    })
+
+
+async def _large(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("a" * 5000)
+
+
+async def _events(request: Request) -> StreamingResponse:
+    async def stream():
+        for i in range(3):
+            yield f"data: {'x' * 600}{i}\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+def _client(*middleware) -> TestClient:
+    app = Starlette(routes=[
+        Route("/api/v1/whoami", _whoami),
+        Route("/api/v1/large", _large),
+        Route("/api/v1/events", _events),
+    ])
+    for cls, kwargs in middleware:
+        app.add_middleware(cls, **kwargs)
+    return TestClient(app)
+
+
+class TestRequestContext:
+    """Tests for the shared per-request context."""
+
+    def test_request_id_echoed_and_mirrored_to_state(self):
+        client = _client((RequestContextMiddleware, {}))
+
+        response = client.get("/api/v1/whoami", headers={"X-Request-ID": "req-123"})
+
+        assert response.headers["X-Request-ID"] == "req-123"
+        assert response.json()["request_id"] == "req-123"
+        assert response.json()["ctx_request_id"] == "req-123"
+
+    def test_request_id_generated_when_missing(self):
+        client = _client((RequestContextMiddleware, {}))
+
+        response = client.get("/api/v1/whoami")
+
+        assert response.headers["X-Request-ID"] == response.json()["request_id"]
+        assert len(response.headers["X-Request-ID"]) == 36
+
+    def test_context_created_once_per_request(self):
+        scope = {"type": "http", "headers": [(b"x-request-id", b"abc")]}
+
+        first = get_request_context(scope)
+
+        assert get_request_context(scope) is first
+        assert scope["state"]["request_id"] == "abc"
+
+    def test_principal_decoded_once(self):
+        scope = {"type": "http", "headers": [(b"authorization", b"Bearer token")]}
+        calls = []
+
+        def decode(token):
+            calls.append(token)
+            return {"user_id": "user-1", "tier": "pro"}
+
+        resolve_principal(scope, decode)
+        ctx = resolve_principal(scope, decode)
+
+        assert calls == ["token"]
+        assert (ctx.user_id, ctx.tier) == ("user-1", "pro")
+
+
+class TestCompressionMiddleware:
+    """Tests for streaming-aware gzip compression."""
+
+    def test_large_response_is_compressed(self):
+        client = _client((CompressionMiddleware, {"minimum_size": 1000}))
+
+        response = client.get("/api/v1/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert response.text == "a" * 5000
+
+    def test_event_stream_is_not_compressed(self):
+        client = _client((CompressionMiddleware, {"minimum_size": 100}))
+
+        response = client.get("/api/v1/events", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.text.count("data: ") == 3
+
+    def test_small_response_is_not_compressed(self):
+        client = _client((CompressionMiddleware, {"minimum_size": 1000}))
+
+        response = client.get("/api/v1/whoami", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+
+    def test_streamed_body_compresses_incrementally(self):
+        """Non-excluded streams drop Content-Length and stay valid gzip."""
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200,
+                        "headers": [(b"content-type", b"text/plain"), (b"content-length", b"2000")]})
+            await send({"type": "http.response.body", "body": b"a" * 1000, "more_body": True})
+            await send({"type": "http.response.body", "body": b"b" * 1000})
+
+        response = TestClient(CompressionMiddleware(app, minimum_size=10)).get(
+            "/", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.content == b"a" * 1000 + b"b" * 1000
+
+
+class TestRateLimitMiddleware:
+    """Tests for the pure-ASGI API rate limiter."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        with patch.object(api_rate_limit, "RATE_LIMITING_ENABLED", True):
+            api_rate_limit.get_rate_limit_store().clear_all()
+            yield
+            api_rate_limit.get_rate_limit_store().clear_all()
+
+    def test_decoded_principal_shared_with_route(self):
+        client = _client((APIRateLimitMiddleware, {}), (RequestContextMiddleware, {}))
+
+        with patch.object(
+            api_rate_limit, "_decode_jwt_for_rate_limit",
+            return_value={"user_id": "user-7", "tier": "pro"},
+        ) as decode:
+            response = client.get("/api/v1/whoami", headers={"Authorization": "Bearer t"})
+
+        decode.assert_called_once_with("t")
+        assert response.json()["user_id"] == "user-7"
+        assert response.headers["X-RateLimit-Limit"] == str(api_rate_limit.API_RATE_LIMITS["pro"])
+
+    def test_limit_exceeded_returns_429_with_outer_headers(self):
+        client = _client(
+            (APIRateLimitMiddleware, {}),
+            (SecurityHeadersMiddleware, {}),
+            (RequestContextMiddleware, {}),
+        )
+
+        with patch.dict(api_rate_limit.API_RATE_LIMITS, {"anonymous": 1}):
+            assert client.get("/api/v1/whoami").status_code == 200
+            response = client.get("/api/v1/whoami", headers={"X-Request-ID": "rl-1"})
+
+        assert response.status_code == 429
+        assert response.json()["error"]["code"] == "API_RATE_LIMIT_EXCEEDED"
+        assert response.headers["X-Request-ID"] == "rl-1"
+        assert response.headers["X-Frame-Options"] == "DENY"
@@ -30,7 +30,9 @@ class TestSecurityModeStrict:
         """Create mock password service."""
         mock = MagicMock()
         mock.hash_password.return_value = "hashed_password"
+        mock.hash_password_async = AsyncMock(return_value="hashed_password")
         mock.verify_password.return_value = True
+        mock.verify_password_async = AsyncMock(return_value=True)
         mock.validate_password_strength.return_value = MagicMock(is_valid=True)
         return mock
     
@@ -178,7 +180,9 @@ class TestSecurityModePermissive:
     def mock_password_service(self):
         mock = MagicMock()
         mock.hash_password.return_value = "hashed_password"
+        mock.hash_password_async = AsyncMock(return_value="hashed_password")
         mock.verify_password.return_value = True
+        mock.verify_password_async = AsyncMock(return_value=True)
         mock.validate_password_strength.return_value = MagicMock(is_valid=True)
         return mock
     
@@ -327,7 +331,9 @@ class TestSecurityModeConfiguration:
         """Create mock password service."""
         mock = MagicMock()
         mock.hash_password.return_value = "hashed"
+        mock.hash_password_async = AsyncMock(return_value="hashed")
         mock.verify_password.return_value = True
+        mock.verify_password_async = AsyncMock(return_value=True)
         mock.validate_password_strength.return_value = MagicMock(is_valid=True)
         return mock
     
@@ -378,6 +384,7 @@ class TestPasswordChangeOrder:
     def mock_password_service(self):
         mock = MagicMock()
         mock.hash_password.return_value = "new_hash"
+        mock.hash_password_async = AsyncMock(return_value="new_hash")
         mock.validate_password_strength.return_value = MagicMock(is_valid=True)
         return mock
     
@@ -0,0 +1,176 @@
+"""
+Unit tests for the request-scoped batch loaders.
+
+Tests tick coalescing, per-request caching and error propagation in
+BatchLoader, request scoping, and that spotlight creators and user search
+cost a fixed number of queries however many rows they show.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.batch_loader import (
+    BatchLoader,
+    get_request_loaders,
+    loader_scope,
+    relationship_key,
+)
+from backend.services.community_feed_service import CommunityFeedService
+from backend.services.social_service import SocialService
+
+
+class RecordingClient:
+    """Minimal Supabase stand-in: every chain returns canned rows per table."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def table(self, name):
+        return self._query(name)
+
+    def rpc(self, name, params=None):
+        return self._query(f"rpc:{name}")
+
+    def _query(self, name):
+        query = MagicMock()
+        for method in ("select", "eq", "neq", "in_", "or_", "ilike", "order", "limit", "range"):
+            getattr(query, method).return_value = query
+
+        def execute():
+            self.queries.append(name)
+            return MagicMock(data=self.rows.get(name, []), count=None)
+
+        query.execute.side_effect = execute
+        return query
+
+
+class TestBatchLoader:
+    """Tests for the generic tick-coalescing loader."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_one_tick_share_one_batch(self):
+        calls = []
+
+        async def batch(keys):
+            calls.append(list(keys))
+            return {key: key * 2 for key in keys}
+
+        loader = BatchLoader(batch)
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+
+        assert results == [2, 4, 2, 6]
+        assert calls == [[1, 2, 3]]
+        assert await loader.load(2) == 4
+        assert loader.batches == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_keys_resolve_to_default_and_clear_refetches(self):
+        calls = []
+
+        async def batch(keys):
+            calls.append(list(keys))
+            return {}
+
+        loader = BatchLoader(batch, default=False)
+        assert await loader.load("a") is False
+
+        loader.clear("a")
+        await loader.load("a")
+
+        assert calls == [["a"], ["a"]]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_waiter_and_is_not_cached(self):
+        attempts = []
+
+        async def batch(keys):
+            attempts.append(keys)
+            if len(attempts) == 1:
+                raise ConnectionError("db down")
+            return {key: "ok" for key in keys}
+
+        loader = BatchLoader(batch)
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert await loader.load("a") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_large_batches_are_chunked(self):
+        sizes = []
+
+        async def batch(keys):
+            sizes.append(len(keys))
+            return {}
+
+        loader = BatchLoader(batch, max_batch_size=2)
+        await loader.load_many(range(5))
+
+        assert sizes == [2, 2, 1]
+
+
+class TestRequestScope:
+    """Tests that loaders live for exactly one request."""
+
+    def test_same_loaders_within_scope_fresh_outside(self):
+        db = object()
+
+        with loader_scope():
+            first = get_request_loaders(db)
+            assert get_request_loaders(db) is first
+        with loader_scope():
+            assert get_request_loaders(db) is not first
+        assert get_request_loaders(db) is not get_request_loaders(db)
+
+    def test_relationship_key_is_order_independent(self):
+        assert relationship_key("b", "a") == relationship_key("a", "b") == ("a", "b")
+
+
+class TestServiceRoundTrips:
+    """Tests that list views cost a fixed number of queries."""
+
+    @pytest.mark.asyncio
+    async def test_spotlight_creators_batch_all_lookups(self):
+        creator_ids = [f"creator-{i}" for i in range(8)]
+        client = RecordingClient({
+            "rpc:get_spotlight_creators": [{"user_id": c, "follower_count": 1} for c in creator_ids],
+            "users": [{"id": c, "display_name": c, "avatar_url": None} for c in creator_ids],
+            "community_posts": [
+                {"id": f"p-{c}", "user_id": c, "asset_url": "u", "asset_type": "logo"} for c in creator_ids
+            ],
+            "community_follows": [{"following_id": "creator-3"}],
+        })
+
+        creators = await CommunityFeedService(supabase_client=client).get_spotlight_creators(
+            limit=8, viewer_id="viewer"
+        )
+
+        assert len(creators) == 8
+        assert [c["is_following"] for c in creators].count(True) == 1
+        assert creators[0]["recent_assets"] == [{"id": "p-creator-0", "url": "u", "type": "logo"}]
+        assert sorted(client.queries) == sorted([
+            "rpc:get_spotlight_creators", "users", "community_posts", "community_follows",
+        ])
+
+    @pytest.mark.asyncio
+    async def test_search_users_batches_block_and_relationship_checks(self):
+        found = [{"id": f"u{i}", "display_name": f"User {i}", "avatar_url": None} for i in range(6)]
+        client = RecordingClient({
+            "users": found,
+            "friendships": [{"user_id": "viewer", "friend_id": "u1", "status": "accepted"}],
+        })
+        service = SocialService()
+        service._supabase = client
+
+        # "viewer" sorts after every candidate, so it is the second half of each key
+        result = await service.search_users("viewer", "user")
+
+        assert result["total"] == 6
+        statuses = {u["id"]: u["relationship_status"] for u in result["users"]}
+        assert statuses["u1"] == "accepted"
+        assert statuses["u2"] == "none"
+        # own block list, search, then one batched block check and one relationship check
+        assert client.queries == ["blocked_users", "users", "blocked_users", "friendships"]
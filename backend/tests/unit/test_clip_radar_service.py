@@ -15,16 +15,29 @@ from unittest.mock import MagicMock, AsyncMock, patch
 from dataclasses import dataclass
 
 
+def _async_redis_mock():
+    """Create a mock of the shared async Redis client."""
+    redis = AsyncMock()
+    redis.get.return_value = None
+    redis.zrevrange.return_value = []
+    redis.hmget.return_value = []
+    redis.hkeys.return_value = []
+    # pipeline() and register_script() are synchronous on redis.asyncio
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    # Batched view count script: (prev_views, prev_data) per clip
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[None, None]))
+    return redis
+
+
 class TestClipRadarVelocityCalculation:
     """Tests for velocity calculation logic."""
     
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        redis = MagicMock()
-        redis.hget.return_value = None
-        redis.hset.return_value = True
-        return redis
+        return _async_redis_mock()
     
     @pytest.fixture
     def clip_radar_service(self, mock_redis):
@@ -56,7 +69,7 @@ class TestClipRadarVelocityCalculation:
     @pytest.mark.asyncio
     async def test_velocity_new_clip_no_history(self, clip_radar_service, mock_redis):
         """Test velocity calculation for a clip with no tracking history."""
-        mock_redis.hget.return_value = None  # No previous data
+        mock_redis.register_script.return_value.return_value = [None, None]  # No previous data
         
         clip = self.MockClip(view_count=1000)
         clip.created_at = datetime.now(timezone.utc) - timedelta(minutes=30)
@@ -72,14 +85,14 @@ class TestClipRadarVelocityCalculation:
     async def test_velocity_with_tracking_history(self, clip_radar_service, mock_redis):
         """Test velocity calculation with previous tracking data."""
         # Previous view count was 500
-        mock_redis.hget.side_effect = lambda key, field: {
-            ("clip_radar:clip_views", "clip123"): "500",
-            ("clip_radar:clip_data", "clip123"): json.dumps({
+        mock_redis.register_script.return_value.return_value = [
+            "500",
+            json.dumps({
                 "first_seen_at": (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat(),
                 "game_id": "509658",
                 "game_name": "Just Chatting",
             }),
-        }.get((key, field))
+        ]
         
         clip = self.MockClip(view_count=1000)
         clip.created_at = datetime.now(timezone.utc) - timedelta(minutes=30)
@@ -96,12 +109,12 @@ class TestClipRadarVelocityCalculation:
     async def test_velocity_never_negative(self, clip_radar_service, mock_redis):
         """Test that velocity is never negative even with decreasing views."""
         # Previous view count was higher (edge case - shouldn't happen normally)
-        mock_redis.hget.side_effect = lambda key, field: {
-            ("clip_radar:clip_views", "clip123"): "2000",
-            ("clip_radar:clip_data", "clip123"): json.dumps({
+        mock_redis.register_script.return_value.return_value = [
+            "2000",
+            json.dumps({
                 "first_seen_at": (datetime.now(timezone.utc) - timedelta(minutes=10)).isoformat(),
             }),
-        }.get((key, field))
+        ]
         
         clip = self.MockClip(view_count=1000)  # Lower than previous
         clip.created_at = datetime.now(timezone.utc) - timedelta(minutes=30)
@@ -113,6 +126,32 @@ class TestClipRadarVelocityCalculation:
         assert tracked.total_gained >= 0
 
 
+    @pytest.mark.asyncio
+    async def test_batch_processing_uses_single_script_call(self, clip_radar_service, mock_redis):
+        """All clips in a category are updated with one scripted Redis call."""
+        script = mock_redis.register_script.return_value
+        script.return_value = [None, None, "100", None, None, None]
+        
+        clips = [self.MockClip(id=f"clip{i}", view_count=200 + i) for i in range(3)]
+        
+        tracked = await clip_radar_service._process_clips(clips, "Just Chatting")
+        
+        assert script.call_count == 1
+        _, kwargs = script.call_args
+        assert kwargs["keys"] == ["clip_radar:clip_views", "clip_radar:clip_data"]
+        assert kwargs["args"][0::3] == ["clip0", "clip1", "clip2"]
+        assert kwargs["args"][1::3] == [200, 201, 202]
+        assert [t.previous_view_count for t in tracked] == [None, 100, None]
+    
+    @pytest.mark.asyncio
+    async def test_batch_processing_empty_skips_redis(self, clip_radar_service, mock_redis):
+        """No Redis call is made when a category has no fresh clips."""
+        tracked = await clip_radar_service._process_clips([], "Just Chatting")
+        
+        assert tracked == []
+        mock_redis.register_script.return_value.assert_not_called()
+
+
 class TestViralDetection:
     """Tests for viral clip detection."""
     
@@ -401,13 +440,7 @@ class TestPollClipsErrorHandling:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        redis = MagicMock()
-        redis.hget.return_value = None
-        redis.hset.return_value = True
-        redis.set.return_value = True
-        redis.delete.return_value = True
-        redis.zadd.return_value = True
-        return redis
+        return _async_redis_mock()
     
     @pytest.mark.asyncio
     async def test_poll_continues_on_category_error(self, mock_redis):
@@ -463,6 +496,35 @@ class TestPollClipsErrorHandling:
             assert stats.total_clips == 0
 
 
+    @pytest.mark.asyncio
+    async def test_poll_fetches_categories_concurrently(self, mock_redis):
+        """Category fetches overlap instead of running one after another."""
+        import asyncio
+        from backend.services.clip_radar.service import ClipRadarService
+        from backend.services.clip_radar.constants import CLIP_POLL_MAX_CONCURRENCY
+        
+        service = ClipRadarService(redis_client=mock_redis)
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def mock_fetch_clips(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+        
+        mock_twitch = AsyncMock()
+        mock_twitch.fetch_clips = mock_fetch_clips
+        service._twitch = mock_twitch
+        
+        await service.poll_clips()
+        
+        assert 1 < max_in_flight <= CLIP_POLL_MAX_CONCURRENCY
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -473,15 +535,7 @@ class TestErrorTracking:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        redis = MagicMock()
-        redis.hget.return_value = None
-        redis.hset.return_value = True
-        redis.set.return_value = True
-        redis.delete.return_value = True
-        redis.zadd.return_value = True
-        redis.get.return_value = None
-        redis.hkeys.return_value = []
-        return redis
+        return _async_redis_mock()
     
     @pytest.mark.asyncio
     async def test_category_stats_includes_error_fields(self, mock_redis):
@@ -560,8 +614,7 @@ class TestCleanup:
     @pytest.fixture
     def mock_redis(self):
         """Create a mock Redis client."""
-        redis = MagicMock()
-        return redis
+        return _async_redis_mock()
     
     @pytest.mark.asyncio
     async def test_cleanup_removes_old_data(self, mock_redis):
@@ -577,19 +630,20 @@ class TestCleanup:
         recent_time = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
         
         mock_redis.hkeys.return_value = ["old_clip", "recent_clip"]
-        mock_redis.hget.side_effect = lambda key, clip_id: {
-            ("clip_radar:clip_data", "old_clip"): json.dumps({"first_seen_at": old_time}),
-            ("clip_radar:clip_data", "recent_clip"): json.dumps({"first_seen_at": recent_time}),
-        }.get((key, clip_id))
+        mock_redis.hmget.return_value = [
+            json.dumps({"first_seen_at": old_time}),
+            json.dumps({"first_seen_at": recent_time}),
+        ]
         
         await service.cleanup_old_data(max_age_hours=24)
         
-        # Old clip should be deleted
-        hdel_calls = mock_redis.hdel.call_args_list
-        deleted_clips = [str(call) for call in hdel_calls]
-        assert any("old_clip" in str(call) for call in hdel_calls)
+        # Old clip should be deleted from both hashes in one batch
+        mock_redis.hmget.assert_awaited_once_with("clip_radar:clip_data", ["old_clip", "recent_clip"])
+        hdel_calls = mock_redis.pipeline.return_value.hdel.call_args_list
+        assert [call.args[1:] for call in hdel_calls] == [("old_clip",), ("old_clip",)]
     
-    def test_get_poll_health_returns_status(self, mock_redis):
+    @pytest.mark.asyncio
+    async def test_get_poll_health_returns_status(self, mock_redis):
         """Test that get_poll_health returns health status."""
         from backend.services.clip_radar.service import ClipRadarService
         import json
@@ -599,20 +653,115 @@ class TestCleanup:
         
         # Setup mock data
         now = datetime.now(timezone.utc)
-        mock_redis.get.side_effect = lambda key: {
-            "clip_radar:last_poll": now.isoformat(),
-            "clip_radar:last_poll:metadata": json.dumps({
+        mock_redis.mget.return_value = [
+            now.isoformat(),
+            json.dumps({
                 "success_rate": 100,
                 "failed_categories": [],
                 "recap_tracked": True,
                 "total_clips": 50,
                 "total_viral": 5,
             }),
-        }.get(key)
+        ]
         
-        health = service.get_poll_health()
+        health = await service.get_poll_health()
         
         assert health["status"] == "healthy"
         assert health["success_rate"] == 100
         assert health["failed_categories"] == []
         assert health["recap_healthy"] == True
+
+
+class TestViralClipIndex:
+    """Tests for the precomputed viral clip indexes."""
+    
+    @pytest.fixture
+    def mock_redis(self):
+        """Create a mock Redis client."""
+        return _async_redis_mock()
+    
+    @staticmethod
+    def _viral_clip(clip_id: str, game_id: str, velocity: float):
+        from backend.services.clip_radar.models import ViralClip
+        return ViralClip(
+            clip_id=clip_id,
+            title=f"Clip {clip_id}",
+            url=f"https://twitch.tv/clip/{clip_id}",
+            thumbnail_url="https://example.com/thumb.jpg",
+            broadcaster_id="user1",
+            broadcaster_name="Streamer",
+            creator_name="Creator",
+            game_id=game_id,
+            game_name="Game",
+            language="en",
+            duration=30.0,
+            created_at=datetime.now(timezone.utc) - timedelta(minutes=20),
+            view_count=500,
+            velocity=velocity,
+            total_gained=500,
+            alert_reason="Trending",
+        )
+    
+    @pytest.mark.asyncio
+    async def test_update_builds_staging_keys_then_renames(self, mock_redis):
+        """Indexes are built under staging keys and renamed in one transaction."""
+        from backend.services.clip_radar.service import ClipRadarService
+        
+        build_pipe, swap_pipe = MagicMock(), MagicMock()
+        build_pipe.execute = AsyncMock(return_value=[])
+        swap_pipe.execute = AsyncMock(return_value=[])
+        mock_redis.pipeline = MagicMock(side_effect=[build_pipe, swap_pipe])
+        service = ClipRadarService(redis_client=mock_redis)
+        
+        await service._update_viral_clips([
+            self._viral_clip("a", "509658", 9.0),
+            self._viral_clip("b", "33214", 4.0),
+        ])
+        
+        assert mock_redis.pipeline.call_args_list[1].kwargs == {"transaction": True}
+        staged = {call.args[0] for call in build_pipe.zadd.call_args_list}
+        assert all(":staging:" in key for key in staged)
+        renamed = {call.args[1]: call.args[0] for call in swap_pipe.rename.call_args_list}
+        assert set(renamed) == {
+            "clip_radar:viral",
+            "clip_radar:viral:data",
+            "clip_radar:viral:game:509658",
+            "clip_radar:viral:game:33214",
+        }
+        assert renamed["clip_radar:viral"] in staged
+        # Games without viral clips lose their stale index in the same swap
+        deleted = swap_pipe.delete.call_args.args
+        assert "clip_radar:viral:game:21779" in deleted
+        assert "clip_radar:viral:game:509658" not in deleted
+    
+    @pytest.mark.asyncio
+    async def test_update_with_no_viral_clips_clears_live_keys(self, mock_redis):
+        """An empty poll deletes the live indexes instead of renaming."""
+        from backend.services.clip_radar.service import ClipRadarService
+        
+        service = ClipRadarService(redis_client=mock_redis)
+        
+        await service._update_viral_clips([])
+        
+        pipe = mock_redis.pipeline.return_value
+        pipe.rename.assert_not_called()
+        deleted = pipe.delete.call_args.args
+        assert "clip_radar:viral" in deleted
+        assert "clip_radar:viral:data" in deleted
+    
+    @pytest.mark.asyncio
+    async def test_get_viral_clips_reads_game_index_with_hmget(self, mock_redis):
+        """Game filtering reads only the requested page of the per-game index."""
+        from backend.services.clip_radar.service import ClipRadarService
+        
+        service = ClipRadarService(redis_client=mock_redis)
+        clip = self._viral_clip("a", "509658", 9.0)
+        mock_redis.zrevrange.return_value = ["a", "gone"]
+        mock_redis.hmget.return_value = [service._viral_clip_payload(clip), None]
+        
+        clips = await service.get_viral_clips(limit=5, game_id="509658")
+        
+        mock_redis.zrevrange.assert_awaited_once_with("clip_radar:viral:game:509658", 0, 4)
+        mock_redis.hmget.assert_awaited_once_with("clip_radar:viral:data", ["a", "gone"])
+        mock_redis.hget.assert_not_called()
+        assert [c.clip_id for c in clips] == ["a"]
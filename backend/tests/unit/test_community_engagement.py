@@ -261,11 +261,13 @@ class TestFollows:
                      "follower_count": 100, "following_count": 25, "is_banned": False,
                      "created_at": now.isoformat(), "updated_at": now.isoformat()}
         make_eq_chain(mock_supabase, [
-            MagicMock(data=[user_row]),
             MagicMock(data=[stats_row]),
             MagicMock(data=[{"created_at": now_iso()}]),
             MagicMock(data=[]),  # Not following
         ])
+        # User summary comes from the batched users loader
+        mock_supabase.table.return_value.select.return_value.in_.return_value.execute.return_value = MagicMock(
+            data=[user_row])
 
         profile = await service.get_creator_profile(user_id, viewer_id="viewer")
         assert profile.user.display_name == "TestUser"
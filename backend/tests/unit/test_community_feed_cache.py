@@ -0,0 +1,230 @@
+"""
+Unit tests for the precomputed community feeds.
+
+Tests that trending/featured pages are built once and then served from
+Redis with only the viewer's likes queried, that hiding/deleting/editing a
+post or banning its author invalidates every feed (including one being
+rebuilt), and that oversize
+pages and Redis outages fall back to the live query.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.api.schemas.community import UpdatePostRequest
+from backend.services import community_admin_service, community_post_service
+from backend.services.community_admin_service import CommunityAdminService
+from backend.services.community_feed_cache import GENERATION_KEY, CommunityFeedCache
+from backend.services.community_feed_service import CommunityFeedService
+from backend.services.community_post_service import CommunityPostService
+
+NOW = "2026-01-01T00:00:00+00:00"
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the async Redis calls the cache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+def _post(i):
+    return {
+        "id": f"post-{i}", "user_id": f"user-{i % 2}", "asset_id": f"asset-{i}",
+        "title": "Overlay", "asset_type": "overlay", "asset_url": "https://cdn/x.png",
+        "tags": [], "like_count": 10 - i, "created_at": NOW, "updated_at": NOW,
+        "trending_score": 1.5,
+    }
+
+
+class RecordingClient:
+    """Supabase stand-in that records which table/RPC each query hit."""
+
+    def __init__(self, posts):
+        self.posts = posts
+        self.queries = []
+
+    def table(self, name):
+        return self._query(name)
+
+    def rpc(self, name, params=None):
+        return self._query(f"rpc:{name}")
+
+    def _query(self, name):
+        rows = {
+            "rpc:get_trending_community_posts": self.posts,
+            "users": [{"id": u, "display_name": u, "avatar_url": None} for u in ("user-0", "user-1")],
+            "community_likes": [{"post_id": "post-1"}],
+            "community_posts": self.posts,
+        }.get(name, [])
+        query = MagicMock()
+        for method in ("select", "eq", "in_", "order", "limit"):
+            getattr(query, method).return_value = query
+
+        def execute():
+            self.queries.append(name)
+            return MagicMock(data=rows, count=len(rows))
+
+        query.execute.side_effect = execute
+        return query
+
+
+@pytest.fixture
+def client():
+    return RecordingClient([_post(i) for i in range(5)])
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def service(client, redis):
+    return CommunityFeedService(
+        supabase_client=client,
+        feed_cache=CommunityFeedCache(supabase_client=client, redis_client=redis),
+    )
+
+
+class TestPrecomputedTrending:
+    """Tests for serving trending pages from the materialized feed."""
+
+    @pytest.mark.asyncio
+    async def test_built_once_then_only_viewer_likes_queried(self, service, client):
+        first, total = await service.get_trending_posts(limit=3, viewer_id="viewer")
+        assert client.queries == ["rpc:get_trending_community_posts", "users", "community_likes"]
+
+        client.queries.clear()
+        second, _ = await service.get_trending_posts(limit=3, viewer_id="viewer")
+
+        assert client.queries == ["community_likes"]
+        assert total == 3
+        assert [p.id for p in second] == ["post-0", "post-1", "post-2"]
+        assert [p.is_liked for p in second] == [False, True, False]
+        assert second[0].author.display_name == "user-0"
+
+    @pytest.mark.asyncio
+    async def test_anonymous_viewer_costs_no_queries_on_hit(self, service, client):
+        await service.get_trending_posts(limit=5)
+        client.queries.clear()
+
+        posts, _ = await service.get_trending_posts(limit=5)
+
+        assert client.queries == []
+        assert len(posts) == 5
+
+    @pytest.mark.asyncio
+    async def test_featured_reports_total_featured(self, service, client):
+        posts, total = await service.get_featured_posts(limit=2)
+
+        assert len(posts) == 2
+        assert total == 5
+        assert client.queries[0] == "community_posts"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_build(self, service, client):
+        await asyncio.gather(*(service.get_trending_posts(limit=3) for _ in range(5)))
+
+        assert client.queries.count("rpc:get_trending_community_posts") == 1
+
+
+class TestInvalidation:
+    """Tests that moderation and post edits drop the materialized feeds."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_rebuild(self, service, client, redis):
+        await service.get_trending_posts(limit=3)
+        client.posts = client.posts[1:]  # post-0 hidden
+
+        await service.feed_cache.invalidate("post-0")
+        posts, _ = await service.get_trending_posts(limit=3)
+
+        assert redis.data[GENERATION_KEY] == 1
+        assert "post-0" not in [p.id for p in posts]
+
+    @pytest.mark.asyncio
+    async def test_refresh_during_invalidation_cannot_resurrect_post(self, service, client, redis):
+        cache = service.feed_cache
+        generation = await cache._generation()
+        await cache.invalidate("post-0")
+        # A refresh that read the old generation finishes after the invalidation
+        await cache._build(cache._key("trending", generation, None), "trending", None)
+        client.posts = client.posts[1:]
+
+        posts, _ = await service.get_trending_posts(limit=3)
+
+        assert "post-0" not in [p.id for p in posts]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_swallows_redis_errors(self):
+        redis = MagicMock()
+        redis.incr = AsyncMock(side_effect=ConnectionError("down"))
+
+        await CommunityFeedCache(supabase_client=MagicMock(), redis_client=redis).invalidate("post-0")
+
+    @pytest.mark.asyncio
+    async def test_ban_invalidates_feeds(self):
+        db = MagicMock()
+        db.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [
+            {"user_id": "user-0", "is_banned": False},
+        ]
+        cache = MagicMock(invalidate=AsyncMock())
+
+        with patch.object(community_admin_service, "get_community_feed_cache", return_value=cache):
+            await CommunityAdminService(supabase_client=db).ban_user("user-0", "spam")
+
+        cache.invalidate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_post_edit_invalidates_feeds(self):
+        post = _post(0)
+        db = MagicMock()
+        service = CommunityPostService(supabase_client=db)
+        service._check_user_banned = AsyncMock()
+        service._get_user_summary = AsyncMock(return_value=MagicMock())
+        service._map_post_with_author_response = MagicMock()
+        db.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [post]
+        db.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [post]
+        cache = MagicMock(invalidate=AsyncMock())
+
+        with patch.object(community_post_service, "get_community_feed_cache", return_value=cache):
+            await service.update_post("user-0", "post-0", UpdatePostRequest(title="New title"))
+
+        cache.invalidate.assert_awaited_once_with("post-0")
+
+
+class TestLiveFallback:
+    """Tests for pages the cache cannot serve."""
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_serves_live(self, client):
+        redis = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("down"))
+        service = CommunityFeedService(
+            supabase_client=client,
+            feed_cache=CommunityFeedCache(supabase_client=client, redis_client=redis),
+        )
+
+        posts, total = await service.get_trending_posts(limit=3)
+
+        assert total == 5  # the live RPC path
+        assert client.queries == ["rpc:get_trending_community_posts", "users"]
+
+    @pytest.mark.asyncio
+    async def test_page_larger_than_cache_bypasses(self, service, client, redis):
+        await service.get_trending_posts(limit=500)
+
+        assert redis.data == {}
@@ -4,9 +4,12 @@ Unit tests for Depth Map Service and Animation Engine.
 Tests the enterprise-grade depth processing and animation systems.
 """
 
+import json
 import pytest
 import math
 
+import numpy as np
+
 # Import directly to avoid environment variable requirements
 import importlib.util
 
@@ -27,6 +30,9 @@ AnimationKeyframe = animation_engine.AnimationKeyframe
 AnimationTrack = animation_engine.AnimationTrack
 AnimationTimeline = animation_engine.AnimationTimeline
 DepthParallaxEngine = animation_engine.DepthParallaxEngine
+build_parallax_plan = animation_engine.build_parallax_plan
+depth_layer_boundaries = animation_engine.depth_layer_boundaries
+quantize_depth_layers = animation_engine.quantize_depth_layers
 create_designer_animation = animation_engine.create_designer_animation
 
 
@@ -311,6 +317,82 @@ class TestDepthParallaxEngine:
         assert transform["translateZ"] > 0
 
 
+class TestParallaxPlan:
+    """Test whole-timeline parallax precomputation."""
+
+    @pytest.mark.parametrize("smooth_factor", [0.1, 0.9, 1.0])
+    def test_planned_offsets_match_per_frame_calls(self, smooth_factor):
+        """One planned call should equal calling calculate_layer_offsets per frame."""
+        rng = np.random.default_rng(3)
+        inputs = rng.uniform(-1, 1, size=(1200, 2))
+        factors = [0.2, 0.6, 1.0]
+        layers = [{"parallax_factor": f} for f in factors]
+
+        stepped = DepthParallaxEngine(max_offset=40, smooth_factor=smooth_factor)
+        expected = np.array([stepped.calculate_layer_offsets(x, y, layers) for x, y in inputs])
+
+        planned = DepthParallaxEngine(max_offset=40, smooth_factor=smooth_factor)
+        offsets = planned.plan_layer_offsets(inputs[:, 0], inputs[:, 1], factors)
+
+        assert offsets.shape == (1200, 3, 2)
+        np.testing.assert_allclose(offsets, expected, atol=1e-9)
+        # State carries over into later per-frame calls
+        np.testing.assert_allclose(
+            planned.calculate_layer_offsets(0.5, 0.5, layers),
+            stepped.calculate_layer_offsets(0.5, 0.5, layers),
+        )
+
+    def test_planned_transforms_match_per_call(self):
+        """Per-frame tilt transforms should match calculate_3d_transform."""
+        engine = DepthParallaxEngine()
+        config = {"type": "tilt", "intensity": 0.7, "max_angle_x": 20}
+        xs = np.linspace(-1, 1, 7)
+        ys = np.linspace(1, -1, 7)
+
+        planned = engine.plan_3d_transforms(xs, ys, 0.8, config)
+
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            single = engine.calculate_3d_transform(x, y, 0.8, config)
+            for name, value in single.items():
+                assert planned[name][i] == pytest.approx(value)
+
+    def test_build_plan_is_json_ready(self):
+        """Plans should cover every frame and serialize for the OBS blob."""
+        config = {"duration_ms": 2000, "depth_effect": {"type": "parallax", "intensity": 0.5}}
+        plan = build_parallax_plan(config, frame_count=60, layer_count=4)
+        inverted = build_parallax_plan(
+            {**config, "depth_effect": {"type": "parallax", "intensity": 0.5, "invert": True}},
+            frame_count=60,
+            layer_count=4,
+        )
+
+        assert plan.layer_offsets.shape == (60, 4, 2)
+        assert plan.frame_at(2000) == 59
+        np.testing.assert_allclose(inverted.layer_offsets, -plan.layer_offsets)
+        data = json.loads(json.dumps(plan.to_dict()))
+        assert data["frames"] == 60
+        assert len(data["transforms"]["translateX"]) == 60
+
+
+class TestDepthLayerQuantization:
+    """Test single-pass depth layer segmentation."""
+
+    def test_counts_and_map_match_per_layer_masks(self):
+        """Counts and layer map should match one half-open mask per layer."""
+        depth = np.round(np.random.default_rng(4).random((60, 80)), 1).astype(np.float32)
+
+        boundaries, counts = depth_layer_boundaries(depth, 5)
+        layer_map = quantize_depth_layers(depth, boundaries)
+
+        for i in range(5):
+            mask = (depth >= boundaries[i]) & (depth < boundaries[i + 1])
+            assert counts[i] == mask.sum()
+            assert np.all(layer_map[mask] == i)
+        # Pixels at the top boundary move with the foreground
+        assert np.all(layer_map[depth == boundaries[-1]] == 4)
+        assert boundaries == [float(b) for b in np.percentile(depth, [0, 20, 40, 60, 80, 100])]
+
+
 class TestDesignerAnimations:
     """Test pre-built designer animation presets."""
 
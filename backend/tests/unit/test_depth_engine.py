@@ -0,0 +1,159 @@
+"""
+Unit tests for the micro-batched depth inference engine.
+
+Tests DPT-compatible input sizing, that concurrent requests are coalesced
+into batches grouped by input size, that backend failures reach every
+waiting caller, and that the engine reports the backend it fell back to. A fake backend stands in for ONNX Runtime/PyTorch.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from backend.services.alert_animation import depth_engine
+from backend.services.alert_animation.depth_engine import (
+    DepthEngine,
+    model_input_size,
+    postprocess,
+    preprocess,
+)
+
+
+class FakeBackend:
+    """Records batch sizes; predicts the mean of each input channel stack."""
+
+    name = "fake"
+    quantized = False
+
+    def __init__(self, delay=0.0, fail=False):
+        self.batches = []
+        self.delay = delay
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def run(self, batch):
+        with self.lock:
+            self.batches.append(batch.shape)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("session failed")
+        return batch.mean(axis=1)
+
+
+@pytest.fixture
+def engines():
+    created = []
+
+    def make(backend, **kwargs):
+        engine = DepthEngine(backend, **kwargs)
+        created.append(engine)
+        return engine
+
+    yield make
+    for engine in created:
+        engine.close()
+
+
+class TestPreprocessing:
+    """Tests for the DPT image processor equivalent."""
+
+    def test_square_image_maps_to_518(self):
+        assert model_input_size(1024, 1024) == (518, 518)
+
+    def test_aspect_kept_and_multiple_of_14(self):
+        width, height = model_input_size(1920, 1080)
+
+        assert width % 14 == 0 and height % 14 == 0
+        assert abs(width / height - 1920 / 1080) < 0.02
+        assert min(width, height) == 518
+
+    def test_preprocess_and_postprocess_shapes(self):
+        image = Image.new("RGB", (300, 200), color=(200, 100, 50))
+
+        pixels = preprocess(image)
+        depth = postprocess(np.random.default_rng(0).random(pixels.shape[1:]), image.size)
+
+        assert pixels.shape == (3, *model_input_size(300, 200)[::-1])
+        assert pixels.dtype == np.float32
+        assert depth.shape == (200, 300)
+        assert depth.min() == pytest.approx(0, abs=1e-6)
+        assert depth.max() == pytest.approx(1, abs=1e-6)
+
+
+class TestMicroBatching:
+    """Tests for coalescing concurrent requests."""
+
+    def test_concurrent_requests_share_a_batch(self, engines):
+        backend = FakeBackend()
+        engine = engines(backend, max_batch=4, window_ms=200)
+        images = [Image.new("RGB", (64, 64), color=(i * 40, 0, 0)) for i in range(4)]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            depths = list(pool.map(engine.infer, images))
+
+        assert backend.batches == [(4, 3, 518, 518)]
+        assert all(depth.shape == (64, 64) for depth in depths)
+        assert engine.images == 4
+
+    def test_results_match_their_requests(self, engines):
+        engine = engines(FakeBackend(), max_batch=8, window_ms=100)
+        inputs = [np.full((3, 14, 14), float(i), dtype=np.float32) for i in range(5)]
+
+        futures = [engine.submit(pixels) for pixels in inputs]
+
+        for i, future in enumerate(futures):
+            assert float(future.result(timeout=5).mean()) == pytest.approx(i)
+
+    def test_mixed_sizes_run_as_separate_groups(self, engines):
+        backend = FakeBackend()
+        engine = engines(backend, max_batch=8, window_ms=100)
+
+        futures = [engine.submit(np.zeros((3, 14, 28), dtype=np.float32)) for _ in range(2)]
+        futures.append(engine.submit(np.zeros((3, 28, 14), dtype=np.float32)))
+        for future in futures:
+            future.result(timeout=5)
+
+        assert sorted(backend.batches) == [(1, 3, 28, 14), (2, 3, 14, 28)]
+
+    def test_batch_cap_is_respected(self, engines):
+        backend = FakeBackend(delay=0.05)
+        engine = engines(backend, max_batch=2, window_ms=100)
+
+        futures = [engine.submit(np.zeros((3, 14, 14), dtype=np.float32)) for _ in range(5)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert max(shape[0] for shape in backend.batches) == 2
+        assert sum(shape[0] for shape in backend.batches) == 5
+
+    def test_backend_failure_reaches_every_caller(self, engines):
+        engine = engines(FakeBackend(fail=True), max_batch=4, window_ms=100)
+
+        futures = [engine.submit(np.zeros((3, 14, 14), dtype=np.float32)) for _ in range(3)]
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="session failed"):
+                future.result(timeout=5)
+
+
+class TestBackendSelection:
+    """Tests for the backend the engine reports as in use."""
+
+    def test_onnx_failure_reports_torch(self, engines, monkeypatch):
+        def broken_onnx(*args, **kwargs):
+            raise RuntimeError("no onnxruntime")
+
+        class FakeTorch(FakeBackend):
+            name = "torch"
+
+        monkeypatch.setattr(depth_engine, "onnx_model_path", lambda quantized: __file__)
+        monkeypatch.setattr(depth_engine, "OnnxDepthBackend", broken_onnx)
+        monkeypatch.setattr(depth_engine, "TorchDepthBackend", FakeTorch)
+
+        engine = engines(depth_engine.load_depth_backend("onnx", quantize=True))
+
+        assert engine.variant == {"backend": "torch", "quantized": False}
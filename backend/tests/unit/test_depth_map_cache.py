@@ -0,0 +1,170 @@
+"""
+Unit tests for the depth map cache and off-loop refinement.
+
+Tests content addressing (image hash + normalized options), that a cached
+depth map skips inference and refinement, that cache failures fall back to
+generating, and that refinement through reused scratch buffers never
+aliases results or mutates its input.
+"""
+
+import importlib.util
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+spec = importlib.util.spec_from_file_location(
+    'depth_service',
+    'backend/services/alert_animation/depth_service.py'
+)
+depth_service = importlib.util.module_from_spec(spec)
+with patch.dict('sys.modules', {'backend.services.storage_service': MagicMock()}):
+    spec.loader.exec_module(depth_service)
+
+DepthMapService = depth_service.DepthMapService
+depth_cache_key = depth_service.depth_cache_key
+normalize_depth_options = depth_service.normalize_depth_options
+
+ONNX = {"backend": "onnx", "quantized": False}
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the sync Redis calls the cache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+def _png(color, size=(64, 48)):
+    buffer = BytesIO()
+    Image.new("RGB", size, color=color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _service(cache):
+    service = DepthMapService(cache_client=cache)
+    service._engine_variant = MagicMock(return_value=ONNX)
+    service._storage = MagicMock()
+    service._storage.upload_raw = AsyncMock(return_value=MagicMock(url="https://cdn/depth.png", path="p"))
+    service._download_image = AsyncMock(return_value=_png("red"))
+    depth = np.linspace(0, 1, 48 * 64, dtype=np.float32).reshape(48, 64)
+    service._estimate_depth = AsyncMock(return_value=depth)
+    return service
+
+
+class TestDepthCacheKey:
+    """Tests for content addressing."""
+
+    def test_defaults_and_explicit_options_share_a_key(self):
+        image = _png("red")
+        implicit = depth_cache_key(image, normalize_depth_options(None), ONNX)
+        explicit = depth_cache_key(image, normalize_depth_options({"smooth_factor": 0.3, "layer_count": 5.0}), ONNX)
+
+        assert implicit == explicit
+
+    def test_image_and_options_change_the_key(self):
+        base = depth_cache_key(_png("red"), normalize_depth_options(None), ONNX)
+
+        assert depth_cache_key(_png("blue"), normalize_depth_options(None), ONNX) != base
+        assert depth_cache_key(_png("red"), normalize_depth_options({"layer_count": 3}), ONNX) != base
+
+    def test_backend_and_quantization_change_the_key(self):
+        image, options = _png("red"), normalize_depth_options(None)
+        base = depth_cache_key(image, options, ONNX)
+
+        assert depth_cache_key(image, options, {**ONNX, "backend": "torch"}) != base
+        assert depth_cache_key(image, options, {**ONNX, "quantized": True}) != base
+
+
+class TestCachedGeneration:
+    """Tests that repeat requests skip the model."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_is_served_from_cache(self):
+        cache = FakeRedis()
+        first_service = _service(cache)
+        first = await first_service.generate_depth_map("https://src", "user-1", "project-1")
+
+        second_service = _service(cache)
+        second = await second_service.generate_depth_map("https://src", "user-2", "project-2")
+
+        second_service._estimate_depth.assert_not_awaited()
+        assert first["metadata"]["cached"] is False
+        assert second["metadata"]["cached"] is True
+        assert second["layer_data"] == first["layer_data"]
+        assert second["original_size"] == first["original_size"] == (64, 48)
+        uploaded = second_service._storage.upload_raw.await_args.kwargs
+        assert uploaded["path"] == "user-2/animations/project-2/depth_map.png"
+        assert uploaded["data"] == first_service._storage.upload_raw.await_args.kwargs["data"]
+
+    @pytest.mark.asyncio
+    async def test_different_options_miss(self):
+        cache = FakeRedis()
+        await _service(cache).generate_depth_map("https://src", "u", "p")
+
+        service = _service(cache)
+        result = await service.generate_depth_map("https://src", "u", "p", options={"layer_count": 3})
+
+        service._estimate_depth.assert_awaited_once()
+        assert result["layer_data"]["layer_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_torch_fallback_does_not_serve_onnx_maps(self):
+        cache = FakeRedis()
+        await _service(cache).generate_depth_map("https://src", "u", "p")
+
+        fallback = _service(cache)
+        fallback._engine_variant.return_value = {"backend": "torch", "quantized": False}
+        result = await fallback.generate_depth_map("https://src", "u", "p")
+
+        fallback._estimate_depth.assert_awaited_once()
+        assert result["metadata"]["cached"] is False
+
+    @pytest.mark.asyncio
+    async def test_cache_outage_still_generates(self):
+        cache = MagicMock()
+        cache.get.side_effect = ConnectionError("down")
+        cache.set.side_effect = ConnectionError("down")
+
+        result = await _service(cache).generate_depth_map("https://src", "u", "p")
+
+        assert result["metadata"]["cached"] is False
+        assert result["layer_data"]["layer_count"] == 5
+
+
+class TestScratchRefinement:
+    """Tests for refinement through reused float32 buffers."""
+
+    def test_results_do_not_alias_and_input_is_untouched(self):
+        service = DepthMapService(cache_client=FakeRedis())
+        rng = np.random.default_rng(1)
+        depth = rng.random((40, 50)).astype(np.float32)
+        original = depth.copy()
+        source = Image.new("L", (50, 40), color=90)
+
+        first = service._refine_depth_map(depth, source)
+        second = service._refine_depth_map(rng.random((40, 50)).astype(np.float32), source)
+
+        np.testing.assert_array_equal(depth, original)
+        assert not np.shares_memory(first, second)
+        assert first.dtype == np.float32
+        assert 0 <= first.min() and first.max() <= 1
+
+    def test_postprocess_matches_separate_steps(self):
+        service = DepthMapService(cache_client=FakeRedis())
+        depth = np.random.default_rng(2).random((32, 32)).astype(np.float32)
+        image = Image.new("RGB", (32, 32), color="green")
+
+        png, layers = service._postprocess_depth(depth, image, normalize_depth_options(None))
+        refined = service._refine_depth_map(depth, image)
+
+        assert layers == service._generate_depth_layers(refined, 5)
+        assert png == service._depth_to_png(refined)
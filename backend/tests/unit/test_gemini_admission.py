@@ -0,0 +1,198 @@
+"""
+Unit tests for the Gemini admission controller.
+
+Tests the AIMD limit (additive increase on success, one multiplicative
+decrease per cooldown on 429s/timeouts), priority ordering of queued
+callers, lease expiry, fail-open behaviour when Redis is unreachable, and
+that the Nano Banana client holds a slot for each attempt.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.services.exceptions import ContentPolicyError, RateLimitError
+from backend.services.gemini_admission import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    PRIORITY_PAID,
+    GeminiAdmissionController,
+    is_overload_error,
+    priority_for_tier,
+)
+from backend.services.nano_banana_client import GenerationRequest, GenerationResponse, NanoBananaClient
+
+MODEL = "gemini-test"
+
+
+def controller(**kwargs) -> GeminiAdmissionController:
+    defaults = dict(backend="memory", initial_limit=2, min_limit=1, max_limit=4, cooldown_ms=60_000, poll_ms=1)
+    defaults.update(kwargs)
+    return GeminiAdmissionController(**defaults)
+
+
+class TestAimdLimit:
+    """Tests for how outcomes move the limit."""
+
+    @pytest.mark.asyncio
+    async def test_success_increases_additively(self):
+        admission = controller(initial_limit=2)
+
+        for _ in range(2):
+            async with admission.slot(MODEL):
+                pass
+
+        # +1/limit per success: 2 -> 2.5 -> 2.9
+        assert await admission.get_limit(MODEL) == pytest.approx(2.9)
+
+    @pytest.mark.asyncio
+    async def test_limit_capped_at_max(self):
+        admission = controller(initial_limit=4, max_limit=4)
+
+        async with admission.slot(MODEL):
+            pass
+
+        assert await admission.get_limit(MODEL) == 4
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_halves_once_per_cooldown(self):
+        admission = controller(initial_limit=4)
+
+        for _ in range(2):
+            with pytest.raises(RateLimitError):
+                async with admission.slot(MODEL):
+                    raise RateLimitError(retry_after=1)
+
+        assert await admission.get_limit(MODEL) == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_floored_at_min(self):
+        admission = controller(initial_limit=1, cooldown_ms=0)
+
+        with pytest.raises(RateLimitError):
+            async with admission.slot(MODEL):
+                raise RateLimitError(retry_after=1)
+
+        assert await admission.get_limit(MODEL) == 1
+
+    @pytest.mark.asyncio
+    async def test_other_errors_leave_limit_unchanged(self):
+        admission = controller(initial_limit=2)
+
+        with pytest.raises(ContentPolicyError):
+            async with admission.slot(MODEL):
+                raise ContentPolicyError(reason="blocked")
+
+        assert await admission.get_limit(MODEL) == 2
+
+    def test_overload_classification(self):
+        sdk_error = Exception("429 RESOURCE_EXHAUSTED")
+        coded = MagicMock(spec=Exception, code=429)
+
+        assert is_overload_error(RateLimitError(retry_after=1))
+        assert is_overload_error(asyncio.TimeoutError())
+        assert is_overload_error(sdk_error)
+        assert is_overload_error(coded)
+        assert not is_overload_error(ValueError("bad"))
+
+
+class TestAdmission:
+    """Tests for slot admission and queueing."""
+
+    @pytest.mark.asyncio
+    async def test_admits_up_to_limit(self):
+        admission = controller(initial_limit=2)
+        first = await admission.acquire(MODEL)
+        second = await admission.acquire(MODEL)
+
+        with pytest.raises(RateLimitError):
+            await admission.acquire(MODEL, timeout=0.01)
+
+        await admission.release(first, "neutral")
+        assert await admission.acquire(MODEL, timeout=0.01) is not None
+        assert second is not None
+
+    @pytest.mark.asyncio
+    async def test_paid_admitted_before_earlier_batch(self):
+        admission = controller(initial_limit=1)
+        held = await admission.acquire(MODEL)
+        order = []
+
+        async def call(priority):
+            lease = await admission.acquire(MODEL, priority, timeout=5)
+            order.append(priority)
+            await admission.release(lease, "neutral")
+
+        batch = asyncio.create_task(call(PRIORITY_BATCH))
+        await asyncio.sleep(0.02)
+        paid = asyncio.create_task(call(PRIORITY_PAID))
+        await asyncio.sleep(0.02)
+
+        await admission.release(held, "neutral")
+        await asyncio.gather(batch, paid)
+
+        assert order == [PRIORITY_PAID, PRIORITY_BATCH]
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_frees_slot(self):
+        admission = controller(initial_limit=1, lease_ms=1)
+        await admission.acquire(MODEL)
+        await asyncio.sleep(0.005)
+
+        assert await admission.acquire(MODEL, timeout=0.01) is not None
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self):
+        admission = controller(initial_limit=1)
+        held = await admission.acquire(MODEL)
+        with pytest.raises(RateLimitError):
+            await admission.acquire(MODEL, PRIORITY_PAID, timeout=0.01)
+        await admission.release(held, "neutral")
+
+        # The abandoned paid waiter must not block a batch caller
+        assert await admission.acquire(MODEL, PRIORITY_BATCH, timeout=0.01) is not None
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_admits_without_slot(self):
+        redis = MagicMock()
+        redis.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+        admission = GeminiAdmissionController(redis_client=redis, backend="redis")
+
+        async with admission.slot(MODEL) as lease:
+            assert lease is None
+
+    @pytest.mark.asyncio
+    async def test_off_backend_never_queues(self):
+        admission = controller(backend="off")
+
+        assert await admission.acquire(MODEL) is None
+
+    def test_priority_for_tier(self):
+        assert priority_for_tier("studio") == PRIORITY_PAID
+        assert priority_for_tier("pro") == PRIORITY_PAID
+        assert priority_for_tier("free") == PRIORITY_INTERACTIVE
+        assert priority_for_tier(None) == PRIORITY_INTERACTIVE
+
+
+class TestClientAdmission:
+    """Tests that the Nano Banana client takes a slot per attempt."""
+
+    @pytest.mark.asyncio
+    async def test_429_shrinks_shared_limit_then_retries(self):
+        admission = controller(initial_limit=4)
+        client = NanoBananaClient(api_key="test")
+        client.RETRY_DELAYS = [0, 0, 0]
+        client._execute_generation = AsyncMock(side_effect=[
+            RateLimitError(retry_after=0),
+            GenerationResponse(b"img", "gen", 1, 10),
+        ])
+
+        with patch("backend.services.nano_banana_client.get_gemini_admission", return_value=admission):
+            response = await client.generate(
+                GenerationRequest(prompt="a", width=64, height=64, model=MODEL, priority=PRIORITY_PAID)
+            )
+
+        assert response.image_data == b"img"
+        # Halved by the 429, then +1/limit for the success
+        assert await admission.get_limit(MODEL) == pytest.approx(2.5)
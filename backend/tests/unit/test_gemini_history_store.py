@@ -0,0 +1,196 @@
+"""
+Unit tests for the Gemini multi-turn history blob store.
+
+Tests that history turns hold small content-addressed references, that
+references resolve back to the inline base64 the Gemini request needs
+(LRU first, then one MGET, then the storage URL), that Redis failures
+fall back to inlining, and that the client resolves history once per
+generation rather than once per retry.
+"""
+
+import base64
+import json
+import logging
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.gemini_history_store import BLOB_KEY_PREFIX, GeminiHistoryStore, blob_digest
+from backend.services.nano_banana_client import GenerationRequest, GenerationResponse, NanoBananaClient
+
+IMAGE = b"\x89PNG" + bytes(range(256)) * 4000
+SIGNATURE = b"signature-bytes"
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the binary async Redis calls the store makes."""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = 0
+        self.mgets = 0
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.sets += 1
+        self.data[key] = value
+        return True
+
+    async def expire(self, key, ttl):
+        return key in self.data
+
+    async def mget(self, keys):
+        self.mgets += 1
+        return [self.data.get(key) for key in keys]
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def store(redis):
+    return GeminiHistoryStore(redis_client=redis)
+
+
+class TestModelTurn:
+    """Tests for writing history turns."""
+
+    @pytest.mark.asyncio
+    async def test_turn_holds_references_not_bytes(self, store, redis):
+        turn = await store.model_turn(IMAGE, image_url="https://cdn/a.png", thought_signature=SIGNATURE)
+
+        assert turn["image_ref"] == blob_digest(IMAGE)
+        assert turn["thought_signature_ref"] == blob_digest(SIGNATURE)
+        assert "image_data" not in turn
+        assert len(json.dumps(turn)) < 300
+        assert redis.data[f"{BLOB_KEY_PREFIX}{blob_digest(IMAGE)}"] == IMAGE
+
+    @pytest.mark.asyncio
+    async def test_same_image_is_stored_once(self, store, redis):
+        await store.model_turn(IMAGE)
+        await store.model_turn(IMAGE)
+
+        assert redis.sets == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_inlines_base64(self):
+        redis = FakeRedis()
+        redis.set = AsyncMock(side_effect=ConnectionError("down"))
+
+        turn = await GeminiHistoryStore(redis_client=redis).model_turn(IMAGE, thought_signature=SIGNATURE)
+
+        assert base64.b64decode(turn["image_data"]) == IMAGE
+        assert base64.b64decode(turn["thought_signature"]) == SIGNATURE
+        assert "image_ref" not in turn
+
+
+class TestResolveHistory:
+    """Tests for resolving references before a Gemini call."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_from_another_process(self, store, redis):
+        history = [{"role": "user", "text": "make it blue"}]
+        history.append(await store.model_turn(IMAGE, thought_signature=SIGNATURE))
+
+        # A worker with a cold LRU resolves with a single MGET
+        resolved = await GeminiHistoryStore(redis_client=redis).resolve_history(history)
+
+        assert redis.mgets == 1
+        assert resolved[0] == history[0]
+        assert base64.b64decode(resolved[1]["image_data"]) == IMAGE
+        assert base64.b64decode(resolved[1]["thought_signature"]) == SIGNATURE
+        assert "image_ref" not in resolved[1]
+        assert "image_ref" in history[1]  # stored history is not mutated
+
+    @pytest.mark.asyncio
+    async def test_lru_hit_skips_redis(self, store, redis):
+        history = [await store.model_turn(IMAGE)]
+
+        await store.resolve_history(history)
+
+        assert redis.mgets == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_blob_downloads_from_storage(self, redis):
+        writer = GeminiHistoryStore(redis_client=redis)
+        history = [await writer.model_turn(IMAGE, image_url="https://cdn/a.png")]
+        redis.data.clear()
+        reader = GeminiHistoryStore(redis_client=redis)
+        reader._download = AsyncMock(return_value=IMAGE)
+
+        resolved = await reader.resolve_history(history)
+
+        reader._download.assert_awaited_once_with("https://cdn/a.png")
+        assert base64.b64decode(resolved[0]["image_data"]) == IMAGE
+
+    @pytest.mark.asyncio
+    async def test_inline_turns_pass_through(self, store, redis):
+        legacy = [{"role": "model", "image_data": "aW1n", "thought_signature": "c2ln"}]
+
+        assert await store.resolve_history(legacy) == legacy
+        assert redis.mgets == 0
+
+    @pytest.mark.asyncio
+    async def test_unavailable_image_falls_back_to_prompt_only(self, redis, caplog):
+        history = [
+            {"role": "user", "text": "a castle"},
+            {"role": "model", "image_ref": "missing", "image_url": "https://cdn/gone.png"},
+        ]
+        store = GeminiHistoryStore(redis_client=redis)
+        store._download = AsyncMock(return_value=None)
+
+        with caplog.at_level(logging.WARNING):
+            resolved = await store.resolve_history(history)
+
+        assert resolved == []
+        assert "prompt-only" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_expired_thought_signature_is_logged(self, redis, caplog):
+        writer = GeminiHistoryStore(redis_client=redis)
+        history = [await writer.model_turn(IMAGE, thought_signature=SIGNATURE)]
+        del redis.data[f"{BLOB_KEY_PREFIX}{blob_digest(SIGNATURE)}"]
+
+        with caplog.at_level(logging.WARNING):
+            resolved = await GeminiHistoryStore(redis_client=redis).resolve_history(history)
+
+        assert base64.b64decode(resolved[0]["image_data"]) == IMAGE
+        assert "thought_signature" not in resolved[0]
+        assert "thought signature" in caplog.text
+
+
+class TestClientResolution:
+    """Tests that the client resolves history once per generation."""
+
+    @pytest.mark.asyncio
+    async def test_generate_resolves_before_retries(self, store):
+        history = [{"role": "user", "text": "a"}, await store.model_turn(IMAGE)]
+        client = NanoBananaClient(api_key="test")
+        client._request_with_retry = AsyncMock(
+            return_value=GenerationResponse(b"out", "gen", 1, 10)
+        )
+
+        with patch("backend.services.gemini_history_store.get_gemini_history_store", return_value=store):
+            await client.generate(GenerationRequest(prompt="b", width=64, height=64, conversation_history=history))
+
+        sent = client._request_with_retry.await_args.kwargs["conversation_history"]
+        assert base64.b64decode(sent[1]["image_data"]) == IMAGE
+        contents = client._build_multi_turn_contents(sent, "b", 64, 64)
+        assert contents[1]["parts"][0]["inlineData"]["data"] == sent[1]["image_data"]
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_image_sends_prompt_only(self, redis):
+        history = [{"role": "user", "text": "a"}, {"role": "model", "image_ref": "missing"}]
+        client = NanoBananaClient(api_key="test")
+        client._request_with_retry = AsyncMock(
+            return_value=GenerationResponse(b"out", "gen", 1, 10)
+        )
+
+        store = GeminiHistoryStore(redis_client=redis)
+        with patch("backend.services.gemini_history_store.get_gemini_history_store", return_value=store):
+            await client.generate(GenerationRequest(prompt="b", width=64, height=64, conversation_history=history))
+
+        assert client._request_with_retry.await_args.kwargs["conversation_history"] == []
@@ -0,0 +1,133 @@
+"""
+Unit tests for the streaming Gemini inline image decoder.
+
+Tests that inline image data decodes identically to response.json() plus
+b64decode at any chunking, that the rest of the response survives in the
+skeleton, and that the Nano Banana client streams 200 responses through it.
+"""
+
+import base64
+import json
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.services.gemini_stream import InlineDataDecoder
+from backend.services.nano_banana_client import NanoBananaClient
+
+IMAGE = os.urandom(300_001)
+SIGNATURE = os.urandom(700)
+
+
+def gemini_body(*images: bytes, escape_slashes: bool = False) -> bytes:
+    parts = [{"text": 'Here is "data": your {image}\\'}]
+    for image in images:
+        parts.append({
+            "inlineData": {"mimeType": "image/png", "data": base64.b64encode(image).decode()},
+            "thoughtSignature": base64.b64encode(SIGNATURE).decode(),
+        })
+    body = json.dumps({
+        "candidates": [{"content": {"role": "model", "parts": parts}, "finishReason": "STOP"}],
+        "usageMetadata": {"totalTokenCount": 1290},
+    }, indent=1)
+    if escape_slashes:
+        body = body.replace("/", "\\/")
+    return body.encode()
+
+
+def decode(body: bytes, chunk_size: int, size_hint=None) -> InlineDataDecoder:
+    decoder = InlineDataDecoder(size_hint=size_hint)
+    for start in range(0, len(body), chunk_size):
+        decoder.feed(body[start:start + chunk_size])
+    return decoder
+
+
+class TestInlineDataDecoder:
+    """Tests for incremental decoding."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 4096, 65536, 10**7])
+    def test_matches_full_parse_at_any_chunking(self, chunk_size):
+        body = gemini_body(IMAGE)
+        decoder = decode(body, chunk_size, size_hint=len(body))
+
+        data = decoder.result()
+        part = data["candidates"][0]["content"]["parts"][1]
+
+        assert decoder.resolve(part["inlineData"]["data"]) == IMAGE
+        assert part["thoughtSignature"] == json.loads(body)["candidates"][0]["content"]["parts"][1]["thoughtSignature"]
+        assert data["candidates"][0]["content"]["parts"][0]["text"] == 'Here is "data": your {image}\\'
+        assert data["usageMetadata"]["totalTokenCount"] == 1290
+
+    @pytest.mark.parametrize("size_hint", [None, 10, 10**7])
+    def test_size_hint_is_only_a_hint(self, size_hint):
+        decoder = decode(gemini_body(IMAGE), 4096, size_hint=size_hint)
+
+        assert decoder.blobs == [IMAGE]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+    def test_escaped_slashes(self, chunk_size):
+        decoder = decode(gemini_body(IMAGE, escape_slashes=True), chunk_size)
+
+        assert decoder.blobs == [IMAGE]
+
+    def test_multiple_images_keep_order(self):
+        second = os.urandom(1234)
+        decoder = decode(gemini_body(IMAGE, second), 4096)
+
+        assert decoder.blobs == [IMAGE, second]
+
+    def test_truncated_body_raises(self):
+        body = gemini_body(IMAGE)
+
+        with pytest.raises(ValueError):
+            decode(body[: len(body) // 2], 4096).result()
+
+    def test_extract_image_data_resolves_placeholders(self):
+        second = os.urandom(1234)
+        decoder = decode(gemini_body(IMAGE, second), 4096)
+
+        image, signature = NanoBananaClient(api_key="test")._extract_image_data(decoder.result(), decoder)
+
+        # Last inline image wins, as with the non-streaming path
+        assert image == second
+        assert signature == SIGNATURE
+
+
+class FakeResponse:
+    """aiohttp response stand-in that serves its body in chunks."""
+
+    def __init__(self, body: bytes):
+        self.status = 200
+        self.content_length = len(body)
+        self.json = AsyncMock(side_effect=AssertionError("body must be streamed"))
+        self.content = self
+        self._body = body
+
+    def iter_chunked(self, size):
+        async def chunks():
+            for start in range(0, len(self._body), size):
+                yield self._body[start:start + size]
+        return chunks()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class TestClientStreaming:
+    """Tests that the client streams successful responses."""
+
+    @pytest.mark.asyncio
+    async def test_execute_generation_streams_body(self):
+        client = NanoBananaClient(api_key="test")
+        session = AsyncMock()
+        session.post = lambda *args, **kwargs: FakeResponse(gemini_body(IMAGE))
+        client._get_session = AsyncMock(return_value=session)
+
+        response = await client._execute_generation(prompt="a", model_name="m", seed=1, width=64, height=64)
+
+        assert response.image_data == IMAGE
+        assert response.thought_signature == SIGNATURE
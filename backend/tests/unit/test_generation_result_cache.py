@@ -0,0 +1,177 @@
+"""
+Unit tests for the generation result cache.
+
+Tests that the canonical key covers every generation input, that only
+seeded non-refinement requests from enabled tiers are cached, and that the
+worker serves a seeded repeat from the cache instead of calling Gemini,
+recording provenance that points at the original generation.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.services.generation_result_cache import GenerationResultCache, result_cache_key
+from backend.services.nano_banana_client import GenerationRequest, GenerationResponse, MediaAssetInput
+from backend.services.nano_banana_provenance import GenerationContext, ProvenanceNanoBananaClient
+from backend.workers.generation_worker import _generate_with_result_cache
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def hset(self, key, mapping):
+        self.ops.append((key, mapping))
+
+    def expire(self, key, ttl):
+        pass
+
+    async def execute(self):
+        for key, mapping in self.ops:
+            self.redis.data[key] = {
+                field: value.encode() if isinstance(value, str) else value
+                for field, value in mapping.items()
+            }
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the binary Redis calls the cache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def hmget(self, key, fields):
+        entry = self.data.get(key, {})
+        return [entry.get(field) for field in fields]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def request(**overrides) -> GenerationRequest:
+    params = {
+        "prompt": "Epic victory royale thumbnail",
+        "width": 1280,
+        "height": 720,
+        "seed": 42,
+        "media_assets": [MediaAssetInput(image_data=b"face-bytes", asset_type="face", display_name="Me")],
+    }
+    params.update(overrides)
+    return GenerationRequest(**params)
+
+
+def response(image=b"generated-png", seed=42) -> GenerationResponse:
+    return GenerationResponse(
+        image_data=image, generation_id="gen-1", seed=seed, inference_time_ms=9000, thought_signature=b"sig",
+    )
+
+
+@pytest.fixture
+def cache():
+    return GenerationResultCache(redis_client=FakeRedis(), tiers=frozenset({"pro"}))
+
+
+class TestResultCacheKey:
+    """Tests for result_cache_key."""
+
+    def test_identical_inputs_share_a_key(self):
+        assert result_cache_key(request()) == result_cache_key(request())
+
+    @pytest.mark.parametrize("overrides", [
+        {"prompt": "Epic victory royale thumbnail!"},
+        {"width": 1920},
+        {"seed": 43},
+        {"model": "gemini-2.5-flash-image"},
+        {"enable_grounding": True},
+        {"input_image": b"canvas"},
+        {"media_assets": [MediaAssetInput(image_data=b"other-face", asset_type="face", display_name="Me")]},
+        {"media_assets": []},
+    ])
+    def test_any_input_change_changes_the_key(self, overrides):
+        assert result_cache_key(request(**overrides)) != result_cache_key(request())
+
+    def test_priority_does_not_change_the_key(self):
+        assert result_cache_key(request(priority="paid")) == result_cache_key(request())
+
+
+class TestGenerationResultCache:
+    """Tests for GenerationResultCache."""
+
+    def test_only_seeded_requests_from_enabled_tiers(self, cache):
+        assert cache.key_for(request(), "pro")
+        assert cache.key_for(request(seed=None), "pro") is None
+        assert cache.key_for(request(), "free") is None
+        assert cache.key_for(request(conversation_history=[{"role": "user"}]), "pro") is None
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, cache):
+        key = cache.key_for(request(), "pro")
+        assert await cache.get(key) is None
+
+        await cache.put(key, response(), job_id="job-0")
+        cached = await cache.get(key)
+
+        served = cached.response
+        assert (served.image_data, served.seed, served.thought_signature) == (b"generated-png", 42, b"sig")
+        assert served.inference_time_ms == 0
+        assert served.generation_id != "gen-1"
+        assert (cached.source_generation_id, cached.source_job_id) == ("gen-1", "job-0")
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(self, cache):
+        cache._redis.hmget = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        assert await cache.get(cache.key_for(request(), "pro")) is None
+
+
+class TestWorkerResultCache:
+    """Tests for _generate_with_result_cache in the generation worker."""
+
+    @pytest.fixture
+    def client(self):
+        client = MagicMock()
+        client.generate_with_provenance = AsyncMock(return_value=response())
+        client.record_cache_hit = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_seeded_repeat_skips_gemini(self, cache, client):
+        with patch("backend.workers.generation_worker.get_generation_result_cache", return_value=cache):
+            first = await _generate_with_result_cache(client, request(), MagicMock(job_id="job-1"), user_tier="pro")
+            second = await _generate_with_result_cache(client, request(), MagicMock(job_id="job-2"), user_tier="pro")
+
+        assert client.generate_with_provenance.await_count == 1
+        assert second.image_data == first.image_data
+
+        # The hit is recorded, pointing at the job that generated the image
+        client.record_cache_hit.assert_awaited_once()
+        hit = client.record_cache_hit.await_args.kwargs
+        assert hit["response"] is second
+        assert (hit["source_generation_id"], hit["source_job_id"]) == ("gen-1", "job-1")
+
+    @pytest.mark.asyncio
+    async def test_unseeded_requests_always_generate(self, cache, client):
+        context = MagicMock(job_id="job-1")
+        with patch("backend.workers.generation_worker.get_generation_result_cache", return_value=cache):
+            await _generate_with_result_cache(client, request(seed=None), context, user_tier="pro")
+            await _generate_with_result_cache(client, request(seed=None), context, user_tier="pro")
+
+        assert client.generate_with_provenance.await_count == 2
+        assert cache._redis.data == {}
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_provenance_names_the_source(self):
+        service = MagicMock()
+        with patch("backend.services.nano_banana_provenance.get_provenance_service", return_value=service), \
+                patch("backend.services.provenance.capture.get_provenance_service", return_value=service):
+            client = ProvenanceNanoBananaClient(client=MagicMock(model="gemini-test"))
+            context = GenerationContext(job_id="job-2", user_id="u", execution_id="gen_job-2", asset_type="thumbnail")
+            await client.record_cache_hit(request(), response(), context, "gen-1", "job-1")
+
+        record = service.store.call_args.args[0]
+        assert record.insight_value["cached"] is True
+        assert (record.insight_value["source_generation_id"], record.insight_value["source_job_id"]) == ("gen-1", "job-1")
+        assert record.data_sources[0].sample_ids == ["gen-1"]
+        assert "result_cache_hit" in record.tags
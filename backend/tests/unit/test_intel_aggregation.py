@@ -0,0 +1,221 @@
+"""
+Unit tests for incremental Creator Intel aggregation.
+
+Tests mergeable partials, hash-driven change detection in the hourly
+aggregator and the daily rollup merging hourly partials.
+"""
+
+import json
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.services.intel.aggregation.daily import DailyRollup
+from backend.services.intel.aggregation.hourly import HourlyAggregator
+from backend.services.intel.aggregation.partials import (
+    HourPartial,
+    VideoPartial,
+    partial_field,
+    partials_key,
+    state_key,
+)
+
+
+def _videos():
+    return [
+        {"video_id": "a", "view_count": 1000, "engagement_rate": 0.1, "duration_seconds": 600,
+         "is_short": False, "default_audio_language": "en-US"},
+        {"video_id": "b", "view_count": 3000, "engagement_rate": 0.3, "duration_seconds": 30,
+         "is_short": True, "default_audio_language": "es"},
+        {"video_id": "c", "view_count": 2000, "engagement_rate": None,
+         "is_short": False, "default_audio_language": None},
+    ]
+
+
+def _redis_with(store: dict):
+    """Async Redis mock backed by a dict for GET-style reads."""
+    redis = AsyncMock()
+    redis.mget.side_effect = lambda *keys: [store.get(k) for k in keys]
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[])
+    redis.pipeline = MagicMock(return_value=pipe)
+    return redis
+
+
+class TestVideoPartial:
+    """Tests for the mergeable video partial."""
+
+    def test_from_videos_matches_direct_averages(self):
+        partial = VideoPartial.from_videos(_videos())
+
+        assert partial.video_count == 3
+        assert partial.total_views == 6000
+        assert partial.avg_views == 2000
+        assert partial.avg_engagement == pytest.approx(0.4 / 3)
+        assert partial.avg_duration_seconds == 315
+        assert partial.shorts_avg_views == 3000
+        assert partial.longform_avg_views == 1500
+        assert partial.language_counts == {"en": 2, "es": 1}
+        assert partial.dominant_language == "en"
+
+    def test_merge_equals_partial_of_combined_videos(self):
+        videos = _videos()
+        merged = VideoPartial.from_videos(videos[:1]).merge(VideoPartial.from_videos(videos[1:]))
+
+        assert merged == VideoPartial.from_videos(videos)
+
+    def test_hour_partial_round_trip(self):
+        hour = HourPartial(
+            hour=7, videos=VideoPartial.from_videos(_videos()),
+            viral_count=2, avg_views=2000.0, optimal_duration_bucket="8-12 min",
+        )
+
+        assert HourPartial.from_json(hour.to_json().encode()) == hour
+        assert HourPartial.from_json("not json") is None
+
+
+class TestHourlyAggregator:
+    """Tests for hash-driven incremental hourly aggregation."""
+
+    @pytest.fixture
+    def aggregator_games(self, monkeypatch):
+        monkeypatch.setattr(HourlyAggregator, "TRACKED_GAMES", ["fortnite", "valorant"])
+
+    @pytest.mark.asyncio
+    async def test_changed_hash_recomputes_and_saves_state(self, aggregator_games):
+        """Games without matching state are recomputed from the raw blob."""
+        store = {
+            "youtube:hash:fortnite": "h1",
+            "youtube:games:fortnite": json.dumps({"videos": _videos()}),
+        }
+        redis = _redis_with(store)
+        db = MagicMock()
+
+        count = await HourlyAggregator(redis, db).run()
+
+        assert count == 1
+        assert redis.mget.await_count == 2
+        records = db.table.return_value.upsert.call_args.args[0]
+        assert records[0]["total_views"] == 6000
+
+        pipe = redis.pipeline.return_value
+        saved_key, saved_state = pipe.set.call_args.args
+        assert saved_key == state_key("fortnite")
+        assert json.loads(saved_state)["source_hash"] == "h1"
+        assert pipe.hset.call_args.args[0].startswith("intel:agg:partials:")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_hash_skips_raw_data(self, aggregator_games):
+        """Matching collector hashes reuse the saved partial without reading videos."""
+        partial = VideoPartial.from_videos(_videos())
+        store = {
+            "youtube:hash:fortnite": "h1",
+            state_key("fortnite"): json.dumps({"source_hash": "h1", "videos": partial.to_dict()}),
+            "youtube:hash:valorant": "h2",
+            state_key("valorant"): json.dumps({"source_hash": "h2", "videos": partial.to_dict()}),
+            "intel:viral:precomputed:fortnite": json.dumps({"data": {"viral_video_count": 4}}),
+        }
+        redis = _redis_with(store)
+        db = MagicMock()
+
+        count = await HourlyAggregator(redis, db).run()
+
+        assert count == 2
+        redis.mget.assert_awaited_once()
+        db.table.return_value.upsert.assert_called_once()
+        records = db.table.return_value.upsert.call_args.args[0]
+        assert [r["category_key"] for r in records] == ["fortnite", "valorant"]
+        assert records[0]["viral_count"] == 4
+        assert records[0]["avg_views"] == 2000
+        redis.pipeline.return_value.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_state_is_recomputed(self, aggregator_games):
+        store = {
+            "youtube:hash:fortnite": "new",
+            state_key("fortnite"): json.dumps({"source_hash": "old", "videos": VideoPartial().to_dict()}),
+            "youtube:games:fortnite": json.dumps({"videos": _videos()}),
+        }
+        redis = _redis_with(store)
+        db = MagicMock()
+
+        await HourlyAggregator(redis, db).run()
+
+        records = db.table.return_value.upsert.call_args.args[0]
+        assert records[0]["video_count"] == 3
+
+
+class TestDailyRollup:
+    """Tests for daily rollups merging hourly partials."""
+
+    @staticmethod
+    def _hour(hour: int, viral: int, avg_views: float, langs: dict) -> HourPartial:
+        return HourPartial(
+            hour=hour,
+            videos=VideoPartial(
+                video_count=10, total_views=int(avg_views * 10),
+                shorts_count=2, shorts_views=4000, longform_count=8, longform_views=8000,
+                language_counts=langs,
+            ),
+            viral_count=viral,
+            avg_views=avg_views,
+            optimal_duration_bucket="8-12 min",
+        )
+
+    @pytest.mark.asyncio
+    async def test_merges_partials_without_querying_hourly_table(self):
+        target = date(2025, 1, 1)
+        redis = AsyncMock()
+        redis.hgetall.return_value = {
+            partial_field("fortnite", 1).encode(): self._hour(1, 2, 100.0, {"en": 5}).to_json().encode(),
+            partial_field("fortnite", 5): self._hour(5, 6, 300.0, {"en": 3, "es": 2}).to_json(),
+        }
+        db = MagicMock()
+        db.table.return_value.select.return_value.eq.return_value.eq.return_value \
+            .single.return_value.execute.side_effect = Exception("Not found")
+        rollup = DailyRollup(db, redis)
+
+        hours = await rollup._load_hour_partials(target)
+        result = await rollup._rollup_game("fortnite", target, hours.get("fortnite"))
+
+        redis.hgetall.assert_awaited_once_with(partials_key("2025-01-01"))
+        db.table.return_value.select.return_value.eq.return_value.gte.assert_not_called()
+        assert result.total_videos_seen == 20
+        assert result.peak_viral_count == 6
+        assert result.avg_viral_count == 4
+        assert result.best_hour_utc == 5
+        assert result.worst_hour_utc == 1
+        assert result.shorts_performance_ratio == 2.0
+        assert result.dominant_language == "en"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_hourly_rows(self):
+        """Without Redis partials the hourly table rows are merged instead."""
+        db = MagicMock()
+        db.table.return_value.select.return_value.eq.return_value.gte.return_value.lt.return_value \
+            .order.return_value.execute.return_value = MagicMock(data=[{
+                "hour_start": datetime(2025, 1, 1, 3, tzinfo=timezone.utc).isoformat(),
+                "video_count": 10,
+                "avg_views": 500,
+                "total_views": 5000,
+                "viral_count": 3,
+                "shorts_count": 2,
+                "shorts_avg_views": 1000,
+                "longform_count": 8,
+                "longform_avg_views": 500,
+                "optimal_duration_bucket": "5-10min",
+                "language_distribution": json.dumps({"en": 6, "fr": 4}),
+            }])
+        db.table.return_value.select.return_value.eq.return_value.eq.return_value \
+            .single.return_value.execute.side_effect = Exception("Not found")
+
+        rollup = DailyRollup(db)
+        assert await rollup._load_hour_partials(date(2025, 1, 1)) == {}
+
+        result = await rollup._rollup_game("fortnite", date(2025, 1, 1))
+
+        assert result.total_videos_seen == 10
+        assert result.best_hour_utc == 3
+        assert result.shorts_performance_ratio == 2.0
+        assert result.language_diversity_score > 0
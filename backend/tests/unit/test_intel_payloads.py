@@ -0,0 +1,315 @@
+"""
+Unit tests for precomputed Creator Intel response payloads.
+
+Tests payload serialization, ETag handling, worker-side publishing and
+the routes serving stored bytes without running analysis.
+"""
+
+import asyncio
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.services.intel.api.payloads import (
+    IntelPayload,
+    IntelPayloadStore,
+    accepts_gzip,
+    build_combined_response,
+    etag_matches,
+    payload_key,
+    published_key,
+)
+from backend.services.intel.api.schemas import DescriptionResponse, ContentFormatResponse
+
+
+def _comparison(a: str, b: str) -> dict:
+    return {
+        "format_a": a,
+        "format_b": b,
+        "format_a_count": 10,
+        "format_b_count": 20,
+        "format_a_avg_views": 1000.0,
+        "format_b_avg_views": 2000.0,
+        "performance_ratio": 0.5,
+        "recommendation": f"Prefer {b}",
+        "confidence": 70,
+    }
+
+
+def _format_data(confidence: int = 80, insights: int = 1) -> dict:
+    return {
+        "category_key": "fortnite",
+        "category_name": "Fortnite",
+        "duration_buckets": [],
+        "optimal_duration_range": "8-12 min",
+        "optimal_duration_min_seconds": 480,
+        "optimal_duration_max_seconds": 720,
+        "shorts_vs_longform": _comparison("shorts", "longform"),
+        "live_vs_vod": _comparison("live", "vod"),
+        "hd_vs_sd": _comparison("hd", "sd"),
+        "insights": [f"Insight number {i} about video length" for i in range(insights)],
+        "video_count": 50,
+        "confidence": confidence,
+        "analyzed_at": "2025-01-01T00:00:00+00:00",
+    }
+
+
+def _description_data(confidence: int = 60) -> dict:
+    return {
+        "category_key": "fortnite",
+        "category_name": "Fortnite",
+        "top_hashtags": [],
+        "hashtag_count_avg": 2.5,
+        "has_timestamps_percent": 40.0,
+        "common_chapter_patterns": [],
+        "has_sponsor_percent": 10.0,
+        "sponsor_patterns": [],
+        "has_social_links_percent": 70.0,
+        "common_platforms": ["twitter"],
+        "insights": [],
+        "video_count": 50,
+        "confidence": confidence,
+        "analyzed_at": "2025-01-01T00:00:00+00:00",
+    }
+
+
+class TestIntelPayload:
+    """Tests for payload serialization."""
+
+    def test_etag_is_stable_for_identical_content(self):
+        """The same response always produces the same bytes and ETag."""
+        first = IntelPayload.from_model(ContentFormatResponse(**_format_data()))
+        second = IntelPayload.from_model(ContentFormatResponse(**_format_data()))
+
+        assert first.etag == second.etag
+        assert first.body == second.body
+        assert json.loads(first.body)["category_key"] == "fortnite"
+
+    def test_etag_changes_with_content(self):
+        first = IntelPayload.from_model(ContentFormatResponse(**_format_data(confidence=80)))
+        second = IntelPayload.from_model(ContentFormatResponse(**_format_data(confidence=81)))
+
+        assert first.etag != second.etag
+
+    def test_large_payloads_are_precompressed(self):
+        """Bodies over the threshold carry a gzip copy; small ones do not."""
+        small = IntelPayload.from_model(DescriptionResponse(**_description_data()))
+        large = IntelPayload.from_model(ContentFormatResponse(**_format_data(insights=40)))
+
+        assert small.gzip_body is None
+        assert gzip.decompress(large.gzip_body) == large.body
+
+    def test_etag_matching(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"x", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+        assert not etag_matches('"x"', '"abc"')
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches('"abc"', None)
+
+    @pytest.mark.parametrize("header, expected", [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, *;q=1", False),
+        ("x-gzip", False),
+        ("identity", False),
+        ("", False),
+        (None, False),
+    ])
+    def test_accepts_gzip_honors_q_values(self, header, expected):
+        assert accepts_gzip(header) is expected
+
+
+class TestCombinedBuilder:
+    """Tests for building the combined response."""
+
+    def test_combines_available_analyzers(self):
+        combined = build_combined_response("fortnite", {
+            "format": ContentFormatResponse(**_format_data(confidence=80)),
+            "description": DescriptionResponse(**_description_data(confidence=60)),
+        })
+
+        assert combined.analyzers_available == ["content_format", "description"]
+        assert combined.confidence.score == 70
+        assert combined.confidence.label == "Recent"
+        assert combined.semantic is None
+
+    def test_no_data_returns_none(self):
+        assert build_combined_response("fortnite", {}) is None
+
+
+class TestIntelPayloadStore:
+    """Tests for publishing and loading payloads."""
+
+    @pytest.fixture
+    def mock_redis(self):
+        redis = AsyncMock()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        redis.pipeline = MagicMock(return_value=pipe)
+        return redis
+
+    @pytest.mark.asyncio
+    async def test_publish_writes_endpoint_and_combined_payloads(self, mock_redis):
+        """Available analyses are published; missing ones are cleared."""
+        mock_redis.mget.return_value = [
+            json.dumps({"data": _format_data()}).encode(),
+            None, None, None, None,
+        ]
+        store = IntelPayloadStore(redis_client=mock_redis)
+
+        published = await store.publish_category("fortnite")
+
+        assert published == ["format", "combined"]
+        pipe = mock_redis.pipeline.return_value
+        written = [call.args[0] for call in pipe.hset.call_args_list]
+        assert written == [payload_key("fortnite", "format"), payload_key("fortnite", "combined")]
+        deleted = {call.args[0] for call in pipe.delete.call_args_list}
+        assert payload_key("fortnite", "semantic") in deleted
+        assert pipe.set.call_args.args[0] == published_key("fortnite")
+
+    @pytest.mark.asyncio
+    async def test_cold_miss_publishes_once_for_concurrent_requests(self, mock_redis):
+        """Concurrent misses on an unpublished category share one stored build."""
+        stored = IntelPayload(etag='"tag"', body=b"{}")
+        mock_redis.hmget.side_effect = [[None, None]] * 3 + [[b'"tag"', b"{}"]] * 3
+        mock_redis.exists.return_value = 0
+        store = IntelPayloadStore(redis_client=mock_redis)
+
+        async def slow_publish(category_key):
+            await asyncio.sleep(0.01)
+            return ["format"]
+
+        with patch.object(store, "publish_category", side_effect=slow_publish) as publish:
+            payloads = await asyncio.gather(*(store.load("fortnite", "format") for _ in range(3)))
+
+        publish.assert_awaited_once_with("fortnite")
+        assert payloads == [stored] * 3
+
+    @pytest.mark.asyncio
+    async def test_published_category_without_endpoint_data_is_not_rebuilt(self, mock_redis):
+        mock_redis.hmget.return_value = [None, None]
+        mock_redis.exists.return_value = 1
+        store = IntelPayloadStore(redis_client=mock_redis)
+
+        with patch.object(store, "publish_category", new_callable=AsyncMock) as publish:
+            assert await store.load("fortnite", "semantic") is None
+
+        publish.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_prefers_gzip_when_accepted(self, mock_redis):
+        mock_redis.hmget.return_value = [b'"tag"', b"gz-bytes"]
+        store = IntelPayloadStore(redis_client=mock_redis)
+
+        payload = await store.get("fortnite", "format", accept_gzip=True)
+
+        mock_redis.hmget.assert_awaited_once_with(payload_key("fortnite", "format"), ["etag", "gzip"])
+        assert payload.gzip_body == b"gz-bytes"
+        assert payload.etag == '"tag"'
+
+
+class TestIntelRoutes:
+    """Tests for routes serving precomputed payloads."""
+
+    @pytest.fixture
+    def payload(self):
+        return IntelPayload.from_model(ContentFormatResponse(**_format_data(insights=40)))
+
+    @pytest.fixture
+    def store(self, payload):
+        store = MagicMock()
+        store.get_etag = AsyncMock(return_value=payload.etag)
+        store.load = AsyncMock(return_value=payload)
+        return store
+
+    @pytest.fixture
+    def client(self, store):
+        from backend.services.intel.api.routes import router
+
+        app = FastAPI()
+        app.include_router(router)
+        with patch("backend.services.intel.api.routes.get_intel_payload_store", return_value=store):
+            yield TestClient(app)
+
+    def test_serves_stored_bytes_with_etag(self, client, payload):
+        response = client.get("/api/v1/intel/fortnite/format", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.content == payload.body
+        assert response.headers["etag"] == payload.etag
+        assert "content-encoding" not in response.headers
+
+    def test_serves_precompressed_body(self, client, store, payload):
+        response = client.get("/api/v1/intel/fortnite/format", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == payload.body  # transparently decompressed by the client
+        store.load.assert_awaited_once_with("fortnite", "format", accept_gzip=True)
+
+    def test_gzip_refused_with_zero_quality(self, client, store, payload):
+        response = client.get("/api/v1/intel/fortnite/format", headers={"Accept-Encoding": "gzip;q=0"})
+
+        assert "content-encoding" not in response.headers
+        store.load.assert_awaited_once_with("fortnite", "format", accept_gzip=False)
+
+    def test_if_none_match_returns_304_without_loading_body(self, client, store, payload):
+        response = client.get(
+            "/api/v1/intel/fortnite/format",
+            headers={"If-None-Match": payload.etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == payload.etag
+        store.load.assert_not_awaited()
+
+    def test_missing_payload_never_runs_analysis(self, client, store):
+        store.load.return_value = None
+
+        with patch(
+            "backend.services.intel.analyzers.content_format.ContentFormatAnalyzer.analyze_with_cache",
+            new_callable=AsyncMock,
+        ) as analyze:
+            response = client.get("/api/v1/intel/fortnite/combined")
+
+        assert response.status_code == 404
+        assert store.load.await_args.args == ("fortnite", "combined")
+        analyze.assert_not_awaited()
+
+
+    @pytest.mark.parametrize("category_key, status", [("made_up_game", 404), ("Bad-Key", 400)])
+    def test_unknown_categories_never_publish(self, client, store, category_key, status):
+        response = client.get(f"/api/v1/intel/{category_key}/combined")
+
+        assert response.status_code == status
+        store.get_etag.assert_not_awaited()
+        store.load.assert_not_awaited()
+
+class TestOrchestratorPublishing:
+    """The intel v2 orchestrator republishes payloads after each analysis run."""
+
+    @pytest.mark.asyncio
+    async def test_analysis_run_publishes_succeeded_categories(self):
+        from backend.workers.intel.orchestrator import IntelOrchestrator
+
+        results = {
+            "fortnite": MagicMock(analyzers_succeeded=["content_format"]),
+            "valorant": MagicMock(analyzers_succeeded=[]),
+        }
+        store = MagicMock()
+        store.publish_category = AsyncMock(return_value=["format"])
+
+        with patch("backend.services.intel.analyzers.runner.run_all_analyzers", AsyncMock(return_value=results)), \
+                patch("backend.services.intel.api.payloads.get_intel_payload_store", return_value=store):
+            await IntelOrchestrator(MagicMock(), MagicMock())._run_intel_analysis()
+
+        store.publish_category.assert_awaited_once_with("fortnite")
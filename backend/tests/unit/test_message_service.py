@@ -0,0 +1,227 @@
+"""
+Unit tests for the direct message service.
+
+Tests the set-based inbox query (one RPC plus one batched profile fetch)
+and the cached per-user unread counter maintained by send_message and
+mark_as_read, including that a rebuild never overwrites an adjustment made
+while it read the database.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.services import message_service
+from backend.services.message_service import UNREAD_COUNT_KEY, UNREAD_GENERATION_KEY, MessageService
+
+USER = "user-a"
+
+
+def _summary(conversation_id, other_user_id, unread_count, last_message=True):
+    row = {
+        "conversation_id": conversation_id,
+        "other_user_id": other_user_id,
+        "updated_at": "2026-01-02T00:00:00+00:00",
+        "last_message_id": None,
+        "last_message_content": None,
+        "last_message_sender_id": None,
+        "last_message_created_at": None,
+        "unread_count": unread_count,
+    }
+    if last_message:
+        row.update({
+            "last_message_id": f"msg-{conversation_id}",
+            "last_message_content": "hello",
+            "last_message_sender_id": other_user_id,
+            "last_message_created_at": "2026-01-02T00:00:00+00:00",
+        })
+    return row
+
+
+class FakeRedis:
+    """Dict-backed stand-in that runs the two unread-counter scripts."""
+
+    def __init__(self):
+        self.data = {}
+        self.evals = []
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], [str(arg) for arg in args[numkeys:]]
+        self.evals.append((script, keys, argv))
+        counter, generation = keys
+        if script == message_service._ADJUST_UNREAD_SCRIPT:
+            await self.incr(generation)
+            if counter not in self.data:
+                return None
+            self.data[counter] = str(max(0, int(self.data[counter]) + int(argv[0])))
+            return int(self.data[counter])
+        if self.data.get(generation, "0") != argv[1] or counter in self.data:
+            return 0
+        self.data[counter] = argv[0]
+        return 1
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def supabase():
+    supabase = MagicMock()
+    supabase.rpc.return_value.execute.return_value = MagicMock(data=[
+        _summary("conv-1", "user-b", 2),
+        _summary("conv-2", "user-c", 0, last_message=False),
+    ])
+    users = MagicMock()
+    users.select.return_value.in_.return_value.execute.return_value = MagicMock(data=[
+        {"id": "user-b", "display_name": "Bee", "avatar_url": "https://cdn/b.png"},
+    ])
+    supabase.table.side_effect = lambda name: users if name == "users" else MagicMock()
+    return supabase
+
+
+@pytest.fixture
+def service(supabase, redis):
+    service = MessageService(redis_client=redis)
+    service._supabase = supabase
+    return service
+
+
+class TestGetConversations:
+    """Tests for the batched inbox query."""
+
+    @pytest.mark.asyncio
+    async def test_one_rpc_and_one_profile_fetch(self, service, supabase, redis):
+        result = await service.get_conversations(USER)
+
+        supabase.rpc.assert_called_once_with("get_conversation_summaries", {"p_user_id": USER})
+        supabase.table.assert_called_once_with("users")
+        supabase.table("users").select.return_value.in_.assert_called_once()
+
+        first, second = result["conversations"]
+        assert first["other_user_display_name"] == "Bee"
+        assert first["last_message"]["id"] == "msg-conv-1"
+        assert first["unread_count"] == 2
+        assert second["other_user_display_name"] is None
+        assert second["last_message"] is None
+        assert result["total_unread"] == 2
+        assert redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] == "2"
+
+    @pytest.mark.asyncio
+    async def test_does_not_overwrite_an_existing_counter(self, service, redis):
+        redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] = "5"
+
+        await service.get_conversations(USER)
+
+        assert redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] == "5"
+
+    @pytest.mark.asyncio
+    async def test_no_conversations_skips_profile_fetch(self, service, supabase):
+        supabase.rpc.return_value.execute.return_value = MagicMock(data=[])
+
+        result = await service.get_conversations(USER)
+
+        assert result == {"conversations": [], "total_unread": 0}
+        supabase.table.assert_not_called()
+
+
+class TestUnreadCounter:
+    """Tests for the cached per-user unread counter."""
+
+    @pytest.mark.asyncio
+    async def test_cached_count_skips_database(self, service, supabase, redis):
+        redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] = "7"
+
+        assert await service.get_unread_count(USER) == 7
+        supabase.rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_miss_rebuilds_counter_from_summaries(self, service, supabase, redis):
+        assert await service.get_unread_count(USER) == 2
+
+        supabase.rpc.assert_called_once()
+        assert redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] == "2"
+
+    @pytest.mark.asyncio
+    async def test_adjustment_during_rebuild_is_not_overwritten(self, service, supabase, redis):
+        summaries = service._get_conversation_summaries
+
+        async def summaries_then_new_message(user_id):
+            rows = await summaries(user_id)
+            # A message arrives after the database read, before the cache write
+            await service._adjust_cached_unread(USER, 1)
+            return rows
+
+        service._get_conversation_summaries = summaries_then_new_message
+
+        assert await service.get_unread_count(USER) == 2
+
+        # The stale total is not cached; the next read rebuilds with the new message
+        assert UNREAD_COUNT_KEY.format(user_id=USER) not in redis.data
+        service._get_conversation_summaries = summaries
+        supabase.rpc.return_value.execute.return_value = MagicMock(data=[_summary("conv-1", "user-b", 3)])
+        assert await service.get_unread_count(USER) == 3
+        assert redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] == "3"
+
+    @pytest.mark.asyncio
+    async def test_redis_error_falls_back_to_database(self, service, redis):
+        redis.mget = AsyncMock(side_effect=ConnectionError("down"))
+        redis.eval = AsyncMock()
+
+        assert await service.get_unread_count(USER) == 2
+        redis.eval.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_send_increments_recipient_counter(self, service, redis):
+        service._is_blocked = AsyncMock(return_value=False)
+        service.get_or_create_conversation = AsyncMock(return_value={"id": "conv-1"})
+        service._supabase.table.side_effect = None
+        service._supabase.table.return_value.insert.return_value.execute.return_value = MagicMock(
+            data=[{"id": "msg-1"}]
+        )
+
+        await service.send_message(USER, "user-b", "hi there")
+
+        assert len(redis.evals) == 1
+        _, keys, argv = redis.evals[0]
+        assert keys == (UNREAD_COUNT_KEY.format(user_id="user-b"), UNREAD_GENERATION_KEY.format(user_id="user-b"))
+        assert argv[0] == "1"
+        assert redis.data[UNREAD_GENERATION_KEY.format(user_id="user-b")] == "1"
+
+    @pytest.mark.asyncio
+    async def test_mark_as_read_decrements_by_marked_count(self, service, redis):
+        service.get_or_create_conversation = AsyncMock(return_value={"id": "conv-1"})
+        service._supabase.table.side_effect = None
+        update = service._supabase.table.return_value.update.return_value
+        update.eq.return_value.eq.return_value.is_.return_value.execute.return_value = MagicMock(
+            data=[{"id": "m1"}, {"id": "m2"}, {"id": "m3"}]
+        )
+        redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] = "5"
+
+        result = await service.mark_as_read(USER, "user-b")
+
+        assert result == {"marked_count": 3}
+        assert redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] == "2"
+
+    @pytest.mark.asyncio
+    async def test_failed_adjustment_drops_counter(self, service, redis):
+        redis.data[UNREAD_COUNT_KEY.format(user_id=USER)] = "5"
+        redis.eval = AsyncMock(side_effect=ConnectionError("down"))
+
+        await service._adjust_cached_unread(USER, 1)
+
+        assert UNREAD_COUNT_KEY.format(user_id=USER) not in redis.data
+        assert redis.data[UNREAD_GENERATION_KEY.format(user_id=USER)] == "1"
@@ -0,0 +1,104 @@
+"""
+Unit tests for the bounded password hash pool.
+
+Tests that bcrypt runs off the event loop, that the admission limit
+sheds load with PasswordHashingBusyError, and that the API maps that
+error to a 503 with Retry-After.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.main import password_hashing_busy_handler
+from backend.services.exceptions import PasswordHashingBusyError
+from backend.services.password_service import PasswordHashPool, PasswordService
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(workers=1, max_pending=2, kind="thread", retry_after=3)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def service(pool):
+    return PasswordService(cost_factor=4, hash_pool=pool)
+
+
+def _blocking_job(release: threading.Event):
+    def job():
+        release.wait(5)
+        return "done", 0.0
+    return job
+
+
+class TestPasswordHashPool:
+    """Tests for the dedicated bcrypt pool."""
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self, service, pool):
+        hashed = await service.hash_password_async("Sup3rSecret!")
+
+        assert await service.verify_password_async("Sup3rSecret!", hashed) is True
+        assert await service.verify_password_async("wrong", hashed) is False
+        assert await service.verify_password_async("x", "not-a-bcrypt-hash") is False
+        assert service.verify_password("Sup3rSecret!", hashed) is True
+        assert pool.stats()["completed"] == 4
+
+    @pytest.mark.asyncio
+    async def test_rejects_beyond_admission_limit(self, pool):
+        release = threading.Event()
+        job = _blocking_job(release)
+        running = [asyncio.create_task(pool.run("verify", job)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+
+        assert pool.pending == 2
+        with pytest.raises(PasswordHashingBusyError) as exc_info:
+            await pool.run("verify", job)
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.details["retry_after_seconds"] == 3
+
+        release.set()
+        assert await asyncio.gather(*running) == ["done", "done"]
+        assert pool.stats()["pending"] == 0
+        assert pool.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self, service):
+        """Other coroutines keep running while bcrypt work is queued."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(service.hash_password_async("Sup3rSecret!") for _ in range(2)))
+        task.cancel()
+
+        assert ticks > 2
+
+
+class TestPasswordHashingBusyResponse:
+    """Tests for the API's load-shedding response."""
+
+    def test_busy_error_returns_503_with_retry_after(self):
+        app = FastAPI()
+        app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
+
+        @app.post("/api/v1/auth/login")
+        async def login():
+            raise PasswordHashingBusyError(retry_after=2)
+
+        response = TestClient(app).post("/api/v1/auth/login")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "2"
+        assert response.json()["error"]["code"] == "AUTH_BUSY"
@@ -5,7 +5,7 @@ Tests the metrics collection, export format, and business metric tracking.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from backend.api.middleware.prometheus_metrics import (
     MetricsRegistry,
@@ -188,52 +188,66 @@ class TestBusinessMetrics:
 class TestPrometheusMiddleware:
     """Tests for the Prometheus middleware."""
     
-    @pytest.fixture
-    def mock_app(self):
-        """Create a mock FastAPI app."""
-        app = MagicMock()
-        app.routes = []
-        return app
+    @staticmethod
+    def _scope(path, route=None):
+        scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+        if route is not None:
+            scope["route"] = route
+        return scope
     
-    @pytest.fixture
-    def middleware(self, mock_app):
-        """Create middleware instance."""
-        return PrometheusMiddleware(mock_app)
+    @staticmethod
+    def _app(status=200, set_route=None):
+        """ASGI app that optionally records a matched route like the router does."""
+        async def app(scope, receive, send):
+            if set_route is not None:
+                scope["route"] = set_route
+            await send({"type": "http.response.start", "status": status, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+        return app
     
     @pytest.mark.asyncio
-    async def test_middleware_tracks_request(self, middleware):
-        """Middleware should track request metrics."""
-        # Create mock request and response
-        request = MagicMock()
-        request.url.path = "/api/v1/test"
-        request.method = "GET"
-        request.app.routes = []
+    async def test_middleware_tracks_request(self):
+        """Middleware should label metrics with the matched route template."""
+        route = MagicMock(path="/api/v1/items/{item_id}")
+        middleware = PrometheusMiddleware(self._app(status=201, set_route=route))
+        send = AsyncMock()
+        
+        await middleware(self._scope("/api/v1/items/42"), AsyncMock(), send)
         
-        response = MagicMock()
-        response.status_code = 200
+        assert send.await_count == 2
+        export = get_registry().export()
+        assert 'path="/api/v1/items/{item_id}",status="201"' in export
+        assert "/api/v1/items/42" not in export
+    
+    @pytest.mark.asyncio
+    async def test_middleware_records_500_on_exception(self):
+        """Unhandled errors are counted as 500s and re-raised."""
+        async def failing_app(scope, receive, send):
+            raise RuntimeError("boom")
         
-        async def call_next(req):
-            return response
+        middleware = PrometheusMiddleware(failing_app)
         
-        # Process request
-        with patch.object(middleware, '_get_path_template', return_value="/api/v1/test"):
-            result = await middleware.dispatch(request, call_next)
+        with pytest.raises(RuntimeError):
+            await middleware(self._scope("/api/v1/failing"), AsyncMock(), AsyncMock())
         
-        assert result == response
+        assert 'path="/api/v1/failing",status="500"' in get_registry().export()
     
     @pytest.mark.asyncio
-    async def test_middleware_skips_metrics_endpoint(self, middleware):
+    async def test_middleware_skips_metrics_endpoint(self):
         """Middleware should skip the metrics endpoint itself."""
-        request = MagicMock()
-        request.url.path = "/metrics"
+        middleware = PrometheusMiddleware(self._app())
         
-        response = MagicMock()
+        await middleware(self._scope("/metrics"), AsyncMock(), AsyncMock())
+        
+        assert 'path="/metrics"' not in get_registry().export()
+    
+    def test_path_template_falls_back_to_truncated_path(self):
+        """Unmatched paths are truncated to bound label cardinality."""
+        path = "/api/v1/" + "x" * 100
         
-        async def call_next(req):
-            return response
+        template = PrometheusMiddleware._get_path_template(self._scope(path))
         
-        result = await middleware.dispatch(request, call_next)
-        assert result == response
+        assert template == path[:50] + "..."
 
 
 class TestMetricsRouter:
@@ -0,0 +1,409 @@
+"""
+Unit tests for the indexed provenance query engine and its rollups.
+
+Tests that queries are answered from the sorted-set indexes (unions within a
+dimension, intersections across dimensions, range filters, sort indexes),
+that only the requested page is loaded with one MGET, that retention
+trimming drops expired IDs from the global indexes, and that aggregates
+come from the hourly/daily rollups without loading records.
+"""
+
+import fnmatch
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.provenance import service as service_module
+from backend.services.provenance.models import (
+    ConfidenceLevel,
+    DecisionFactor,
+    InsightType,
+    ProvenanceQuery,
+    ProvenanceRecord,
+)
+from backend.services.provenance.service import (
+    INDEX_BY_SCORE,
+    INDEX_BY_TIME,
+    RECORD_KEY,
+    RECORD_TTL,
+    SEARCH_KEY,
+    ProvenanceService,
+    _rollup_buckets,
+)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the sync Redis commands the service uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    # Strings
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def get(self, key):
+        self.calls.append("get")
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.calls.append("mget")
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def expire(self, key, ttl):
+        pass
+
+    def keys(self, pattern):
+        return [key for key in self.data if fnmatch.fnmatch(key, pattern)]
+
+    # Hashes
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        self.calls.append("hgetall")
+        return {field: str(value) for field, value in self.data.get(key, {}).items()}
+
+    def hmget(self, key, fields):
+        values = self.data.get(key, {})
+        return [values.get(field) for field in fields]
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.data.get(key, {}).pop(field, None)
+
+    def hincrby(self, key, field, amount):
+        values = self.data.setdefault(key, {})
+        values[field] = int(values.get(field, 0)) + amount
+
+    def hincrbyfloat(self, key, field, amount):
+        values = self.data.setdefault(key, {})
+        values[field] = float(values.get(field, 0)) + amount
+
+    # Lists
+    def lpush(self, key, value):
+        self.data.setdefault(key, []).insert(0, value)
+
+    def ltrim(self, key, start, stop):
+        self.data[key] = self.data.get(key, [])[start:stop + 1]
+
+    def lrange(self, key, start, stop):
+        values = self.data.get(key, [])
+        return values[start:] if stop == -1 else values[start:stop + 1]
+
+    # Sorted sets
+    def _zset(self, key):
+        return self.data.get(key, {})
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, *members):
+        for member in members:
+            self._zset(key).pop(member, None)
+
+    def zcard(self, key):
+        return len(self._zset(key))
+
+    @staticmethod
+    def _bound(value):
+        text = str(value)
+        if text in ("-inf", "+inf"):
+            return float(text), False
+        if text.startswith("("):
+            return float(text[1:]), True
+        return float(text), False
+
+    def _in_range(self, score, low, high):
+        low_value, low_open = self._bound(low)
+        high_value, high_open = self._bound(high)
+        above = score > low_value if low_open else score >= low_value
+        below = score < high_value if high_open else score <= high_value
+        return above and below
+
+    def _ordered(self, key, desc=False):
+        items = sorted(self._zset(key).items(), key=lambda item: (item[1], item[0]))
+        return [member for member, _ in (reversed(items) if desc else items)]
+
+    def zrangebyscore(self, key, low, high, start=None, num=None):
+        members = [m for m in self._ordered(key) if self._in_range(self._zset(key)[m], low, high)]
+        if start is not None:
+            members = members[start:start + num]
+        return members
+
+    def zremrangebyscore(self, key, low, high):
+        for member in self.zrangebyscore(key, low, high):
+            del self.data[key][member]
+
+    def zrange(self, key, start, stop):
+        return self._ordered(key)[start:stop + 1]
+
+    def zrevrange(self, key, start, stop):
+        return self._ordered(key, desc=True)[start:stop + 1]
+
+    def zunionstore(self, dest, keys, aggregate=None):
+        result = {}
+        for key in keys:
+            for member, score in self._zset(key).items():
+                result[member] = max(score, result.get(member, score))
+        self.data[dest] = result
+
+    def zinterstore(self, dest, keys):
+        weights = keys if isinstance(keys, dict) else {key: 1 for key in keys}
+        sets = [self._zset(key) for key in weights]
+        members = set(sets[0]).intersection(*sets[1:])
+        self.data[dest] = {
+            member: sum(values[member] * weight for values, weight in zip(sets, weights.values()))
+            for member in members
+        }
+
+
+class FakePipeline:
+    """Queues calls and runs them in order on execute()."""
+
+    def __init__(self, client):
+        self._client = client
+        self._queued = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._queued.append((getattr(self._client, name), args, kwargs))
+        return queue
+
+    def execute(self):
+        results = [method(*args, **kwargs) for method, args, kwargs in self._queued]
+        self._queued = []
+        return results
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_record(index: int, **overrides) -> ProvenanceRecord:
+    defaults = dict(
+        provenance_id=f"p{index:03d}",
+        worker_name=["trends", "clips", "thumbs"][index % 3],
+        insight_type=[InsightType.VIDEO_IDEA, InsightType.TITLE_SUGGESTION][index % 2],
+        category_key=["fortnite", "valorant"][index % 2],
+        computed_at=NOW - timedelta(minutes=index),
+        confidence_score=index / 100,
+        confidence_level=[ConfidenceLevel.HIGH, ConfidenceLevel.LOW][index % 2],
+        quality_score=(index * 37 % 100) / 100,
+        insight_summary=f"insight number {index}",
+        tags=["daily"] if index % 4 == 0 else [],
+        validation_passed=index % 5 != 0,
+        decision_factors=[
+            DecisionFactor("velocity", index, 0.5, 0.4, 0.2, "fast"),
+        ] if index % 2 == 0 else [],
+    )
+    defaults.update(overrides)
+    return ProvenanceRecord(**defaults)
+
+
+@pytest.fixture
+def service():
+    service = ProvenanceService()
+    service._redis = FakeRedis()
+    for index in range(60):
+        assert service.store(make_record(index))
+    return service
+
+
+def ids(records):
+    return [record.provenance_id for record in records]
+
+
+class TestIndexedQuery:
+    """Tests for filtering and sorting through the indexes."""
+
+    def test_default_is_newest_first(self, service):
+        records, total = service.query(ProvenanceQuery(page_size=5))
+
+        assert total == 60
+        assert ids(records) == ["p000", "p001", "p002", "p003", "p004"]
+
+    def test_multi_value_filters_union_then_intersect(self, service):
+        query = ProvenanceQuery(worker_names=["trends", "clips"], category_keys=["valorant"], page_size=100)
+
+        records, total = service.query(query)
+
+        expected = [f"p{i:03d}" for i in range(60) if i % 3 in (0, 1) and i % 2 == 1]
+        assert ids(records) == expected
+        assert total == len(expected)
+
+    def test_confidence_level_tag_and_validation_filters(self, service):
+        query = ProvenanceQuery(
+            confidence_levels=[ConfidenceLevel.HIGH], tags=["daily"], validation_passed_only=True, page_size=100,
+        )
+
+        records, total = service.query(query)
+
+        expected = [f"p{i:03d}" for i in range(60) if i % 4 == 0 and i % 5 != 0]
+        assert ids(records) == expected
+        assert total == len(expected)
+
+    def test_sort_by_score_index(self, service):
+        query = ProvenanceQuery(sort_by="quality_score", sort_desc=True, page_size=3)
+
+        records, _ = service.query(query)
+
+        assert [r.quality_score for r in records] == sorted(((i * 37 % 100) / 100 for i in range(60)), reverse=True)[:3]
+
+    def test_range_filters_combine_with_sort(self, service):
+        query = ProvenanceQuery(
+            insight_types=[InsightType.VIDEO_IDEA],
+            start_time=NOW - timedelta(minutes=30),
+            min_quality=0.5,
+            sort_by="confidence_score",
+            sort_desc=False,
+            page_size=100,
+        )
+
+        records, total = service.query(query)
+
+        expected = [
+            f"p{i:03d}" for i in range(0, 31, 2) if (i * 37 % 100) / 100 >= 0.5
+        ]
+        assert ids(records) == expected
+        assert total == len(expected)
+
+    def test_range_on_sort_field_keeps_its_scores(self, service):
+        query = ProvenanceQuery(
+            min_confidence=0.5, start_time=NOW - timedelta(minutes=55), sort_by="confidence_score", page_size=100,
+        )
+
+        records, total = service.query(query)
+
+        assert ids(records) == [f"p{i:03d}" for i in range(55, 49, -1)]
+        assert total == 6
+
+    def test_pagination_loads_only_the_page(self, service):
+        service._redis.calls.clear()
+
+        records, total = service.query(ProvenanceQuery(page=3, page_size=10))
+
+        assert total == 60
+        assert ids(records) == [f"p{i:03d}" for i in range(20, 30)]
+        assert service._redis.calls == ["mget"]
+
+    def test_search_filters_in_sort_order(self, service):
+        records, total = service.query(ProvenanceQuery(search_query="NUMBER 1", page_size=3))
+
+        assert total == 11  # p001 and p010-p019
+        assert ids(records) == ["p001", "p010", "p011"]
+
+    def test_scratch_keys_are_deleted(self, service):
+        service.query(ProvenanceQuery(worker_names=["trends", "clips"], min_confidence=0.1))
+
+        assert service._redis.keys("provenance:tmp:*") == []
+
+    def test_expired_records_are_skipped(self, service):
+        del service._redis.data[f"{RECORD_KEY}p000"]
+
+        records, _ = service.query(ProvenanceQuery(page_size=2))
+
+        assert ids(records) == ["p001"]
+
+
+class TestRetention:
+    """Tests for index trimming past the record TTL."""
+
+    def test_trim_drops_expired_ids_from_global_indexes(self, service):
+        old = make_record(99, computed_at=datetime.fromtimestamp(time.time() - RECORD_TTL - 60, timezone.utc))
+        service.store(old)
+
+        assert service._trim_expired(service._redis, force=True) == 1
+        assert "p099" not in service._redis.data[INDEX_BY_TIME]
+        assert "p099" not in service._redis.data[f"{INDEX_BY_SCORE}quality_score"]
+        assert "p099" not in service._redis.data[SEARCH_KEY]
+
+    def test_trim_is_throttled(self, service):
+        service._trim_expired(service._redis, force=True)
+
+        assert service._trim_expired(service._redis) == 0
+
+
+class TestRollups:
+    """Tests for aggregates served from write-time rollups."""
+
+    def test_aggregate_matches_records_without_loading_them(self, service):
+        service._redis.calls.clear()
+
+        agg = service.aggregate()
+
+        assert service._redis.calls and set(service._redis.calls) == {"hgetall"}
+        assert agg.total_records == 60
+        assert agg.records_by_worker == {"trends": 20, "clips": 20, "thumbs": 20}
+        assert agg.records_by_confidence == {"high": 30, "low": 30}
+        assert agg.avg_confidence_score == pytest.approx(sum(i / 100 for i in range(60)) / 60)
+        assert agg.validation_pass_rate == pytest.approx(48 / 60)
+        assert agg.top_decision_factors == [{"name": "velocity", "count": 30, "avg_contribution": pytest.approx(0.2)}]
+        assert sum(h["count"] for h in agg.hourly_counts) == 60
+
+    def test_aggregate_by_one_dimension_sums_value_scopes(self, service):
+        agg = service.aggregate(ProvenanceQuery(worker_names=["trends", "clips"], start_time=NOW - timedelta(hours=3)))
+
+        assert agg.total_records == 40
+        assert agg.records_by_worker == {"trends": 20, "clips": 20}
+
+    def test_aggregate_across_dimensions_falls_back_to_records(self, service):
+        query = ProvenanceQuery(
+            worker_names=["trends"], category_keys=["valorant"], start_time=NOW - timedelta(hours=3),
+        )
+
+        agg = service.aggregate(query)
+
+        assert agg.total_records == 10
+        assert "mget" in service._redis.calls
+
+    def test_record_fallback_pages_past_one_page(self, service, monkeypatch):
+        monkeypatch.setattr(service_module, "AGGREGATE_PAGE_SIZE", 7)
+        query = ProvenanceQuery(worker_names=["trends", "clips"], category_keys=["valorant"])
+        service._redis.calls.clear()
+
+        agg = service.aggregate(query)
+
+        assert agg.total_records == 20
+        assert service._redis.calls.count("mget") == 3
+
+    def test_factor_rollups_skip_missing_category(self):
+        service = ProvenanceService()
+        service._redis = FakeRedis()
+        service.store(make_record(0, category_key=None))
+
+        factor_rollups = [
+            fields for key, fields in service._redis.data.items()
+            if ":factor:velocity" in key and isinstance(fields, dict)
+        ]
+        assert factor_rollups
+        assert all("category:None" not in fields for fields in factor_rollups)
+
+    def test_factor_analysis_and_listing(self, service):
+        analysis = service.get_factor_analysis("velocity", days=1)
+
+        assert analysis["occurrences"] == 30
+        assert analysis["avg_weight"] == pytest.approx(0.4)
+        assert analysis["by_insight_type"] == {"video_idea": 30}
+        assert [s["provenance_id"] for s in analysis["recent_samples"]][:2] == ["p058", "p056"]
+        assert len(analysis["recent_samples"]) == 20
+        assert service.list_factors(hours=24)[0]["count"] == 30
+        assert service.get_factor_analysis("missing")["occurrences"] == 0
+
+    def test_buckets_use_days_for_whole_days(self):
+        start = datetime(2026, 1, 1, 22, 30, tzinfo=timezone.utc)
+        end = datetime(2026, 1, 3, 1, 15, tzinfo=timezone.utc)
+
+        assert _rollup_buckets(start, end) == [
+            ("hour", "2026010122"), ("hour", "2026010123"),
+            ("day", "20260102"),
+            ("hour", "2026010300"), ("hour", "2026010301"),
+        ]
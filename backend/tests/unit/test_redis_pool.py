@@ -0,0 +1,250 @@
+"""
+Unit tests for the shared Redis connection manager.
+
+Tests per-purpose pool reuse, connection limits, pool-wait instrumentation
+and lifecycle handling. No live Redis server is required.
+"""
+
+import pytest
+
+from backend.database.redis_pool import (
+    DEFAULT_POOL_LIMITS,
+    InstrumentedBlockingConnectionPool,
+    InstrumentedSyncBlockingConnectionPool,
+    PoolWaitStats,
+    RedisConnectionManager,
+    get_async_redis,
+    get_redis_manager,
+    reset_redis_manager,
+)
+
+
+@pytest.fixture
+def manager():
+    """Create an isolated manager pointing at a dummy URL."""
+    return RedisConnectionManager(redis_url="redis://localhost:6399/0")
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_manager():
+    reset_redis_manager()
+    yield
+    reset_redis_manager()
+
+
+class TestRedisConnectionManager:
+    """Tests for pool creation and reuse."""
+
+    def test_client_is_reused_per_purpose(self, manager):
+        """Repeated calls return the same client and pool."""
+        first = manager.client("intel")
+        second = manager.client("intel")
+
+        assert first is second
+        assert isinstance(first.connection_pool, InstrumentedBlockingConnectionPool)
+
+    def test_purposes_get_separate_pools(self, manager):
+        """Each purpose has its own bounded pool."""
+        intel = manager.client("intel")
+        sse = manager.client("sse")
+
+        assert intel.connection_pool is not sse.connection_pool
+        assert intel.connection_pool.max_connections == DEFAULT_POOL_LIMITS["intel"]
+        assert sse.connection_pool.max_connections == DEFAULT_POOL_LIMITS["sse"]
+
+    def test_unknown_purpose_rejected(self, manager):
+        """Unknown pool names raise instead of silently creating pools."""
+        with pytest.raises(ValueError, match="Unknown Redis pool purpose"):
+            manager.client("not-a-pool")
+
+    def test_env_override_for_pool_limit(self, manager, monkeypatch):
+        """REDIS_POOL_<PURPOSE>_MAX_CONNECTIONS overrides the default limit."""
+        monkeypatch.setenv("REDIS_POOL_DEFAULT_MAX_CONNECTIONS", "3")
+
+        client = manager.client("default")
+
+        assert client.connection_pool.max_connections == 3
+
+    def test_queue_pool_does_not_decode(self, manager):
+        """The RQ queue pool keeps raw bytes for pickled payloads."""
+        client = manager.sync_client("queue")
+
+        assert client.connection_pool.connection_kwargs["decode_responses"] is False
+
+    def test_queue_worker_pool_has_no_socket_timeout(self, manager):
+        """RQ dequeue blocks longer than the 5s socket timeout enqueuers use."""
+        worker = manager.sync_client("queue_worker").connection_pool.connection_kwargs
+        enqueue = manager.sync_client("queue").connection_pool.connection_kwargs
+
+        assert worker["socket_timeout"] is None
+        assert worker["decode_responses"] is False
+        assert enqueue["socket_timeout"] == 5.0
+
+    def test_sync_pools_are_capped(self, manager):
+        """Sync pools never exceed the sync limit."""
+        client = manager.sync_client("default")
+
+        assert client.connection_pool.max_connections == manager.sync_pool_limit
+
+    def test_max_total_connections_is_bounded(self, manager):
+        """The connection budget is the sum of all pool limits."""
+        expected_async = sum(DEFAULT_POOL_LIMITS.values())
+        expected_sync = sum(
+            min(limit, manager.sync_pool_limit) for limit in DEFAULT_POOL_LIMITS.values()
+        )
+
+        assert manager.max_total_connections == expected_async + expected_sync
+
+    def test_stats_reports_created_pools(self, manager):
+        """stats() includes every pool that has been created."""
+        manager.client("intel")
+        manager.sync_client("default")
+
+        stats = manager.stats()
+
+        assert set(stats) == {"intel", "default_sync"}
+        assert stats["intel"]["max_connections"] == DEFAULT_POOL_LIMITS["intel"]
+        assert stats["intel"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_clears_pools(self, manager):
+        """shutdown() closes and forgets every pool."""
+        manager.client("intel")
+        manager.sync_client("default")
+
+        await manager.shutdown()
+
+        assert manager.stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_startup_tolerates_unavailable_redis(self, manager):
+        """Startup logs but does not raise when Redis is down."""
+        await manager.startup()
+        await manager.shutdown()
+
+
+class TestPoolWaitInstrumentation:
+    """Tests for pool wait statistics."""
+
+    def test_wait_stats_accumulate(self):
+        """Waits are counted, summed and the max is tracked."""
+        stats = PoolWaitStats()
+        stats.record(0.002)
+        stats.record(0.010)
+        stats.record(0.5, timed_out=True)
+        stats.record(0.001, connection_error=True)
+
+        snapshot = stats.to_dict()
+        assert snapshot["acquisitions"] == 4
+        assert snapshot["max_wait_ms"] == 500.0
+        assert snapshot["timeouts"] == 1
+        assert snapshot["connection_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_exhaustion_records_timeout(self):
+        """A caller blocked on a full pool is recorded as a timeout."""
+        import redis
+
+        pool = InstrumentedBlockingConnectionPool.from_url(
+            "redis://localhost:6399/0",
+            purpose="test",
+            max_connections=1,
+            timeout=0.01,
+        )
+        # Occupy the only slot without touching the network
+        held = pool.make_connection()
+        pool._in_use_connections.add(held)
+
+        with pytest.raises(redis.ConnectionError):
+            await pool.get_connection()
+
+        assert pool.wait_stats.acquisitions == 1
+        assert pool.wait_stats.timeouts == 1
+        assert pool.wait_stats.connection_errors == 0
+
+    @pytest.mark.asyncio
+    async def test_refused_connection_is_not_a_timeout(self):
+        """A Redis that cannot be reached is counted apart from pool exhaustion."""
+        import redis
+
+        pool = InstrumentedBlockingConnectionPool.from_url(
+            "redis://localhost:6399/0",
+            purpose="test",
+            max_connections=1,
+            timeout=0.01,
+        )
+
+        with pytest.raises(redis.ConnectionError):
+            await pool.get_connection()
+
+        assert pool.wait_stats.timeouts == 0
+        assert pool.wait_stats.connection_errors == 1
+
+    def test_sync_pool_exhaustion_records_timeout(self):
+        """The sync pool tells an empty queue apart from a refused connection."""
+        import redis
+
+        pool = InstrumentedSyncBlockingConnectionPool.from_url(
+            "redis://localhost:6399/0",
+            purpose="test",
+            max_connections=1,
+            timeout=0.01,
+        )
+
+        with pytest.raises(redis.ConnectionError):
+            pool.get_connection()
+        # The refused connection went back to the queue; hold it this time
+        pool.pool.get_nowait()
+        with pytest.raises(redis.ConnectionError):
+            pool.get_connection()
+
+        assert pool.wait_stats.connection_errors == 1
+        assert pool.wait_stats.timeouts == 1
+
+
+class TestGlobalManager:
+    """Tests for the module-level singleton helpers."""
+
+    def test_get_redis_manager_is_singleton(self):
+        assert get_redis_manager() is get_redis_manager()
+
+    def test_get_async_redis_shares_manager_clients(self):
+        assert get_async_redis("sse") is get_redis_manager().client("sse")
+
+
+
+class TestEventLoopRebinding:
+    """Tests for reusing the shared pools across asyncio.run() cycles."""
+
+    def test_pool_resets_when_event_loop_changes(self):
+        """Connections from a previous event loop are dropped, not reused."""
+        import asyncio
+
+        pool = InstrumentedBlockingConnectionPool.from_url(
+            "redis://localhost:6399/0", purpose="test", max_connections=2,
+        )
+
+        async def bind_and_park():
+            pool._bind_to_running_loop()
+            pool._available_connections.append(pool.make_connection())
+            return pool._condition
+
+        first_condition = asyncio.run(bind_and_park())
+        second_condition = asyncio.run(bind_and_park())
+
+        # The stale connection was discarded before the new one was parked
+        assert len(pool._available_connections) == 1
+        assert second_condition is not first_condition
+
+    @pytest.mark.asyncio
+    async def test_same_loop_keeps_connections(self):
+        """Repeated use on one loop keeps idle connections."""
+        pool = InstrumentedBlockingConnectionPool.from_url(
+            "redis://localhost:6399/0", purpose="test", max_connections=2,
+        )
+        pool._bind_to_running_loop()
+        pool._available_connections.append(pool.make_connection())
+
+        pool._bind_to_running_loop()
+
+        assert len(pool._available_connections) == 1
@@ -0,0 +1,195 @@
+"""
+Unit tests for the thumbnail intel vision cache and run dedup.
+
+Tests that the perceptual hash survives re-encoding but separates different
+images, that unchanged thumbnails reuse their cached analysis, that
+near-duplicate images within a run share one Gemini call, and that
+categories are analyzed concurrently with failures isolated.
+"""
+
+import asyncio
+import io
+import random
+from dataclasses import asdict
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+from backend.services.thumbnail_intel.analysis_cache import (
+    AnalysisRun,
+    hash_distance,
+    perceptual_hash,
+)
+from backend.services.thumbnail_intel.collector import ThumbnailData
+from backend.services.thumbnail_intel.service import analyze_categories
+from backend.services.thumbnail_intel.vision_analyzer import (
+    ThumbnailAnalysis,
+    ThumbnailVisionAnalyzer,
+    extract_hashtags,
+)
+
+
+def thumbnail_image(seed: int, size=(1280, 720), quality=90) -> bytes:
+    rng = random.Random(seed)
+    image = Image.new("RGB", (1280, 720), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x, y = rng.randrange(1280), rng.randrange(720)
+        draw.ellipse([x - 150, y - 100, x + 150, y + 100], fill=tuple(rng.randrange(256) for _ in range(3)))
+    out = io.BytesIO()
+    image.resize(size).save(out, "JPEG", quality=quality)
+    return out.getvalue()
+
+
+def thumb(video_id: str, title: str = "Big Win #fortnite") -> ThumbnailData:
+    return ThumbnailData(
+        video_id=video_id,
+        title=title,
+        thumbnail_url=f"https://i.ytimg.com/vi/{video_id}/default.jpg",
+        thumbnail_url_hq=f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
+        channel_title=f"channel-{video_id}",
+        view_count=1000,
+        like_count=10,
+        published_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        category_key="fortnite",
+        category_name="Fortnite",
+        tags=[],
+    )
+
+
+def vision_result(data: ThumbnailData) -> ThumbnailAnalysis:
+    return ThumbnailAnalysis(
+        video_id=data.video_id, title=data.title, thumbnail_url=data.thumbnail_url_hq, view_count=data.view_count,
+        layout_type="face-left-text-right", text_placement="top-right", focal_point="character-face",
+        dominant_colors=["#FF0000"], color_mood="energetic", background_style="gradient",
+        has_face=True, has_text=True, has_border=False, has_glow_effects=True, has_arrows_circles=False,
+        layout_recipe="Face left, text right", color_recipe="Red on blue", why_it_works="Contrast",
+        difficulty="easy", channel_name=data.channel_title, hashtags=extract_hashtags(data.title),
+    )
+
+
+class FakeCache:
+    """In-memory stand-in for ThumbnailAnalysisCache."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def get_many(self, video_ids):
+        return {vid: self.entries[vid] for vid in video_ids if vid in self.entries}
+
+    async def put(self, video_id, phash, analysis):
+        self.entries[video_id] = (phash, asdict(analysis))
+
+
+@pytest.fixture
+def analyzer():
+    with patch.dict("os.environ", {"GOOGLE_API_KEY": ""}):
+        analyzer = ThumbnailVisionAnalyzer(cache=FakeCache())
+    analyzer.enabled = True
+    analyzer.model_name = "vision-test"
+
+    async def analyze(thumb, img_bytes, index):
+        await asyncio.sleep(0.01)
+        return vision_result(thumb)
+
+    analyzer._analyze_single_thumbnail = AsyncMock(side_effect=analyze)
+    return analyzer
+
+
+class TestPerceptualHash:
+    """Tests for the dHash."""
+
+    def test_reencoded_image_stays_close(self):
+        original = perceptual_hash(thumbnail_image(1))
+        recompressed = perceptual_hash(thumbnail_image(1, size=(480, 270), quality=40))
+
+        assert hash_distance(original, recompressed) <= 4
+
+    def test_different_images_are_far_apart(self):
+        assert hash_distance(perceptual_hash(thumbnail_image(1)), perceptual_hash(thumbnail_image(2))) > 10
+
+    def test_undecodable_bytes(self):
+        assert perceptual_hash(b"not an image") is None
+
+
+class TestVisionReuse:
+    """Tests for cache reuse and in-run dedup."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_across_categories_share_one_call(self, analyzer):
+        run = AnalysisRun()
+        image = thumbnail_image(3)
+        reupload = thumbnail_image(3, size=(640, 360), quality=60)
+
+        first, second = await asyncio.gather(
+            analyzer.analyze_category_thumbnails("fortnite", "Fortnite", [thumb("a")], [image], run=run),
+            analyzer.analyze_category_thumbnails("apex", "Apex", [thumb("b", "Other #apex")], [reupload], run=run),
+        )
+
+        assert run.gemini_calls == 1
+        assert run.dedup_hits == 1
+        duplicate = second.thumbnails[0]
+        assert (duplicate.video_id, duplicate.channel_name, duplicate.hashtags) == ("b", "channel-b", ["apex"])
+        assert duplicate.layout_type == first.thumbnails[0].layout_type
+
+    def test_prompt_depends_only_on_the_image(self, analyzer):
+        prompt = analyzer._build_single_thumbnail_prompt()
+
+        assert "Fortnite" not in prompt and "Big Win" not in prompt and "1,000" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_unchanged_thumbnail_uses_cache_next_day(self, analyzer):
+        images = [thumbnail_image(4), thumbnail_image(5)]
+        await analyzer.analyze_category_thumbnails("fortnite", "Fortnite", [thumb("a"), thumb("b")], images)
+
+        run = AnalysisRun()
+        changed = [thumbnail_image(4, quality=50), thumbnail_image(6)]
+        insight = await analyzer.analyze_category_thumbnails(
+            "fortnite", "Fortnite", [thumb("a"), thumb("b")], changed, run=run,
+        )
+
+        # "a" was only re-encoded; "b" got a new thumbnail
+        assert (run.cache_hits, run.gemini_calls) == (1, 1)
+        assert analyzer._analyze_single_thumbnail.await_count == 3
+        assert [t.video_id for t in insight.thumbnails] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_cached(self, analyzer):
+        data = thumb("a")
+        analyzer._analyze_single_thumbnail = AsyncMock(return_value=analyzer._create_fallback_analysis_sync(data))
+        run = AnalysisRun()
+
+        await analyzer.analyze_category_thumbnails("fortnite", "Fortnite", [data], [thumbnail_image(7)], run=run)
+
+        assert run.failures == 1
+        assert analyzer.cache.entries == {}
+
+
+class TestConcurrentCategories:
+    """Tests for analyze_categories."""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_and_isolates_failures(self):
+        in_flight = 0
+        peak = 0
+
+        async def process(category_key, thumbnails):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if category_key == "bad":
+                raise RuntimeError("boom")
+            return category_key
+
+        results = await analyze_categories(
+            {"a": [thumb("1")], "bad": [thumb("2")], "empty": [], "b": [thumb("3")], "c": [thumb("4")]},
+            process,
+            concurrency=2,
+        )
+
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert peak == 2
@@ -0,0 +1,215 @@
+"""
+Unit tests for the thumbnail intel bulk downloader.
+
+Tests that thumbnails are downscaled for vision before analysis, that
+unchanged thumbnails are revalidated with conditional requests and reuse
+the prepared image, and that bulk downloads keep order, bound concurrency
+and fall back from maxres to hq thumbnails.
+"""
+
+import asyncio
+import io
+
+import httpx
+import pytest
+from PIL import Image
+
+from backend.services.thumbnail_intel import collector as collector_module
+from backend.services.thumbnail_intel.collector import ThumbnailCollector, prepare_for_vision
+
+RealAsyncClient = httpx.AsyncClient
+
+
+def image_bytes(size=(1280, 720), fmt="JPEG") -> bytes:
+    out = io.BytesIO()
+    Image.new("RGB", size, (200, 40, 40)).save(out, fmt)
+    return out.getvalue()
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def set(self, key, value, ex=None):
+        self.ops.append((key, value))
+
+    async def execute(self):
+        for key, value in self.ops:
+            self.redis.data[key] = value.encode() if isinstance(value, str) else value
+
+
+class FakeRedis:
+    """Minimal async binary Redis for the download cache."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeCDN:
+    """Serves thumbnails with ETags and records the requests it sees."""
+
+    def __init__(self, images):
+        self.images = images
+        self.requests = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        url = str(request.url)
+        if url not in self.images:
+            return httpx.Response(404)
+        etag = f'"{hash(self.images[url])}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, content=self.images[url], headers={"etag": etag})
+
+
+@pytest.fixture
+def cdn():
+    return FakeCDN({
+        "https://i.ytimg.com/vi/a/maxresdefault.jpg": image_bytes(),
+        "https://i.ytimg.com/vi/b/hqdefault.jpg": image_bytes((480, 360)),
+        "https://i.ytimg.com/vi/c/maxresdefault.jpg": image_bytes((1280, 720), "PNG"),
+    })
+
+
+@pytest.fixture
+def collector(cdn, monkeypatch):
+    collector = ThumbnailCollector()
+    collector._redis = FakeRedis()
+
+    def client_factory(**kwargs):
+        return RealAsyncClient(transport=httpx.MockTransport(cdn.handler))
+
+    monkeypatch.setattr(collector_module.httpx, "AsyncClient", client_factory)
+    return collector
+
+
+class TestPrepareForVision:
+    """Tests for prepare_for_vision."""
+
+    def test_downscales_large_thumbnail(self):
+        original = image_bytes()
+        prepared = prepare_for_vision(original, max_width=768)
+
+        with Image.open(io.BytesIO(prepared)) as image:
+            assert (image.format, image.size) == ("JPEG", (768, 432))
+        assert len(prepared) < len(original)
+
+    def test_small_jpeg_is_unchanged(self):
+        original = image_bytes((480, 360))
+        assert prepare_for_vision(original, max_width=768) is original
+
+    def test_converts_png_to_jpeg(self):
+        prepared = prepare_for_vision(image_bytes((640, 360), "PNG"), max_width=768)
+
+        with Image.open(io.BytesIO(prepared)) as image:
+            assert (image.format, image.size) == ("JPEG", (640, 360))
+
+    def test_undecodable_bytes(self):
+        assert prepare_for_vision(b"not an image") is None
+
+
+class TestBulkDownload:
+    """Tests for ThumbnailCollector.download_thumbnails."""
+
+    @pytest.mark.asyncio
+    async def test_keeps_order_and_falls_back_to_hq(self, collector):
+        images = await collector.download_thumbnails([
+            "https://i.ytimg.com/vi/a/maxresdefault.jpg",
+            "https://i.ytimg.com/vi/missing/hqdefault.jpg",
+            "https://i.ytimg.com/vi/b/maxresdefault.jpg",
+            "https://i.ytimg.com/vi/c/maxresdefault.jpg",
+        ])
+
+        sizes = [Image.open(io.BytesIO(img)).size if img else None for img in images]
+        assert sizes == [(768, 432), None, (480, 360), (768, 432)]
+        assert collector.download_stats["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, collector, cdn, monkeypatch):
+        monkeypatch.setattr(collector_module, "DOWNLOAD_CONCURRENCY", 2)
+        urls = ["https://i.ytimg.com/vi/a/maxresdefault.jpg"] * 6
+
+        images = await collector.download_thumbnails(urls)
+
+        assert all(images)
+        assert cdn.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_thumbnail_is_revalidated(self, collector, cdn):
+        url = "https://i.ytimg.com/vi/a/maxresdefault.jpg"
+        first = await collector.download_thumbnail(url)
+        cdn.requests.clear()
+
+        second = await collector.download_thumbnail(url)
+
+        assert second == first
+        assert cdn.requests[0].headers.get("if-none-match")
+        assert collector.download_stats["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_errors_fall_back_to_plain_requests(self, collector, cdn):
+        class BrokenRedis(FakeRedis):
+            async def mget(self, keys):
+                raise ConnectionError("redis down")
+
+        collector._redis = BrokenRedis()
+
+        image = await collector.download_thumbnail("https://i.ytimg.com/vi/a/maxresdefault.jpg")
+
+        assert image is not None
+        assert "if-none-match" not in cdn.requests[0].headers
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_one_client(self, collector, monkeypatch):
+        created = []
+        factory = collector_module.httpx.AsyncClient
+
+        def counting_factory(**kwargs):
+            created.append(kwargs)
+            return factory(**kwargs)
+
+        monkeypatch.setattr(collector_module.httpx, "AsyncClient", counting_factory)
+
+        async with collector.download_session():
+            await collector.download_thumbnails(["https://i.ytimg.com/vi/a/maxresdefault.jpg"])
+            await collector.download_thumbnails(["https://i.ytimg.com/vi/b/hqdefault.jpg"])
+
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_overlapping_runs_keep_their_own_client(self, collector, cdn):
+        session_open = asyncio.Event()
+
+        async def short_run():
+            async with collector.download_session():
+                session_open.set()
+                while not cdn.requests:
+                    await asyncio.sleep(0)
+
+        async def long_run():
+            await session_open.wait()
+            # b has no maxres, so its hq fallback is sent after the first
+            # run has left its session
+            return await collector.download_thumbnails([
+                "https://i.ytimg.com/vi/b/maxresdefault.jpg",
+            ])
+
+        _, images = await asyncio.gather(short_run(), long_run())
+
+        assert all(image is not None for image in images)
+        assert collector.download_stats["failed"] == 0
@@ -0,0 +1,136 @@
+"""
+Unit tests for the verified access token cache.
+
+Tests the bounded LRU of verified tokens, expiry handling, jti
+invalidation, and that the rate limiter and get_current_user share a
+single verification per request.
+"""
+
+import time
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.config import get_settings
+from backend.api.middleware import api_rate_limit
+from backend.api.middleware.api_rate_limit import APIRateLimitMiddleware
+from backend.api.middleware.auth import get_current_user
+from backend.api.middleware.request_context import RequestContextMiddleware
+from backend.services import jwt_service as jwt_module
+from backend.services.exceptions import TokenExpiredError
+from backend.services.jwt_service import (
+    JWTService,
+    TokenPayload,
+    VerifiedTokenCache,
+    get_verified_token_cache,
+)
+
+SECRET = "cache-test-secret-key-that-is-at-least-32-characters"
+
+
+@pytest.fixture
+def cache():
+    return VerifiedTokenCache(max_size=2)
+
+
+@pytest.fixture
+def service(cache):
+    return JWTService(secret_key=SECRET, token_cache=cache)
+
+
+def _token(service, user_id="user-1", **kwargs):
+    return service.create_access_token(user_id=user_id, tier="pro", email="u@example.com", **kwargs)
+
+
+class TestVerifiedTokenCache:
+    """Tests for the bounded LRU of verified tokens."""
+
+    def test_repeat_decode_skips_verification(self, service, cache):
+        token = _token(service)
+        first = service.decode_access_token(token)
+
+        with patch.object(jwt_module.jwt, "decode") as decode:
+            second = service.decode_access_token(token)
+
+        decode.assert_not_called()
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_expired_entry_is_reverified(self, service, cache):
+        token = _token(service, expires_delta=timedelta(seconds=1))
+        service.decode_access_token(token)
+
+        with patch.object(jwt_module.time, "time", return_value=time.time() + 5):
+            assert cache.get(service._cache_namespace, token) is None
+        assert len(cache) == 0
+
+        expired = _token(service, expires_delta=timedelta(seconds=-10))
+        with pytest.raises(TokenExpiredError) as exc_info:
+            service.decode_access_token(expired)
+        assert exc_info.value.details["expired_at"]
+
+    def test_other_signing_key_never_hits(self, service, cache):
+        token = _token(service)
+        service.decode_access_token(token)
+        other = JWTService(secret_key="x" * 40, token_cache=cache)
+
+        assert cache.get(other._cache_namespace, token) is None
+
+    def test_evicts_least_recently_used(self, service, cache):
+        tokens = [_token(service, user_id=f"user-{i}") for i in range(3)]
+        service.decode_access_token(tokens[0])
+        service.decode_access_token(tokens[1])
+        service.decode_access_token(tokens[0])
+        service.decode_access_token(tokens[2])
+
+        namespace = service._cache_namespace
+        assert cache.get(namespace, tokens[0]) is not None
+        assert cache.get(namespace, tokens[1]) is None
+        assert len(cache) == 2
+
+    def test_invalidate_by_jti(self, service, cache):
+        token = _token(service)
+        payload = service.decode_access_token(token)
+
+        cache.invalidate(payload.jti)
+
+        assert cache.get(service._cache_namespace, token) is None
+
+
+class TestSharedVerification:
+    """Tests that one request verifies its token once."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+
+        @app.get("/api/v1/me")
+        async def me(user: TokenPayload = Depends(get_current_user)):
+            return {"sub": user.sub}
+
+        app.add_middleware(APIRateLimitMiddleware)
+        app.add_middleware(RequestContextMiddleware)
+        get_verified_token_cache().clear()
+        with patch.object(api_rate_limit, "RATE_LIMITING_ENABLED", True):
+            yield TestClient(app)
+        get_verified_token_cache().clear()
+
+    def test_rate_limiter_and_auth_share_one_decode(self, client):
+        settings = get_settings()
+        token = JWTService(
+            secret_key=settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM,
+        ).create_access_token(user_id="user-42", tier="studio", email="s@example.com")
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with patch.object(jwt_module.jwt, "decode", wraps=jwt_module.jwt.decode) as decode:
+            first = client.get("/api/v1/me", headers=headers)
+            assert decode.call_count == 1
+
+            second = client.get("/api/v1/me", headers=headers)
+            assert decode.call_count == 1
+
+        assert first.json() == second.json() == {"sub": "user-42"}
+        assert first.headers["X-RateLimit-Limit"] == str(api_rate_limit.API_RATE_LIMITS["studio"])
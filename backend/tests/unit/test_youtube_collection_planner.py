@@ -0,0 +1,256 @@
+"""
+Unit tests for the YouTube game collection planner.
+
+Tests that games are planned by staleness x popularity within the remaining
+daily units, that video stats lookups for all planned games share full
+50-ID batches, and that the worker executes a plan with bounded concurrency
+for fewer units per refreshed game than fetching games one by one.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.intel.collectors.batch_collector import video_content_hash
+from backend.services.intel.collectors.collection_planner import (
+    GameCandidate,
+    cached_popularity,
+    estimate_units,
+    merge_stat_batches,
+    plan_collection,
+)
+from backend.services.trends.youtube_collector import YouTubeVideoResponse
+from backend.workers import youtube_worker
+from backend.workers.youtube_worker import GAMES_TO_FETCH, SINGLE_GAME_FETCH_UNITS, fetch_all_games
+
+NOW = datetime(2026, 1, 10, 5, 0)
+
+
+def candidate(key, hours_ago=None, popularity=1.0) -> GameCandidate:
+    last_fetch = NOW - timedelta(hours=hours_ago) if hours_ago is not None else None
+    return GameCandidate(key=key, query=f"{key} gameplay", display=key, last_fetch=last_fetch, popularity=popularity)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append((key, value))
+        self.redis.ttls[key] = ttl
+
+    def set(self, key, value):
+        self.ops.append((key, value))
+
+    async def execute(self):
+        self.redis.data.update(self.ops)
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the Redis calls the game fetch makes."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakeYouTube:
+    """Returns 35 search results per query and records the calls it sees."""
+
+    def __init__(self, results_per_query=35):
+        self.results_per_query = results_per_query
+        self.searches = []
+        self.stats_calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _call(self):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def search_video_ids(self, query, **kwargs):
+        self.searches.append(query)
+        await self._call()
+        return [f"{query}-{i}" for i in range(self.results_per_query)]
+
+    async def fetch_video_stats(self, video_ids):
+        self.stats_calls.append(list(video_ids))
+        await self._call()
+        return [
+            YouTubeVideoResponse(video_id=video_id, title=video_id, thumbnail="", channel_id="c", channel_title="C")
+            for video_id in video_ids
+        ]
+
+    async def close(self):
+        pass
+
+
+@asynccontextmanager
+async def acquired_lock(*args, **kwargs):
+    yield True
+
+
+class TestPlanCollection:
+    """Tests for plan_collection."""
+
+    def test_ranks_by_staleness_times_popularity(self):
+        plan = plan_collection(
+            [candidate("old", 24, 1.0), candidate("popular", 18, 2.0), candidate("never")],
+            budget=10_000, results_per_game=35, now=NOW,
+        )
+
+        assert [game.key for game in plan.games] == ["never", "popular", "old"]
+
+    def test_fresh_games_are_skipped_unless_forced(self):
+        games = [candidate("fresh", 2), candidate("stale", 30)]
+
+        assert plan_collection(games, 10_000, 35, now=NOW).skipped == {"fresh": "fresh"}
+        assert len(plan_collection(games, 10_000, 35, now=NOW, force=True).games) == 2
+
+    def test_admits_highest_scores_within_budget(self):
+        games = [candidate(f"game{i}", hours_ago=20 + i) for i in range(5)]
+
+        plan = plan_collection(games, budget=303, results_per_game=35, now=NOW)
+
+        assert [game.key for game in plan.games] == ["game4", "game3", "game2"]
+        assert plan.skipped == {"game1": "quota", "game0": "quota"}
+        assert plan.estimated_units == 303
+
+    def test_merged_batches_cost_less_than_one_stats_call_per_game(self):
+        assert estimate_units(9, 35) == 907
+        assert estimate_units(9, 35) < 9 * SINGLE_GAME_FETCH_UNITS
+
+
+class TestMergeStatBatches:
+    """Tests for merge_stat_batches and cached_popularity."""
+
+    def test_fills_batches_and_dedupes_across_games(self):
+        batches = merge_stat_batches([["a", "b"] * 20 + [f"x{i}" for i in range(30)], ["a"], [f"y{i}" for i in range(40)]])
+
+        assert [len(batch) for batch in batches] == [50, 22]
+        assert batches[0][:3] == ["a", "b", "x0"]
+
+    def test_popularity_from_cached_views(self):
+        assert cached_popularity([{"view_count": 999}, {"view_count": 999}]) == pytest.approx(3.0)
+        assert cached_popularity([]) is None
+
+
+class TestFetchAllGames:
+    """Tests for the planned fetch_all_games in the YouTube worker."""
+
+    @pytest.fixture
+    def redis_client(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def youtube(self):
+        return FakeYouTube()
+
+    @pytest.fixture
+    def worker(self, redis_client, youtube):
+        track = AsyncMock(return_value=0)
+        with patch.object(youtube_worker, "get_redis_client", AsyncMock(return_value=redis_client)), \
+                patch.object(youtube_worker, "get_youtube_collector", return_value=youtube), \
+                patch.object(youtube_worker, "worker_lock", acquired_lock), \
+                patch.object(youtube_worker, "_get_quota_used_today", AsyncMock(return_value=0)), \
+                patch.object(youtube_worker, "_track_quota_usage", track):
+            yield track
+
+    @pytest.mark.asyncio
+    async def test_refreshes_every_stale_game_in_merged_batches(self, worker, redis_client, youtube):
+        result = await fetch_all_games()
+
+        assert set(result["games"].values()) == {"success"}
+        assert len(youtube.stats_calls) == 7
+        assert all(len(batch) == 50 for batch in youtube.stats_calls[:-1])
+        assert result["units_used"] == 907
+        assert result["units_per_game"] < result["units_per_game_unbatched"] == 101
+        worker.assert_awaited_once_with(redis_client, 907)
+
+        cached = json.loads(redis_client.data["youtube:games:fortnite"])
+        assert cached["video_count"] == 35
+        assert cached["videos"][0]["video_id"] == "fortnite gameplay-0"
+        assert cached["videos"][0]["category"] == "gaming"
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_change_hash_with_cache_ttl(self, worker, redis_client):
+        await fetch_all_games()
+
+        hash_key, games_key = "youtube:hash:fortnite", "youtube:games:fortnite"
+        videos = json.loads(redis_client.data[games_key])["videos"]
+        assert redis_client.data[hash_key] == video_content_hash(videos)
+        assert redis_client.ttls[hash_key] == redis_client.ttls[games_key]
+
+    @pytest.mark.asyncio
+    async def test_failed_stats_batch_keeps_previous_cache(self, worker, redis_client, youtube):
+        fetch = youtube.fetch_video_stats
+
+        async def flaky_stats(video_ids):
+            if len(youtube.stats_calls) == 1:
+                youtube.stats_calls.append(list(video_ids))
+                raise RuntimeError("stats failed")
+            return await fetch(video_ids)
+
+        youtube.fetch_video_stats = flaky_stats
+        with patch.object(youtube_worker, "GAMES_FETCH_CONCURRENCY", 1):
+            result = await fetch_all_games()
+
+        # The second batch (IDs 50-99) holds part of the second and third game
+        failed = [key for key, status in result["games"].items() if status == "failed"]
+        assert len(failed) == 2
+        assert all(f"youtube:games:{key}" not in redis_client.data for key in failed)
+        assert all(
+            f"youtube:games:{key}" in redis_client.data
+            for key, status in result["games"].items() if status == "success"
+        )
+
+    @pytest.mark.asyncio
+    async def test_quota_is_tracked_before_cache_writes(self, worker, redis_client):
+        async def failing_execute():
+            raise ConnectionError("redis down")
+
+        pipeline = FakePipeline(redis_client)
+        pipeline.execute = failing_execute
+        with patch.object(redis_client, "pipeline", return_value=pipeline), pytest.raises(ConnectionError):
+            await fetch_all_games()
+
+        worker.assert_awaited_once_with(redis_client, 907)
+
+    @pytest.mark.asyncio
+    async def test_fresh_games_cost_nothing(self, worker, redis_client, youtube):
+        await fetch_all_games()
+        youtube.searches.clear()
+
+        result = await fetch_all_games()
+
+        assert youtube.searches == []
+        assert result["units_used"] == 0
+        assert result["games_skipped"] == len(GAMES_TO_FETCH)
+
+    @pytest.mark.asyncio
+    async def test_plan_respects_remaining_quota(self, worker, youtube):
+        with patch.object(youtube_worker, "_get_quota_used_today", AsyncMock(return_value=8200)):
+            result = await fetch_all_games()
+
+        assert len(youtube.searches) == 2
+        assert list(result["games"].values()).count("skipped_quota") == len(GAMES_TO_FETCH) - 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, worker, youtube):
+        with patch.object(youtube_worker, "GAMES_FETCH_CONCURRENCY", 3):
+            await fetch_all_games()
+
+        assert youtube.peak == 3
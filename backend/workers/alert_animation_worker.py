@@ -5,17 +5,26 @@ Processes async jobs for:
 1. Depth map generation (Depth Anything V2)
 2. Server-side animation export (FFmpeg fallback)
 
-Uses RQ (Redis Queue) for job management.
+Uses RQ (Redis Queue) for job management. Jobs run in-process on
+ALERT_ANIMATION_CONCURRENCY worker threads that share one depth engine,
+which is loaded before the first job and micro-batches their inference.
+
+Usage:
+    python -m backend.workers.alert_animation_worker
 """
 
 import asyncio
 import logging
 import os
+import signal
 import sys
+import threading
+import time
+import uuid
 from datetime import datetime, timezone
 
 from redis import Redis
-from rq import Worker, Queue
+from rq import Queue, SimpleWorker
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +38,13 @@ WORKER_NAME = "alert_animation_worker"
 QUEUE_NAME = "alert_animation"
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 
+# Jobs processed at once per container; concurrent depth jobs share batches
+ALERT_ANIMATION_CONCURRENCY = int(os.environ.get("ALERT_ANIMATION_CONCURRENCY", "2"))
+
+# Seconds idle followers are joined for at shutdown, so a job one dequeued
+# just before the stop request starts (and is then waited for)
+ALERT_ANIMATION_STOP_GRACE = float(os.environ.get("ALERT_ANIMATION_STOP_GRACE", "3"))
+
 
 def run_async(coro):
     """Run async function in sync context for RQ."""
@@ -300,10 +316,84 @@ def remove_background_job(*, job_id: str, project_id: str, user_id: str, source_
     return run_async(_process_remove_background_job(job_id, project_id, user_id, source_url))
 
 
-if __name__ == "__main__":
+class AlertAnimationWorker(SimpleWorker):
+    """
+    RQ worker that runs jobs in its own process (no fork per job), so every
+    job reuses the preloaded depth engine. Only the main-thread worker owns
+    the signal handlers; main() switches job timeouts to a timer, since
+    SIGALRM only reaches the main thread.
+    """
+    
+    def _install_signal_handlers(self):
+        if threading.current_thread() is threading.main_thread():
+            super()._install_signal_handlers()
+
+
+def _stop_followers(workers, threads) -> None:
+    """
+    Warm-stop the follower workers and wait for their in-flight jobs.
+    
+    Busy followers finish their current job (bounded by its timeout) and
+    then leave their loop. Idle followers are joined for up to
+    ALERT_ANIMATION_STOP_GRACE seconds, since one may have dequeued a job
+    it has not marked busy yet; after that they are blocked dequeuing and
+    exit with the process. A second SIGTERM/SIGINT while waiting forces a
+    cold shutdown through RQ's handler.
+    """
+    from rq.exceptions import StopRequested
+    from rq.worker import WorkerStatus
+    
+    for worker in workers:
+        try:
+            worker.request_stop(signal.SIGTERM, None)
+        except StopRequested:
+            pass  # Idle: nothing in flight
+    
+    # Re-check every follower each pass: an idle one may have just dequeued
+    deadline = time.monotonic() + ALERT_ANIMATION_STOP_GRACE
+    while True:
+        alive = [(worker, thread) for worker, thread in zip(workers, threads) if thread.is_alive()]
+        busy = [thread for worker, thread in alive if worker.get_state() == WorkerStatus.BUSY]
+        if not alive or (not busy and time.monotonic() >= deadline):
+            return
+        (busy or [thread for _, thread in alive])[0].join(timeout=1)
+
+
+def main() -> None:
+    """Preload the depth model, then run the worker threads."""
+    from rq.timeouts import TimerDeathPenalty
+    
+    from backend.services.alert_animation.depth_engine import preload_depth_engine
+    
+    AlertAnimationWorker.death_penalty_class = TimerDeathPenalty
+    
+    try:
+        preload_depth_engine()
+    except Exception as e:
+        # Background removal and exports still work; depth jobs will retry the load
+        logger.error(f"Depth engine preload failed: {e}")
+    
     redis_conn = Redis.from_url(REDIS_URL)
     queue = Queue(QUEUE_NAME, connection=redis_conn)
+    instance = uuid.uuid4().hex[:8]
+    workers = [
+        AlertAnimationWorker([queue], connection=redis_conn, name=f"{WORKER_NAME}.{instance}.{i}")
+        for i in range(max(1, ALERT_ANIMATION_CONCURRENCY))
+    ]
+    
+    threads = [
+        threading.Thread(target=worker.work, name=worker.name, daemon=True)
+        for worker in workers[1:]
+    ]
+    for thread in threads:
+        thread.start()
+    
+    logger.info(f"Starting {len(workers)} {WORKER_NAME} threads on queue '{QUEUE_NAME}'")
+    workers[0].work()
     
-    worker = Worker([queue], connection=redis_conn, name=WORKER_NAME)
-    logger.info(f"Starting {WORKER_NAME} listening on queue '{QUEUE_NAME}'")
-    worker.work()
+    # Main worker got SIGTERM/SIGINT: let the others finish their current job
+    _stop_followers(workers[1:], threads)
+
+
+if __name__ == "__main__":
+    main()
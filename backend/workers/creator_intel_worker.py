@@ -451,6 +451,14 @@ async def analyze_intel_v2(game_key: str, redis_client) -> Dict[str, bool]:
     except Exception as e:
         logger.error(f"Live stream analysis failed for {game_key}: {e}")
     
+    # Publish ready-to-serve API payloads (pre-serialized, ETagged) so the
+    # intel routes never reshape or analyze on the request path
+    try:
+        from backend.services.intel.api.payloads import get_intel_payload_store
+        await get_intel_payload_store().publish_category(game_key)
+    except Exception as e:
+        logger.error(f"Intel payload publish failed for {game_key}: {e}")
+    
     return results
 
 
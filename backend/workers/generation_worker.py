@@ -45,8 +45,11 @@ from backend.services.generation_service import (
     JobStatus,
     ASSET_DIMENSIONS,
 )
+from backend.services.gemini_admission import priority_for_tier
+from backend.services.generation_result_cache import get_generation_result_cache
 from backend.services.nano_banana_client import (
     GenerationRequest,
+    GenerationResponse,
     MediaAssetInput,
 )
 from backend.services.nano_banana_provenance import (
@@ -441,8 +444,9 @@ async def process_tiktok_emote_sizes(
 
 
 def get_redis_connection() -> Redis:
-    """Create a Redis connection from the configured URL."""
-    return Redis.from_url(REDIS_URL)
+    """Get the shared (binary) Redis connection used for RQ queues."""
+    from backend.database.redis_pool import get_sync_redis
+    return get_sync_redis("queue")
 
 
 def get_queue() -> Queue:
@@ -790,6 +794,58 @@ Output: {width}x{height} pixels"""
     return context
 
 
+async def _generate_with_result_cache(
+    nano_banana_client,
+    generation_request: GenerationRequest,
+    provenance_ctx: GenerationContext,
+    user_tier: Optional[str],
+) -> GenerationResponse:
+    """
+    Generate an image, serving seeded repeats from the result cache.
+    
+    Requests without a seed, refinements and tiers without the cache
+    always call Nano Banana. The cached image is the raw generation, so
+    logo compositing, emote processing and upload still run per job.
+    Cache hits still record provenance, pointing at the original generation.
+    
+    Args:
+        nano_banana_client: Provenance-enabled Nano Banana client
+        generation_request: Prepared generation request
+        provenance_ctx: Provenance context for the job
+        user_tier: User's subscription tier
+        
+    Returns:
+        GenerationResponse from the cache or from Nano Banana
+    """
+    result_cache = get_generation_result_cache()
+    cache_key = result_cache.key_for(generation_request, user_tier)
+    
+    if cache_key:
+        cached = await result_cache.get(cache_key, user_tier)
+        if cached:
+            logger.info(
+                f"Serving cached generation result: job_id={provenance_ctx.job_id}, "
+                f"seed={generation_request.seed}, source_job_id={cached.source_job_id}"
+            )
+            await nano_banana_client.record_cache_hit(
+                request=generation_request,
+                response=cached.response,
+                context=provenance_ctx,
+                source_generation_id=cached.source_generation_id,
+                source_job_id=cached.source_job_id,
+            )
+            return cached.response
+    
+    generation_response = await nano_banana_client.generate_with_provenance(
+        request=generation_request,
+        context=provenance_ctx,
+    )
+    
+    if cache_key:
+        await result_cache.put(cache_key, generation_response, job_id=provenance_ctx.job_id)
+    return generation_response
+
+
 async def _try_claim_job(generation_service, job_id: str) -> tuple[bool, str]:
     """
     Attempt to claim a job for processing using optimistic locking.
@@ -1089,6 +1145,8 @@ async def process_generation_job(job_id: str, user_id: str) -> dict:
             conversation_history=generation_context["conversation_history"],
             media_assets=generation_context["media_assets"],
             enable_grounding=enable_grounding,
+            priority=priority_for_tier(job_params.get("user_tier")),
+            seed=job_params.get("seed"),
         )
 
         # Build provenance context for tracking
@@ -1101,10 +1159,12 @@ async def process_generation_job(job_id: str, user_id: str) -> dict:
             is_refinement=bool(job_params.get("is_refinement")),
         )
 
-        # Generate with full provenance capture
-        generation_response = await nano_banana_client.generate_with_provenance(
-            request=generation_request,
-            context=provenance_ctx,
+        # Generate with full provenance capture (seeded repeats may be served from cache)
+        generation_response = await _generate_with_result_cache(
+            nano_banana_client,
+            generation_request,
+            provenance_ctx,
+            user_tier=job_params.get("user_tier"),
         )
 
         logger.info(f"Image generated: job_id={job_id}, inference_time_ms={generation_response.inference_time_ms}")
@@ -1313,6 +1373,7 @@ async def process_generation_job(job_id: str, user_id: str) -> dict:
                         prompt=job.prompt,
                         image_data=image_data,
                         asset_id=asset.id,
+                        image_url=upload_result.url,
                         thought_signature=generation_response.thought_signature,
                     )
                 except Exception as e:
@@ -1425,13 +1486,15 @@ async def _update_session_gemini_history(
     prompt: str,
     image_data: bytes,
     asset_id: str,
+    image_url: Optional[str] = None,
     thought_signature: Optional[bytes] = None,
 ) -> None:
     """
     Update the coach session's gemini_history for multi-turn refinements.
     
     This stores the conversation context so future refinements can use
-    multi-turn without re-uploading the image.
+    multi-turn without re-uploading the image. The image and thought
+    signature go to the history blob store; the session keeps references.
     
     Args:
         session_id: Coach session UUID
@@ -1439,12 +1502,12 @@ async def _update_session_gemini_history(
         prompt: The prompt used for generation
         image_data: The generated image bytes
         asset_id: The created asset ID
+        image_url: Storage URL of the image (used if the blob expires)
         thought_signature: Optional Gemini thought signature for multi-turn (required for refinements)
     """
-    import base64
-
     try:
         from backend.services.coach import get_session_manager
+        from backend.services.gemini_history_store import get_gemini_history_store
 
         session_manager = get_session_manager()
         session = await session_manager.get(session_id)
@@ -1459,21 +1522,15 @@ async def _update_session_gemini_history(
             "text": prompt,
         })
 
-        # Add the model response turn (with image)
-        # Store image as base64 for JSON serialization
-        image_b64 = base64.b64encode(image_data).decode()
-        model_turn = {
-            "role": "model",
-            "image_data": image_b64,
-            "image_mime_type": "image/png",
-        }
-
-        # CRITICAL: Store thought_signature for multi-turn refinements
-        # This is required by Gemini API when referencing model-generated images
-        if thought_signature:
-            model_turn["thought_signature"] = base64.b64encode(thought_signature).decode()
-            logger.info(f"Stored thought_signature for session: {session_id}")
-
+        # Add the model response turn, referencing the stored image
+        # CRITICAL: the thought_signature is required by Gemini API when
+        # referencing model-generated images in multi-turn refinements
+        model_turn = await get_gemini_history_store().model_turn(
+            image_data=image_data,
+            mime_type="image/png",
+            image_url=image_url,
+            thought_signature=thought_signature,
+        )
         session.gemini_history.append(model_turn)
 
         # Update last generated asset ID
@@ -1560,7 +1617,9 @@ def run_worker():
     logger.info(f"Redis URL: {REDIS_URL}")
     logger.info(f"Queue name: {QUEUE_NAME}")
 
-    redis_conn = get_redis_connection()
+    # Dequeue blocks in BLPOP far longer than the enqueue pool's socket timeout
+    from backend.database.redis_pool import get_sync_redis
+    redis_conn = get_sync_redis("queue_worker")
 
     try:
         redis_conn.ping()
@@ -478,6 +478,7 @@ class IntelOrchestrator:
     async def _run_intel_analysis(self) -> None:
         """Run all intel analyzers."""
         from backend.services.intel.analyzers.runner import run_all_analyzers
+        from backend.services.intel.api.payloads import get_intel_payload_store
         from backend.services.intel.collectors.quota_manager import QuotaManager
         
         games = QuotaManager.DEFAULT_PRIORITIES.keys()
@@ -485,6 +486,16 @@ class IntelOrchestrator:
         
         succeeded = sum(1 for r in results.values() if r.analyzers_succeeded)
         logger.info(f"Intel analysis complete: {succeeded}/{len(results)} categories")
+        
+        # Republish the served payloads so routes never lag the analyses
+        store = get_intel_payload_store()
+        for category_key, result in results.items():
+            if not result.analyzers_succeeded:
+                continue
+            try:
+                await store.publish_category(category_key)
+            except Exception as e:
+                logger.error(f"Intel payload publish failed for {category_key}: {e}")
     
     async def _run_hourly_aggregation(self) -> None:
         """Run hourly aggregation."""
@@ -498,7 +509,7 @@ class IntelOrchestrator:
         """Run daily rollup."""
         from backend.services.intel.aggregation.daily import DailyRollup
         
-        rollup = DailyRollup(self.db)
+        rollup = DailyRollup(self.db, self.redis)
         count = await rollup.run()
         logger.info(f"Daily rollup complete: {count} categories")
     
@@ -230,7 +230,7 @@ async def run_daily_rollup(redis_client, db) -> dict:
             
             from backend.services.intel.aggregation.daily import DailyRollup
             
-            rollup = DailyRollup(db)
+            rollup = DailyRollup(db, redis_client)
             count = await rollup.run()
         
         # Record last run
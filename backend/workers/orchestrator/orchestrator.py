@@ -45,6 +45,9 @@ The 15 Workers Managed:
         12. coach_cleanup_worker - Session cleanup (hourly)
         13. clip_radar_recap_worker - Daily compression (daily)
     
+    COMMUNITY (1):
+        community_feed_refresh - Precomputed trending/featured feeds (1min)
+    
     META (2):
         14. intel/orchestrator - Sub-orchestrator for intel
         15. graceful_shutdown - Utility module
@@ -69,6 +72,7 @@ from typing import Any, Callable, Coroutine, Dict, List, Optional
 
 import redis.asyncio as redis
 
+from backend.services.community_feed_cache import FEED_REFRESH_INTERVAL
 from backend.services.distributed_lock import DistributedLock, worker_lock
 
 from .types import (
@@ -462,6 +466,22 @@ class HeadOrchestrator:
             handler=self._run_sse_guardian,
         )
         
+        # =====================================================================
+        # COMMUNITY FEEDS (1)
+        # =====================================================================
+        
+        # 14. Community Feed Refresh - Rebuild precomputed trending/featured feeds
+        self._workers["community_feed_refresh"] = WorkerConfig(
+            name="community_feed_refresh",
+            worker_type=WorkerType.ANALYTICS,
+            execution_mode=WorkerExecutionMode.SCHEDULED,
+            interval_seconds=FEED_REFRESH_INTERVAL,
+            timeout_seconds=30,
+            expected_duration_ms=2000,
+            priority=JobPriority.NORMAL,
+            handler=self._run_community_feed_refresh,
+        )
+        
         # Register all workers with health monitor
         for name, config in self._workers.items():
             self._health_monitor.register_worker(
@@ -1109,6 +1129,39 @@ class HeadOrchestrator:
             submit_execution_report(report)
             return {"success": False, "error": str(e)}
     
+    async def _run_community_feed_refresh(self) -> Dict[str, Any]:
+        """Rebuild the precomputed trending and featured community feeds."""
+        from backend.services.community_feed_cache import get_community_feed_cache
+        from backend.workers.execution_report import (
+            create_report,
+            submit_execution_report,
+            ExecutionOutcome,
+        )
+        
+        report = create_report("community_feed_refresh")
+        
+        try:
+            counts = await get_community_feed_cache().refresh()
+            
+            report.data_verification.records_fetched = sum(counts.values())
+            report.data_verification.records_stored = sum(counts.values())
+            report.custom_metrics = {
+                "trending_posts": counts["trending"],
+                "featured_posts": counts["featured"],
+            }
+            report.outcome = ExecutionOutcome.SUCCESS
+            submit_execution_report(report)
+            
+            return {"success": True, "metrics": report.custom_metrics}
+            
+        except Exception as e:
+            logger.error(f"Community feed refresh error: {e}")
+            report.outcome = ExecutionOutcome.FAILED
+            report.error_message = str(e)
+            report.error_type = type(e).__name__
+            submit_execution_report(report)
+            return {"success": False, "error": str(e)}
+    
     # =========================================================================
     # Health & Monitoring
     # =========================================================================
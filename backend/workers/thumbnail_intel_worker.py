@@ -118,11 +118,13 @@ async def run_analysis():
             report.duration_ms = duration_ms
             
             # Data verification metrics
-            # V2: Each thumbnail gets its own Gemini call (10 per category)
+            # V2: One Gemini call per thumbnail, less cache hits and duplicates
+            run_report = service.last_run_report or {}
+            gemini_calls = run_report.get("gemini_calls", total_thumbnails)
             report.data_verification.records_fetched = len(results)
             report.data_verification.records_processed = total_thumbnails
-            report.data_verification.api_calls_made = total_thumbnails  # One Gemini call per thumbnail
-            report.data_verification.api_calls_succeeded = total_thumbnails  # Assuming all succeeded
+            report.data_verification.api_calls_made = gemini_calls
+            report.data_verification.api_calls_succeeded = gemini_calls - run_report.get("failures", 0)
             report.data_verification.cache_writes = len(results)
             report.data_verification.cache_ttl_seconds = 86400  # 24 hours
             
@@ -138,7 +140,10 @@ async def run_analysis():
                 "categories_processed": len(results),
                 "total_thumbnails_analyzed": total_thumbnails,
                 "category_details": category_details,
-                "gemini_vision_calls": total_thumbnails,  # V2: One call per thumbnail
+                "gemini_vision_calls": gemini_calls,
+                "vision_cache_hits": run_report.get("cache_hits", 0),
+                "vision_dedup_hits": run_report.get("dedup_hits", 0),
+                "analysis_wall_ms": run_report.get("wall_ms", duration_ms),
                 "architecture": "per_thumbnail_v2",
             }
             
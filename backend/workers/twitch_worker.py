@@ -61,8 +61,9 @@ REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 
 
 def get_redis_connection() -> Redis:
-    """Create a Redis connection from the configured URL."""
-    return Redis.from_url(REDIS_URL)
+    """Get the shared (binary) Redis connection used for RQ queues."""
+    from backend.database.redis_pool import get_sync_redis
+    return get_sync_redis("queue")
 
 
 def get_queue() -> Queue:
@@ -488,7 +489,9 @@ def run_worker():
     logger.info(f"Redis URL: {REDIS_URL}")
     logger.info(f"Queue name: {QUEUE_NAME}")
     
-    redis_conn = get_redis_connection()
+    # Dequeue blocks in BLPOP far longer than the enqueue pool's socket timeout
+    from backend.database.redis_pool import get_sync_redis
+    redis_conn = get_sync_redis("queue_worker")
     
     try:
         redis_conn.ping()
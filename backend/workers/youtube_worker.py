@@ -6,7 +6,8 @@ Users NEVER hit the YouTube API directly - they only read from cache.
 
 QUOTA BUDGET (~1,200 units/day out of 10,000):
 - Trending: 4 categories × 48 fetches/day × 1 unit = 192 units/day
-- Game-specific: 10 games × 1 fetch/day × 101 units = 1,010 units/day
+- Game-specific: 9 games × 1 fetch/day × ~100.8 units = ~907 units/day
+  (100 per search; stats lookups for all games share 50-ID batches)
 
 Schedule:
 - Trending videos: Every 30 minutes (1 unit per category)
@@ -27,7 +28,7 @@ import logging
 import os
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 
 import redis.asyncio as redis
 
@@ -38,6 +39,14 @@ from backend.services.trends.youtube_collector import (
     TrendCategory,
 )
 from backend.services.distributed_lock import worker_lock
+from backend.services.intel.collectors.batch_collector import YOUTUBE_HASH_KEY, video_content_hash
+from backend.services.intel.collectors.collection_planner import (
+    CollectionPlan,
+    GameCandidate,
+    cached_popularity,
+    merge_stat_batches,
+    plan_collection,
+)
 from backend.workers.heartbeat import send_heartbeat, send_idle_heartbeat, report_execution
 from backend.workers.execution_report import (
     create_report,
@@ -68,8 +77,8 @@ GAMES_FETCH_INTERVAL = 60 * 60 * 24  # 24 hours (once daily)
 CATEGORIES: List[TrendCategory] = ["gaming", "entertainment", "music", "education"]
 
 # Games to fetch with search (guaranteed coverage)
-# Each search costs 100 units + 1 unit for video details = 101 units
-# 9 games × 101 units = 909 units/day
+# Each search costs 100 units; video details for all games share 50-ID batches
+# 9 games × 100 units + 7 batches = 907 units/day (909 when fetched one by one)
 GAMES_TO_FETCH = [
     {"key": "fortnite", "query": "fortnite gameplay", "display": "Fortnite"},
     {"key": "warzone", "query": "warzone gameplay", "display": "Warzone"},
@@ -82,6 +91,22 @@ GAMES_TO_FETCH = [
     {"key": "roblox", "query": "roblox gameplay", "display": "Roblox"},
 ]
 
+# Search results per game (the stats lookup for 35 IDs fills 70% of a batch)
+GAME_SEARCH_RESULTS = 35
+
+# Units per search.list call, and per game fetched on its own (+ one stats call)
+GAME_SEARCH_UNITS = 100
+SINGLE_GAME_FETCH_UNITS = GAME_SEARCH_UNITS + 1
+
+# Games fetched less than this many hours ago are fresh
+GAME_MIN_REFRESH_HOURS = 12
+
+# Daily units game searches may use up to (the rest is left for trending)
+GAMES_QUOTA_CEILING = int(os.environ.get("YOUTUBE_GAMES_QUOTA_CEILING", "8500"))
+
+# Concurrent YouTube calls while executing a game collection plan
+GAMES_FETCH_CONCURRENCY = int(os.environ.get("YOUTUBE_GAMES_FETCH_CONCURRENCY", "4"))
+
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
 
 # Lock timeout for fetch operations (5 minutes should be plenty)
@@ -198,6 +223,19 @@ def _serialize_video(video: YouTubeVideoResponse) -> dict:
     }
 
 
+def _queue_game_cache_writes(pipe, game_key: str, cache_data: dict) -> None:
+    """
+    Queue the cache writes for one game's refreshed videos.
+    
+    The change-detection hash is written with the videos and the same TTL,
+    so hourly aggregation recomputes the game instead of reusing its
+    previous partial.
+    """
+    pipe.setex(YOUTUBE_GAMES_KEY.format(game=game_key), GAMES_CACHE_TTL, json.dumps(cache_data))
+    pipe.setex(YOUTUBE_HASH_KEY.format(game=game_key), GAMES_CACHE_TTL, video_content_hash(cache_data["videos"]))
+    pipe.set(YOUTUBE_LAST_FETCH_KEY.format(type=f"games:{game_key}"), cache_data["fetched_at"])
+
+
 async def _track_quota_usage(redis_client: redis.Redis, units: int) -> int:
     """
     Track quota usage for the day atomically. Returns total used today.
@@ -274,80 +312,6 @@ async def fetch_trending_category(
         return 0
 
 
-async def fetch_game_videos(
-    collector: YouTubeCollector,
-    redis_client: redis.Redis,
-    game: dict,
-    force: bool = False,
-) -> int:
-    """
-    Fetch videos for a specific game using search and cache them.
-    
-    Returns quota units used (100 for search + 1 for video details = 101).
-    Skips fetch if cache is fresh (< 12 hours old) unless force=True.
-    """
-    game_key = game["key"]
-    query = game["query"]
-    display_name = game["display"]
-    
-    # Cache-aware: skip if we have fresh data (dev restart protection)
-    if not force:
-        cache_key = YOUTUBE_GAMES_KEY.format(game=game_key)
-        cached = await redis_client.get(cache_key)
-        if cached:
-            try:
-                data = json.loads(cached)
-                fetched_at_str = data.get("fetched_at")
-                if fetched_at_str:
-                    fetched_at = datetime.fromisoformat(fetched_at_str)
-                    age_hours = (datetime.utcnow() - fetched_at).total_seconds() / 3600
-                    if age_hours < 12:  # Cache is fresh enough
-                        logger.info(f"Skipping {display_name} - cache is {age_hours:.1f}h old (< 12h)")
-                        return 0  # No quota used
-            except (json.JSONDecodeError, ValueError) as e:
-                logger.warning(f"Could not parse cache for {game_key}: {e}")
-    
-    logger.info(f"Fetching videos for game: {display_name} (query: {query})")
-    
-    try:
-        # search_videos costs 100 units + fetch_video_stats costs 1 unit
-        # Using "relevance" instead of "viewCount" for better mix of viral + rising
-        # Extended to 7 days and 35 results for better pattern analysis
-        videos = await collector.search_videos(
-            query=query,
-            category="gaming",
-            max_results=35,  # More data, same API cost
-            order="relevance",  # Mix of views + recency + engagement
-            published_after=datetime.utcnow() - timedelta(days=7),  # 7 days for better coverage
-        )
-        
-        # Serialize and cache
-        cache_data = {
-            "videos": [_serialize_video(v) for v in videos],
-            "game": game_key,
-            "game_display_name": display_name,
-            "fetched_at": datetime.utcnow().isoformat(),
-            "video_count": len(videos),
-        }
-        
-        cache_key = YOUTUBE_GAMES_KEY.format(game=game_key)
-        await redis_client.setex(cache_key, GAMES_CACHE_TTL, json.dumps(cache_data))
-        
-        # Track last fetch time
-        last_fetch_key = YOUTUBE_LAST_FETCH_KEY.format(type=f"games:{game_key}")
-        await redis_client.set(last_fetch_key, datetime.utcnow().isoformat())
-        
-        logger.info(f"Cached {len(videos)} videos for {display_name}")
-        
-        # Track quota: 100 (search) + 1 (video details) = 101 units
-        await _track_quota_usage(redis_client, 101)
-        return 101
-        
-    except Exception as e:
-        logger.error(f"Failed to fetch videos for {display_name}: {e}")
-        return 0
-
-
 async def fetch_all_trending() -> dict:
     """
     Fetch trending videos for all categories.
@@ -400,19 +364,156 @@ async def fetch_all_trending() -> dict:
         await collector.close()
 
 
+async def _load_game_candidates(redis_client: redis.Redis) -> List[GameCandidate]:
+    """
+    Build planner candidates for GAMES_TO_FETCH from their cached videos.
+    
+    Reads every game cache in one MGET. Last fetch time and popularity come
+    from the cached payload; games without a usable cache get the median
+    popularity of the others so they are ranked by staleness alone.
+    """
+    cache_keys = [YOUTUBE_GAMES_KEY.format(game=game["key"]) for game in GAMES_TO_FETCH]
+    cached_values = await redis_client.mget(cache_keys)
+    
+    candidates = []
+    popularity = {}
+    for game, cached in zip(GAMES_TO_FETCH, cached_values):
+        candidate = GameCandidate(
+            key=game["key"],
+            query=game["query"],
+            display=game["display"],
+            min_refresh_hours=GAME_MIN_REFRESH_HOURS,
+        )
+        if cached:
+            try:
+                data = json.loads(cached)
+                if data.get("fetched_at"):
+                    candidate.last_fetch = datetime.fromisoformat(data["fetched_at"])
+                weight = cached_popularity(data.get("videos", []))
+                if weight is not None:
+                    popularity[candidate.key] = weight
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning(f"Could not parse cache for {game['key']}: {e}")
+        candidates.append(candidate)
+    
+    known = sorted(popularity.values())
+    default_popularity = known[len(known) // 2] if known else 1.0
+    for candidate in candidates:
+        candidate.popularity = popularity.get(candidate.key, default_popularity)
+    return candidates
+
+
+async def _execute_game_plan(
+    collector: YouTubeCollector,
+    redis_client: redis.Redis,
+    plan: CollectionPlan,
+) -> Tuple[Dict[str, str], int]:
+    """
+    Run a collection plan: searches, then merged stats batches, then caching.
+    
+    YouTube calls run with at most GAMES_FETCH_CONCURRENCY in flight. The
+    units consumed are tracked with a single quota increment for the cycle,
+    before any cache write. A game with IDs in a failed stats batch keeps
+    its previous cache rather than being overwritten with a partial list.
+    
+    Returns:
+        Tuple of (map of game_key -> "success" or "failed", units used)
+    """
+    semaphore = asyncio.Semaphore(GAMES_FETCH_CONCURRENCY)
+    published_after = datetime.utcnow() - timedelta(days=7)
+    
+    async def search(game: GameCandidate) -> Optional[List[str]]:
+        async with semaphore:
+            logger.info(f"Searching videos for game: {game.display} (query: {game.query})")
+            try:
+                return await collector.search_video_ids(
+                    query=game.query,
+                    category="gaming",
+                    max_results=plan.results_per_game,
+                    order="relevance",  # Mix of views + recency + engagement
+                    published_after=published_after,
+                )
+            except Exception as e:
+                logger.error(f"Failed to search videos for {game.display}: {e}")
+                return None
+    
+    async def fetch_stats(batch: List[str]) -> Optional[List[YouTubeVideoResponse]]:
+        async with semaphore:
+            try:
+                return await collector.fetch_video_stats(batch)
+            except Exception as e:
+                logger.error(f"Failed to fetch stats for {len(batch)} videos: {e}")
+                return None
+    
+    searched = await asyncio.gather(*(search(game) for game in plan.games))
+    units = sum(1 for ids in searched if ids is not None) * GAME_SEARCH_UNITS
+    
+    batches = merge_stat_batches(ids for ids in searched if ids)
+    fetched = await asyncio.gather(*(fetch_stats(batch) for batch in batches))
+    units += sum(1 for videos in fetched if videos is not None)
+    if units:
+        await _track_quota_usage(redis_client, units)
+    
+    failed_ids = {
+        video_id
+        for batch, videos in zip(batches, fetched) if videos is None
+        for video_id in batch
+    }
+    videos_by_id = {
+        video.video_id: video
+        for videos in fetched if videos
+        for video in videos
+    }
+    
+    results = {}
+    now = datetime.utcnow().isoformat()
+    pipe = redis_client.pipeline(transaction=False)
+    for game, ids in zip(plan.games, searched):
+        if ids is None:
+            results[game.key] = "failed"
+            continue
+        if failed_ids.intersection(ids):
+            # Some of this game's stats are missing; keep the previous cache
+            results[game.key] = "failed"
+            continue
+        videos = [videos_by_id[video_id] for video_id in ids if video_id in videos_by_id]
+        for video in videos:
+            video.category = "gaming"
+        
+        cache_data = {
+            "videos": [_serialize_video(v) for v in videos],
+            "game": game.key,
+            "game_display_name": game.display,
+            "fetched_at": now,
+            "video_count": len(videos),
+        }
+        _queue_game_cache_writes(pipe, game.key, cache_data)
+        results[game.key] = "success"
+        logger.info(f"Cached {len(videos)} videos for {game.display}")
+    
+    if "success" in results.values():
+        await pipe.execute()
+    return results, units
+
+
 async def fetch_all_games(force: bool = False) -> dict:
     """
     Fetch videos for all tracked games using search.
     
     Called once daily by scheduler (at 5 AM UTC).
-    Quota cost: ~808 units max (101 per game × 8 games).
+    Quota cost: ~907 units max (100 per search + 7 shared stats batches for 9 games).
     
-    With cache-aware fetching, restarts with fresh cache cost 0 units.
+    The cycle is planned up front across all games: stale games are ranked
+    by staleness × popularity and admitted while the cycle fits in the units
+    left under GAMES_QUOTA_CEILING. Searches run concurrently, and the video
+    stats lookups of every game are merged into full 50-ID batches. With
+    cache-aware fetching, restarts with fresh cache cost 0 units.
     
     Uses distributed locking to prevent duplicate runs across multiple instances.
     
     Args:
-        force: If True, bypass cache freshness check and fetch all games.
+        force: If True, bypass cache freshness check and fetch all games
+               the remaining quota allows.
     """
     logger.info(f"Starting daily game videos fetch (force={force})")
     
@@ -421,7 +522,7 @@ async def fetch_all_games(force: bool = False) -> dict:
     
     # Check quota before proceeding
     quota_today = await _get_quota_used_today(redis_client)
-    if quota_today > 8500:
+    if quota_today > GAMES_QUOTA_CEILING:
         logger.warning(f"Quota usage high ({quota_today}/10000). Skipping game fetch.")
         return {
             "status": "skipped",
@@ -429,10 +530,6 @@ async def fetch_all_games(force: bool = False) -> dict:
             "quota_today": quota_today,
         }
     
-    total_units = 0
-    results = {}
-    skipped = 0
-    
     try:
         # Acquire distributed lock to prevent duplicate runs
         async with worker_lock(
@@ -449,27 +546,40 @@ async def fetch_all_games(force: bool = False) -> dict:
                     "message": "Another instance is already running this task",
                 }
             
-            for game in GAMES_TO_FETCH:
-                units = await fetch_game_videos(collector, redis_client, game, force=force)
-                total_units += units
-                
-                if units > 0:
-                    results[game["key"]] = "success"
-                else:
-                    results[game["key"]] = "skipped_fresh_cache"
-                    skipped += 1
-                
-                # Small delay between requests
-                await asyncio.sleep(1)
+            candidates = await _load_game_candidates(redis_client)
+            plan = plan_collection(
+                candidates,
+                budget=GAMES_QUOTA_CEILING - quota_today,
+                results_per_game=GAME_SEARCH_RESULTS,
+                force=force,
+            )
+            logger.info(
+                f"Game fetch plan: {len(plan.games)} games, ~{plan.estimated_units} units "
+                f"of {plan.budget} remaining. Skipped: {plan.skipped}"
+            )
+            
+            results, total_units = await _execute_game_plan(collector, redis_client, plan)
+            for game_key, reason in plan.skipped.items():
+                results[game_key] = "skipped_fresh_cache" if reason == "fresh" else "skipped_quota"
+            
+            refreshed = sum(1 for status in results.values() if status == "success")
+            units_per_game = round(total_units / refreshed, 2) if refreshed else 0
             
             quota_today = await _get_quota_used_today(redis_client)
-            logger.info(f"Game fetch complete. Units used: {total_units}. Skipped: {skipped}. Total today: {quota_today}")
+            logger.info(
+                f"Game fetch complete. Units used: {total_units} "
+                f"({units_per_game} per refreshed game, {SINGLE_GAME_FETCH_UNITS} when fetched one by one). "
+                f"Skipped: {len(plan.skipped)}. Total today: {quota_today}"
+            )
             
             return {
                 "status": "complete",
                 "games": results,
                 "units_used": total_units,
-                "games_skipped": skipped,
+                "units_per_game": units_per_game,
+                "units_per_game_unbatched": SINGLE_GAME_FETCH_UNITS,
+                "games_skipped": len(plan.skipped),
+                "plan": plan.to_dict(),
                 "quota_today": quota_today,
             }
         